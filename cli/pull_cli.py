@@ -18,7 +18,6 @@ from prisma.api_client import PrismaAccessAPIClient
 from prisma.pull.config_pull import pull_configuration
 from prisma.pull.folder_capture import FolderCapture
 from prisma.pull.snippet_capture import SnippetCapture
-from load_settings import prisma_access_auth
 from .application_search import interactive_application_search
 
 
@@ -358,16 +357,12 @@ Examples:
             print("✗ Client secret is required")
             return 1
 
-        # Authenticate
+        # Initialize API client (authenticates on creation)
         print("Authenticating...")
-        token = prisma_access_auth(args.tsg, args.client_id, client_secret)
-        if not token:
+        api_client = PrismaAccessAPIClient(args.tsg, args.client_id, client_secret)
+        if not api_client.token:
             print("✗ Authentication failed")
             return 1
-
-        # Initialize API client
-        print("Initializing API client...")
-        api_client = PrismaAccessAPIClient(args.tsg, args.client_id, client_secret)
         print("✓ API client initialized")
 
         # Determine which folders and snippets to pull
@@ -21,6 +21,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# SSH key type for generated VM credentials. Ed25519 is supported by Azure
+# Linux VMs and OpenSSH, and generating it takes microseconds; RSA (4096-bit)
+# remains available for targets that require it.
+SSH_KEY_TYPES = ('ed25519', 'rsa')
+DEFAULT_SSH_KEY_TYPE = 'ed25519'
+
 
 class AuthType(str, Enum):
     """Authentication types"""
@@ -139,12 +145,12 @@ class PasswordGenerator:
         return username.lower()
 
     @classmethod
-    def generate_ssh_keypair(cls, key_type: str = 'rsa', bits: int = 4096) -> tuple:
+    def generate_ssh_keypair(cls, key_type: str = DEFAULT_SSH_KEY_TYPE, bits: int = 4096) -> tuple:
         """
         Generate SSH key pair.
 
         Args:
-            key_type: Key type ('rsa' or 'ed25519')
+            key_type: Key type ('ed25519' or 'rsa')
             bits: Key size for RSA (ignored for ed25519)
 
         Returns:
@@ -152,7 +158,12 @@ class PasswordGenerator:
 
         Raises:
             ImportError: If cryptography library not available
+            ValueError: If the key type is not supported
         """
+        key_type = key_type.lower()
+        if key_type not in SSH_KEY_TYPES:
+            raise ValueError(f"Unsupported SSH key type: {key_type}")
+
         try:
             from cryptography.hazmat.primitives import serialization
             from cryptography.hazmat.primitives.asymmetric import rsa, ed25519
@@ -338,6 +349,7 @@ class VMCredentials:
     password: Optional[str] = None
     ssh_public_key: Optional[str] = None
     ssh_private_key: Optional[str] = None  # Stored separately, not in tenant file
+    ssh_key_type: str = DEFAULT_SSH_KEY_TYPE  # Use 'rsa' for targets without Ed25519 support
     generated_at: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
@@ -346,17 +358,23 @@ class VMCredentials:
             'username': self.username,
             'password': self.password,
             'ssh_public_key': self.ssh_public_key,
+            'ssh_key_type': self.ssh_key_type,
             # Note: ssh_private_key intentionally not serialized to tenant file
             'generated_at': self.generated_at,
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'VMCredentials':
+        ssh_key_type = str(data.get('ssh_key_type') or DEFAULT_SSH_KEY_TYPE).lower()
+        if ssh_key_type not in SSH_KEY_TYPES:
+            logger.warning(f"Unsupported SSH key type '{ssh_key_type}', using {DEFAULT_SSH_KEY_TYPE}")
+            ssh_key_type = DEFAULT_SSH_KEY_TYPE
         return cls(
             use_generated=data.get('use_generated', True),
             username=data.get('username'),
             password=data.get('password'),
             ssh_public_key=data.get('ssh_public_key'),
+            ssh_key_type=ssh_key_type,
             generated_at=data.get('generated_at'),
         )
 
@@ -393,7 +411,7 @@ class VMCredentials:
         # Generate SSH key if requested
         if include_ssh_key:
             try:
-                private_key, public_key = PasswordGenerator.generate_ssh_keypair()
+                private_key, public_key = PasswordGenerator.generate_ssh_keypair(self.ssh_key_type)
                 self.ssh_private_key = private_key
                 self.ssh_public_key = public_key
                 result['ssh_private_key'] = private_key
@@ -663,9 +681,9 @@ class CredentialManager:
         return PasswordGenerator.generate_username(base_name, max_length)
 
     @staticmethod
-    def generate_ssh_keypair(key_type: str = 'rsa') -> tuple:
+    def generate_ssh_keypair(key_type: str = DEFAULT_SSH_KEY_TYPE, bits: int = 4096) -> tuple:
         """Generate SSH key pair"""
-        return PasswordGenerator.generate_ssh_keypair(key_type)
+        return PasswordGenerator.generate_ssh_keypair(key_type, bits)
 
     @staticmethod
     def prepare_terraform_credentials(
@@ -0,0 +1,444 @@
+"""
+Precompiled default-item classifier.
+
+Whether an item is a system default used to be decided one item at a time,
+with each layer (pull filtering, the config tree, DefaultDetector) looping
+over snippet names, name prefixes and regex pattern lists on every call.
+DefaultClassifier compiles all of those rules once:
+
+- snippet and per-type name rules (pull filtering, config tree) become
+  frozenset lookups, memoized per distinct snippet value
+- each DefaultConfigs pattern list becomes one compiled alternation, so a
+  name is checked with a single regex match instead of a loop of re.match()
+- name prefixes become one str.startswith() tuple (see compile_prefixes)
+
+and classifies a whole type list per call (classify(), classify_objects(),
+...), which is what the callers have in hand anyway.
+
+Example:
+    classifier = get_default_classifier()
+    flags = classifier.classify(raw_items, "address_object")
+    custom = [item for item, is_default in zip(raw_items, flags) if not is_default]
+"""
+
+import re
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple
+
+from .default_configs import DefaultConfigs
+
+# ========== Item rules (pull filtering, config tree) ==========
+
+# Snippet values that mark an item as a system default. The snippet field of
+# an API item is the authoritative source for default vs user-created.
+DEFAULT_SNIPPETS: FrozenSet[str] = frozenset({
+    'default',           # General system defaults (crypto profiles, tags, addresses)
+    'hip-default',       # HIP-specific defaults (HIP objects and profiles)
+    'optional-default',  # Optional pre-built defaults
+    # Named default snippets from Prisma Access
+    'Web Security Global',
+    'PA_predefined_embargo_rule',
+    'best-practice',
+    'decrypt-bypass',
+    'Block-brute-force',
+})
+
+# Any snippet ending in this is a default (catches future patterns)
+DEFAULT_SNIPPET_SUFFIX = '-default'
+
+# Default item names by type - these are system-provided items that are
+# defaults regardless of which snippet they're in
+DEFAULT_ITEM_NAMES: Dict[str, FrozenSet[str]] = {
+    'address_object': frozenset({
+        'Palo Alto Networks Sinkhole',
+    }),
+    'application_filter': frozenset({
+        'general-browsing',
+        'All New apps',
+        'DLP App Exclusion',
+    }),
+    'service_object': frozenset({
+        'service-http',
+        'service-https',
+    }),
+    'tag': frozenset({
+        'Sanctioned',
+        'Tolerated',
+        'empty',
+    }),
+    'external_dynamic_list': frozenset({
+        'Palo Alto Networks - Authentication Portal Exclude List',
+    }),
+    'profile_group': frozenset({
+        'best-practice',
+        'Explicit Proxy - Unknown Users',
+    }),
+    'anti_spyware_profile': frozenset({
+        'best-practice',
+    }),
+    'vulnerability_profile': frozenset({
+        'best-practice',
+    }),
+    'wildfire_profile': frozenset({
+        'best-practice',
+    }),
+    'dns_security_profile': frozenset({
+        'best-practice',
+    }),
+    'url_access_profile': frozenset({
+        'best-practice',
+        'Explicit Proxy - Unknown Users',
+    }),
+    'file_blocking_profile': frozenset({
+        'best-practice',
+    }),
+    'decryption_profile': frozenset({
+        'best-practice',
+        'web-security-default',
+    }),
+}
+
+# Keywords that mark a folder or snippet name as holding default items
+# (DefaultManager)
+DEFAULT_KEYWORDS_RE: Pattern = re.compile(r"predefined|default|system")
+
+_NO_NAMES: FrozenSet[str] = frozenset()
+
+# Bound on the memoized results per snippet value (values repeat across
+# thousands of items, but there are only a handful of distinct ones)
+_FLAG_CACHE_SIZE = 4096
+
+
+class _FlagCache(dict):
+    """Memoized str -> bool rule; a lookup is one dict access for known values."""
+
+    def __init__(self, rule: Callable[[str], bool]):
+        super().__init__()
+        self._rule = rule
+        self[None] = self[''] = False
+
+    def __missing__(self, value: str) -> bool:
+        if len(self) >= _FLAG_CACHE_SIZE:
+            self.clear()
+            self[None] = self[''] = False
+        result = self[value] = bool(self._rule(value))
+        return result
+
+
+def compile_patterns(patterns: Iterable[str]) -> Pattern:
+    """
+    Compile a list of case-insensitive re.match() patterns into one alternation.
+
+    Match it against the lowercased name: pattern.match(name.lower()) is
+    True exactly when any of the patterns would match the name. Lowercase
+    patterns (all of DefaultConfigs) are compiled without re.IGNORECASE,
+    which roughly halves the matching cost. An empty list compiles to a
+    pattern that never matches.
+
+    Args:
+        patterns: Regular expressions, as used with re.match()
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return re.compile(r"(?!)")
+    flags = 0 if all(pattern == pattern.lower() for pattern in patterns) else re.IGNORECASE
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+def compile_prefixes(prefixes: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Compile name prefixes for a case-insensitive str.startswith() check.
+
+    Usage: name.lower().startswith(compile_prefixes(prefixes))
+
+    Args:
+        prefixes: Name prefixes (any case)
+    """
+    # Longest first so the common prefixes short-circuit early; startswith()
+    # with an empty tuple is simply False
+    return tuple(sorted({prefix.lower() for prefix in prefixes}, key=len, reverse=True))
+
+
+class DefaultClassifier:
+    """
+    Classifies items as system defaults with precompiled rules.
+
+    Item rules (is_default_item/classify) are used by pull filtering and the
+    config tree. Pattern rules (matches/classify_objects/classify_profiles/
+    classify_rules) implement DefaultConfigs and are used by DefaultDetector.
+    """
+
+    # Pattern categories -> DefaultConfigs pattern list
+    PATTERN_CATEGORIES: Dict[str, List[str]] = {
+        'folder': DefaultConfigs.DEFAULT_FOLDER_PATTERNS,
+        'snippet': DefaultConfigs.DEFAULT_SNIPPET_PATTERNS,
+        'profile': DefaultConfigs.DEFAULT_PROFILE_NAME_PATTERNS,
+        'auth_profile': DefaultConfigs.DEFAULT_AUTH_PROFILE_PATTERNS,
+        'decryption_profile': DefaultConfigs.DEFAULT_DECRYPTION_PROFILE_PATTERNS,
+        'object': DefaultConfigs.DEFAULT_OBJECT_NAME_PATTERNS,
+        'application': DefaultConfigs.DEFAULT_APPLICATION_PATTERNS,
+        'rule': DefaultConfigs.DEFAULT_RULE_PATTERNS["name_patterns"],
+    }
+
+    def __init__(
+        self,
+        default_snippets: Iterable[str] = DEFAULT_SNIPPETS,
+        default_item_names: Mapping[str, Iterable[str]] = DEFAULT_ITEM_NAMES,
+    ):
+        """
+        Compile the classification rules.
+
+        Args:
+            default_snippets: Snippet values that mark an item as default
+            default_item_names: Item type -> names that are always default
+        """
+        self.default_snippets = frozenset(default_snippets)
+        self.default_item_names = {
+            item_type: frozenset(names) for item_type, names in default_item_names.items()
+        }
+
+        self._patterns: Dict[str, Pattern] = {
+            category: compile_patterns(patterns)
+            for category, patterns in self.PATTERN_CATEGORIES.items()
+        }
+        # Object names: application objects are checked against their own and
+        # the general object patterns, everything else against the general ones
+        self._object_patterns: Dict[Optional[str], Pattern] = {
+            'application': compile_patterns(
+                DefaultConfigs.DEFAULT_APPLICATION_PATTERNS + DefaultConfigs.DEFAULT_OBJECT_NAME_PATTERNS
+            ),
+        }
+
+        self._object_names: Dict[str, FrozenSet[str]] = {
+            'address': frozenset(DefaultConfigs.DEFAULT_ADDRESS_OBJECTS),
+            'service': frozenset(DefaultConfigs.DEFAULT_SERVICE_OBJECTS),
+        }
+        self._profile_names: Dict[str, FrozenSet[str]] = {
+            profile_type: frozenset(name.lower() for name in names)
+            for profile_type, names in DefaultConfigs.DEFAULT_SECURITY_PROFILE_NAMES.items()
+        }
+
+        snippets = self.default_snippets
+        self._snippet_flags = _FlagCache(
+            lambda snippet: snippet in snippets or snippet.endswith(DEFAULT_SNIPPET_SUFFIX)
+        )
+        snippet_match = self._patterns['snippet'].match
+        self._snippet_pattern_flags = _FlagCache(lambda snippet: snippet_match(snippet.lower()))
+
+    # ========== Item rules ==========
+
+    def is_default_snippet_value(self, snippet: Optional[str]) -> bool:
+        """Check whether an item's snippet field marks it as a default."""
+        if not isinstance(snippet, str):
+            return False
+        return self._snippet_flags[snippet]
+
+    def is_default_item(self, item: Dict[str, Any], item_type: Optional[str] = None) -> bool:
+        """
+        Check whether an item is a system default by its snippet field or name.
+
+        Args:
+            item: Raw item dictionary (API response or saved config)
+            item_type: Optional item type, enables the per-type default names
+
+        Returns:
+            True if the item is a system default
+        """
+        names = self.default_item_names.get(item_type, _NO_NAMES)
+        if names and item.get('name', '') in names:
+            return True
+        return self.is_default_snippet_value(item.get('snippet', ''))
+
+    def classify(self, items: Sequence[Dict[str, Any]], item_type: Optional[str] = None) -> List[bool]:
+        """
+        Classify a whole type list in one pass.
+
+        Args:
+            items: Raw item dictionaries of one type; malformed entries
+                (non-dicts) are classified as not default
+            item_type: Optional item type, enables the per-type default names
+
+        Returns:
+            List of is-default flags, parallel to items
+        """
+        names = self.default_item_names.get(item_type, _NO_NAMES)
+        snippet_flags = self._snippet_flags
+        try:
+            if names:
+                return [
+                    item.get('name') in names or snippet_flags[item.get('snippet')]
+                    for item in items
+                ]
+            return [snippet_flags[item.get('snippet')] for item in items]
+        except (AttributeError, TypeError):
+            # Malformed entries somewhere in the list - classify one by one
+            return [self._is_default_entry(item, item_type) for item in items]
+
+    def _is_default_entry(self, item: Any, item_type: Optional[str]) -> bool:
+        """is_default_item() that treats malformed entries as not default."""
+        try:
+            return isinstance(item, dict) and self.is_default_item(item, item_type)
+        except TypeError:
+            # Unhashable name - only the snippet field can tell
+            return self.is_default_snippet_value(item.get('snippet'))
+
+    def partition(
+        self, items: Sequence[Dict[str, Any]], item_type: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split a type list into custom and default items (order preserved).
+
+        Returns:
+            Tuple of (custom items, default items)
+        """
+        custom, defaults = [], []
+        for item, is_default in zip(items, self.classify(items, item_type)):
+            (defaults if is_default else custom).append(item)
+        return custom, defaults
+
+    # ========== Pattern rules (DefaultConfigs) ==========
+
+    def matches(self, category: str, name: Optional[str]) -> bool:
+        """
+        Check a name against one DefaultConfigs pattern category.
+
+        Args:
+            category: One of PATTERN_CATEGORIES ('folder', 'snippet', 'profile', ...)
+            name: Name to check
+
+        Returns:
+            True if any pattern of the category matches
+        """
+        return bool(name) and self._patterns[category].match(name.lower()) is not None
+
+    def classify_names(self, category: str, names: Iterable[Optional[str]]) -> List[bool]:
+        """Check many names against one pattern category."""
+        match = self._patterns[category].match
+        return [bool(name) and match(name.lower()) is not None for name in names]
+
+    def is_default_object(
+        self,
+        name: Optional[str],
+        object_type: Optional[str] = None,
+        object_data: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Check an object against the DefaultConfigs object rules.
+
+        Args:
+            name: Object name
+            object_type: Optional object type ('address', 'service', 'application')
+            object_data: Optional full object dictionary (for its snippet association)
+        """
+        if not name:
+            return False
+        if object_data:
+            snippet = object_data.get("snippet", "")
+            if snippet and self._snippet_pattern_flags[snippet]:
+                return True
+        if name in self._object_names.get(object_type, _NO_NAMES):
+            return True
+        pattern = self._object_patterns.get(object_type, self._patterns['object'])
+        return pattern.match(name.lower()) is not None
+
+    def classify_objects(
+        self, objects: Sequence[Dict[str, Any]], object_type: Optional[str] = None
+    ) -> List[bool]:
+        """
+        Classify a list of object dictionaries of one type.
+
+        Args:
+            objects: Object dictionaries (name and optional snippet fields)
+            object_type: Optional object type ('address', 'service', 'application')
+
+        Returns:
+            List of is-default flags, parallel to objects
+        """
+        names = self._object_names.get(object_type, _NO_NAMES)
+        match = self._object_patterns.get(object_type, self._patterns['object']).match
+        snippet_flags = self._snippet_pattern_flags
+
+        flags = []
+        for obj in objects:
+            name = obj.get("name", "")
+            if not name:
+                flags.append(False)
+                continue
+            snippet = obj.get("snippet", "")
+            flags.append(
+                bool(snippet and snippet_flags[snippet])
+                or name in names
+                or match(name.lower()) is not None
+            )
+        return flags
+
+    def is_default_profile_name(self, name: Optional[str], profile_type: Optional[str] = None) -> bool:
+        """
+        Check a security profile name against the known names of its type and
+        the general profile patterns.
+        """
+        if not name:
+            return False
+        name_lower = name.lower()
+        if profile_type and name_lower in self._profile_names.get(profile_type, _NO_NAMES):
+            return True
+        return self._patterns['profile'].match(name_lower) is not None
+
+    def classify_profiles(
+        self, profiles: Sequence[Dict[str, Any]], profile_type: Optional[str] = None
+    ) -> List[bool]:
+        """
+        Classify a list of security profile dictionaries of one type.
+
+        Returns:
+            List of is-default flags, parallel to profiles
+        """
+        names = self._profile_names.get(profile_type, _NO_NAMES) if profile_type else _NO_NAMES
+        match = self._patterns['profile'].match
+        return [
+            bool(name) and (name in names or match(name) is not None)
+            for name in (profile.get("name", "").lower() for profile in profiles)
+        ]
+
+    def is_default_rule(self, rule: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check a security rule by name pattern, or as an allow/deny rule that
+        matches "any" everywhere.
+        """
+        if not rule:
+            return False
+
+        rule_name = rule.get("name", "")
+        if rule_name and self._patterns['rule'].match(rule_name.lower()) is not None:
+            return True
+
+        action = rule.get("action", "").lower()
+        if action not in ("deny", "allow"):
+            return False
+
+        for field in ("source", "destination", "application", "service"):
+            values = rule.get(field, [])
+            if values and "any" not in [value.lower() for value in values]:
+                return False
+        return True
+
+    def classify_rules(self, rules: Sequence[Dict[str, Any]]) -> List[bool]:
+        """Classify a list of security rules."""
+        is_default_rule = self.is_default_rule
+        return [is_default_rule(rule) for rule in rules]
+
+
+# ========== Shared classifier ==========
+
+_classifier: Optional[DefaultClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_default_classifier() -> DefaultClassifier:
+    """Get the shared classifier (compiled on first use)."""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = DefaultClassifier()
+    return _classifier
@@ -7,7 +7,13 @@ are used to identify and filter default configurations during capture.
 """
 
 from typing import Dict, Any, List, Set, Optional
-import re
+
+
+def _classifier():
+    """Shared DefaultClassifier, which holds these patterns precompiled."""
+    from .default_classifier import get_default_classifier
+
+    return get_default_classifier()
 
 
 class DefaultConfigs:
@@ -211,12 +217,7 @@ class DefaultConfigs:
                 if parent_lower == default_parent.lower():
                     return True
 
-        # Check folder name patterns
-        folder_lower = folder_name.lower()
-        for pattern in DefaultConfigs.DEFAULT_FOLDER_PATTERNS:
-            if re.match(pattern, folder_lower, re.IGNORECASE):
-                return True
-        return False
+        return _classifier().matches("folder", folder_name)
 
     @staticmethod
     def is_default_snippet(snippet_name: str) -> bool:
@@ -229,14 +230,7 @@ class DefaultConfigs:
         Returns:
             True if snippet matches default patterns
         """
-        if not snippet_name:
-            return False
-
-        snippet_lower = snippet_name.lower()
-        for pattern in DefaultConfigs.DEFAULT_SNIPPET_PATTERNS:
-            if re.match(pattern, snippet_lower, re.IGNORECASE):
-                return True
-        return False
+        return _classifier().matches("snippet", snippet_name)
 
     @staticmethod
     def is_default_profile_name(
@@ -252,28 +246,7 @@ class DefaultConfigs:
         Returns:
             True if profile matches default patterns
         """
-        if not profile_name:
-            return False
-
-        profile_lower = profile_name.lower()
-
-        # Check type-specific defaults
-        if (
-            profile_type
-            and profile_type in DefaultConfigs.DEFAULT_SECURITY_PROFILE_NAMES
-        ):
-            for default_name in DefaultConfigs.DEFAULT_SECURITY_PROFILE_NAMES[
-                profile_type
-            ]:
-                if profile_lower == default_name.lower():
-                    return True
-
-        # Check general patterns
-        for pattern in DefaultConfigs.DEFAULT_PROFILE_NAME_PATTERNS:
-            if re.match(pattern, profile_lower, re.IGNORECASE):
-                return True
-
-        return False
+        return _classifier().is_default_profile_name(profile_name, profile_type)
 
     @staticmethod
     def is_default_auth_profile(auth_profile_name: str) -> bool:
@@ -286,14 +259,7 @@ class DefaultConfigs:
         Returns:
             True if profile matches default patterns
         """
-        if not auth_profile_name:
-            return False
-
-        profile_lower = auth_profile_name.lower()
-        for pattern in DefaultConfigs.DEFAULT_AUTH_PROFILE_PATTERNS:
-            if re.match(pattern, profile_lower, re.IGNORECASE):
-                return True
-        return False
+        return _classifier().matches("auth_profile", auth_profile_name)
 
     @staticmethod
     def is_default_decryption_profile(decryption_profile_name: str) -> bool:
@@ -306,14 +272,7 @@ class DefaultConfigs:
         Returns:
             True if profile matches default patterns
         """
-        if not decryption_profile_name:
-            return False
-
-        profile_lower = decryption_profile_name.lower()
-        for pattern in DefaultConfigs.DEFAULT_DECRYPTION_PROFILE_PATTERNS:
-            if re.match(pattern, profile_lower, re.IGNORECASE):
-                return True
-        return False
+        return _classifier().matches("decryption_profile", decryption_profile_name)
 
     @staticmethod
     def is_default_object(
@@ -332,46 +291,7 @@ class DefaultConfigs:
         Returns:
             True if object matches default patterns
         """
-        if not object_name:
-            return False
-
-        # Check if object is associated with a predefined snippet
-        # Applications (and potentially other objects) can be part of predefined snippets
-        if object_data:
-            snippet = object_data.get("snippet", "")
-            if snippet:
-                snippet_lower = snippet.lower()
-                # Check if snippet matches predefined snippet patterns
-                for pattern in DefaultConfigs.DEFAULT_SNIPPET_PATTERNS:
-                    if re.match(pattern, snippet_lower, re.IGNORECASE):
-                        return True
-
-        object_lower = object_name.lower()
-
-        # Check type-specific defaults
-        if (
-            object_type == "address"
-            and object_name in DefaultConfigs.DEFAULT_ADDRESS_OBJECTS
-        ):
-            return True
-
-        if (
-            object_type == "service"
-            and object_name in DefaultConfigs.DEFAULT_SERVICE_OBJECTS
-        ):
-            return True
-
-        if object_type == "application":
-            for pattern in DefaultConfigs.DEFAULT_APPLICATION_PATTERNS:
-                if re.match(pattern, object_lower, re.IGNORECASE):
-                    return True
-
-        # Check general patterns
-        for pattern in DefaultConfigs.DEFAULT_OBJECT_NAME_PATTERNS:
-            if re.match(pattern, object_lower, re.IGNORECASE):
-                return True
-
-        return False
+        return _classifier().is_default_object(object_name, object_type, object_data)
 
     @staticmethod
     def is_default_rule(rule: Dict[str, Any]) -> bool:
@@ -384,36 +304,7 @@ class DefaultConfigs:
         Returns:
             True if rule matches default patterns
         """
-        if not rule:
-            return False
-
-        rule_name = rule.get("name", "")
-        if rule_name:
-            rule_name_lower = rule_name.lower()
-            for pattern in DefaultConfigs.DEFAULT_RULE_PATTERNS["name_patterns"]:
-                if re.match(pattern, rule_name_lower, re.IGNORECASE):
-                    return True
-
-        # Check if rule matches common default rule patterns
-        action = rule.get("action", "").lower()
-        source = rule.get("source", [])
-        destination = rule.get("destination", [])
-        application = rule.get("application", [])
-        service = rule.get("service", [])
-
-        # Check for "any" patterns (common in default rules)
-        has_any_source = not source or "any" in [s.lower() for s in source]
-        has_any_dest = not destination or "any" in [d.lower() for d in destination]
-        has_any_app = not application or "any" in [a.lower() for a in application]
-        has_any_service = not service or "any" in [s.lower() for s in service]
-
-        # Very permissive rules with "any" everywhere are often defaults
-        if has_any_source and has_any_dest and has_any_app and has_any_service:
-            # But only if action is deny or allow (not custom)
-            if action in ["deny", "allow"]:
-                return True
-
-        return False
+        return _classifier().is_default_rule(rule)
 
     @staticmethod
     def get_default_patterns_summary() -> Dict[str, List[str]]:
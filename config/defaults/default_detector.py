@@ -7,6 +7,7 @@ by comparing captured configurations against the default configuration database.
 
 from typing import Dict, Any, List
 from .default_configs import DefaultConfigs
+from .default_classifier import get_default_classifier
 
 
 class DefaultDetector:
@@ -22,6 +23,7 @@ class DefaultDetector:
         """
         self.strict_mode = strict_mode
         self.default_configs = DefaultConfigs()
+        self.classifier = get_default_classifier()
         self.detection_stats = {
             "folders": 0,
             "snippets": 0,
@@ -120,15 +122,9 @@ class DefaultDetector:
         if not rules:
             return rules
 
-        detected_rules = []
-        for rule in rules:
-            is_default = self.default_configs.is_default_rule(rule)
-            if is_default:
-                self.detection_stats["rules"] += 1
-
-            rule["is_default"] = is_default
-            detected_rules.append(rule)
-
+        detected_rules = list(rules)
+        flags = self.classifier.classify_rules(detected_rules)
+        self._mark(detected_rules, flags, "rules")
         return detected_rules
 
     def detect_defaults_in_objects(
@@ -153,32 +149,25 @@ class DefaultDetector:
                 detected_objects[obj_type] = []
                 continue
 
-            detected_list = []
-            for obj in obj_list:
-                obj_name = obj.get("name", "")
-
-                # Map object type for detection
-                detection_type = None
-                if obj_type in ["address_objects", "address_groups"]:
-                    detection_type = "address"
-                elif obj_type in ["service_objects", "service_groups"]:
-                    detection_type = "service"
-                elif obj_type == "applications":
-                    # Applications are user-specified custom apps only
-                    # Don't detect defaults - user has already specified which ones to capture
+            detected_list = list(obj_list)
+
+            # Map object type for detection
+            detection_type = None
+            if obj_type in ["address_objects", "address_groups"]:
+                detection_type = "address"
+            elif obj_type in ["service_objects", "service_groups"]:
+                detection_type = "service"
+            elif obj_type == "applications":
+                # Applications are user-specified custom apps only
+                # Don't detect defaults - user has already specified which ones to capture
+                for obj in detected_list:
                     obj["is_default"] = False
-                    detected_list.append(obj)
-                    continue
-
-                # Pass full object data to check for snippet associations (for non-applications)
-                is_default = self.default_configs.is_default_object(
-                    obj_name, detection_type, object_data=obj
-                )
-                if is_default:
-                    self.detection_stats["objects"] += 1
+                detected_objects[obj_type] = detected_list
+                continue
 
-                obj["is_default"] = is_default
-                detected_list.append(obj)
+            # Full object data is classified to check for snippet associations
+            flags = self.classifier.classify_objects(detected_list, detection_type)
+            self._mark(detected_list, flags, "objects")
 
             detected_objects[obj_type] = detected_list
 
@@ -203,17 +192,11 @@ class DefaultDetector:
         if "authentication_profiles" in profiles:
             auth_profiles = profiles["authentication_profiles"]
             if isinstance(auth_profiles, list):
-                detected_auth = []
-                for profile in auth_profiles:
-                    profile_name = profile.get("name", "")
-                    is_default = self.default_configs.is_default_auth_profile(
-                        profile_name
-                    )
-                    if is_default:
-                        self.detection_stats["auth_profiles"] += 1
-
-                    profile["is_default"] = is_default
-                    detected_auth.append(profile)
+                detected_auth = list(auth_profiles)
+                flags = self.classifier.classify_names(
+                    "auth_profile", [profile.get("name", "") for profile in detected_auth]
+                )
+                self._mark(detected_auth, flags, "auth_profiles")
                 detected_profiles["authentication_profiles"] = detected_auth
 
         # Detect security profiles
@@ -226,17 +209,9 @@ class DefaultDetector:
                         detected_sec[profile_type] = profile_list
                         continue
 
-                    detected_list = []
-                    for profile in profile_list:
-                        profile_name = profile.get("name", "")
-                        is_default = self.default_configs.is_default_profile_name(
-                            profile_name, profile_type
-                        )
-                        if is_default:
-                            self.detection_stats["profiles"] += 1
-
-                        profile["is_default"] = is_default
-                        detected_list.append(profile)
+                    detected_list = list(profile_list)
+                    flags = self.classifier.classify_profiles(detected_list, profile_type)
+                    self._mark(detected_list, flags, "profiles")
 
                     detected_sec[profile_type] = detected_list
                 detected_profiles["security_profiles"] = detected_sec
@@ -245,21 +220,21 @@ class DefaultDetector:
         if "decryption_profiles" in profiles:
             decryption_profiles = profiles["decryption_profiles"]
             if isinstance(decryption_profiles, list):
-                detected_dec = []
-                for profile in decryption_profiles:
-                    profile_name = profile.get("name", "")
-                    is_default = self.default_configs.is_default_decryption_profile(
-                        profile_name
-                    )
-                    if is_default:
-                        self.detection_stats["decryption_profiles"] += 1
-
-                    profile["is_default"] = is_default
-                    detected_dec.append(profile)
+                detected_dec = list(decryption_profiles)
+                flags = self.classifier.classify_names(
+                    "decryption_profile", [profile.get("name", "") for profile in detected_dec]
+                )
+                self._mark(detected_dec, flags, "decryption_profiles")
                 detected_profiles["decryption_profiles"] = detected_dec
 
         return detected_profiles
 
+    def _mark(self, items: List[Dict[str, Any]], flags: List[bool], category: str):
+        """Set is_default on each item from its flag and count the defaults."""
+        for item, is_default in zip(items, flags):
+            item["is_default"] = is_default
+        self.detection_stats[category] += sum(flags)
+
     def detect_defaults_in_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Detect defaults in complete configuration dictionary.
@@ -0,0 +1,92 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+pan-os-python, jinja2, jsonschema and cryptography together add a noticeable
+amount of import time, yet most entry points (a CLI pull, opening the GUI)
+only need them much later, if at all. This module lets code refer to those
+packages at module level without importing them until first use:
+
+- lazy_import(): module proxy that imports on first attribute access
+- module_available(): cheap "is it installed" check that does not import
+
+Example:
+    panos_firewall = lazy_import("panos.firewall")
+    PANOS_AVAILABLE = module_available("panos")
+
+    def connect(host):
+        return panos_firewall.Firewall(host)   # panos imported here
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+import types
+from functools import lru_cache
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes not set on the proxy itself
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Get a proxy for a module that is imported on first attribute access.
+
+    Missing modules raise ImportError at that first access, not here; pair
+    with module_available() where the caller needs to check up front.
+
+    Args:
+        name: Absolute module name (e.g. "panos.firewall")
+
+    Returns:
+        LazyModule proxy
+    """
+    return LazyModule(name)
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """
+    Check whether a top-level package is installed without importing it.
+
+    Args:
+        name: Top-level package name (e.g. "panos")
+    """
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
@@ -8,6 +8,10 @@ Provides centralized logging configuration with support for:
 - Activity logging
 - Performance tracking
 - Log rotation and retention
+- Non-blocking output: records are queued by a QueueHandler and written by a
+  background QueueListener, so file/GUI I/O stays off the request path
+- Optional JSON-lines output for machine-readable performance traces
+  (workflow_id, endpoint, duration_ms, item_type)
 
 Log Level Guidelines:
 - ERROR: Failures that stop the operation
@@ -18,10 +22,19 @@ Log Level Guidelines:
 - DEBUG: Developer-level debugging (stack traces, internal state)
 """
 
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, List
 from datetime import datetime, timedelta
 import shutil
 
@@ -43,6 +56,18 @@ STANDARD_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEBUG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
 SIMPLE_FORMAT = "%(levelname)s - %(message)s"
 
+# Per-operation fields carried into structured (JSON-lines) output.
+# Pass them with extra={...} or bind them with log_context().
+STRUCTURED_FIELDS = ('workflow_id', 'endpoint', 'duration_ms', 'item_type')
+
+# Fields bound to the current thread/task by log_context()
+_log_context: contextvars.ContextVar = contextvars.ContextVar('log_context', default={})
+
+# Background writer state (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_output_handlers: List[logging.Handler] = []
+_pipeline_lock = threading.RLock()
+
 
 def normal(self, message, *args, **kwargs):
     """Log a message at NORMAL level (high-level summaries)."""
@@ -73,6 +98,126 @@ class DebugModeFilter(logging.Filter):
         return _debug_mode
 
 
+class LogContextFilter(logging.Filter):
+    """
+    Copy fields bound with log_context() onto each record.
+
+    Runs in the thread that emits the record (before it is queued), since
+    context variables are not visible from the background writer.
+    """
+    
+    def filter(self, record):
+        """Attach context fields that the record does not set explicitly."""
+        for key, value in _log_context.get().items():
+            if getattr(record, key, None) is None:
+                setattr(record, key, value)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+    
+    Always includes ts, level, logger and message; STRUCTURED_FIELDS are
+    included when present on the record.
+    """
+    
+    def format(self, record):
+        """Format a record as a JSON line."""
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key in STRUCTURED_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+# Formats tracebacks before records are queued (exc_info is not picklable)
+_exception_formatter = logging.Formatter()
+
+
+class ExceptionPreservingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps the formatted traceback on queued records.
+    
+    The stock prepare() folds the traceback into the message and clears
+    exc_info/exc_text. Here the message is merged with its args only and
+    the traceback is kept in exc_text, so listener-side formatters still
+    append it (text) or report it separately (JSON 'exc' field).
+    """
+    
+    def prepare(self, record):
+        """Copy the record with a merged message and its traceback as text."""
+        record = copy.copy(record)
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    Bind structured fields to all records logged inside the block.
+    
+    Context is per thread (and per asyncio task); worker pools started
+    inside the block do not inherit it.
+    
+    Example:
+        with log_context(workflow_id=new_workflow_id('push')):
+            orchestrator.push(...)
+    
+    Args:
+        **fields: Fields to attach (e.g. workflow_id, item_type)
+    """
+    token = bind_log_context(**fields)
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
+def bind_log_context(**fields) -> contextvars.Token:
+    """
+    Bind structured fields for the rest of the current thread/task.
+    
+    Args:
+        **fields: Fields to attach
+        
+    Returns:
+        Token that can be passed to contextvars.ContextVar.reset
+    """
+    merged = dict(_log_context.get())
+    merged.update({k: v for k, v in fields.items() if v is not None})
+    return _log_context.set(merged)
+
+
+def new_workflow_id(prefix: str = "wf") -> str:
+    """
+    Generate a short unique workflow ID.
+    
+    Args:
+        prefix: Workflow kind (e.g. 'pull', 'push')
+        
+    Returns:
+        ID such as 'push-3f9c1a2b'
+    """
+    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+
+
 def rotate_logs(log_file: Path, keep_count: int = 7) -> None:
     """
     Rotate log files on startup.
@@ -156,11 +301,17 @@ def setup_logging(
     console: bool = True,
     debug: bool = False,
     rotate: bool = True,
-    keep_rotations: int = 7
+    keep_rotations: int = 7,
+    async_logging: bool = True,
+    json_log_file: Optional[Path] = None
 ):
     """
     Set up logging configuration.
     
+    With async_logging, the root logger only gets a QueueHandler; the
+    console, file and JSON handlers are driven by a background
+    QueueListener. Call flush_logging() before reading log files back.
+    
     Args:
         level: Log level (logging.ERROR, WARNING, NORMAL, INFO, DEBUG)
         log_file: Optional file path for log output
@@ -168,47 +319,171 @@ def setup_logging(
         debug: Enable debug mode
         rotate: Whether to rotate logs on startup (default: True)
         keep_rotations: Number of log rotations to keep (default: 7)
+        async_logging: Write through a background thread (default: True)
+        json_log_file: Optional file path for JSON-lines structured output
     """
-    global _debug_mode
+    global _debug_mode, _queue_listener, _output_handlers
     _debug_mode = debug
     
-    # Rotate logs before opening new file
-    if log_file and rotate:
-        rotate_logs(log_file, keep_count=keep_rotations)
-    
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG if debug else level)
     
-    # Remove existing handlers
-    root_logger.handlers.clear()
-    
-    # Create formatter
-    if debug:
-        formatter = logging.Formatter(DEBUG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
-    else:
-        formatter = logging.Formatter(STANDARD_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
-    
-    # Add console handler
-    if console:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
-        console_handler.addFilter(DebugModeFilter())
-        root_logger.addHandler(console_handler)
-    
-    # Add file handler
-    if log_file:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG if debug else level)
-        file_handler.setFormatter(formatter)
-        file_handler.addFilter(DebugModeFilter())
-        root_logger.addHandler(file_handler)
+    with _pipeline_lock:
+        # Tear down the previous pipeline (drains queued records first)
+        _stop_listener()
+        for handler in _output_handlers:
+            handler.close()
+        _output_handlers = []
+        
+        # Remove existing handlers
+        root_logger.handlers.clear()
+        
+        # Rotate logs before opening new file
+        if log_file and rotate:
+            rotate_logs(log_file, keep_count=keep_rotations)
+        if json_log_file and rotate:
+            rotate_logs(json_log_file, keep_count=keep_rotations)
+        
+        # Create formatter
+        if debug:
+            formatter = logging.Formatter(DEBUG_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+        else:
+            formatter = logging.Formatter(STANDARD_FORMAT, datefmt='%Y-%m-%d %H:%M:%S')
+        
+        # Add console handler
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(level)
+            console_handler.setFormatter(formatter)
+            console_handler.addFilter(DebugModeFilter())
+            _output_handlers.append(console_handler)
+        
+        # Add file handler
+        if log_file:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setLevel(logging.DEBUG if debug else level)
+            file_handler.setFormatter(formatter)
+            file_handler.addFilter(DebugModeFilter())
+            _output_handlers.append(file_handler)
+        
+        # Add structured JSON-lines handler
+        if json_log_file:
+            json_log_file.parent.mkdir(parents=True, exist_ok=True)
+            json_handler = logging.FileHandler(json_log_file)
+            json_handler.setLevel(logging.DEBUG if debug else level)
+            json_handler.setFormatter(JsonLinesFormatter())
+            json_handler.addFilter(DebugModeFilter())
+            _output_handlers.append(json_handler)
+        
+        if async_logging:
+            log_queue = queue.SimpleQueue()
+            queue_handler = ExceptionPreservingQueueHandler(log_queue)
+            queue_handler.addFilter(LogContextFilter())
+            root_logger.addHandler(queue_handler)
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, *_output_handlers, respect_handler_level=True
+            )
+            _queue_listener.start()
+        else:
+            for handler in _output_handlers:
+                handler.addFilter(LogContextFilter())
+                root_logger.addHandler(handler)
     
     # Log initial message
     level_name = 'DEBUG' if debug else logging.getLevelName(level)
-    root_logger.info(f"Logging initialized (level={level_name}, debug={debug})")
+    root_logger.info(f"Logging initialized (level={level_name}, debug={debug}, async={async_logging})")
+
+
+def _stop_listener():
+    """Stop the background writer, flushing queued records."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def add_log_handler(handler: logging.Handler):
+    """
+    Attach an output handler (e.g. the GUI handler) to the logging pipeline.
+    
+    With the background writer running, the handler is driven by the
+    listener thread instead of the thread that logs; its emit() must be
+    thread-safe.
+    
+    Args:
+        handler: Handler to add
+    """
+    global _queue_listener
+    with _pipeline_lock:
+        if handler in _output_handlers:
+            return
+        _output_handlers.append(handler)
+        if _queue_listener is None:
+            handler.addFilter(LogContextFilter())
+            logging.getLogger().addHandler(handler)
+            return
+        # QueueListener's handler list is fixed while running: restart it
+        log_queue = _queue_listener.queue
+        _queue_listener.stop()
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *_output_handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+
+
+def remove_log_handler(handler: logging.Handler):
+    """
+    Detach a handler previously added with add_log_handler().
+    
+    Args:
+        handler: Handler to remove
+    """
+    global _queue_listener
+    with _pipeline_lock:
+        if handler not in _output_handlers:
+            return
+        _output_handlers.remove(handler)
+        logging.getLogger().removeHandler(handler)
+        if _queue_listener is not None:
+            log_queue = _queue_listener.queue
+            _queue_listener.stop()
+            _queue_listener = logging.handlers.QueueListener(
+                log_queue, *_output_handlers, respect_handler_level=True
+            )
+            _queue_listener.start()
+
+
+def get_output_handlers() -> List[logging.Handler]:
+    """Get the handlers that actually write log output (console, files, GUI)."""
+    return list(_output_handlers)
+
+
+def flush_logging():
+    """Block until all queued records have been written."""
+    with _pipeline_lock:
+        if _queue_listener is not None:
+            # stop() drains the queue; restart on the same queue
+            _queue_listener.stop()
+            _queue_listener.start()
+        for handler in _output_handlers:
+            handler.flush()
+
+
+def shutdown_logging():
+    """Flush and stop the background writer (registered with atexit)."""
+    with _pipeline_lock:
+        _stop_listener()
+        for handler in _output_handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed at exit (same as logging.shutdown)
+                pass
+
+
+atexit.register(shutdown_logging)
 
 
 def enable_debug_mode():
@@ -217,7 +492,7 @@ def enable_debug_mode():
     _debug_mode = True
     logging.getLogger().setLevel(logging.DEBUG)
     # Also update all handlers to DEBUG level
-    for handler in logging.getLogger().handlers:
+    for handler in get_output_handlers():
         handler.setLevel(logging.DEBUG)
     logging.info("Debug mode ENABLED")
 
@@ -243,7 +518,7 @@ def set_log_level(level: int):
         level: Log level (logging.ERROR, WARNING, NORMAL, INFO, DEBUG)
     """
     logging.getLogger().setLevel(level)
-    for handler in logging.getLogger().handlers:
+    for handler in get_output_handlers():
         handler.setLevel(level)
     logging.info(f"Log level changed to {logging.getLevelName(level)}")
 
@@ -328,10 +603,11 @@ class ActivityLogger:
         if summary:
             message += f" - {summary}"
         
+        extra = {'duration_ms': round(duration * 1000, 1) if duration is not None else None}
         if success:
-            self.logger.info(message)
+            self.logger.info(message, extra=extra)
         else:
-            self.logger.error(message)
+            self.logger.error(message, extra=extra)
     
     def log_api_call(
         self,
@@ -349,10 +625,14 @@ class ActivityLogger:
         if duration:
             message += f" ({duration:.3f}s)"
         
+        extra = {
+            'endpoint': f"{method} {endpoint}",
+            'duration_ms': round(duration * 1000, 1) if duration is not None else None,
+        }
         if status_code and status_code >= 400:
-            self.logger.warning(message)
+            self.logger.warning(message, extra=extra)
         else:
-            self.logger.debug(message)
+            self.logger.debug(message, extra=extra)
     
     def log_config_change(
         self,
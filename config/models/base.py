@@ -9,6 +9,8 @@ from typing import Optional, Dict, Any, List, Type
 from abc import ABC, abstractmethod
 import logging
 
+from config.models.fingerprint import content_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +69,50 @@ class ConfigItem(ABC):
         self._parent_cache = None
         self._children_cache = None
     
+    # ========== Content Fingerprint ==========
+    
+    @property
+    def raw_config(self) -> Dict[str, Any]:
+        """Raw configuration dictionary (replacing it invalidates the fingerprint)"""
+        return self._raw_config
+    
+    @raw_config.setter
+    def raw_config(self, value: Dict[str, Any]):
+        self._raw_config = value
+        self._fingerprint: Optional[str] = None
+    
+    @property
+    def fingerprint(self) -> str:
+        """
+        Normalized content fingerprint of this item.
+        
+        Ignores id, location, metadata, internal tracking fields and the order
+        of set-like member lists (see config.models.fingerprint). Computed lazily and cached; call
+        invalidate_fingerprint() after editing raw_config in place.
+        
+        Returns:
+            Hex digest string
+        """
+        if self._fingerprint is None:
+            self._fingerprint = content_fingerprint(self._raw_config)
+        return self._fingerprint
+    
+    def invalidate_fingerprint(self):
+        """Drop the cached fingerprint (call after in-place raw_config edits)"""
+        self._fingerprint = None
+    
+    def content_equals(self, other: 'ConfigItem') -> bool:
+        """
+        Check if another item has the same content (by fingerprint).
+        
+        Args:
+            other: Item to compare with
+            
+        Returns:
+            True if both items have identical normalized content
+        """
+        return self.item_type == other.item_type and self.fingerprint == other.fingerprint
+    
     # ========== Lightweight Properties (Computed) ==========
     
     @property
@@ -302,8 +348,9 @@ class ConfigItem(ABC):
         return []
     
     def clear_dependency_cache(self):
-        """Clear cached dependencies (call after modifications)"""
+        """Clear cached dependencies and fingerprint (call after modifications)"""
         self._dependencies_cache = None
+        self._fingerprint = None
     
     # ========== Modification Methods ==========
     
@@ -320,6 +367,7 @@ class ConfigItem(ABC):
         old_name = self.name
         self.name = new_name
         self.raw_config['name'] = new_name
+        self.invalidate_fingerprint()
         
         logger.info(f"Renamed {self.item_type} from '{old_name}' to '{new_name}'")
     
@@ -508,8 +556,8 @@ class ConfigItem(ABC):
         if local_updated and current_updated:
             return local_updated < current_updated
         
-        # If no timestamps, assume it's current
-        return False
+        # If no timestamps, compare content fingerprints
+        return self.fingerprint != current.fingerprint
     
     @classmethod
     def get(cls, api_client, name: str, location: str, is_snippet: bool = False) -> Optional['ConfigItem']:
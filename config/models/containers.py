@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional, Union, Type
 import logging
 from config.models.base import ConfigItem
 from config.models.cloud import CloudConfig
+from config.models.fingerprint import build_container_tree, build_configuration_tree, diff_configuration_trees
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +123,20 @@ class FolderConfig:
         
         return deps
     
+    def fingerprint_tree(self) -> Dict[str, Any]:
+        """
+        Get the Merkle-style fingerprint subtree for this folder.
+        
+        Returns:
+            {'hash': str, 'types': {item_type: {'hash': str, 'items': {name: fingerprint}}}}
+        """
+        return build_container_tree(self.items)
+    
+    @property
+    def fingerprint(self) -> str:
+        """Get the rolled-up content fingerprint of this folder"""
+        return self.fingerprint_tree()['hash']
+    
     def __len__(self) -> int:
         """Get number of items in this folder"""
         return len(self.items)
@@ -239,6 +254,20 @@ class SnippetConfig:
         
         return deps
     
+    def fingerprint_tree(self) -> Dict[str, Any]:
+        """
+        Get the Merkle-style fingerprint subtree for this snippet.
+        
+        Returns:
+            {'hash': str, 'types': {item_type: {'hash': str, 'items': {name: fingerprint}}}}
+        """
+        return build_container_tree(self.items)
+    
+    @property
+    def fingerprint(self) -> str:
+        """Get the rolled-up content fingerprint of this snippet"""
+        return self.fingerprint_tree()['hash']
+    
     def __len__(self) -> int:
         """Get number of items in this snippet"""
         return len(self.items)
@@ -435,6 +464,20 @@ class InfrastructureConfig:
         _resolve(item)
         return chain
     
+    def fingerprint_tree(self) -> Dict[str, Any]:
+        """
+        Get the Merkle-style fingerprint subtree for infrastructure items.
+        
+        Returns:
+            {'hash': str, 'types': {item_type: {'hash': str, 'items': {name: fingerprint}}}}
+        """
+        return build_container_tree(self.items)
+    
+    @property
+    def fingerprint(self) -> str:
+        """Get the rolled-up content fingerprint of all infrastructure items"""
+        return self.fingerprint_tree()['hash']
+    
     def __len__(self) -> int:
         """Get number of infrastructure items"""
         return len(self.items)
@@ -668,6 +711,38 @@ class Configuration:
         
         return deps
     
+    def fingerprint_tree(self) -> Dict[str, Any]:
+        """
+        Get the Merkle-style fingerprint tree for the whole configuration.
+        
+        Item fingerprints are cached on each ConfigItem, so rebuilding the
+        tree after a few changes only re-hashes the changed items.
+        
+        Returns:
+            {'hash': str, 'folders': {...}, 'snippets': {...}, 'infrastructure': {...}}
+        """
+        return build_configuration_tree(self)
+    
+    @property
+    def fingerprint(self) -> str:
+        """Get the root content fingerprint of this configuration"""
+        return self.fingerprint_tree()['hash']
+    
+    def diff(self, other: 'Configuration') -> Dict[str, List[str]]:
+        """
+        Compare this configuration (baseline) with another one.
+        
+        Only subtrees whose fingerprints differ are walked.
+        
+        Args:
+            other: Configuration to compare against
+            
+        Returns:
+            Dict with 'added', 'removed', 'modified' item paths
+            (e.g. 'folder:Shared/address_object/web') and 'changed_containers'
+        """
+        return diff_configuration_trees(self.fingerprint_tree(), other.fingerprint_tree())
+    
     def save_to_file(
         self, 
         file_path: str, 
@@ -683,7 +758,8 @@ class Configuration:
         to a JSON file. If password is provided, encrypts the file using AES-256.
         
         Args:
-            file_path: Path to save configuration file (.json, .json.gz, or .pac)
+            file_path: Path to save configuration file (.json, .json.gz, .pac, or .pacsnap
+                for a compressed snapshot, see config.storage.snapshot)
             compress: Whether to compress with gzip (default: False, ignored if encrypted)
             description: Optional description to include in metadata
             password: If provided, encrypt the file with this password
@@ -697,6 +773,7 @@ class Configuration:
         import gzip
         from pathlib import Path
         from datetime import datetime
+        from config.storage.snapshot import SNAPSHOT_EXTENSION, write_snapshot
         
         logger.info(f"Saving configuration to {file_path}")
         logger.debug(f"Compress: {compress}, Description: {description}, Encrypted: {bool(password)}")
@@ -731,6 +808,8 @@ class Configuration:
                 "modified_at": self.modified_at,
                 "description": description
             },
+            # Filled in below; kept ahead of the items so listings only read the header
+            "stats": {},
             "push_history": self.push_history,
             "folders": {},
             "snippets": {},
@@ -738,7 +817,6 @@ class Configuration:
                 "items": []
             },
             "cloud": None,
-            "stats": {}
         }
         
         logger.debug(f"Serializing {len(self.folders)} folders")
@@ -798,8 +876,8 @@ class Configuration:
             logger.debug(f"Writing to temporary file: {temp_path}")
             
             if password:
-                # Encrypted save
-                from config.utils.encryption import encrypt_config
+                # Encrypted save, streamed in chunks (v2 format)
+                from config.utils.encryption import encrypt_config_stream
                 
                 # Prepare metadata for encryption wrapper
                 enc_metadata = {
@@ -814,12 +892,15 @@ class Configuration:
                     "snippets_count": config_dict["stats"]["snippets_count"],
                 }
                 
-                encrypted = encrypt_config(config_dict, password, enc_metadata)
-                
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(encrypted, f, indent=2)
+                with open(temp_path, 'wb') as f:
+                    encrypt_config_stream(config_dict, password, f, enc_metadata, file_path=file_path)
                 logger.debug("Wrote encrypted file")
                 
+            elif file_path.endswith(SNAPSHOT_EXTENSION):
+                with open(temp_path, 'wb') as f:
+                    stats = write_snapshot(config_dict, f)
+                logger.debug(f"Wrote snapshot ({stats['batches']} batches, {stats['codec']})")
+                
             elif compress or file_path.endswith('.gz'):
                 with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
                     json.dump(config_dict, f, indent=2, sort_keys=False)
@@ -857,7 +938,7 @@ class Configuration:
         If the file is encrypted, a password must be provided.
         
         Args:
-            file_path: Path to configuration file (.json, .json.gz, or .pac)
+            file_path: Path to configuration file (.json, .json.gz, .pac, or .pacsnap)
             strict: If True, fail on any validation error. If False, allow partial load (default: True)
             on_error: How to handle errors: "fail" (raise), "warn" (log warning), "skip" (silent) (default: "fail")
             password: Password for encrypted files (required if file is encrypted)
@@ -883,10 +964,19 @@ class Configuration:
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
         
+        from config.utils.encryption import is_stream_encrypted_file
+        from config.storage.snapshot import is_snapshot_file, read_snapshot
+        
         # Read file (handle compressed, uncompressed, and encrypted)
         try:
             logger.debug("Reading file")
-            if file_path.endswith('.gz'):
+            if is_stream_encrypted_file(file_path):
+                # v2 encrypted - decrypted below, straight from the file
+                config_dict = {'format': 'pac_encrypted_v2'}
+            elif is_snapshot_file(file_path):
+                config_dict = read_snapshot(file_path)
+                logger.debug("Loaded snapshot file")
+            elif file_path.endswith('.gz'):
                 with gzip.open(file_path_obj, 'rt', encoding='utf-8') as f:
                     config_dict = json.load(f)
                 logger.debug("Loaded compressed file")
@@ -899,14 +989,18 @@ class Configuration:
             raise IOError(f"Failed to read configuration file {file_path}: {e}") from e
         
         # Check if file is encrypted
-        if config_dict.get('format') == 'pac_encrypted_v1':
+        if config_dict.get('format') in ('pac_encrypted_v1', 'pac_encrypted_v2'):
             logger.info("File is encrypted, decrypting...")
             if not password:
                 raise ValueError("File is encrypted but no password provided")
             
-            from config.utils.encryption import decrypt_config
+            from config.utils.encryption import decrypt_config, decrypt_config_stream
             try:
-                config_dict = decrypt_config(config_dict, password)
+                if config_dict['format'] == 'pac_encrypted_v2':
+                    with open(file_path_obj, 'rb') as f:
+                        config_dict = decrypt_config_stream(f, password, file_path=file_path)
+                else:
+                    config_dict = decrypt_config(config_dict, password, file_path=file_path)
                 logger.debug("Decrypted successfully")
             except ValueError as e:
                 logger.error(f"Decryption failed: {e}")
@@ -0,0 +1,237 @@
+"""
+Content fingerprints for configuration items and containers.
+
+Provides a stable, normalized content hash for configuration dictionaries
+and Merkle-style rollups so that two configurations can be compared by
+walking only the subtrees whose hashes differ:
+
+    Configuration
+    ├── folders/<name>/<item_type>/<item_name>
+    ├── snippets/<name>/<item_type>/<item_name>
+    └── infrastructure/<item_type>/<item_name>
+
+Fingerprints ignore fields that do not describe the item's content: the API
+assigned ID, location (folder/snippet), metadata/timestamps, our internal
+tracking fields, underscore-prefixed fields, and the order of set-like member
+lists (UNORDERED_LIST_FIELDS, unordered on the API side). All other lists keep
+their order: e.g. IKE/IPsec crypto proposals are tried in list order.
+"""
+
+from typing import Dict, Any, List, Iterable, Tuple, Optional
+import hashlib
+import json
+
+# Fields that never take part in a content fingerprint
+FINGERPRINT_IGNORED_FIELDS = frozenset({
+    'id', 'folder', 'snippet', 'device',
+    'metadata', 'created', 'updated', 'created_by', 'updated_by',
+    'created_at', 'modified_at',
+    'is_default', 'push_strategy', 'item_type',
+    'deleted', 'delete_success',
+})
+
+# Set-like member lists whose order carries no meaning
+UNORDERED_LIST_FIELDS = frozenset({
+    'members', 'static', 'tag',
+    'source', 'destination', 'from', 'to',
+    'source_user', 'source_hip', 'destination_hip',
+    'application', 'service', 'category',
+})
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def normalize_for_fingerprint(value: Any, key: Optional[str] = None) -> Any:
+    """
+    Normalize a value for fingerprinting.
+
+    Dicts drop ignored and underscore-prefixed keys. Lists of scalars under
+    an UNORDERED_LIST_FIELDS key are sorted; every other list keeps its order
+    (e.g. rule entries, crypto proposal lists).
+
+    Args:
+        value: Value to normalize (dict, list or scalar)
+        key: Dict key the value is stored under, if any
+
+    Returns:
+        Normalized value
+    """
+    if isinstance(value, dict):
+        return {
+            k: normalize_for_fingerprint(v, k)
+            for k, v in value.items()
+            if k not in FINGERPRINT_IGNORED_FIELDS and not str(k).startswith('_')
+        }
+    if isinstance(value, list):
+        normalized = [normalize_for_fingerprint(v) for v in value]
+        if key in UNORDERED_LIST_FIELDS and all(isinstance(v, _SCALAR_TYPES) for v in normalized):
+            return sorted(normalized, key=lambda v: (type(v).__name__, str(v)))
+        return normalized
+    return value
+
+
+def content_fingerprint(data: Dict[str, Any]) -> str:
+    """
+    Compute the normalized content fingerprint of an item dictionary.
+
+    Args:
+        data: Item dictionary (raw_config, ConfigItem.to_dict() or API response)
+
+    Returns:
+        Hex digest (32 chars)
+    """
+    encoded = json.dumps(
+        normalize_for_fingerprint(data),
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str,
+    )
+    return hashlib.blake2b(encoded.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def rollup(entries: Iterable[Tuple[str, str]]) -> str:
+    """
+    Combine child (key, fingerprint) pairs into a parent fingerprint.
+
+    The result is independent of the order of entries.
+
+    Args:
+        entries: Iterable of (key, fingerprint) pairs
+
+    Returns:
+        Hex digest (32 chars)
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for key, fp in sorted(entries):
+        h.update(key.encode('utf-8'))
+        h.update(b'\x00')
+        h.update(fp.encode('ascii'))
+        h.update(b'\x01')
+    return h.hexdigest()
+
+
+def build_container_tree(items: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Build the fingerprint subtree for a container (folder, snippet, infrastructure).
+
+    Args:
+        items: ConfigItem instances in the container
+
+    Returns:
+        {'hash': str, 'types': {item_type: {'hash': str, 'items': {name: fingerprint}}}}
+    """
+    by_type: Dict[str, Dict[str, str]] = {}
+    for item in items:
+        type_items = by_type.setdefault(item.item_type or '', {})
+        name = item.name
+        if name in type_items:
+            # Duplicate names within a type: keep both contributions
+            type_items[name] = rollup([('0', type_items[name]), ('1', item.fingerprint)])
+        else:
+            type_items[name] = item.fingerprint
+
+    types = {
+        item_type: {'hash': rollup(type_items.items()), 'items': type_items}
+        for item_type, type_items in by_type.items()
+    }
+    return {
+        'hash': rollup((t, node['hash']) for t, node in types.items()),
+        'types': types,
+    }
+
+
+def build_configuration_tree(config: Any) -> Dict[str, Any]:
+    """
+    Build the full fingerprint tree for a Configuration.
+
+    Args:
+        config: Configuration instance
+
+    Returns:
+        {'hash': str, 'folders': {...}, 'snippets': {...}, 'infrastructure': {...}}
+    """
+    folders = {name: build_container_tree(f.items) for name, f in config.folders.items()}
+    snippets = {name: build_container_tree(s.items) for name, s in config.snippets.items()}
+    infrastructure = build_container_tree(config.infrastructure.items)
+
+    root = rollup([
+        ('folders', rollup((n, node['hash']) for n, node in folders.items())),
+        ('snippets', rollup((n, node['hash']) for n, node in snippets.items())),
+        ('infrastructure', infrastructure['hash']),
+    ])
+    return {
+        'hash': root,
+        'folders': folders,
+        'snippets': snippets,
+        'infrastructure': infrastructure,
+    }
+
+
+def _diff_types(
+    prefix: str,
+    old: Optional[Dict[str, Any]],
+    new: Optional[Dict[str, Any]],
+    result: Dict[str, List[str]]
+) -> None:
+    """Diff two container subtrees, descending only into changed types."""
+    old_types = old['types'] if old else {}
+    new_types = new['types'] if new else {}
+
+    for item_type in old_types.keys() | new_types.keys():
+        old_node = old_types.get(item_type)
+        new_node = new_types.get(item_type)
+        if old_node and new_node and old_node['hash'] == new_node['hash']:
+            continue
+
+        old_items = old_node['items'] if old_node else {}
+        new_items = new_node['items'] if new_node else {}
+        for name in old_items.keys() | new_items.keys():
+            path = f"{prefix}/{item_type}/{name}"
+            if name not in old_items:
+                result['added'].append(path)
+            elif name not in new_items:
+                result['removed'].append(path)
+            elif old_items[name] != new_items[name]:
+                result['modified'].append(path)
+
+
+def diff_configuration_trees(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Compare two configuration fingerprint trees.
+
+    Unchanged subtrees are skipped by hash, so comparing two large
+    configurations with few differences only touches the changed branches.
+
+    Args:
+        old: Tree from build_configuration_tree() (baseline)
+        new: Tree from build_configuration_tree() (current)
+
+    Returns:
+        Dict with 'added', 'removed', 'modified' lists of paths
+        (e.g. 'folder:Shared/address_object/web-server') and 'changed_containers'
+    """
+    result: Dict[str, List[str]] = {
+        'added': [], 'removed': [], 'modified': [], 'changed_containers': [],
+    }
+    if old['hash'] == new['hash']:
+        return result
+
+    for kind in ('folders', 'snippets'):
+        label = kind[:-1]
+        old_containers = old.get(kind, {})
+        new_containers = new.get(kind, {})
+        for name in old_containers.keys() | new_containers.keys():
+            old_node = old_containers.get(name)
+            new_node = new_containers.get(name)
+            if old_node and new_node and old_node['hash'] == new_node['hash']:
+                continue
+            result['changed_containers'].append(f"{label}:{name}")
+            _diff_types(f"{label}:{name}", old_node, new_node, result)
+
+    if old['infrastructure']['hash'] != new['infrastructure']['hash']:
+        result['changed_containers'].append('infrastructure')
+        _diff_types('infrastructure', old['infrastructure'], new['infrastructure'], result)
+
+    for key in result:
+        result[key].sort()
+    return result
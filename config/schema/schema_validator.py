@@ -3,20 +3,35 @@ JSON Schema validation for Prisma Access configuration files.
 
 This module provides validation functions using the jsonschema library
 for comprehensive validation of configuration files.
+
+Schemas are compiled once per process (get_validator()); when the optional
+fastjsonschema package is installed it is used as a compiled fast path and
+jsonschema only runs to collect the full error list of an invalid document.
+IncrementalValidator re-validates only the sections of a document (each
+folder, each snippet, each top-level section) whose content changed since
+its previous run.
 """
 
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Tuple, Optional
 
-try:
-    from jsonschema import Draft7Validator
-
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:
-    JSONSCHEMA_AVAILABLE = False
+from config.lazy_import import lazy_import, module_available
 
 from .config_schema_v2 import CONFIG_SCHEMA_V2, validate_config_structure
 
+# jsonschema / fastjsonschema are imported on the first full validation
+JSONSCHEMA_AVAILABLE = module_available("jsonschema")
+FASTJSONSCHEMA_AVAILABLE = module_available("fastjsonschema")
+jsonschema = lazy_import("jsonschema")
+fastjsonschema = lazy_import("fastjsonschema")
+
+# Incremental validators kept for recently saved/loaded files
+MAX_INCREMENTAL_VALIDATORS = 16
+
 
 class SchemaValidationError(Exception):
     """Custom exception for schema validation errors."""
@@ -24,6 +39,125 @@ class SchemaValidationError(Exception):
     pass
 
 
+# ========== Compiled Validators ==========
+
+
+def _schema_formats(schema: Any, found: Optional[set] = None) -> set:
+    """Collect the "format" keywords used anywhere in a schema."""
+    found = set() if found is None else found
+    if isinstance(schema, dict):
+        if isinstance(schema.get("format"), str):
+            found.add(schema["format"])
+        for value in schema.values():
+            _schema_formats(value, found)
+    elif isinstance(schema, list):
+        for value in schema:
+            _schema_formats(value, found)
+    return found
+
+
+class CompiledValidator:
+    """A schema compiled once and reused for every validation."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Initialize the validator (compilation happens on first use).
+
+        Args:
+            schema: JSON schema (Draft 7)
+        """
+        self.schema = schema
+        self._lock = threading.Lock()
+        self._fast = None
+        self._fast_failed = not FASTJSONSCHEMA_AVAILABLE
+        self._draft7 = None
+
+    def _fast_validator(self):
+        if self._fast is None and not self._fast_failed:
+            with self._lock:
+                if self._fast is None and not self._fast_failed:
+                    try:
+                        # Match Draft7Validator defaults: formats are not
+                        # checked and defaults are never written into the data
+                        ignored = {name: (lambda value: True) for name in _schema_formats(self.schema)}
+                        self._fast = fastjsonschema.compile(self.schema, formats=ignored, use_default=False)
+                    except Exception:
+                        self._fast_failed = True
+        return self._fast
+
+    def _draft7_validator(self):
+        if self._draft7 is None:
+            with self._lock:
+                if self._draft7 is None:
+                    jsonschema.Draft7Validator.check_schema(self.schema)
+                    self._draft7 = jsonschema.Draft7Validator(self.schema)
+        return self._draft7
+
+    def errors(self, instance: Any) -> List[Tuple[Tuple[Any, ...], str]]:
+        """
+        Validate an instance.
+
+        Returns:
+            List of (path, message) tuples; empty if the instance is valid
+            (or if no validation library is installed)
+        """
+        fast = self._fast_validator()
+        if fast is not None:
+            try:
+                fast(instance)
+                return []
+            except fastjsonschema.JsonSchemaValueException as e:
+                if not JSONSCHEMA_AVAILABLE:
+                    return [(tuple(e.path[1:]), e.message)]
+
+        if not JSONSCHEMA_AVAILABLE:
+            return []
+        return [(tuple(error.path), error.message) for error in self._draft7_validator().iter_errors(instance)]
+
+    def is_valid(self, instance: Any) -> bool:
+        """Check if an instance is valid."""
+        return not self.errors(instance)
+
+    def fast_is_valid(self, instance: Any) -> Optional[bool]:
+        """Check validity with the compiled fast path only (None if unavailable)."""
+        fast = self._fast_validator()
+        if fast is None:
+            return None
+        try:
+            fast(instance)
+            return True
+        except fastjsonschema.JsonSchemaValueException:
+            return False
+
+
+_validators: Dict[int, CompiledValidator] = {}
+_validators_lock = threading.Lock()
+
+
+def get_validator(schema: Optional[Dict[str, Any]] = None) -> CompiledValidator:
+    """
+    Get the compiled validator for a schema (compiled once per process).
+
+    Validators are cached by schema object identity, so pass the same dict
+    (e.g. CONFIG_SCHEMA_V2 or one of its sub-schemas) rather than a copy.
+
+    Args:
+        schema: JSON schema (defaults to CONFIG_SCHEMA_V2)
+    """
+    if schema is None:
+        schema = CONFIG_SCHEMA_V2
+    with _validators_lock:
+        validator = _validators.get(id(schema))
+        if validator is None or validator.schema is not schema:
+            validator = CompiledValidator(schema)
+            _validators[id(schema)] = validator
+        return validator
+
+
+def _format_errors(errors: List[Tuple[Tuple[Any, ...], str]]) -> List[str]:
+    return [f"{' -> '.join(str(p) for p in path)}: {message}" for path, message in errors]
+
+
 def validate_config(
     config: Dict[str, Any], schema: Optional[Dict[str, Any]] = None
 ) -> Tuple[bool, List[str]]:
@@ -49,16 +183,12 @@ def validate_config(
         return False, errors
 
     # Full JSON Schema validation if available
-    if JSONSCHEMA_AVAILABLE:
+    if JSONSCHEMA_AVAILABLE or FASTJSONSCHEMA_AVAILABLE:
         try:
-            validator = Draft7Validator(schema)
-            validation_errors = list(validator.iter_errors(config))
+            validation_errors = get_validator(schema).errors(config)
 
             if validation_errors:
-                for error in validation_errors:
-                    error_path = " -> ".join(str(p) for p in error.path)
-                    errors.append(f"{error_path}: {error.message}")
-                return False, errors
+                return False, _format_errors(validation_errors)
 
             return True, []
 
@@ -70,10 +200,193 @@ def validate_config(
         return True, []
 
 
+# ========== Incremental Validation ==========
+
+
+def _section_digest(value: Any) -> str:
+    # Key order is not normalized: a reordered section is simply re-validated
+    encoded = json.dumps(value, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class IncrementalValidator:
+    """
+    Validates a configuration document section by section, skipping
+    sections whose content has not changed since the previous run.
+
+    When fastjsonschema is installed a valid document is checked in one
+    compiled pass instead; sections are then only used for the errors.
+
+    Sections are the root object itself (required keys), each top-level
+    section (metadata, infrastructure, ...), the security_policies shell,
+    and every folder and snippet. Changes are detected by content hash, so
+    callers do not have to report what they edited.
+
+    Example:
+        validator = IncrementalValidator()
+        validator.validate(config)        # validates everything
+        config["security_policies"]["folders"][0]["name"] = "Renamed"
+        validator.validate(config)        # validates only that folder
+    """
+
+    def __init__(self, schema: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the validator.
+
+        Args:
+            schema: Configuration schema (defaults to CONFIG_SCHEMA_V2)
+        """
+        self.schema = schema if schema is not None else CONFIG_SCHEMA_V2
+        self._lock = threading.Lock()
+        self._results: Dict[Tuple[Any, ...], Tuple[str, List[str]]] = {}
+        # Owned by this instance, not registered with get_validator(): the
+        # dict is new per instance, so caching it by id would only grow
+        self._root_validator = CompiledValidator({k: v for k, v in self.schema.items() if k != "properties"})
+        self._file_result: Optional[Tuple[Tuple[int, int], Tuple[bool, List[str]]]] = None
+        self.last_validated = 0
+        self.last_skipped = 0
+
+    def reset(self):
+        """Forget all previous results (the next run validates everything)."""
+        with self._lock:
+            self._results.clear()
+            self._file_result = None
+
+    def _sections(self, config: Dict[str, Any]):
+        """Yield (key, path prefix, validator, value) for each section."""
+        properties = self.schema.get("properties", {})
+        # The root schema only constrains the keys, so only they are hashed
+        yield ("root",), (), self._root_validator, dict.fromkeys(config)
+
+        for name, value in config.items():
+            subschema = properties.get(name)
+            if subschema is None:
+                continue
+            if name != "security_policies" or not isinstance(value, dict):
+                yield ("property", name), (name,), get_validator(subschema), value
+                continue
+
+            # Folders and snippets are validated one by one
+            policy_properties = subschema.get("properties", {})
+            shell = dict(value)
+            for list_name in ("folders", "snippets"):
+                entries = value.get(list_name)
+                entry_schema = policy_properties.get(list_name, {}).get("items")
+                if not isinstance(entries, list) or entry_schema is None:
+                    continue
+                shell[list_name] = []
+                for index, entry in enumerate(entries):
+                    yield (list_name, index), (name, list_name, index), get_validator(entry_schema), entry
+            yield ("property", name), (name,), get_validator(subschema), shell
+
+    def validate(self, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        """
+        Validate a configuration, re-checking only changed sections.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Tuple of (is_valid, list_of_errors), as validate_config()
+        """
+        is_valid, error_msg = validate_config_structure(config)
+        if not is_valid:
+            return False, [error_msg]
+        if not (JSONSCHEMA_AVAILABLE or FASTJSONSCHEMA_AVAILABLE):
+            return True, []
+
+        # A compiled fastjsonschema pass over the whole document is quicker
+        # than hashing its sections; sections are only needed for the errors
+        try:
+            if get_validator(self.schema).fast_is_valid(config):
+                self.last_validated, self.last_skipped = 1, 0
+                return True, []
+        except Exception:
+            pass
+
+        errors: List[str] = []
+        validated = skipped = 0
+        with self._lock:
+            results = {}
+            try:
+                for key, prefix, section_validator, value in self._sections(config):
+                    digest = _section_digest(value)
+                    previous = self._results.get(key)
+                    if previous is not None and previous[0] == digest:
+                        section_errors = previous[1]
+                        skipped += 1
+                    else:
+                        section_errors = _format_errors(
+                            [(prefix + path, message) for path, message in section_validator.errors(value)]
+                        )
+                        validated += 1
+                    results[key] = (digest, section_errors)
+                    errors.extend(section_errors)
+            except Exception as e:
+                self._results.clear()
+                return False, [f"Schema validation error: {str(e)}"]
+
+            # Sections that no longer exist are dropped
+            self._results = results
+            self.last_validated, self.last_skipped = validated, skipped
+
+        return not errors, errors
+
+    def validate_file(self, file_path: str) -> Tuple[bool, List[str]]:
+        """
+        Validate a configuration JSON file.
+
+        The file is not read again while its size and mtime are unchanged.
+
+        Raises:
+            OSError, json.JSONDecodeError: If the file cannot be read or parsed
+        """
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_result
+        if cached is not None and cached[0] == signature:
+            return cached[1][0], list(cached[1][1])
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        result = self.validate(config)
+        self._file_result = (signature, result)
+        return result[0], list(result[1])
+
+
+_incremental: "OrderedDict[str, IncrementalValidator]" = OrderedDict()
+_incremental_lock = threading.Lock()
+
+
+def get_incremental_validator(key: str) -> IncrementalValidator:
+    """
+    Get the incremental validator for a document (e.g. a file path).
+
+    Saving and re-loading the same file then only validates what changed.
+
+    Args:
+        key: Document key; file paths are normalized with realpath
+    """
+    key = os.path.realpath(key) if key else key
+    with _incremental_lock:
+        validator = _incremental.get(key)
+        if validator is None:
+            validator = IncrementalValidator()
+            _incremental[key] = validator
+            while len(_incremental) > MAX_INCREMENTAL_VALIDATORS:
+                _incremental.popitem(last=False)
+        else:
+            _incremental.move_to_end(key)
+        return validator
+
+
 def validate_config_file(file_path: str) -> Tuple[bool, List[str]]:
     """
     Validate a configuration JSON file.
 
+    Unchanged files are not read again, and a changed file only has its
+    changed sections re-validated (see IncrementalValidator).
+
     Args:
         file_path: Path to JSON configuration file
 
@@ -81,10 +394,7 @@ def validate_config_file(file_path: str) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, list_of_errors)
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-
-        return validate_config(config)
+        return get_incremental_validator(file_path).validate_file(file_path)
 
     except json.JSONDecodeError as e:
         return False, [f"Invalid JSON: {str(e)}"]
@@ -0,0 +1,253 @@
+"""
+Directory-level metadata index for saved configuration files.
+
+Listing saved configurations used to open (and often fully parse) every
+file. ConfigIndex keeps one small JSON file per directory with the header
+information of each configuration (encrypted flag and metadata), keyed by
+file name and validated by size and mtime. A listing is then a single
+directory scan; only files that are new or changed since the last listing
+have their header read.
+
+Example:
+    for entry in ConfigIndex(saved_dir).entries():
+        print(entry["path"], entry["metadata"].get("name"))
+"""
+
+import copy
+import fnmatch
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Callable, Iterable, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = ".pa_config_index"
+INDEX_VERSION = 1
+
+
+def read_index_entry(file_path: str) -> Dict[str, Any]:
+    """
+    Read the index entry for a configuration file from its header.
+
+    Handles .pac/.json files written by config.utils.encryption and
+    Configuration.save_to_file, and the binary salt+Fernet files written by
+    json_storage (whose metadata is encrypted).
+
+    Returns:
+        Dict with 'encrypted' and 'metadata'
+    """
+    with open(file_path, 'rb') as f:
+        first_bytes = f.read(16)
+    if not first_bytes.lstrip().startswith(b'{'):
+        return {"encrypted": True, "metadata": {}}
+
+    from config.utils.encryption import get_config_metadata
+
+    metadata = get_config_metadata(file_path) or {}
+    encrypted = bool(metadata.pop("encrypted", False))
+    return {"encrypted": encrypted, "metadata": metadata}
+
+
+class ConfigIndex:
+    """Cached header metadata of the configuration files in one directory."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        patterns: Iterable[str] = ("*.pac", "*.json"),
+        reader: Optional[Callable[[str], Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            directory: Directory holding configuration files
+            patterns: File name patterns to include
+            reader: Callable returning the entry for a file (default read_index_entry)
+        """
+        self.directory = Path(directory)
+        self.patterns = tuple(patterns)
+        self.reader = reader or read_index_entry
+        self.index_path = self.directory / INDEX_FILE
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # ========== Queries ==========
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        List all configuration files with their metadata.
+
+        Returns:
+            List of dicts with 'file', 'path', 'size', 'modified' (timestamp),
+            'encrypted' and 'metadata', newest first
+        """
+        with self._lock:
+            entries = self._load()
+            seen = set()
+            dirty = False
+
+            try:
+                scan = list(os.scandir(self.directory))
+            except FileNotFoundError:
+                scan = []
+
+            for item in scan:
+                if item.name == INDEX_FILE or not self._matches(item.name):
+                    continue
+                try:
+                    if not item.is_file():
+                        continue
+                    stat = item.stat()
+                except OSError:
+                    continue
+                seen.add(item.name)
+
+                entry = entries.get(item.name)
+                if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                    continue
+                entry = self._read(item.path, stat)
+                if entry is not None:
+                    entries[item.name] = entry
+                    dirty = True
+
+            for name in [name for name in entries if name not in seen]:
+                del entries[name]
+                dirty = True
+
+            if dirty:
+                self._save()
+
+            result = [self._public(name, entry) for name, entry in entries.items() if name in seen]
+
+        result.sort(key=lambda e: e["modified"], reverse=True)
+        return result
+
+    def get(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Get the entry for one file (refreshing it if changed)."""
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(path.name)
+            if not entry or entry.get("size") != stat.st_size or entry.get("mtime_ns") != stat.st_mtime_ns:
+                entry = self._read(str(path), stat)
+                if entry is None:
+                    return None
+                entries[path.name] = entry
+                self._save()
+            return self._public(path.name, entry)
+
+    # ========== Updates ==========
+
+    def update(
+        self,
+        file_path: Union[str, Path],
+        encrypted: Optional[bool] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Record a file that was just written.
+
+        Args:
+            file_path: Configuration file
+            encrypted: Encrypted flag (read from the file if None)
+            metadata: Metadata to index (read from the file if None)
+        """
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        with self._lock:
+            entries = self._load()
+            if encrypted is None or metadata is None:
+                entry = self._read(str(path), stat)
+                if entry is None:
+                    return
+                if encrypted is not None:
+                    entry["encrypted"] = encrypted
+                if metadata is not None:
+                    entry["metadata"] = dict(metadata)
+            else:
+                entry = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "encrypted": encrypted,
+                    "metadata": dict(metadata),
+                }
+            entries[path.name] = entry
+            self._save()
+
+    def remove(self, file_path: Union[str, Path]):
+        """Drop a deleted file from the index."""
+        with self._lock:
+            if self._load().pop(Path(file_path).name, None) is not None:
+                self._save()
+
+    def rename(self, old_path: Union[str, Path], new_path: Union[str, Path]):
+        """Move an entry after a file was renamed (mtime is preserved by rename)."""
+        with self._lock:
+            entries = self._load()
+            entry = entries.pop(Path(old_path).name, None)
+            if entry is not None:
+                entries[Path(new_path).name] = entry
+                self._save()
+
+    # ========== Internals ==========
+
+    def _matches(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def _read(self, file_path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        try:
+            entry = self.reader(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to index {file_path}: {e}")
+            return None
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "encrypted": bool(entry.get("encrypted")),
+            "metadata": entry.get("metadata") or {},
+        }
+
+    def _public(self, name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "file": name,
+            "path": str(self.directory / name),
+            "size": entry["size"],
+            "modified": entry["mtime_ns"] / 1e9,
+            "encrypted": entry["encrypted"],
+            "metadata": copy.deepcopy(entry["metadata"]),
+        }
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the index file once (caller holds the lock)."""
+        if self._entries is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION and isinstance(data.get("entries"), dict):
+                    self._entries = data["entries"]
+                else:
+                    self._entries = {}
+            except (FileNotFoundError, json.JSONDecodeError, OSError, AttributeError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Write the index file atomically (caller holds the lock)."""
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "entries": self._entries}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.debug(f"Could not write config index {self.index_path}: {e}")
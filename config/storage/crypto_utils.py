@@ -7,11 +7,18 @@ for securing configuration files.
 
 import os
 import base64
-from typing import Tuple
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
+from typing import Tuple, TYPE_CHECKING
+
+from config.lazy_import import lazy_import
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+# cryptography is imported on first key derivation, not at module import
+fernet = lazy_import("cryptography.fernet")
+pbkdf2 = lazy_import("cryptography.hazmat.primitives.kdf.pbkdf2")
+hashes = lazy_import("cryptography.hazmat.primitives.hashes")
+backends = lazy_import("cryptography.hazmat.backends")
 
 
 # NIST SP 800-132 recommendations (2024)
@@ -24,7 +31,7 @@ CRYPTO_VERSION = b"PBKDF2v1"
 VERSION_SIZE = 8
 
 
-def derive_key_secure(password: str, salt: bytes = None) -> Tuple[Fernet, bytes]:
+def derive_key_secure(password: str, salt: bytes = None) -> Tuple["Fernet", bytes]:
     """
     Derive a Fernet key from a password using PBKDF2-HMAC-SHA256.
 
@@ -48,19 +55,38 @@ def derive_key_secure(password: str, salt: bytes = None) -> Tuple[Fernet, bytes]
     if not isinstance(salt, bytes) or len(salt) != SALT_SIZE:
         raise ValueError(f"Salt must be {SALT_SIZE} bytes")
 
-    kdf = PBKDF2HMAC(
+    key = base64.urlsafe_b64encode(derive_key_bytes(password, salt))
+    return fernet.Fernet(key), salt
+
+
+def derive_key_bytes(password: str, salt: bytes, iterations: int = PBKDF2_ITERATIONS) -> bytes:
+    """
+    Derive raw key material with PBKDF2-HMAC-SHA256.
+
+    Args:
+        password: Password string
+        salt: Salt bytes
+        iterations: PBKDF2 iteration count
+
+    Returns:
+        KEY_SIZE bytes of key material
+    """
+    kdf = pbkdf2.PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=KEY_SIZE,
         salt=salt,
-        iterations=PBKDF2_ITERATIONS,
-        backend=default_backend(),
+        iterations=iterations,
+        backend=backends.default_backend(),
     )
+    return kdf.derive(password.encode("utf-8"))
+
 
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode("utf-8")))
-    return Fernet(key), salt
+def fernet_from_key_bytes(key: bytes) -> "Fernet":
+    """Build a Fernet cipher from raw KEY_SIZE key material."""
+    return fernet.Fernet(base64.urlsafe_b64encode(bytes(key)))
 
 
-def encrypt_data(data: bytes, cipher: Fernet, include_version: bool = True) -> bytes:
+def encrypt_data(data: bytes, cipher: "Fernet", include_version: bool = True) -> bytes:
     """
     Encrypt data with optional version marker.
 
@@ -80,7 +106,7 @@ def encrypt_data(data: bytes, cipher: Fernet, include_version: bool = True) -> b
     return encrypted
 
 
-def decrypt_data(encrypted_data: bytes, cipher: Fernet) -> bytes:
+def decrypt_data(encrypted_data: bytes, cipher: "Fernet") -> bytes:
     """
     Decrypt data, handling version markers.
 
@@ -116,7 +142,7 @@ def is_encrypted_with_version(data: bytes) -> bool:
 
 
 # Backward compatibility: Legacy SHA-256 key derivation
-def derive_key_legacy(password: str) -> Fernet:
+def derive_key_legacy(password: str) -> "Fernet":
     """
     Legacy key derivation using SHA-256 (DEPRECATED).
 
@@ -137,4 +163,4 @@ def derive_key_legacy(password: str) -> Fernet:
 
     hash_bytes = hashlib.sha256(password.encode()).digest()
     key = base64.urlsafe_b64encode(hash_bytes)
-    return Fernet(key)
+    return fernet.Fernet(key)
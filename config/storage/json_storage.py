@@ -10,33 +10,38 @@ compliant with NIST SP 800-132 recommendations (2024).
 
 import json
 import os
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
-from cryptography.fernet import Fernet
 import getpass
 
-from ..schema.config_schema_v2 import create_empty_config_v2, CONFIG_SCHEMA_V2
-from ..schema.schema_validator import validate_config, is_v2_config
+from ..schema.config_schema_v2 import create_empty_config_v2
+from ..schema.schema_validator import get_incremental_validator, is_v2_config
 from .crypto_utils import (
-    derive_key_secure,
     derive_key_legacy,
     encrypt_data,
     decrypt_data,
     is_encrypted_with_version,
 )
+from .keyring import get_keyring
 from .path_validator import PathValidator
 from .json_validator import ConfigurationValidator
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
 
-def derive_key(password: str) -> Tuple[Fernet, bytes]:
+
+def derive_key(password: str, file_path: Optional[str] = None) -> Tuple["Fernet", bytes]:
     """
     Derive a Fernet key from a password using secure PBKDF2.
 
     This function uses PBKDF2-HMAC-SHA256 with 480,000 iterations
-    as recommended by NIST SP 800-132 (2024).
+    as recommended by NIST SP 800-132 (2024). Keys are cached by the
+    session keyring, and when file_path is given the salt already used
+    for that file is reused, so repeated saves skip the KDF.
 
     Args:
         password: Password string
+        file_path: Optional file the key will encrypt
 
     Returns:
         Tuple of (Fernet cipher instance, salt bytes)
@@ -45,10 +50,10 @@ def derive_key(password: str) -> Tuple[Fernet, bytes]:
         For backward compatibility with legacy files, use
         derive_key_legacy() from crypto_utils module.
     """
-    return derive_key_secure(password)
+    return get_keyring().cipher(password, path=file_path)
 
 
-def encrypt_json_data(data: str, cipher: Fernet, salt: bytes) -> bytes:
+def encrypt_json_data(data: str, cipher: "Fernet", salt: bytes) -> bytes:
     """
     Encrypt JSON string data with salt.
 
@@ -66,7 +71,10 @@ def encrypt_json_data(data: str, cipher: Fernet, salt: bytes) -> bytes:
 
 
 def decrypt_json_data(
-    encrypted_data: bytes, password: str = None, cipher: Fernet = None
+    encrypted_data: bytes,
+    password: str = None,
+    cipher: "Fernet" = None,
+    file_path: Optional[str] = None,
 ) -> Tuple[str, bytes]:
     """
     Decrypt JSON data, automatically detecting format.
@@ -75,6 +83,7 @@ def decrypt_json_data(
         encrypted_data: Encrypted bytes (salt + version + data or legacy format)
         password: Password for decryption (required if cipher not provided)
         cipher: Optional pre-derived cipher (for legacy format)
+        file_path: Optional source file (its salt is reused on re-save)
 
     Returns:
         Tuple of (decrypted JSON string, salt bytes or None for legacy)
@@ -93,9 +102,11 @@ def decrypt_json_data(
             if cipher is None:
                 if password is None:
                     raise ValueError("Password required for decryption")
-                cipher, _ = derive_key_secure(password, salt=potential_salt)
+                cipher, _ = get_keyring().cipher(password, salt=potential_salt)
 
             decrypted_bytes = decrypt_data(remaining, cipher)
+            if password is not None and file_path:
+                get_keyring().remember_salt(file_path, password, potential_salt)
             return decrypted_bytes.decode("utf-8"), potential_salt
 
     # Legacy format without salt
@@ -108,10 +119,25 @@ def decrypt_json_data(
     return decrypted_bytes.decode("utf-8"), None
 
 
+def _validate_schema(config: Dict[str, Any], file_path: str):
+    """
+    Validate a configuration against CONFIG_SCHEMA_V2 for a file.
+
+    Uses the file's incremental validator, so saving or re-loading a file
+    only re-validates the folders, snippets and sections that changed.
+
+    Raises:
+        ValueError: If the configuration does not match the schema
+    """
+    is_valid, errors = get_incremental_validator(file_path).validate(config)
+    if not is_valid:
+        raise ValueError(f"Configuration schema validation failed: {errors[0]}")
+
+
 def save_config_json(
     config: Dict[str, Any],
     file_path: str,
-    cipher: Optional[Fernet] = None,
+    cipher: Optional["Fernet"] = None,
     salt: Optional[bytes] = None,
     encrypt: bool = True,
     pretty: bool = True,
@@ -151,17 +177,23 @@ def save_config_json(
         else:
             json_str = json.dumps(config, ensure_ascii=False)
 
-        # Validate JSON structure if requested
+        # Validate structure and limits if requested. The dict is validated
+        # directly (no re-parse of json_str), and the schema check only covers
+        # sections changed since this file was last saved or loaded.
         if validate:
-            ConfigurationValidator.validate_json_structure(
-                json_str, schema=CONFIG_SCHEMA_V2
-            )
+            if len(json_str) > ConfigurationValidator.MAX_CONFIG_SIZE:
+                raise ValueError(
+                    f"Configuration exceeds maximum size "
+                    f"({ConfigurationValidator.MAX_CONFIG_SIZE} bytes, got {len(json_str)} bytes)"
+                )
+            _validate_schema(config, str(safe_path))
+            ConfigurationValidator.validate_parsed(config)
 
         # Encrypt if requested
         if encrypt:
             if cipher is None:
                 password = getpass.getpass("Enter password for encryption: ")
-                cipher, salt = derive_key_secure(password)
+                cipher, salt = get_keyring().cipher(password, path=str(safe_path))
             else:
                 # Cipher provided - salt must also be provided
                 if salt is None:
@@ -186,7 +218,7 @@ def save_config_json(
 
 def load_config_json(
     file_path: str,
-    cipher: Optional[Fernet] = None,
+    cipher: Optional["Fernet"] = None,
     encrypted: Optional[bool] = None,
     validate: bool = True,
 ) -> Optional[Dict[str, Any]]:
@@ -248,7 +280,7 @@ def load_config_json(
 
             # Decrypt (auto-detects format)
             json_str, salt = decrypt_json_data(
-                encrypted_data, password=password, cipher=cipher
+                encrypted_data, password=password, cipher=cipher, file_path=str(safe_path)
             )
         else:
             # Read unencrypted file
@@ -257,20 +289,19 @@ def load_config_json(
 
         # Validate JSON structure if requested
         if validate:
-            config = ConfigurationValidator.validate_json_structure(
-                json_str, schema=CONFIG_SCHEMA_V2
-            )
+            config = ConfigurationValidator.validate_json_structure(json_str)
+            _validate_schema(config, str(safe_path))
         else:
             # Parse JSON without validation
             config = json.loads(json_str)
 
-        # Validate if v2 config
-        if is_v2_config(config):
-            is_valid, errors = validate_config(config)
-            if not is_valid:
-                print("Warning: Configuration validation errors:")
-                for error in errors:
-                    print(f"  - {error}")
+            # Validate if v2 config
+            if is_v2_config(config):
+                is_valid, errors = get_incremental_validator(str(safe_path)).validate(config)
+                if not is_valid:
+                    print("Warning: Configuration validation errors:")
+                    for error in errors:
+                        print(f"  - {error}")
 
         return config
 
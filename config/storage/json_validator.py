@@ -7,7 +7,8 @@ to prevent injection attacks, resource exhaustion, and malformed data.
 
 import json
 from typing import Dict, Any
-from jsonschema import validate, ValidationError
+
+from ..schema.schema_validator import get_validator
 
 
 class ConfigurationValidator:
@@ -53,12 +54,33 @@ class ConfigurationValidator:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {e}")
 
-        # Validate against schema if provided
+        return ConfigurationValidator.validate_parsed(config, schema)
+
+    @staticmethod
+    def validate_parsed(
+        config: Dict[str, Any], schema: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate an already parsed configuration (schema and limits).
+
+        Lets callers that hold the dictionary (e.g. before saving) skip the
+        serialize/parse round trip; the size limit is checked by the caller.
+
+        Args:
+            config: Parsed configuration dictionary
+            schema: Optional JSON schema for validation
+
+        Returns:
+            The configuration dictionary
+
+        Raises:
+            ValueError: If validation fails
+        """
+        # Validate against schema if provided (compiled once per schema)
         if schema:
-            try:
-                validate(instance=config, schema=schema)
-            except ValidationError as e:
-                raise ValueError(f"Configuration schema validation failed: {e.message}")
+            errors = get_validator(schema).errors(config)
+            if errors:
+                raise ValueError(f"Configuration schema validation failed: {errors[0][1]}")
 
         # Check nesting depth
         max_depth = ConfigurationValidator._get_max_depth(config)
@@ -0,0 +1,230 @@
+"""
+Process-local session keyring for password-derived encryption keys.
+
+Every encrypted save and load derives its key with 480,000 PBKDF2 iterations,
+which costs a noticeable fraction of a second each time. The keyring keeps
+derived keys for the session, keyed by (password fingerprint, salt,
+iterations), and remembers the salt used for each file so re-saving the same
+file with the same password reuses its salt. Only the first unlock of a file
+pays the KDF cost.
+
+Passwords are never stored: the fingerprint is an HMAC-SHA256 of the password
+under a random per-process pepper. Key material is held in bytearrays that
+are overwritten with zeros by lock(), which also runs at interpreter exit.
+
+Example:
+    cipher, salt = get_keyring().cipher(password, path=file_path)
+"""
+
+import atexit
+import hashlib
+import hmac
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
+
+from .crypto_utils import (
+    PBKDF2_ITERATIONS,
+    SALT_SIZE,
+    derive_key_bytes,
+    fernet_from_key_bytes,
+)
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+logger = logging.getLogger(__name__)
+
+# Derived keys unused for this long are zeroized and dropped
+DEFAULT_KEY_TTL = 1800
+MAX_KEYS = 32
+
+
+class SessionKeyring:
+    """
+    Cache of derived keys and per-file salts for the current session.
+
+    Use get_keyring() for the process-wide instance.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_KEY_TTL, max_keys: int = MAX_KEYS):
+        """
+        Initialize the keyring.
+
+        Args:
+            ttl: Seconds an unused key is kept (0 = until lock())
+            max_keys: Maximum number of cached keys
+        """
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self.derivations = 0
+        self.hits = 0
+
+        self._pepper = os.urandom(32)
+        self._keys: "OrderedDict[Tuple[bytes, bytes, int], Tuple[bytearray, float]]" = OrderedDict()
+        self._salts: Dict[Tuple[str, bytes], bytes] = {}
+        self._lock = threading.Lock()
+
+    # ========== Keys ==========
+
+    def key(
+        self,
+        password: str,
+        salt: Optional[bytes] = None,
+        path: Optional[str] = None,
+        iterations: int = PBKDF2_ITERATIONS,
+    ) -> Tuple[bytes, bytes]:
+        """
+        Get the key for a password and salt, deriving it on first use.
+
+        Args:
+            password: Password string
+            salt: Salt from an existing file (None = reuse the salt remembered
+                for path, or generate a new one)
+            path: File the key is used for; its salt is remembered
+            iterations: PBKDF2 iteration count
+
+        Returns:
+            Tuple of (raw key bytes, salt bytes)
+        """
+        fingerprint = self._fingerprint(password)
+        path_key = (self._normalize(path), fingerprint) if path else None
+
+        with self._lock:
+            self._expire()
+            if salt is None and path_key:
+                salt = self._salts.get(path_key)
+            if salt is None:
+                salt = os.urandom(SALT_SIZE)
+            if not isinstance(salt, bytes) or len(salt) != SALT_SIZE:
+                raise ValueError(f"Salt must be {SALT_SIZE} bytes")
+
+            cache_key = (fingerprint, salt, iterations)
+            entry = self._keys.get(cache_key)
+            if entry is not None:
+                self.hits += 1
+                self._keys[cache_key] = (entry[0], time.monotonic())
+                self._keys.move_to_end(cache_key)
+                if path_key:
+                    self._salts[path_key] = salt
+                return bytes(entry[0]), salt
+
+        # Derive outside the lock so other files are not blocked meanwhile
+        start = time.perf_counter()
+        material = bytearray(derive_key_bytes(password, salt, iterations))
+        logger.debug(f"Derived key in {time.perf_counter() - start:.2f}s")
+
+        with self._lock:
+            self.derivations += 1
+            existing = self._keys.pop(cache_key, None)
+            if existing is not None:
+                _zeroize(existing[0])
+            self._keys[cache_key] = (material, time.monotonic())
+            while len(self._keys) > self.max_keys:
+                _, (old, _) = self._keys.popitem(last=False)
+                _zeroize(old)
+            if path_key:
+                self._salts[path_key] = salt
+            return bytes(material), salt
+
+    def cipher(
+        self,
+        password: str,
+        salt: Optional[bytes] = None,
+        path: Optional[str] = None,
+        iterations: int = PBKDF2_ITERATIONS,
+    ) -> Tuple["Fernet", bytes]:
+        """
+        Get a Fernet cipher for a password and salt (see key()).
+
+        Returns:
+            Tuple of (Fernet cipher, salt bytes)
+        """
+        material, salt = self.key(password, salt=salt, path=path, iterations=iterations)
+        return fernet_from_key_bytes(material), salt
+
+    # ========== Salts ==========
+
+    def remember_salt(self, path: str, password: str, salt: bytes):
+        """Remember the salt of a file so re-saves with this password reuse it."""
+        with self._lock:
+            self._salts[(self._normalize(path), self._fingerprint(password))] = salt
+
+    def forget(self, path: str):
+        """Forget the salts remembered for a file (next save uses a new salt)."""
+        normalized = self._normalize(path)
+        with self._lock:
+            for path_key in [k for k in self._salts if k[0] == normalized]:
+                del self._salts[path_key]
+
+    # ========== Lifecycle ==========
+
+    def lock(self):
+        """Zeroize and drop all cached keys and forget remembered salts."""
+        with self._lock:
+            for material, _ in self._keys.values():
+                _zeroize(material)
+            count = len(self._keys)
+            self._keys.clear()
+            self._salts.clear()
+        if count:
+            logger.debug(f"Keyring locked ({count} key(s) zeroized)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                'keys': len(self._keys),
+                'salts': len(self._salts),
+                'derivations': self.derivations,
+                'hits': self.hits,
+            }
+
+    # ========== Internals ==========
+
+    def _fingerprint(self, password: str) -> bytes:
+        return hmac.new(self._pepper, password.encode("utf-8"), hashlib.sha256).digest()
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.realpath(os.fspath(path))
+
+    def _expire(self):
+        """Drop keys unused for longer than ttl (caller holds the lock)."""
+        if not self.ttl:
+            return
+        cutoff = time.monotonic() - self.ttl
+        for cache_key in [k for k, (_, used) in self._keys.items() if used < cutoff]:
+            material, _ = self._keys.pop(cache_key)
+            _zeroize(material)
+
+
+def _zeroize(material: bytearray):
+    """Overwrite key material in place."""
+    for i in range(len(material)):
+        material[i] = 0
+
+
+_keyring: Optional[SessionKeyring] = None
+_keyring_lock = threading.Lock()
+
+
+def get_keyring() -> SessionKeyring:
+    """Get the process-wide session keyring."""
+    global _keyring
+    with _keyring_lock:
+        if _keyring is None:
+            _keyring = SessionKeyring()
+            atexit.register(lock_keyring)
+        return _keyring
+
+
+def lock_keyring():
+    """Zeroize all cached keys (e.g. on logout, lock or exit)."""
+    with _keyring_lock:
+        keyring = _keyring
+    if keyring is not None:
+        keyring.lock()
@@ -8,16 +8,18 @@ configuration files to the new JSON format.
 import pickle
 import os
 import json
-from typing import Dict, Any, Optional
-from cryptography.fernet import Fernet
+from typing import Dict, Any, Optional, TYPE_CHECKING
 import getpass
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 from .json_storage import derive_key, save_config_json
 from ..schema.config_schema_v2 import create_empty_config_v2
 
 
 def load_pickle_config(
-    file_path: str, cipher: Optional[Fernet] = None
+    file_path: str, cipher: Optional["Fernet"] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Load a legacy pickle-based configuration file.
@@ -57,7 +59,7 @@ def load_pickle_config(
 def convert_pickle_to_json(
     pickle_file_path: str,
     json_file_path: Optional[str] = None,
-    cipher: Optional[Fernet] = None,
+    cipher: Optional["Fernet"] = None,
     preserve_legacy: bool = True,
 ) -> Optional[Dict[str, Any]]:
     """
@@ -222,7 +224,7 @@ def detect_config_format(file_path: str) -> str:
 
 
 def load_config_auto(
-    file_path: str, cipher: Optional[Fernet] = None
+    file_path: str, cipher: Optional["Fernet"] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Automatically detect and load configuration file (pickle or JSON).
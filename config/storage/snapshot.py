@@ -0,0 +1,416 @@
+"""
+Compressed, batch-oriented snapshot format for pulled configurations.
+
+Saved pulls in the JSON format repeat the same keys (folder, snippet,
+item_type, id, tracking fields ...) on every item. A snapshot stores the
+items of each (location, container, item type) as one compressed batch:
+
+    PACSNAP1
+    <batch> <batch> ...                      compressed NDJSON, one per batch
+    <footer>                                 gzip JSON: document, string table, index
+    <8-byte footer length> PACSNAP1
+
+Each batch starts with a header line listing its keys, the values that are
+identical for every record (hoisted once as "constants", e.g. folder and
+item_type), the columns interned in the string table (tag lists) and each
+record's position in its container. The records follow as compact arrays
+``[presence_bitmask, value, ...]``.
+
+The footer index maps (location, container, item type) to the byte range of
+its batch, so a single type of a single folder can be read without
+decompressing anything else (SnapshotReader.read_items()).
+
+Batches are compressed with zstd when the optional ``zstandard`` package is
+installed, otherwise with gzip.
+
+The snapshot holds the same dictionary Configuration.save_to_file() writes
+as JSON; read_snapshot() returns it unchanged (apart from key order).
+"""
+
+import gzip
+import json
+import logging
+import struct
+from typing import Dict, Any, Optional, List, Tuple, BinaryIO, Iterable
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"PACSNAP1"
+SNAPSHOT_FORMAT = "pac_snapshot_v1"
+SNAPSHOT_EXTENSION = ".pacsnap"
+
+CODEC_ZSTD = "zstd"
+CODEC_GZIP = "gzip"
+
+# Columns whose string values go through the string table
+INTERNED_KEYS = ("folder", "snippet", "tag")
+
+_FOOTER_TAIL = struct.Struct(">Q")
+
+# Location of a batch -> key of its containers in the configuration dict
+_LOCATIONS = (("folder", "folders"), ("snippet", "snippets"))
+
+
+def default_codec() -> str:
+    """Best available batch codec."""
+    return CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_GZIP
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Snapshot uses zstd compression; install the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _canonical(value: Any) -> str:
+    """Equality key for JSON values (keeps True distinct from 1)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+class _StringTable:
+    """Interned strings shared by all batches of a snapshot."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def _is_internable(value: Any) -> bool:
+    if isinstance(value, str):
+        return True
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+def _encode_batch(items: List[Tuple[int, Dict[str, Any]]], strings: _StringTable) -> bytes:
+    """
+    Encode the records of one batch as NDJSON.
+
+    Args:
+        items: (position in container, item dict) pairs
+        strings: Snapshot string table
+
+    Returns:
+        Uncompressed batch bytes
+    """
+    keys: List[str] = []
+    seen = set()
+    for _, item in items:
+        for key in item:
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+
+    # Hoist keys present in every record with the same value
+    constants: Dict[str, Any] = {}
+    for key in keys:
+        first = items[0][1]
+        if key not in first:
+            continue
+        marker = _canonical(first[key])
+        if all(key in item and _canonical(item[key]) == marker for _, item in items[1:]):
+            constants[key] = first[key]
+
+    columns = [key for key in keys if key not in constants]
+    interned = [
+        key for key in columns
+        if key in INTERNED_KEYS and all(_is_internable(item[key]) for _, item in items if key in item)
+    ]
+
+    def encode_value(key: str, value: Any) -> Any:
+        if key not in interned:
+            return value
+        if isinstance(value, str):
+            return strings.intern(value)
+        return [strings.intern(v) for v in value]
+
+    header = {
+        "keys": keys,
+        "constants": constants,
+        "interned": interned,
+        "positions": [position for position, _ in items],
+    }
+    lines = [json.dumps(header, separators=(",", ":"))]
+    for _, item in items:
+        presence = 0
+        row: List[Any] = [0]
+        for bit, key in enumerate(columns):
+            if key in item:
+                presence |= 1 << bit
+                row.append(encode_value(key, item[key]))
+        row[0] = presence
+        lines.append(json.dumps(row, separators=(",", ":")))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _decode_batch(data: bytes, strings: List[str]) -> List[Tuple[int, Dict[str, Any]]]:
+    """Decode a batch into (position, item dict) pairs."""
+    lines = data.decode("utf-8").splitlines()
+    header = json.loads(lines[0])
+    keys = header["keys"]
+    constants = header["constants"]
+    interned = set(header["interned"])
+    columns = [key for key in keys if key not in constants]
+
+    items = []
+    for position, line in zip(header["positions"], lines[1:]):
+        row = json.loads(line)
+        presence = row[0]
+        values = iter(row[1:])
+        decoded = {}
+        for bit, key in enumerate(columns):
+            if presence >> bit & 1:
+                value = next(values)
+                if key in interned:
+                    value = strings[value] if isinstance(value, int) else [strings[v] for v in value]
+                decoded[key] = value
+        item = {}
+        for key in keys:
+            if key in constants:
+                item[key] = constants[key]
+            elif key in decoded:
+                item[key] = decoded[key]
+        items.append((position, item))
+    return items
+
+
+def _group_by_type(items: Iterable[Dict[str, Any]]) -> Dict[str, List[Tuple[int, Dict[str, Any]]]]:
+    groups: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+    for position, item in enumerate(items):
+        groups.setdefault(str(item.get("item_type", "")), []).append((position, item))
+    return groups
+
+
+def write_snapshot(
+    config_dict: Dict[str, Any],
+    out: BinaryIO,
+    codec: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Write a configuration dictionary as a snapshot.
+
+    Args:
+        config_dict: Dictionary as built by Configuration.save_to_file()
+        out: Binary file object to write to
+        codec: 'zstd' or 'gzip' (default: zstd if available)
+
+    Returns:
+        Stats dict with 'batches', 'items', 'strings' and 'bytes'
+    """
+    codec = codec or default_codec()
+    strings = _StringTable()
+    batches: List[Dict[str, Any]] = []
+    offset = len(SNAPSHOT_MAGIC)
+    out.write(SNAPSHOT_MAGIC)
+
+    def add_batches(location: str, container: str, items: List[Dict[str, Any]]):
+        nonlocal offset
+        for item_type, group in _group_by_type(items).items():
+            blob = _compress(_encode_batch(group, strings), codec)
+            out.write(blob)
+            batches.append({
+                "location": location,
+                "container": strings.intern(container),
+                "type": strings.intern(item_type),
+                "count": len(group),
+                "offset": offset,
+                "length": len(blob),
+            })
+            offset += len(blob)
+
+    document = {
+        key: value for key, value in config_dict.items()
+        if key not in ("folders", "snippets", "infrastructure")
+    }
+    for location, section in _LOCATIONS:
+        containers = config_dict.get(section) or {}
+        document[section] = {}
+        for name, container in containers.items():
+            document[section][name] = {k: v for k, v in container.items() if k != "items"}
+            add_batches(location, name, container.get("items", []))
+
+    infrastructure = config_dict.get("infrastructure") or {}
+    document["infrastructure"] = {k: v for k, v in infrastructure.items() if k != "items"}
+    add_batches("infrastructure", "", infrastructure.get("items", []))
+
+    footer = {
+        "format": SNAPSHOT_FORMAT,
+        "codec": codec,
+        "key_order": list(config_dict.keys()),
+        "document": document,
+        "strings": strings.strings,
+        "batches": batches,
+    }
+    footer_blob = gzip.compress(json.dumps(footer, separators=(",", ":")).encode("utf-8"), mtime=0)
+    out.write(footer_blob)
+    out.write(_FOOTER_TAIL.pack(len(footer_blob)))
+    out.write(SNAPSHOT_MAGIC)
+
+    total = offset + len(footer_blob) + _FOOTER_TAIL.size + len(SNAPSHOT_MAGIC)
+    stats = {
+        "batches": len(batches),
+        "items": sum(batch["count"] for batch in batches),
+        "strings": len(strings.strings),
+        "bytes": total,
+        "codec": codec,
+    }
+    logger.debug(f"Wrote snapshot: {stats}")
+    return stats
+
+
+def is_snapshot_file(file_path: str) -> bool:
+    """True if the file starts with the snapshot magic."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+class SnapshotReader:
+    """
+    Random access to the batches of a snapshot file.
+
+    Example:
+        with SnapshotReader(path) as snapshot:
+            rules = snapshot.read_items("folder", "Mobile Users", "security_rule")
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Open a snapshot and read its footer.
+
+        Args:
+            file_path: Snapshot file
+
+        Raises:
+            ValueError: If the file is not a valid snapshot
+        """
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        try:
+            self._read_footer()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_footer(self):
+        f = self._file
+        if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a configuration snapshot: {self.file_path}")
+        tail_size = _FOOTER_TAIL.size + len(SNAPSHOT_MAGIC)
+        f.seek(0, 2)
+        size = f.tell()
+        if size < len(SNAPSHOT_MAGIC) + tail_size:
+            raise ValueError("Truncated snapshot")
+        f.seek(size - tail_size)
+        tail = f.read(tail_size)
+        if tail[_FOOTER_TAIL.size:] != SNAPSHOT_MAGIC:
+            raise ValueError("Truncated snapshot")
+        footer_length, = _FOOTER_TAIL.unpack(tail[:_FOOTER_TAIL.size])
+        f.seek(size - tail_size - footer_length)
+        footer = json.loads(gzip.decompress(f.read(footer_length)))
+        if footer.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported snapshot format: {footer.get('format')}")
+
+        self.codec = footer["codec"]
+        self.strings: List[str] = footer["strings"]
+        self.document: Dict[str, Any] = footer["document"]
+        self.key_order: List[str] = footer.get("key_order", [])
+        self._batches: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for batch in footer["batches"]:
+            key = (batch["location"], self.strings[batch["container"]], self.strings[batch["type"]])
+            self._batches[key] = batch
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    @property
+    def index(self) -> List[Dict[str, Any]]:
+        """Batches as dicts with 'location', 'container', 'item_type' and 'count'."""
+        return [
+            {"location": location, "container": container, "item_type": item_type, "count": batch["count"]}
+            for (location, container, item_type), batch in self._batches.items()
+        ]
+
+    def _read_batch(self, batch: Dict[str, Any]) -> List[Tuple[int, Dict[str, Any]]]:
+        self._file.seek(batch["offset"])
+        return _decode_batch(_decompress(self._file.read(batch["length"]), self.codec), self.strings)
+
+    def read_items(self, location: str, container: str, item_type: str) -> List[Dict[str, Any]]:
+        """
+        Read the items of one type in one container.
+
+        Args:
+            location: 'folder', 'snippet' or 'infrastructure'
+            container: Folder or snippet name ('' for infrastructure)
+            item_type: Item type, e.g. 'address_object'
+
+        Returns:
+            Item dicts in their original order (empty if none)
+        """
+        batch = self._batches.get((location, container, item_type))
+        if batch is None:
+            return []
+        return [item for _, item in self._read_batch(batch)]
+
+    def read_container(self, location: str, container: str) -> List[Dict[str, Any]]:
+        """Read all items of a container in their original order."""
+        positioned = []
+        for (batch_location, batch_container, _), batch in self._batches.items():
+            if batch_location == location and batch_container == container:
+                positioned.extend(self._read_batch(batch))
+        positioned.sort(key=lambda pair: pair[0])
+        return [item for _, item in positioned]
+
+    def to_config_dict(self) -> Dict[str, Any]:
+        """Rebuild the full configuration dictionary."""
+        document = json.loads(json.dumps(self.document))
+        for location, section in _LOCATIONS:
+            for name, container in document.get(section, {}).items():
+                container["items"] = self.read_container(location, name)
+        document.setdefault("infrastructure", {})["items"] = self.read_container("infrastructure", "")
+
+        ordered = {key: document[key] for key in self.key_order if key in document}
+        ordered.update((key, value) for key, value in document.items() if key not in ordered)
+        return ordered
+
+
+def read_snapshot(file_path: str) -> Dict[str, Any]:
+    """
+    Read a snapshot into the configuration dictionary it was written from.
+
+    Raises:
+        ValueError: If the file is not a valid snapshot
+    """
+    with SnapshotReader(file_path) as snapshot:
+        return snapshot.to_config_dict()
@@ -10,16 +10,26 @@ Extended in Phase 2 to support:
 - Panorama credentials (password, API key, certificate)
 - Supporting VM credentials (password, SSH key)
 - Secure credential generation
+
+The encrypted tenants file is decrypted once per process into a shared
+in-memory store (one per file). Reads are served from the store, writes go
+through it, and it is reloaded when the file's mtime/size/inode changes
+(e.g. another instance of the application saved tenants). PBKDF2 keys are
+memoized per salt, so the 480,000-iteration derivation runs once per
+session instead of twice per call.
 """
 
+import copy
 import json
 import os
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from config.storage.crypto_utils import derive_key_secure, encrypt_data, decrypt_data
+from config.storage.crypto_utils import encrypt_data, decrypt_data
+from config.storage.keyring import get_keyring
 from config.credential_manager import (
     TenantCredentials,
     DeviceCredentials,
@@ -31,6 +41,53 @@ from config.credential_manager import (
 )
 
 
+def _derive_key_for_salt(password: str, salt: bytes):
+    """Get the Fernet cipher for a password/salt pair (cached by the session keyring)."""
+    cipher, _ = get_keyring().cipher(password, salt=salt)
+    return cipher
+
+
+class _TenantStore:
+    """Decrypted tenants file shared by all TenantManager instances."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.data: Optional[Dict[str, Any]] = None
+        self.signature: Optional[Tuple[int, int, int]] = None
+        self.salt: Optional[bytes] = None
+
+    def current_signature(self) -> Optional[Tuple[int, int, int]]:
+        """(mtime_ns, size, inode) of the file, or None if it does not exist."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def is_current(self) -> bool:
+        """True if the loaded data still matches the file on disk."""
+        return self.data is not None and self.signature == self.current_signature()
+
+
+_stores: Dict[str, _TenantStore] = {}
+_stores_lock = threading.Lock()
+
+
+def _get_store(path: Path) -> _TenantStore:
+    """Get the process-wide store for a tenants file."""
+    key = str(path.resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = _TenantStore(path)
+        return store
+
+
+def _empty_tenants() -> Dict[str, Any]:
+    return {"version": "1.0", "tenants": []}
+
+
 class TenantManager:
     """
     Manage saved tenant information.
@@ -55,9 +112,8 @@ class TenantManager:
         # Ensure directory exists
         self.base_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache for current session
-        self._tenants_cache = None
-        self._encryption_key = None
+        # Decrypted tenants, shared with other managers of the same file
+        self._store = _get_store(self.tenants_file)
     
     def _get_system_password(self) -> str:
         """
@@ -77,28 +133,53 @@ class TenantManager:
         Get or create encryption key for tenant storage.
         
         Uses system-specific key derivation (no user password required).
+        Reuses the salt of the existing file so the memoized key serves both
+        reads and writes.
         
         Returns:
             Tuple of (cipher, salt)
         """
-        if self._encryption_key is None:
-            self._encryption_key = derive_key_secure(self._get_system_password())
+        with self._store.lock:
+            if self._store.salt is None:
+                self._store.salt = os.urandom(16)
+            salt = self._store.salt
+        return _derive_key_for_salt(self._get_system_password(), salt), salt
+    
+    def _read_tenants(self) -> Dict[str, Any]:
+        """
+        Get the shared tenant data, (re)loading the file if it changed.
         
-        return self._encryption_key
+        The returned structure is shared - callers must not modify it.
+        Use _load_tenants() to get a copy for modification.
+        """
+        store = self._store
+        with store.lock:
+            if not store.is_current():
+                signature = store.current_signature()
+                store.data = self._read_file()
+                # The file may have been deleted as corrupted
+                store.signature = signature if self.tenants_file.exists() else None
+            return store.data
     
     def _load_tenants(self) -> Dict[str, Any]:
         """
-        Load tenants from encrypted file.
+        Load tenants for modification.
+        
+        Returns:
+            Copy of the tenant data structure (pass it to _save_tenants)
+        """
+        return copy.deepcopy(self._read_tenants())
+    
+    def _read_file(self) -> Dict[str, Any]:
+        """
+        Decrypt and parse the tenants file.
         
         Returns:
             Dictionary with tenant data structure
         """
         if not self.tenants_file.exists():
             # Return empty structure
-            return {
-                "version": "1.0",
-                "tenants": []
-            }
+            return _empty_tenants()
         
         try:
             # Read encrypted file
@@ -111,7 +192,7 @@ class TenantManager:
                 print("Deleting corrupted file...")
                 # Delete corrupted file
                 self.tenants_file.unlink()
-                return {"version": "1.0", "tenants": []}
+                return _empty_tenants()
             
             # Extract salt (first 16 bytes) and encrypted data
             salt = file_data[:16]
@@ -122,13 +203,12 @@ class TenantManager:
                 print("Deleting corrupted file...")
                 # Delete corrupted file
                 self.tenants_file.unlink()
-                return {"version": "1.0", "tenants": []}
+                return _empty_tenants()
             
-            # Decrypt
-            cipher, _ = self._get_encryption_key()
-            # Re-derive key with stored salt
-            cipher, _ = derive_key_secure(self._get_system_password(), salt)
+            # Decrypt with the (memoized) key for the stored salt
+            cipher = _derive_key_for_salt(self._get_system_password(), salt)
             decrypted_bytes = decrypt_data(encrypted_data, cipher)
+            self._store.salt = salt
             
             # Parse JSON
             json_str = decrypted_bytes.decode('utf-8')
@@ -149,7 +229,7 @@ class TenantManager:
             print("\nReturning empty tenant structure (file may be corrupted)...")
             # Return empty structure on error but DON'T try to save
             # (saving might fail and cause more corruption)
-            return {"version": "1.0", "tenants": []}
+            return _empty_tenants()
     
     def _save_tenants(self, data: Dict[str, Any]) -> bool:
         """
@@ -175,24 +255,27 @@ class TenantManager:
             
             # Atomic write: write to temp file first
             temp_file = self.tenants_file.with_suffix('.tmp')
-            try:
-                # Write to temp file
-                with open(temp_file, 'wb') as f:
-                    f.write(salt)  # Write salt first
-                    f.write(encrypted_data)
-                    f.flush()  # Ensure data is written
-                    os.fsync(f.fileno())  # Force write to disk
-                
-                # Atomic rename (replaces old file)
-                temp_file.replace(self.tenants_file)
+            store = self._store
+            with store.lock:
+                try:
+                    # Write to temp file
+                    with open(temp_file, 'wb') as f:
+                        f.write(salt)  # Write salt first
+                        f.write(encrypted_data)
+                        f.flush()  # Ensure data is written
+                        os.fsync(f.fileno())  # Force write to disk
+                    
+                    # Atomic rename (replaces old file)
+                    temp_file.replace(self.tenants_file)
+                    
+                finally:
+                    # Clean up temp file if it still exists
+                    if temp_file.exists():
+                        temp_file.unlink()
                 
-            finally:
-                # Clean up temp file if it still exists
-                if temp_file.exists():
-                    temp_file.unlink()
-            
-            # Update cache
-            self._tenants_cache = data
+                # Write through to the shared store
+                store.data = copy.deepcopy(data)
+                store.signature = store.current_signature()
             
             return True
             
@@ -425,11 +508,11 @@ class TenantManager:
         Returns:
             Tenant dictionary or None if not found
         """
-        data = self._load_tenants()
+        data = self._read_tenants()
         
         for tenant in data["tenants"]:
             if tenant["id"] == tenant_id:
-                return tenant.copy()
+                return copy.deepcopy(tenant)
         
         return None
     
@@ -443,8 +526,7 @@ class TenantManager:
         Returns:
             List of tenant dictionaries
         """
-        data = self._load_tenants()
-        tenants = data["tenants"].copy()
+        tenants = copy.deepcopy(self._read_tenants()["tenants"])
         
         # Sort
         if sort_by == "name":
@@ -471,7 +553,7 @@ class TenantManager:
             return self.list_tenants()
         
         query_lower = query.lower().strip()
-        data = self._load_tenants()
+        data = self._read_tenants()
         
         results = []
         for tenant in data["tenants"]:
@@ -480,7 +562,7 @@ class TenantManager:
                 query_lower in tenant["tsg_id"].lower() or
                 query_lower in tenant["client_id"].lower() or
                 query_lower in tenant.get("description", "").lower()):
-                results.append(tenant.copy())
+                results.append(copy.deepcopy(tenant))
         
         # Sort by name
         results.sort(key=lambda t: t["name"].lower())
@@ -517,12 +599,12 @@ class TenantManager:
         Returns:
             Tenant dictionary or None if not found
         """
-        data = self._load_tenants()
+        data = self._read_tenants()
         name_lower = name.lower()
         
         for tenant in data["tenants"]:
             if tenant["name"].lower() == name_lower:
-                return tenant.copy()
+                return copy.deepcopy(tenant)
         
         return None
     
@@ -537,7 +619,7 @@ class TenantManager:
             Tuple of (success, message)
         """
         try:
-            data = self._load_tenants()
+            data = self._read_tenants()
             
             with open(filepath, 'w') as f:
                 json.dump(data, f, indent=2)
@@ -8,8 +8,11 @@ including encryption, validation, and file handling.
 from .encryption import (
     encrypt_config,
     decrypt_config,
+    encrypt_config_stream,
+    decrypt_config_stream,
     is_encrypted_file,
     get_config_metadata,
+    read_config_header,
     PasswordValidator,
     PasswordPolicy,
 )
@@ -17,8 +20,11 @@ from .encryption import (
 __all__ = [
     'encrypt_config',
     'decrypt_config',
+    'encrypt_config_stream',
+    'decrypt_config_stream',
     'is_encrypted_file',
     'get_config_metadata',
+    'read_config_header',
     'PasswordValidator',
     'PasswordPolicy',
 ]
@@ -6,18 +6,32 @@ configuration storage, plus configurable password validation.
 """
 
 import os
+import copy
 import json
 import base64
 import re
+import struct
+import threading
+import zlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, BinaryIO, TYPE_CHECKING
 from datetime import datetime
 import logging
 
-from cryptography.fernet import Fernet, InvalidToken
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
+from config.lazy_import import lazy_import
+from config.storage.keyring import get_keyring
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# cryptography is imported on first encrypt/decrypt, not at module import
+crypto_exceptions = lazy_import("cryptography.exceptions")
+fernet = lazy_import("cryptography.fernet")
+hashes = lazy_import("cryptography.hazmat.primitives.hashes")
+aead = lazy_import("cryptography.hazmat.primitives.ciphers.aead")
+hkdf = lazy_import("cryptography.hazmat.primitives.kdf.hkdf")
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +42,8 @@ KEY_SIZE = 32   # 256 bits
 
 # File format identifiers
 FORMAT_ENCRYPTED_V1 = "pac_encrypted_v1"
+FORMAT_ENCRYPTED_V2 = "pac_encrypted_v2"
+ENCRYPTED_FORMATS = (FORMAT_ENCRYPTED_V1, FORMAT_ENCRYPTED_V2)
 FORMAT_PLAIN = "pac_plain_v1"
 FILE_EXTENSION_ENCRYPTED = ".pac"
 FILE_EXTENSION_PLAIN = ".json"
@@ -180,36 +196,51 @@ class PasswordValidator:
         return "\n".join(requirements)
 
 
-def _derive_key(password: str, salt: bytes = None) -> Tuple[Fernet, bytes]:
+def _derive_key(
+    password: str, salt: bytes = None, file_path: Optional[str] = None
+) -> Tuple["Fernet", bytes]:
     """
     Derive encryption key from password using PBKDF2.
     
+    Keys are cached for the session by the keyring, so only the first
+    unlock of a file runs the KDF.
+    
     Args:
         password: Password string
-        salt: Optional salt (generated if None)
+        salt: Optional salt (reuses the file's salt, or generated, if None)
+        file_path: Optional file the key is for (keeps its salt stable)
         
     Returns:
         Tuple of (Fernet cipher, salt)
     """
-    if salt is None:
-        salt = os.urandom(SALT_SIZE)
-    
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=KEY_SIZE,
-        salt=salt,
-        iterations=PBKDF2_ITERATIONS,
-        backend=default_backend(),
-    )
-    
-    key = base64.urlsafe_b64encode(kdf.derive(password.encode('utf-8')))
-    return Fernet(key), salt
+    return get_keyring().cipher(password, salt=salt, path=file_path, iterations=PBKDF2_ITERATIONS)
+
+
+def _envelope_metadata(metadata: Optional[Dict[str, Any]], version: str) -> Dict[str, Any]:
+    """Build the unencrypted metadata block of an encrypted file."""
+    metadata = metadata or {}
+    now = datetime.now().isoformat()
+    return {
+        "name": metadata.get("name", "Untitled Configuration"),
+        "description": metadata.get("description", ""),
+        "created_at": metadata.get("created_at", now),
+        "modified_at": now,
+        "version": version,
+        # Additional metadata
+        "source_tenant": metadata.get("source_tenant"),
+        "source_tsg": metadata.get("source_tsg"),
+        "pull_date": metadata.get("pull_date"),
+        "item_count": metadata.get("item_count"),
+        "folders_count": metadata.get("folders_count"),
+        "snippets_count": metadata.get("snippets_count"),
+    }
 
 
 def encrypt_config(
     config_data: Dict[str, Any],
     password: str,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    file_path: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Encrypt configuration data with password.
@@ -218,6 +249,7 @@ def encrypt_config(
         config_data: Configuration dictionary to encrypt
         password: Encryption password
         metadata: Optional metadata to include (stored unencrypted)
+        file_path: Optional destination file (re-saves keep its salt)
         
     Returns:
         Encrypted configuration dictionary
@@ -227,12 +259,10 @@ def encrypt_config(
     config_bytes = config_json.encode('utf-8')
     
     # Derive key and encrypt
-    cipher, salt = _derive_key(password)
+    cipher, salt = _derive_key(password, file_path=file_path)
     encrypted_data = cipher.encrypt(config_bytes)
     
     # Build encrypted file structure
-    now = datetime.now().isoformat()
-    
     result = {
         "format": FORMAT_ENCRYPTED_V1,
         "encryption": {
@@ -241,20 +271,7 @@ def encrypt_config(
             "iterations": PBKDF2_ITERATIONS,
             "salt": base64.b64encode(salt).decode('utf-8'),
         },
-        "metadata": {
-            "name": metadata.get("name", "Untitled Configuration") if metadata else "Untitled Configuration",
-            "description": metadata.get("description", "") if metadata else "",
-            "created_at": metadata.get("created_at", now) if metadata else now,
-            "modified_at": now,
-            "version": "1.0",
-            # Additional metadata
-            "source_tenant": metadata.get("source_tenant") if metadata else None,
-            "source_tsg": metadata.get("source_tsg") if metadata else None,
-            "pull_date": metadata.get("pull_date") if metadata else None,
-            "item_count": metadata.get("item_count") if metadata else None,
-            "folders_count": metadata.get("folders_count") if metadata else None,
-            "snippets_count": metadata.get("snippets_count") if metadata else None,
-        },
+        "metadata": _envelope_metadata(metadata, "1.0"),
         "data": base64.b64encode(encrypted_data).decode('utf-8'),
     }
     
@@ -262,13 +279,18 @@ def encrypt_config(
     return result
 
 
-def decrypt_config(encrypted_data: Dict[str, Any], password: str) -> Dict[str, Any]:
+def decrypt_config(
+    encrypted_data: Dict[str, Any],
+    password: str,
+    file_path: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Decrypt configuration data with password.
     
     Args:
         encrypted_data: Encrypted configuration dictionary
         password: Decryption password
+        file_path: Optional source file (its salt is remembered for re-saves)
         
     Returns:
         Decrypted configuration dictionary
@@ -294,15 +316,347 @@ def decrypt_config(encrypted_data: Dict[str, Any], password: str) -> Dict[str, A
         decrypted_bytes = cipher.decrypt(encrypted_bytes)
         config_data = json.loads(decrypted_bytes.decode('utf-8'))
         
+        if file_path:
+            get_keyring().remember_salt(file_path, password, salt)
+        
         logger.info(f"Decrypted configuration: {encrypted_data.get('metadata', {}).get('name', 'Unknown')}")
         return config_data
         
-    except InvalidToken:
+    except fernet.InvalidToken:
         raise ValueError("Incorrect password or corrupted data")
     except Exception as e:
         raise ValueError(f"Decryption failed: {str(e)}")
 
 
+# ========== Streaming format (v2) ==========
+#
+# Layout of a v2 file:
+#
+#   {"format": "pac_encrypted_v2", "encryption": {...}, "metadata": {...}}\n
+#   [4-byte big-endian length][AES-256-GCM chunk] ...
+#
+# The first line is a plain JSON header, so metadata is readable without the
+# password (read_config_header()). The payload is the config JSON, compressed
+# with zlib, split into chunk_size pieces and sealed one chunk at a time. Each
+# chunk's nonce is an 11-byte counter plus a final-chunk flag (the STREAM
+# construction), and the header line is the associated data of every chunk, so
+# reordered, truncated, extended or header-tampered files fail to decrypt.
+# The chunk key is derived with HKDF from the password key and a random
+# per-file nonce, so re-saves that reuse the salt never reuse a chunk key.
+
+STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_KEY_NONCE_SIZE = 16
+_STREAM_TAG_SIZE = 16
+_STREAM_LENGTH = struct.Struct(">I")
+
+
+def _stream_cipher(key: bytes, key_nonce: bytes) -> "AESGCM":
+    """AES-256-GCM cipher for one file's chunks."""
+    chunk_key = hkdf.HKDF(
+        algorithm=hashes.SHA256(),
+        length=KEY_SIZE,
+        salt=key_nonce,
+        info=b"pa_config_lab pac v2 chunk key",
+    ).derive(key)
+    return aead.AESGCM(chunk_key)
+
+
+def _stream_nonce(counter: int, last: bool) -> bytes:
+    if counter >= 1 << 88:
+        raise ValueError("Too many chunks")
+    return counter.to_bytes(11, "big") + (b"\x01" if last else b"\x00")
+
+
+def encrypt_config_stream(
+    config_data: Dict[str, Any],
+    password: str,
+    out: BinaryIO,
+    metadata: Optional[Dict[str, Any]] = None,
+    file_path: Optional[str] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Encrypt configuration data to a stream in the v2 chunked format.
+    
+    The config is JSON-encoded incrementally and each compressed chunk is
+    encrypted and written as soon as it is full, so neither the full JSON
+    text nor the ciphertext is held in memory.
+    
+    Args:
+        config_data: Configuration dictionary to encrypt
+        password: Encryption password
+        out: Binary file object to write to
+        metadata: Optional metadata to include (stored unencrypted)
+        file_path: Optional destination file (re-saves keep its salt)
+        chunk_size: Plaintext bytes per encrypted chunk
+        
+    Returns:
+        The file header (format, encryption and metadata)
+    """
+    key, salt = get_keyring().key(password, path=file_path, iterations=PBKDF2_ITERATIONS)
+    key_nonce = os.urandom(_STREAM_KEY_NONCE_SIZE)
+    
+    header = {
+        "format": FORMAT_ENCRYPTED_V2,
+        "encryption": {
+            "algorithm": "AES-256-GCM",
+            "kdf": "PBKDF2-SHA256",
+            "iterations": PBKDF2_ITERATIONS,
+            "salt": base64.b64encode(salt).decode('utf-8'),
+            "key_nonce": base64.b64encode(key_nonce).decode('utf-8'),
+            "compression": "zlib",
+            "chunk_size": chunk_size,
+        },
+        "metadata": _envelope_metadata(metadata, "2.0"),
+    }
+    header_line = json.dumps(header, separators=(",", ":")).encode('utf-8') + b"\n"
+    out.write(header_line)
+    
+    aead = _stream_cipher(key, key_nonce)
+    compressor = zlib.compressobj(6)
+    pending = bytearray()
+    counter = 0
+    
+    def seal(chunk: bytes, last: bool):
+        sealed = aead.encrypt(_stream_nonce(counter, last), chunk, header_line)
+        out.write(_STREAM_LENGTH.pack(len(sealed)))
+        out.write(sealed)
+    
+    for piece in json.JSONEncoder(separators=(",", ":")).iterencode(config_data):
+        pending += compressor.compress(piece.encode('utf-8'))
+        while len(pending) > chunk_size:
+            seal(bytes(pending[:chunk_size]), last=False)
+            del pending[:chunk_size]
+            counter += 1
+    
+    pending += compressor.flush()
+    while len(pending) > chunk_size:
+        seal(bytes(pending[:chunk_size]), last=False)
+        del pending[:chunk_size]
+        counter += 1
+    seal(bytes(pending), last=True)
+    
+    logger.info(f"Encrypted configuration: {header['metadata']['name']} ({counter + 1} chunk(s))")
+    return header
+
+
+def decrypt_config_stream(
+    inp: BinaryIO,
+    password: str,
+    file_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Decrypt a v2 chunked configuration stream.
+    
+    Args:
+        inp: Binary file object positioned at the start of the file
+        password: Decryption password
+        file_path: Optional source file (its salt is remembered for re-saves)
+        
+    Returns:
+        Decrypted configuration dictionary
+        
+    Raises:
+        ValueError: If format is invalid or decryption fails
+    """
+    header_line = inp.readline(MAX_HEADER_SIZE)
+    try:
+        header = json.loads(header_line)
+    except ValueError:
+        raise ValueError("Invalid encrypted file header")
+    if not isinstance(header, dict) or header.get("format") != FORMAT_ENCRYPTED_V2:
+        raise ValueError(f"Unknown format: {header.get('format') if isinstance(header, dict) else None}")
+    
+    encryption = header.get("encryption", {})
+    try:
+        salt = base64.b64decode(encryption["salt"])
+        key_nonce = base64.b64decode(encryption["key_nonce"])
+        iterations = int(encryption.get("iterations", PBKDF2_ITERATIONS))
+    except (KeyError, ValueError, TypeError):
+        raise ValueError("Missing encryption parameters")
+    
+    key, _ = get_keyring().key(password, salt=salt, iterations=iterations)
+    aead = _stream_cipher(key, key_nonce)
+    decompressor = zlib.decompressobj()
+    parts: List[bytes] = []
+    
+    def read_record() -> Optional[bytes]:
+        prefix = inp.read(_STREAM_LENGTH.size)
+        if not prefix:
+            return None
+        if len(prefix) != _STREAM_LENGTH.size:
+            raise ValueError("Truncated encrypted file")
+        length, = _STREAM_LENGTH.unpack(prefix)
+        if length < _STREAM_TAG_SIZE:
+            raise ValueError("Corrupted encrypted chunk")
+        sealed = inp.read(length)
+        if len(sealed) != length:
+            raise ValueError("Truncated encrypted file")
+        return sealed
+    
+    counter = 0
+    sealed = read_record()
+    if sealed is None:
+        raise ValueError("Encrypted file has no data")
+    try:
+        while sealed is not None:
+            following = read_record()
+            chunk = aead.decrypt(_stream_nonce(counter, following is None), sealed, header_line)
+            parts.append(decompressor.decompress(chunk))
+            sealed = following
+            counter += 1
+        parts.append(decompressor.flush())
+    except crypto_exceptions.InvalidTag:
+        if counter == 0:
+            raise ValueError("Incorrect password or corrupted data")
+        raise ValueError(f"Encrypted file is corrupted (chunk {counter})")
+    except zlib.error as e:
+        raise ValueError(f"Decryption failed: {e}")
+    if not decompressor.eof:
+        raise ValueError("Decryption failed: incomplete compressed data")
+    
+    config_data = json.loads(b"".join(parts).decode('utf-8'))
+    
+    if file_path:
+        get_keyring().remember_salt(file_path, password, salt)
+    
+    logger.info(f"Decrypted configuration: {header.get('metadata', {}).get('name', 'Unknown')}")
+    return config_data
+
+
+def is_stream_encrypted_file(file_path: str) -> bool:
+    """True if the file uses the v2 chunked encrypted format."""
+    try:
+        return read_config_header(file_path).get("format") == FORMAT_ENCRYPTED_V2
+    except Exception:
+        return False
+
+
+# Top-level keys that make up a configuration file header. Files are written
+# header-first, so these keys precede the (large) ciphertext or item data.
+HEADER_KEYS = (
+    "format",
+    "format_version",
+    "program_version",
+    "config_version",
+    "encryption",
+    "metadata",
+    "stats",
+)
+HEADER_READ_SIZE = 64 * 1024
+MAX_HEADER_SIZE = 1024 * 1024
+
+_WHITESPACE = re.compile(r'\s*')
+_header_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_header_cache_lock = threading.Lock()
+_HEADER_CACHE_SIZE = 256
+
+
+def _scan_header(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the leading header keys of a top-level JSON object.
+    
+    Stops at the first key that is not in HEADER_KEYS, so the rest of the
+    document is never parsed.
+    
+    Args:
+        text: Beginning of the file
+        
+    Returns:
+        Dict of header keys, or None if text ends before the header does
+        
+    Raises:
+        ValueError: If the text is not a JSON object
+    """
+    decoder = json.JSONDecoder()
+    pos = _WHITESPACE.match(text, 0).end()
+    if pos >= len(text):
+        return None
+    if text[pos] != '{':
+        raise ValueError("Not a JSON configuration file")
+    pos += 1
+    
+    header: Dict[str, Any] = {}
+    try:
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if text.startswith('}', pos):
+                return header
+            key, pos = decoder.raw_decode(text, pos)
+            pos = _WHITESPACE.match(text, pos).end()
+            if not text.startswith(':', pos):
+                return None
+            if key not in HEADER_KEYS:
+                return header
+            value, pos = decoder.raw_decode(text, _WHITESPACE.match(text, pos + 1).end())
+            header[key] = value
+            pos = _WHITESPACE.match(text, pos).end()
+            if text.startswith(',', pos):
+                pos += 1
+            elif text.startswith('}', pos):
+                return header
+            else:
+                return None
+    except (json.JSONDecodeError, IndexError):
+        # Truncated inside a value - caller reads more
+        return None
+
+
+def read_config_header(file_path: str) -> Dict[str, Any]:
+    """
+    Read the header of a configuration file without loading its data.
+    
+    Reads only the first few KB (format, encryption envelope, metadata and
+    stats). Files whose header is not at the front fall back to a full
+    parse. Results are cached per file until its size or mtime changes.
+    
+    Args:
+        file_path: Path to configuration file
+        
+    Returns:
+        Dict with the header keys present in the file
+        
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a JSON configuration
+    """
+    stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = os.path.realpath(file_path)
+    
+    with _header_cache_lock:
+        cached = _header_cache.get(cache_key)
+        if cached and cached[0] == signature:
+            _header_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached[1])
+    
+    header = None
+    with open(file_path, 'rb') as f:
+        raw = b""
+        size = HEADER_READ_SIZE
+        while header is None and len(raw) < MAX_HEADER_SIZE:
+            chunk = f.read(size - len(raw))
+            if not chunk:
+                break
+            raw += chunk
+            header = _scan_header(raw.decode('utf-8', errors='ignore'))
+            size *= 4
+    
+    if header is None or "metadata" not in header:
+        # Header not at the front of the file (or unusually large)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("Not a JSON configuration file")
+        header = {key: data[key] for key in HEADER_KEYS if key in data}
+    
+    with _header_cache_lock:
+        _header_cache[cache_key] = (signature, header)
+        while len(_header_cache) > _HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+    return copy.deepcopy(header)
+
+
 def is_encrypted_file(file_path: str) -> bool:
     """
     Check if a file is encrypted.
@@ -314,9 +668,7 @@ def is_encrypted_file(file_path: str) -> bool:
         True if file is encrypted
     """
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        return data.get("format") == FORMAT_ENCRYPTED_V1
+        return read_config_header(file_path).get("format") in ENCRYPTED_FORMATS
     except Exception:
         return False
 
@@ -325,6 +677,8 @@ def get_config_metadata(file_path: str) -> Optional[Dict[str, Any]]:
     """
     Get metadata from a configuration file without decrypting.
     
+    Only the file header is read (see read_config_header()).
+    
     Args:
         file_path: Path to configuration file
         
@@ -332,11 +686,10 @@ def get_config_metadata(file_path: str) -> Optional[Dict[str, Any]]:
         Metadata dictionary or None if file is invalid
     """
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = read_config_header(file_path)
         
-        # Encrypted format
-        if data.get("format") == FORMAT_ENCRYPTED_V1:
+        # Encrypted formats
+        if data.get("format") in ENCRYPTED_FORMATS:
             metadata = data.get("metadata", {})
             metadata["encrypted"] = True
             return metadata
@@ -351,6 +704,8 @@ def get_config_metadata(file_path: str) -> Optional[Dict[str, Any]]:
         metadata = data.get("metadata", {})
         metadata["encrypted"] = False
         metadata["name"] = metadata.get("name", os.path.basename(file_path))
+        if "stats" in data and metadata.get("item_count") is None:
+            metadata["item_count"] = data["stats"].get("total_items")
         return metadata
         
     except Exception as e:
@@ -374,10 +729,9 @@ def save_config_to_file(
         metadata: Optional metadata to include
     """
     if password:
-        # Encrypted save
-        encrypted = encrypt_config(config_data, password, metadata)
-        with open(file_path, 'w') as f:
-            json.dump(encrypted, f, indent=2)
+        # Encrypted save (streamed v2 format)
+        with open(file_path, 'wb') as f:
+            encrypt_config_stream(config_data, password, f, metadata, file_path=file_path)
     else:
         # Plain save
         output = {
@@ -405,13 +759,19 @@ def load_config_from_file(file_path: str, password: Optional[str] = None) -> Dic
     Raises:
         ValueError: If file is encrypted but no password provided
     """
+    if is_stream_encrypted_file(file_path):
+        if not password:
+            raise ValueError("File is encrypted, password required")
+        with open(file_path, 'rb') as f:
+            return decrypt_config_stream(f, password, file_path=file_path)
+    
     with open(file_path, 'r') as f:
         data = json.load(f)
     
     if data.get("format") == FORMAT_ENCRYPTED_V1:
         if not password:
             raise ValueError("File is encrypted, password required")
-        return decrypt_config(data, password)
+        return decrypt_config(data, password, file_path=file_path)
     
     if data.get("format") == FORMAT_PLAIN:
         return data.get("config", {})
@@ -5,9 +5,14 @@ Centralized system for identifying and filtering default/system items
 across all configuration types.
 """
 
-from typing import List, Set, Optional
+from typing import List, Set, Optional, TYPE_CHECKING
 import logging
 
+from config.defaults.default_classifier import DEFAULT_KEYWORDS_RE, compile_prefixes
+
+if TYPE_CHECKING:
+    from config.models.base import ConfigItem
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,6 +76,19 @@ class DefaultManager:
             self.default_snippets.update(custom_snippets)
         if custom_prefixes:
             self.default_prefixes.update(custom_prefixes)
+        
+        self._compile()
+    
+    def _compile(self) -> None:
+        """
+        Precompile the folder, snippet and prefix rules.
+        
+        Called after every change through the add_/remove_ methods; code
+        that edits the sets directly must call it too.
+        """
+        self._folder_keys = frozenset(folder.lower() for folder in self.default_folders)
+        self._snippet_keys = frozenset(snippet.lower() for snippet in self.default_snippets)
+        self._prefixes = compile_prefixes(self.default_prefixes)
     
     def is_default(self, item: 'ConfigItem') -> bool:
         """
@@ -113,53 +131,48 @@ class DefaultManager:
     def _is_default_folder(self, folder: str) -> bool:
         """Check if folder name indicates default items."""
         folder_lower = folder.lower()
-        
-        # Check exact match
-        if folder in self.default_folders:
-            return True
-        
-        # Check case-insensitive match
-        for default_folder in self.default_folders:
-            if folder_lower == default_folder.lower():
-                return True
-        
-        # Check if folder contains default keywords
-        for keyword in ['predefined', 'default', 'system']:
-            if keyword in folder_lower:
-                return True
-        
-        return False
+        return folder_lower in self._folder_keys or DEFAULT_KEYWORDS_RE.search(folder_lower) is not None
     
     def _is_default_snippet(self, snippet: str) -> bool:
         """Check if snippet name indicates default items."""
         snippet_lower = snippet.lower()
-        
-        # Check exact match
-        if snippet in self.default_snippets:
-            return True
-        
-        # Check case-insensitive match
-        for default_snippet in self.default_snippets:
-            if snippet_lower == default_snippet.lower():
-                return True
-        
-        # Check if snippet contains default keywords
-        for keyword in ['predefined', 'default', 'system']:
-            if keyword in snippet_lower:
-                return True
-        
-        return False
+        return snippet_lower in self._snippet_keys or DEFAULT_KEYWORDS_RE.search(snippet_lower) is not None
     
     def _is_default_name(self, name: str) -> bool:
         """Check if item name indicates a default item."""
-        name_lower = name.lower()
+        return name.lower().startswith(self._prefixes)
+    
+    def classify(self, items: List['ConfigItem']) -> List[bool]:
+        """
+        Classify a list of items in one pass.
         
-        # Check prefixes
-        for prefix in self.default_prefixes:
-            if name_lower.startswith(prefix.lower()):
-                return True
+        Folder results are computed once per distinct folder name.
         
-        return False
+        Args:
+            items: List of ConfigItem instances
+            
+        Returns:
+            List of is-default flags, parallel to items
+        """
+        folder_flags = {}
+        flags = []
+        for item in items:
+            if getattr(item, 'item_type', None) in self.ALWAYS_DEFAULT_TYPES or getattr(item, 'default', False):
+                flags.append(True)
+                continue
+            
+            folder = getattr(item, 'folder', None)
+            if folder:
+                is_default_folder = folder_flags.get(folder)
+                if is_default_folder is None:
+                    is_default_folder = folder_flags[folder] = self._is_default_folder(folder)
+                if is_default_folder:
+                    flags.append(True)
+                    continue
+            
+            name = getattr(item, 'name', None)
+            flags.append(bool(name) and name.lower().startswith(self._prefixes))
+        return flags
     
     def filter_defaults(
         self,
@@ -180,8 +193,8 @@ class DefaultManager:
             return items
         
         filtered = []
-        for item in items:
-            if not self.is_default(item):
+        for item, is_default in zip(items, self.classify(items)):
+            if not is_default:
                 filtered.append(item)
             else:
                 logger.debug(f"Filtering out default item: {item.item_type} '{item.name}'")
@@ -214,6 +227,7 @@ class DefaultManager:
             folder: Folder name to add
         """
         self.default_folders.add(folder)
+        self._compile()
         logger.info(f"Added default folder: {folder}")
     
     def add_default_snippet(self, snippet: str) -> None:
@@ -224,6 +238,7 @@ class DefaultManager:
             snippet: Snippet name to add
         """
         self.default_snippets.add(snippet)
+        self._compile()
         logger.info(f"Added default snippet: {snippet}")
     
     def add_default_prefix(self, prefix: str) -> None:
@@ -234,6 +249,7 @@ class DefaultManager:
             prefix: Name prefix to add
         """
         self.default_prefixes.add(prefix)
+        self._compile()
         logger.info(f"Added default prefix: {prefix}")
     
     def remove_default_folder(self, folder: str) -> None:
@@ -244,6 +260,7 @@ class DefaultManager:
             folder: Folder name to remove
         """
         self.default_folders.discard(folder)
+        self._compile()
         logger.info(f"Removed default folder: {folder}")
     
     def remove_default_snippet(self, snippet: str) -> None:
@@ -254,6 +271,7 @@ class DefaultManager:
             snippet: Snippet name to remove
         """
         self.default_snippets.discard(snippet)
+        self._compile()
         logger.info(f"Removed default snippet: {snippet}")
     
     def remove_default_prefix(self, prefix: str) -> None:
@@ -264,4 +282,5 @@ class DefaultManager:
             prefix: Name prefix to remove
         """
         self.default_prefixes.discard(prefix)
+        self._compile()
         logger.info(f"Removed default prefix: {prefix}")
@@ -4,6 +4,10 @@ Deployment coordination for POV environments.
 Provides:
 - DeploymentCoordinator: Orchestrates full deployment workflow
 - deploy_pov: Convenience function for POV deployment
+- DagExecutor: Dependency-ordered concurrent task runner used for device phases
+- ReadinessPoller: Shared TCP/HTTPS readiness probing for booting devices
+- CommitTracker: Shared async commit job polling for firewalls and Panorama
+- send_config_batch: Batched multi-config edits for firewalls and Panorama
 """
 
 from .coordinator import (
@@ -13,6 +17,10 @@ from .coordinator import (
     DeploymentStatus,
     deploy_pov,
 )
+from .dag import DagExecutor, TaskRecord, TaskStatus
+from .readiness import ReadinessPoller, get_readiness_poller, wait_until_ready
+from .commit_tracker import CommitTracker, JobStatus, get_commit_tracker, parse_job_status
+from .config_batch import ConfigBatchOutcome, send_config_batch
 
 __all__ = [
     'DeploymentCoordinator',
@@ -20,4 +28,16 @@ __all__ = [
     'DeploymentPhase',
     'DeploymentStatus',
     'deploy_pov',
+    'DagExecutor',
+    'TaskRecord',
+    'TaskStatus',
+    'ReadinessPoller',
+    'get_readiness_poller',
+    'wait_until_ready',
+    'CommitTracker',
+    'JobStatus',
+    'get_commit_tracker',
+    'parse_job_status',
+    'ConfigBatchOutcome',
+    'send_config_batch',
 ]
@@ -0,0 +1,350 @@
+"""
+Asynchronous commit job tracking for firewalls and Panorama.
+
+Commits are started with ``sync=False`` and their job IDs handed to the
+shared CommitTracker. One scheduler thread polls ``show jobs id <id>`` for
+every tracked job (on a small worker pool, so a slow device does not delay
+the others), backing off while a job makes no progress and streaming
+progress to each job's callback. Waiters block on an event until their job
+finishes, fails or times out, so every device of a deployment can commit in
+parallel without a thread spinning per commit.
+
+Job status XML (``show jobs id``):
+
+    <response status="success"><result><job>
+      <id>12</id><type>Commit</type><status>FIN</status><result>OK</result>
+      <progress>100</progress>
+      <details><line>Configuration committed successfully</line></details>
+      <warnings><line>...</line></warnings>
+      <devices><entry><serial-no>...</serial-no><result>OK</result>...</entry></devices>
+    </job></result></response>
+"""
+
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, Callable, Iterable, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobStatus:
+    """Parsed status of a PAN-OS job."""
+    job_id: str
+    status: str = "PEND"        # PEND, ACT, FIN
+    result: str = "PEND"        # PEND, OK, FAIL
+    progress: int = 0
+    job_type: str = ""
+    details: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    devices: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    timed_out: bool = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status == "FIN" or self.timed_out
+
+    @property
+    def success(self) -> bool:
+        return self.status == "FIN" and self.result == "OK"
+
+    @property
+    def message(self) -> str:
+        """Short human readable summary."""
+        if self.timed_out:
+            return f"Job {self.job_id} timed out at {self.progress}%"
+        if self.details:
+            return "; ".join(self.details)
+        if self.finished:
+            return f"Job {self.job_id} finished: {self.result}"
+        return f"Job {self.job_id} {self.status.lower()} ({self.progress}%)"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'status': self.status,
+            'result': self.result,
+            'progress': self.progress,
+            'job_type': self.job_type,
+            'details': self.details,
+            'warnings': self.warnings,
+            'devices': self.devices,
+            'timed_out': self.timed_out,
+        }
+
+
+def _lines(element: Optional[ET.Element]) -> List[str]:
+    """Collect text of <line> children (or the element text itself)."""
+    if element is None:
+        return []
+    lines = [(line.text or "").strip() for line in element.iter('line')]
+    lines = [line for line in lines if line]
+    if not lines and element.text and element.text.strip():
+        lines = [element.text.strip()]
+    return lines
+
+
+def parse_job_status(response: Union[ET.Element, str, bytes], job_id: Optional[str] = None) -> JobStatus:
+    """
+    Parse a ``show jobs id`` response.
+
+    Args:
+        response: Response element (as returned by pan-os-python op()) or XML text
+        job_id: Job ID to report if the response does not contain one
+
+    Returns:
+        JobStatus
+
+    Raises:
+        ValueError: If the response has no <job> element
+    """
+    if isinstance(response, (str, bytes)):
+        response = ET.fromstring(response)
+
+    job = response if response.tag == 'job' else response.find('.//job')
+    if job is None:
+        raise ValueError(f"No job in response for job {job_id}")
+
+    progress_text = (job.findtext('progress') or '').strip()
+    try:
+        progress = int(float(progress_text))
+    except ValueError:
+        # Finished jobs report a timestamp instead of a percentage
+        progress = 0
+
+    status = JobStatus(
+        job_id=(job.findtext('id') or job_id or '').strip(),
+        status=(job.findtext('status') or 'PEND').strip().upper(),
+        result=(job.findtext('result') or 'PEND').strip().upper(),
+        progress=progress,
+        job_type=(job.findtext('type') or '').strip(),
+        details=_lines(job.find('details')),
+        warnings=_lines(job.find('warnings')),
+    )
+    if status.status == 'FIN':
+        status.progress = 100
+
+    devices = job.find('devices')
+    if devices is not None:
+        for entry in devices.findall('entry'):
+            name = (entry.findtext('serial-no') or entry.findtext('devicename') or entry.get('name') or '').strip()
+            status.devices[name] = {
+                'status': (entry.findtext('status') or '').strip(),
+                'result': (entry.findtext('result') or '').strip(),
+                'progress': (entry.findtext('progress') or '').strip(),
+                'details': _lines(entry.find('details')),
+            }
+
+    return status
+
+
+class TrackedJob:
+    """A job registered with the CommitTracker."""
+
+    def __init__(
+        self,
+        name: str,
+        job_id: str,
+        poll: Callable[[str], JobStatus],
+        timeout: float,
+        progress_callback: Optional[Callable[[int, str], None]],
+        interval: float,
+    ):
+        self.name = name
+        self.job_id = job_id
+        self.poll = poll
+        self.deadline = time.monotonic() + timeout
+        self.progress_callback = progress_callback
+        self.interval = interval
+        self.next_poll = time.monotonic()
+        self.status: Optional[JobStatus] = None
+        self.polls = 0
+        self.in_flight = False
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[JobStatus]:
+        """
+        Block until the job finishes (or the tracker times it out).
+
+        Returns:
+            Final JobStatus, or None if still running when timeout expired
+        """
+        if not self._done.wait(timeout):
+            return None
+        return self.status
+
+
+class CommitTracker:
+    """
+    Poll many commit jobs concurrently with backoff.
+
+    Use get_commit_tracker() for the process-wide instance.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 2.0,
+        max_interval: float = 15.0,
+        backoff_factor: float = 1.5,
+        max_workers: int = 8,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            initial_interval: Delay between polls while a job makes progress
+            max_interval: Upper bound for the delay while progress stalls
+            backoff_factor: Multiplier applied when progress has not changed
+            max_workers: Concurrent status requests
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+        self._jobs: List[TrackedJob] = []
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="commit-poll")
+        self._thread: Optional[threading.Thread] = None
+
+    def track(
+        self,
+        name: str,
+        job_id: str,
+        poll: Callable[[str], JobStatus],
+        timeout: float = 600,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+    ) -> TrackedJob:
+        """
+        Start tracking a job.
+
+        Args:
+            name: Device/job label for logs
+            job_id: PAN-OS job ID
+            poll: Callable returning the JobStatus for a job ID
+            timeout: Seconds before the job is reported as timed out
+            progress_callback: Called with (percent, message) when progress changes
+
+        Returns:
+            TrackedJob to wait() on
+        """
+        job = TrackedJob(name, str(job_id), poll, timeout, progress_callback, self.initial_interval)
+        with self._cond:
+            self._jobs.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="commit-tracker", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        logger.info(f"[Commit] Tracking {name} job {job_id}")
+        return job
+
+    def wait_all(self, jobs: Iterable[TrackedJob]) -> Dict[str, Optional[JobStatus]]:
+        """
+        Wait for several jobs.
+
+        Returns:
+            Dict of job name -> final JobStatus
+        """
+        return {job.name: job.wait() for job in jobs}
+
+    def _run(self):
+        """Scheduler loop: dispatch due polls, expire timed-out jobs."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                wait_for = None
+                for job in list(self._jobs):
+                    if job.done:
+                        self._jobs.remove(job)
+                        continue
+                    if now >= job.deadline:
+                        self._finish(job, timed_out=True)
+                        self._jobs.remove(job)
+                        continue
+                    if job.in_flight:
+                        continue
+                    if job.next_poll <= now:
+                        job.in_flight = True
+                        self._pool.submit(self._poll, job)
+                    else:
+                        delay = min(job.next_poll, job.deadline) - now
+                        wait_for = delay if wait_for is None else min(wait_for, delay)
+                # Wake up at the latest at the next deadline so hung polls time out
+                self._cond.wait(wait_for if wait_for is not None else self._next_deadline())
+
+    def _next_deadline(self) -> Optional[float]:
+        """Seconds until the earliest deadline of an in-flight job."""
+        deadlines = [job.deadline for job in self._jobs if not job.done]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _poll(self, job: TrackedJob):
+        """Fetch one job's status (runs on the worker pool)."""
+        previous = job.status.progress if job.status else -1
+        try:
+            status = job.poll(job.job_id)
+            error = None
+        except Exception as e:
+            # Management plane can be briefly unresponsive during a commit
+            status, error = None, e
+
+        job.polls += 1
+        if status is not None:
+            job.status = status
+            if status.progress != previous and job.progress_callback:
+                try:
+                    job.progress_callback(status.progress, status.message)
+                except Exception as e:
+                    logger.debug(f"[Commit] Progress callback failed: {e}")
+
+        if job.done:
+            pass  # Timed out while this poll was in flight
+        elif status is not None and status.finished:
+            self._finish(job)
+        else:
+            if error is not None:
+                logger.debug(f"[Commit] {job.name} job {job.job_id} poll failed: {error}")
+            if status is None or status.progress == previous:
+                job.interval = min(job.interval * self.backoff_factor, self.max_interval)
+            else:
+                job.interval = self.initial_interval
+            job.next_poll = time.monotonic() + job.interval
+
+        with self._cond:
+            job.in_flight = False
+            self._cond.notify()
+
+    def _finish(self, job: TrackedJob, timed_out: bool = False):
+        """Mark a job complete and release its waiters."""
+        if job.done:
+            return
+        if timed_out:
+            if job.status is None:
+                job.status = JobStatus(job_id=job.job_id)
+            job.status.timed_out = True
+            logger.warning(f"[Commit] {job.name} job {job.job_id} timed out")
+        else:
+            level = logging.INFO if job.status.success else logging.WARNING
+            logger.log(level, f"[Commit] {job.name} job {job.job_id} {job.status.result} after {job.polls} poll(s)")
+        job._done.set()
+
+
+_tracker: Optional[CommitTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_commit_tracker() -> CommitTracker:
+    """Get the process-wide commit tracker."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = CommitTracker()
+        return _tracker
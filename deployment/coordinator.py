@@ -5,22 +5,26 @@ Orchestrates the full deployment workflow:
 1. Generate Terraform configuration
 2. Execute Terraform (init, plan, apply)
 3. Wait for infrastructure to be ready
-4. Push configuration to Panorama
-5. Push configuration to Firewalls
+4. Push configuration to Panorama and Firewalls (concurrently)
+5. Register Firewalls with Panorama (once both are configured)
+
+Steps 4-5 run as a dependency DAG (see deployment.dag): Panorama and each
+firewall only depend on the infrastructure, so device boot waits overlap.
 """
 
 import logging
 import os
+import threading
 from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from config.models.cloud import CloudConfig, CloudDeployment
 from terraform import TerraformGenerator, TerraformExecutor, TerraformResult
 from firewall.push import FirewallPushOrchestrator, PushResult as FirewallPushResult
 from panorama.push import PanoramaPushOrchestrator, PushResult as PanoramaPushResult
+from .dag import DagExecutor, TaskRecord, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +68,7 @@ class DeploymentResult:
     terraform_output: Dict[str, Any] = field(default_factory=dict)
     panorama_result: Optional[PanoramaPushResult] = None
     firewall_results: Dict[str, FirewallPushResult] = field(default_factory=dict)
+    device_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     @property
     def success(self) -> bool:
@@ -85,6 +90,7 @@ class DeploymentResult:
                 name: result.to_dict()
                 for name, result in self.firewall_results.items()
             },
+            'device_timings': self.device_timings,
         }
 
 
@@ -94,11 +100,19 @@ class DeploymentCoordinator:
 
     Manages the lifecycle of deploying a POV environment:
     1. Infrastructure provisioning with Terraform
-    2. Panorama configuration
-    3. Firewall configuration
+    2. Panorama and firewall configuration (concurrent)
+    3. Firewall registration with Panorama
     4. Validation and verification
     """
 
+    # Maximum firewalls configured at the same time
+    MAX_PARALLEL_FIREWALLS = 5
+
+    # DAG task names
+    TASK_PANORAMA = "panorama"
+    TASK_REGISTER = "register_firewalls"
+    FIREWALL_TASK_PREFIX = "firewall:"
+
     def __init__(
         self,
         config: CloudConfig,
@@ -125,6 +139,8 @@ class DeploymentCoordinator:
         self._result: Optional[DeploymentResult] = None
         self._progress_callback: Optional[Callable[[DeploymentPhase, str], None]] = None
         self._terraform_executor: Optional[TerraformExecutor] = None
+        self._terraform_plan: Optional[TerraformResult] = None
+        self._lock = threading.RLock()
 
     def deploy(
         self,
@@ -139,7 +155,8 @@ class DeploymentCoordinator:
         Args:
             skip_terraform: Skip Terraform phases (use existing infrastructure)
             terraform_output: Pre-existing Terraform output (if skip_terraform)
-            parallel_firewalls: Configure firewalls in parallel
+            parallel_firewalls: Configure firewalls in parallel (Panorama is
+                always configured alongside the firewalls)
             progress_callback: Optional callback for progress updates
 
         Returns:
@@ -199,23 +216,11 @@ class DeploymentCoordinator:
             )
             # Infrastructure readiness is handled by push orchestrators
 
-            # Phase 7: Configure Panorama (if present)
-            if self.config.panorama:
-                self._update_phase(
-                    DeploymentPhase.CONFIGURING_PANORAMA,
-                    "Configuring Panorama"
-                )
-                if not self._configure_panorama():
-                    # Panorama failure is not fatal if firewalls can work standalone
-                    self._result.errors.append("Panorama configuration failed")
+            # Phases 7-9: Panorama and firewalls concurrently, then registration
+            if self.config.panorama or self.config.firewalls:
+                firewalls_ok = self._configure_devices(parallel_firewalls=parallel_firewalls)
 
-            # Phase 8: Configure Firewalls
-            if self.config.firewalls:
-                self._update_phase(
-                    DeploymentPhase.CONFIGURING_FIREWALLS,
-                    f"Configuring {len(self.config.firewalls)} firewall(s)"
-                )
-                if not self._configure_firewalls(parallel=parallel_firewalls):
+                if self.config.firewalls and not firewalls_ok:
                     # Check if all firewalls failed
                     all_failed = all(
                         not result.success
@@ -227,14 +232,6 @@ class DeploymentCoordinator:
                         self._result.status = DeploymentStatus.PARTIAL
                         self._result.errors.append("Some firewall configurations failed")
 
-            # Phase 9: Register firewalls with Panorama (if applicable)
-            if self.config.panorama and self.config.firewalls:
-                self._update_phase(
-                    DeploymentPhase.REGISTERING_FIREWALLS,
-                    "Registering firewalls with Panorama"
-                )
-                self._register_firewalls_with_panorama()
-
             # Phase 10: Verify
             self._update_phase(DeploymentPhase.VERIFYING, "Verifying deployment")
             self._verify()
@@ -293,13 +290,26 @@ class DeploymentCoordinator:
 
     def _update_phase(self, phase: DeploymentPhase, message: str):
         """Update current phase and notify callback."""
-        self._result.phase = phase
-        self._result.phases_completed.append(phase.value)
+        with self._lock:
+            self._result.phase = phase
+            if phase.value not in self._result.phases_completed:
+                self._result.phases_completed.append(phase.value)
         logger.info(f"[Deployment] {message}")
 
         if self._progress_callback:
             self._progress_callback(phase, message)
 
+    def _report(self, phase: DeploymentPhase, message: str):
+        """Report per-device progress without changing the current phase."""
+        logger.info(f"[Deployment] {message}")
+        if self._progress_callback:
+            self._progress_callback(phase, message)
+
+    def _add_error(self, message: str):
+        """Record an error (safe to call from device threads)."""
+        with self._lock:
+            self._result.errors.append(message)
+
     def _fail(self, message: str) -> DeploymentResult:
         """Mark deployment as failed."""
         self._result.status = DeploymentStatus.FAILED
@@ -311,18 +321,21 @@ class DeploymentCoordinator:
         return self._result
 
     def _generate_terraform(self) -> bool:
-        """Generate Terraform configuration files."""
+        """Generate Terraform configuration files (only changed files are rewritten)."""
         try:
+            terraform_dir = os.path.join(self.output_dir, "terraform")
             generator = TerraformGenerator(
-                config=self.config,
-                output_dir=self.output_dir,
+                cloud_config=self.config,
+                output_dir=terraform_dir,
             )
             result = generator.generate()
-
-            terraform_dir = os.path.join(self.output_dir, "terraform")
             self._terraform_executor = TerraformExecutor(terraform_dir)
 
-            return len(result.get('files', [])) > 0
+            logger.info(
+                f"[Deployment] Terraform files: {len(result['files_changed'])} changed, "
+                f"{len(result['files_unchanged'])} unchanged"
+            )
+            return len(result.get('files_created', [])) > 0
 
         except Exception as e:
             self._result.errors.append(f"Terraform generation error: {e}")
@@ -334,7 +347,9 @@ class DeploymentCoordinator:
         try:
             result = self._terraform_executor.init()
             if not result.success:
-                self._result.errors.append(f"Terraform init error: {result.error}")
+                self._result.errors.append(f"Terraform init error: {result.error_message}")
+            elif result.cached:
+                self._report(DeploymentPhase.TERRAFORM_INIT, "Terraform already initialized, skipping init")
             return result.success
         except Exception as e:
             self._result.errors.append(f"Terraform init error: {e}")
@@ -346,25 +361,37 @@ class DeploymentCoordinator:
             # Create tfvars from credentials
             var_file = self._create_tfvars()
 
-            result = self._terraform_executor.plan(var_file=var_file)
+            result = self._terraform_executor.plan(var_file=var_file, reuse=True)
             if not result.success:
-                self._result.errors.append(f"Terraform plan error: {result.error}")
-            return result.success
+                self._result.errors.append(f"Terraform plan error: {result.error_message}")
+                return False
+
+            self._terraform_plan = result
+            if result.cached:
+                self._report(DeploymentPhase.TERRAFORM_PLAN, "Inputs unchanged, reusing saved plan")
+            return True
         except Exception as e:
             self._result.errors.append(f"Terraform plan error: {e}")
             return False
 
     def _terraform_apply(self) -> bool:
-        """Run terraform apply."""
+        """Run terraform apply with the saved plan (skipped if it has no changes)."""
         try:
+            plan = self._terraform_plan
+            if plan is not None and not plan.has_changes:
+                self._report(DeploymentPhase.TERRAFORM_APPLY, "No infrastructure changes, skipping apply")
+                return True
+
             var_file = self._create_tfvars()
 
             result = self._terraform_executor.apply(
+                plan_file=plan.plan_file if plan is not None else None,
                 var_file=var_file,
                 auto_approve=self.auto_approve,
             )
+            self._terraform_plan = None
             if not result.success:
-                self._result.errors.append(f"Terraform apply error: {result.error}")
+                self._result.errors.append(f"Terraform apply error: {result.error_message}")
             return result.success
         except Exception as e:
             self._result.errors.append(f"Terraform apply error: {e}")
@@ -397,13 +424,134 @@ class DeploymentCoordinator:
         """Get Terraform output values."""
         try:
             result = self._terraform_executor.output()
-            if result.success and result.output:
-                return result.output
+            if result.success and result.outputs:
+                return result.outputs
             return {}
         except Exception as e:
             logger.error(f"Failed to get Terraform output: {e}")
             return {}
 
+    def _configure_devices(self, parallel_firewalls: bool = True) -> bool:
+        """
+        Configure Panorama and firewalls as a dependency DAG.
+
+        Panorama and every firewall start as soon as the infrastructure is
+        up; registration waits for all of them. Per-device progress and
+        timing are reported through the progress callback and stored in
+        DeploymentResult.device_timings.
+
+        Args:
+            parallel_firewalls: Configure firewalls concurrently (otherwise
+                one after another, still alongside Panorama)
+
+        Returns:
+            True if every firewall was configured successfully
+        """
+        firewalls_ok = True
+        firewall_tasks = []
+        task_phases: Dict[str, DeploymentPhase] = {}
+
+        fw_workers = min(self.MAX_PARALLEL_FIREWALLS, len(self.config.firewalls or [])) if parallel_firewalls else 1
+        dag = DagExecutor(max_workers=1 + max(1, fw_workers))
+
+        if self.config.panorama:
+            dag.add(self.TASK_PANORAMA, self._configure_panorama)
+            task_phases[self.TASK_PANORAMA] = DeploymentPhase.CONFIGURING_PANORAMA
+
+        previous = None
+        for fw in self.config.firewalls or []:
+            fw_ip = self._firewall_ip(fw.name)
+            if not fw_ip:
+                self._add_error(f"No IP found for firewall {fw.name}")
+                firewalls_ok = False
+                continue
+
+            task_name = f"{self.FIREWALL_TASK_PREFIX}{fw.name}"
+            depends_on = [previous] if previous and not parallel_firewalls else []
+            dag.add(
+                task_name,
+                lambda fw=fw, fw_ip=fw_ip: self._run_firewall_task(fw, fw_ip),
+                depends_on=depends_on,
+                # Sequential mode only orders firewalls; one failure must not skip the rest
+                run_on_failed_dependencies=True,
+            )
+            task_phases[task_name] = DeploymentPhase.CONFIGURING_FIREWALLS
+            firewall_tasks.append(task_name)
+            previous = task_name
+
+        if self.config.panorama and self.config.firewalls:
+            dag.add(
+                self.TASK_REGISTER,
+                self._register_firewalls_with_panorama,
+                depends_on=[self.TASK_PANORAMA] + firewall_tasks,
+                run_on_failed_dependencies=True,
+            )
+            task_phases[self.TASK_REGISTER] = DeploymentPhase.REGISTERING_FIREWALLS
+
+        if firewall_tasks:
+            self._update_phase(
+                DeploymentPhase.CONFIGURING_FIREWALLS,
+                f"Configuring {len(firewall_tasks)} firewall(s)"
+                + (" alongside Panorama" if self.config.panorama else "")
+            )
+
+        def on_task_start(name: str):
+            phase = task_phases[name]
+            if name == self.TASK_PANORAMA:
+                self._update_phase(phase, "Configuring Panorama")
+            elif name == self.TASK_REGISTER:
+                self._update_phase(phase, "Registering firewalls with Panorama")
+            else:
+                self._report(phase, f"[{self._device_name(name)}] Configuration started")
+
+        def on_task_done(record: TaskRecord):
+            self._record_timing(record)
+            if record.status == TaskStatus.SKIPPED:
+                message = f"[{self._device_name(record.name)}] Skipped: {record.error}"
+            else:
+                message = (
+                    f"[{self._device_name(record.name)}] {record.status.value} "
+                    f"in {record.duration_s:.1f}s"
+                )
+            self._report(task_phases[record.name], message)
+
+        records = dag.run(on_task_start=on_task_start, on_task_done=on_task_done)
+
+        for task_name in firewall_tasks:
+            record = records[task_name]
+            if record.error and record.status == TaskStatus.FAILED:
+                self._add_error(f"Firewall {self._device_name(task_name)} error: {record.error}")
+            if not record.success:
+                firewalls_ok = False
+
+        if self.config.panorama and not records[self.TASK_PANORAMA].success:
+            # Panorama failure is not fatal if firewalls can work standalone
+            self._add_error("Panorama configuration failed")
+
+        return firewalls_ok
+
+    def _device_name(self, task_name: str) -> str:
+        """Display name for a DAG task."""
+        if task_name.startswith(self.FIREWALL_TASK_PREFIX):
+            return task_name[len(self.FIREWALL_TASK_PREFIX):]
+        if task_name == self.TASK_PANORAMA and self.config.panorama:
+            return getattr(self.config.panorama, 'name', None) or task_name
+        return task_name
+
+    def _record_timing(self, record: TaskRecord):
+        """Store per-device timing in the result."""
+        with self._lock:
+            self._result.device_timings[self._device_name(record.name)] = record.to_dict()
+
+    def _firewall_ip(self, fw_name: str) -> Optional[str]:
+        """Look up a firewall's management IP in the Terraform output."""
+        firewall_ips = self._result.terraform_output.get('firewall_management_ips', {})
+        fw_ip = firewall_ips.get(fw_name)
+        if not fw_ip:
+            # Try alternative naming
+            fw_ip = self._result.terraform_output.get(f'{fw_name}_management_ip')
+        return fw_ip
+
     def _configure_panorama(self) -> bool:
         """Configure Panorama using push orchestrator."""
         try:
@@ -413,7 +561,7 @@ class DeploymentCoordinator:
             )
 
             if not panorama_ip:
-                self._result.errors.append("Panorama IP not found in Terraform output")
+                self._add_error("Panorama IP not found in Terraform output")
                 return False
 
             orchestrator = PanoramaPushOrchestrator(
@@ -427,80 +575,28 @@ class DeploymentCoordinator:
                 license_auth_code=self.credentials.get('panorama_license'),
             )
 
+            name = self._device_name(self.TASK_PANORAMA)
             result = orchestrator.push(
-                progress_callback=lambda phase, msg: logger.info(f"[Panorama] {msg}")
+                progress_callback=lambda phase, msg: self._report(
+                    DeploymentPhase.CONFIGURING_PANORAMA, f"[{name}] {msg}"
+                )
             )
-            self._result.panorama_result = result
+            with self._lock:
+                self._result.panorama_result = result
 
             return result.success
 
         except Exception as e:
-            self._result.errors.append(f"Panorama configuration error: {e}")
+            self._add_error(f"Panorama configuration error: {e}")
             logger.error(f"Failed to configure Panorama: {e}")
             return False
 
-    def _configure_firewalls(self, parallel: bool = True) -> bool:
-        """Configure firewalls using push orchestrators."""
-        try:
-            all_success = True
-
-            # Get firewall IPs from Terraform output
-            firewall_ips = self._result.terraform_output.get('firewall_management_ips', {})
-
-            if parallel and len(self.config.firewalls) > 1:
-                # Configure firewalls in parallel
-                with ThreadPoolExecutor(max_workers=min(5, len(self.config.firewalls))) as executor:
-                    futures = {}
-
-                    for fw in self.config.firewalls:
-                        fw_ip = firewall_ips.get(fw.name)
-                        if not fw_ip:
-                            # Try alternative naming
-                            fw_ip = self._result.terraform_output.get(f'{fw.name}_management_ip')
-
-                        if fw_ip:
-                            future = executor.submit(
-                                self._configure_single_firewall,
-                                fw,
-                                fw_ip,
-                            )
-                            futures[future] = fw.name
-                        else:
-                            self._result.errors.append(f"No IP found for firewall {fw.name}")
-                            all_success = False
-
-                    for future in as_completed(futures):
-                        fw_name = futures[future]
-                        try:
-                            result = future.result()
-                            self._result.firewall_results[fw_name] = result
-                            if not result.success:
-                                all_success = False
-                        except Exception as e:
-                            self._result.errors.append(f"Firewall {fw_name} error: {e}")
-                            all_success = False
-            else:
-                # Configure firewalls sequentially
-                for fw in self.config.firewalls:
-                    fw_ip = firewall_ips.get(fw.name)
-                    if not fw_ip:
-                        fw_ip = self._result.terraform_output.get(f'{fw.name}_management_ip')
-
-                    if fw_ip:
-                        result = self._configure_single_firewall(fw, fw_ip)
-                        self._result.firewall_results[fw.name] = result
-                        if not result.success:
-                            all_success = False
-                    else:
-                        self._result.errors.append(f"No IP found for firewall {fw.name}")
-                        all_success = False
-
-            return all_success
-
-        except Exception as e:
-            self._result.errors.append(f"Firewall configuration error: {e}")
-            logger.error(f"Failed to configure firewalls: {e}")
-            return False
+    def _run_firewall_task(self, firewall_config, management_ip: str) -> bool:
+        """DAG task: configure one firewall and store its result."""
+        result = self._configure_single_firewall(firewall_config, management_ip)
+        with self._lock:
+            self._result.firewall_results[firewall_config.name] = result
+        return result.success
 
     def _configure_single_firewall(self, firewall_config, management_ip: str) -> FirewallPushResult:
         """Configure a single firewall."""
@@ -515,18 +611,37 @@ class DeploymentCoordinator:
         )
 
         return orchestrator.push(
-            progress_callback=lambda phase, msg: logger.info(f"[{firewall_config.name}] {msg}")
+            progress_callback=lambda phase, msg: self._report(
+                DeploymentPhase.CONFIGURING_FIREWALLS, f"[{firewall_config.name}] {msg}"
+            )
         )
 
     def _register_firewalls_with_panorama(self) -> bool:
         """Register firewalls with Panorama (placeholder for future implementation)."""
+        # Runs after Panorama and all firewall tasks have finished; only
+        # successfully configured firewalls would be registered.
+        panorama_result = self._result.panorama_result
+        if not panorama_result or not panorama_result.success:
+            logger.info("Skipping firewall registration - Panorama not configured")
+            return False
+
+        ready = [
+            name for name, result in self._result.firewall_results.items()
+            if result.success
+        ]
+        if not ready:
+            logger.info("Skipping firewall registration - no firewalls configured")
+            return False
+
         # This would use the Panorama API to:
         # 1. Add firewalls as managed devices
         # 2. Assign to device groups
         # 3. Assign template stacks
         # 4. Push policies to devices
 
-        logger.info("Firewall registration with Panorama - not yet implemented")
+        logger.info(
+            f"Firewall registration with Panorama ({', '.join(ready)}) - not yet implemented"
+        )
         return True
 
     def _verify(self) -> bool:
@@ -0,0 +1,237 @@
+"""
+Dependency DAG executor for deployment phases.
+
+Runs tasks on a thread pool as soon as all of their dependencies have
+finished, so independent work (e.g. Panorama and firewall configuration)
+overlaps instead of running phase after phase:
+
+    infrastructure ─┬─> panorama ───────────┐
+                    ├─> firewall:fw-1 ──────┼─> register_firewalls
+                    └─> firewall:fw-2 ──────┘
+
+A task returns True on success. A task whose dependency failed or was
+skipped is skipped too, unless it was added with
+``run_on_failed_dependencies=True``.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Any, Optional, List, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStatus(str, Enum):
+    """Status of a DAG task."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class DagTask:
+    """A unit of work in the DAG."""
+    name: str
+    func: Callable[[], bool]
+    depends_on: List[str] = field(default_factory=list)
+    run_on_failed_dependencies: bool = False
+
+
+@dataclass
+class TaskRecord:
+    """Outcome and timing of a DAG task."""
+    name: str
+    status: TaskStatus = TaskStatus.PENDING
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    duration_s: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.status == TaskStatus.SUCCESS
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'status': self.status.value,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'duration_s': self.duration_s,
+            'error': self.error,
+        }
+
+
+class DagExecutor:
+    """
+    Execute tasks in dependency order with bounded concurrency.
+
+    Example:
+        dag = DagExecutor(max_workers=4)
+        dag.add('panorama', configure_panorama)
+        dag.add('fw-1', configure_fw1)
+        dag.add('register', register, depends_on=['panorama', 'fw-1'])
+        records = dag.run()
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of tasks running at once
+        """
+        self.max_workers = max(1, max_workers)
+        self._tasks: Dict[str, DagTask] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], bool],
+        depends_on: Iterable[str] = (),
+        run_on_failed_dependencies: bool = False,
+    ) -> DagTask:
+        """
+        Add a task.
+
+        Args:
+            name: Unique task name
+            func: Callable returning True on success
+            depends_on: Names of tasks that must finish first
+            run_on_failed_dependencies: Run even if a dependency failed/skipped
+
+        Returns:
+            The added DagTask
+        """
+        if name in self._tasks:
+            raise ValueError(f"Duplicate task name: {name}")
+        task = DagTask(name, func, list(depends_on), run_on_failed_dependencies)
+        self._tasks[name] = task
+        return task
+
+    def validate(self):
+        """
+        Check that all dependencies exist and there are no cycles.
+
+        Raises:
+            ValueError: If the graph is invalid
+        """
+        for task in self._tasks.values():
+            for dep in task.depends_on:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task '{task.name}' depends on unknown task '{dep}'")
+
+        # Kahn's algorithm: every task must be reachable from a root
+        remaining = {name: len(task.depends_on) for name, task in self._tasks.items()}
+        dependents = self._dependents()
+        ready = [name for name, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            name = ready.pop()
+            visited += 1
+            for child in dependents[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if visited != len(self._tasks):
+            cyclic = sorted(name for name, count in remaining.items() if count > 0)
+            raise ValueError(f"Dependency cycle between tasks: {', '.join(cyclic)}")
+
+    def run(
+        self,
+        on_task_start: Optional[Callable[[str], None]] = None,
+        on_task_done: Optional[Callable[[TaskRecord], None]] = None,
+    ) -> Dict[str, TaskRecord]:
+        """
+        Run all tasks.
+
+        Callbacks are invoked from the calling thread.
+
+        Args:
+            on_task_start: Called with the task name when it is submitted
+            on_task_done: Called with the TaskRecord when it finishes or is skipped
+
+        Returns:
+            Dict of task name -> TaskRecord, in insertion order
+        """
+        self.validate()
+
+        records = {name: TaskRecord(name) for name in self._tasks}
+        dependents = self._dependents()
+        waiting = {name: set(task.depends_on) for name, task in self._tasks.items()}
+        lock = threading.Lock()
+
+        def execute(task: DagTask) -> TaskRecord:
+            record = records[task.name]
+            start = time.monotonic()
+            with lock:
+                record.status = TaskStatus.RUNNING
+                record.started_at = datetime.utcnow().isoformat()
+            try:
+                ok = bool(task.func())
+                error = None
+            except Exception as e:
+                logger.exception(f"[DAG] Task '{task.name}' raised: {e}")
+                ok, error = False, str(e)
+            with lock:
+                record.status = TaskStatus.SUCCESS if ok else TaskStatus.FAILED
+                record.error = error
+                record.completed_at = datetime.utcnow().isoformat()
+                record.duration_s = round(time.monotonic() - start, 2)
+            return record
+
+        def finish(record: TaskRecord, ready: List[str]):
+            """Release dependents of a finished task."""
+            if on_task_done:
+                on_task_done(record)
+            for child in dependents[record.name]:
+                waiting[child].discard(record.name)
+                if not waiting[child]:
+                    ready.append(child)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            ready = [name for name, deps in waiting.items() if not deps]
+
+            while ready or running:
+                while ready:
+                    name = ready.pop(0)
+                    task = self._tasks[name]
+                    failed_deps = [
+                        dep for dep in task.depends_on if not records[dep].success
+                    ]
+                    if failed_deps and not task.run_on_failed_dependencies:
+                        record = records[name]
+                        record.status = TaskStatus.SKIPPED
+                        record.error = f"Dependencies not satisfied: {', '.join(failed_deps)}"
+                        logger.info(f"[DAG] Skipping '{name}': {record.error}")
+                        finish(record, ready)
+                        continue
+
+                    if on_task_start:
+                        on_task_start(name)
+                    running[pool.submit(execute, task)] = name
+
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    finish(future.result(), ready)
+
+        return records
+
+    def _dependents(self) -> Dict[str, List[str]]:
+        """Map each task to the tasks that depend on it."""
+        dependents: Dict[str, List[str]] = {name: [] for name in self._tasks}
+        for task in self._tasks.values():
+            for dep in task.depends_on:
+                dependents[dep].append(task.name)
+        return dependents
@@ -0,0 +1,413 @@
+"""
+Shared device readiness poller.
+
+Freshly deployed firewalls and Panorama spend most of their first minutes
+booting. Instead of one thread per device sleeping a fixed interval between
+full API logins, a single background thread probes every watched device
+with cheap non-blocking checks multiplexed on one selector:
+
+    TCP connect (443) -> TLS handshake -> HTTP status line from the web server
+
+Failed probes back off exponentially per device (with jitter). Waiters block
+on an event and are woken the moment their device answers; only then do
+they make the full (expensive) API call. If that call still fails, the
+waiter reports it and the device goes back to probing with backoff.
+
+Example:
+    client = wait_until_ready(
+        ip, check=lambda: connect_client(ip), timeout=600,
+        retry_on=(FirewallConnectionError,),
+    )
+"""
+
+import logging
+import random
+import selectors
+import socket
+import ssl
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Callable, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Probe stages
+_IDLE = "idle"
+_CONNECTING = "connecting"
+_HANDSHAKE = "handshake"
+_RESPONSE = "response"
+
+_PROBE_REQUEST = b"HEAD /php/login.php HTTP/1.0\r\nConnection: close\r\n\r\n"
+
+
+@dataclass
+class _DeviceState:
+    """Probe state for one watched endpoint."""
+    host: str
+    port: int
+    https: bool
+    interval: float
+    ready: threading.Event = field(default_factory=threading.Event)
+    watchers: int = 0
+    stage: str = _IDLE
+    next_probe: float = 0.0
+    deadline: float = 0.0
+    sock: Optional[socket.socket] = None
+    probes: int = 0
+    max_interval: Optional[float] = None
+    first_watched: float = field(default_factory=time.monotonic)
+
+    @property
+    def key(self) -> Tuple[str, int, bool]:
+        return (self.host, self.port, self.https)
+
+
+class ReadinessPoller:
+    """
+    Probe many devices for reachability from one background thread.
+
+    Use get_readiness_poller() for the process-wide instance so all devices
+    of a deployment share the same thread.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.6,
+        probe_timeout: float = 5.0,
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            initial_interval: Delay before re-probing after the first failure
+            max_interval: Upper bound for the per-device backoff
+            backoff_factor: Multiplier applied after each failure
+            probe_timeout: Maximum duration of a single probe
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.probe_timeout = probe_timeout
+
+        self._devices: Dict[Tuple[str, int, bool], _DeviceState] = {}
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self._ssl_context = ssl.create_default_context()
+        # Devices use self-signed certificates; this is a liveness probe only
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    # ========== Waiter API ==========
+
+    def watch(self, host: str, port: int = 443, https: bool = True) -> _DeviceState:
+        """
+        Start probing a device (reference counted).
+
+        Args:
+            host: Hostname or IP
+            port: TCP port to probe
+            https: Also require a TLS handshake and HTTP response
+
+        Returns:
+            Device state handle for wait()/report_not_ready()/unwatch()
+        """
+        with self._lock:
+            key = (host, port, https)
+            state = self._devices.get(key)
+            if state is None:
+                state = _DeviceState(host, port, https, interval=self.initial_interval)
+                self._devices[key] = state
+                logger.debug(f"[Readiness] Watching {host}:{port}")
+            state.watchers += 1
+            self._ensure_thread()
+        self._wake()
+        return state
+
+    def unwatch(self, state: _DeviceState):
+        """Stop probing a device once no waiter needs it."""
+        with self._lock:
+            state.watchers -= 1
+            if state.watchers > 0:
+                return
+            self._devices.pop(state.key, None)
+        self._wake()
+
+    def wait(self, state: _DeviceState, timeout: Optional[float]) -> bool:
+        """
+        Block until the device answers probes.
+
+        Args:
+            state: Handle from watch()
+            timeout: Seconds to wait (None = forever)
+
+        Returns:
+            True if the device is reachable
+        """
+        return state.ready.wait(timeout)
+
+    def set_max_interval(self, state: _DeviceState, max_interval: float):
+        """Cap the backoff between probes of one device."""
+        with self._lock:
+            state.max_interval = max_interval
+
+    def report_not_ready(self, state: _DeviceState):
+        """
+        Report that a full API check failed although probes succeeded.
+
+        The device goes back to probing after its current backoff delay.
+        """
+        with self._lock:
+            state.ready.clear()
+            state.next_probe = time.monotonic() + self._next_delay(state)
+        self._wake()
+
+    def stop(self):
+        """Stop the background thread and release sockets."""
+        with self._lock:
+            self._stopped = True
+        self._wake()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    # ========== Background loop ==========
+
+    def _ensure_thread(self):
+        """Start the probe thread on first use (caller holds the lock)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="device-readiness", daemon=True
+            )
+            self._thread.start()
+
+    def _wake(self):
+        """Interrupt select() so watch/unwatch changes are picked up."""
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run(self):
+        """Probe loop: start due probes, advance in-flight ones, apply timeouts."""
+        while True:
+            with self._lock:
+                if self._stopped:
+                    break
+                devices = list(self._devices.values())
+
+            # Drop in-flight probes of devices nobody waits for anymore
+            watched = {id(state) for state in devices}
+            for key in list(self._selector.get_map().values()):
+                if key.data is not None and id(key.data) not in watched:
+                    self._close_probe(key.data)
+
+            now = time.monotonic()
+            wait_for: Optional[float] = None
+            for state in devices:
+                if state.ready.is_set():
+                    continue
+                if state.stage == _IDLE:
+                    if state.next_probe <= now:
+                        self._start_probe(state, now)
+                    else:
+                        wait_for = self._min(wait_for, state.next_probe - now)
+                        continue
+                if state.stage != _IDLE:
+                    if now >= state.deadline:
+                        self._probe_failed(state, "probe timed out")
+                    else:
+                        wait_for = self._min(wait_for, state.deadline - now)
+
+            for key, _ in self._selector.select(wait_for):
+                if key.data is None:
+                    self._drain_wake()
+                else:
+                    self._advance_probe(key.data)
+
+        for state in list(self._devices.values()):
+            self._close_probe(state)
+
+    @staticmethod
+    def _min(current: Optional[float], value: float) -> float:
+        value = max(0.0, value)
+        return value if current is None else min(current, value)
+
+    def _drain_wake(self):
+        try:
+            while self._wake_r.recv(256):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _start_probe(self, state: _DeviceState, now: float):
+        """Begin a non-blocking TCP connect."""
+        state.probes += 1
+        state.deadline = now + self.probe_timeout
+        try:
+            addr = socket.getaddrinfo(state.host, state.port, type=socket.SOCK_STREAM)[0]
+            sock = socket.socket(addr[0], addr[1], addr[2])
+            sock.setblocking(False)
+            sock.connect_ex(addr[4])
+        except OSError as e:
+            self._probe_failed(state, str(e))
+            return
+        state.sock = sock
+        state.stage = _CONNECTING
+        self._selector.register(sock, selectors.EVENT_WRITE, state)
+
+    def _advance_probe(self, state: _DeviceState):
+        """Move a probe forward when its socket is ready."""
+        try:
+            if state.stage == _CONNECTING:
+                error = state.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if error:
+                    self._probe_failed(state, f"connect error {error}")
+                    return
+                if not state.https:
+                    self._probe_succeeded(state)
+                    return
+                self._selector.unregister(state.sock)
+                state.sock = self._ssl_context.wrap_socket(
+                    state.sock, do_handshake_on_connect=False
+                )
+                state.stage = _HANDSHAKE
+                self._selector.register(state.sock, selectors.EVENT_WRITE, state)
+
+            if state.stage == _HANDSHAKE:
+                state.sock.do_handshake()
+                state.sock.send(_PROBE_REQUEST)
+                state.stage = _RESPONSE
+                self._selector.modify(state.sock, selectors.EVENT_READ, state)
+                return
+
+            if state.stage == _RESPONSE:
+                data = state.sock.recv(64)
+                if data.startswith(b"HTTP/"):
+                    self._probe_succeeded(state)
+                else:
+                    self._probe_failed(state, "no HTTP response")
+
+        except ssl.SSLWantReadError:
+            self._selector.modify(state.sock, selectors.EVENT_READ, state)
+        except ssl.SSLWantWriteError:
+            self._selector.modify(state.sock, selectors.EVENT_WRITE, state)
+        except (OSError, ValueError) as e:
+            self._probe_failed(state, str(e))
+
+    def _probe_succeeded(self, state: _DeviceState):
+        self._close_probe(state)
+        waited = time.monotonic() - state.first_watched
+        logger.info(
+            f"[Readiness] {state.host}:{state.port} reachable after {waited:.0f}s "
+            f"({state.probes} probe(s))"
+        )
+        state.ready.set()
+
+    def _probe_failed(self, state: _DeviceState, reason: str):
+        self._close_probe(state)
+        with self._lock:
+            delay = self._next_delay(state)
+            state.next_probe = time.monotonic() + delay
+        logger.debug(f"[Readiness] {state.host}:{state.port} not reachable ({reason}), next probe in {delay:.1f}s")
+
+    def _next_delay(self, state: _DeviceState) -> float:
+        """Current backoff delay (with jitter); grows the interval for next time (caller holds the lock)."""
+        cap = self.max_interval
+        if state.max_interval is not None:
+            cap = min(cap, state.max_interval)
+        delay = min(state.interval, cap) * random.uniform(0.9, 1.1)
+        state.interval = min(state.interval * self.backoff_factor, cap)
+        return delay
+
+    def _close_probe(self, state: _DeviceState):
+        if state.sock is not None:
+            try:
+                self._selector.unregister(state.sock)
+            except (KeyError, ValueError):
+                pass
+            try:
+                state.sock.close()
+            except OSError:
+                pass
+        state.sock = None
+        state.stage = _IDLE
+
+
+_poller: Optional[ReadinessPoller] = None
+_poller_lock = threading.Lock()
+
+
+def get_readiness_poller() -> ReadinessPoller:
+    """Get the process-wide readiness poller."""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = ReadinessPoller()
+        return _poller
+
+
+def wait_until_ready(
+    host: str,
+    check: Callable[[], T],
+    timeout: float,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    max_attempts: int = 0,
+    max_interval: Optional[float] = None,
+    port: int = 443,
+    label: str = "Device",
+) -> Optional[T]:
+    """
+    Wait for a device to answer probes, then run the full readiness check.
+
+    Args:
+        host: Device hostname or IP
+        check: Full API check; its return value is passed through
+        timeout: Overall timeout in seconds
+        retry_on: Exceptions from check() that mean "not ready yet"
+        max_attempts: Maximum check() calls (0 = limited by timeout only)
+        max_interval: Cap for the backoff between probes of this device
+        port: HTTPS management port
+        label: Name used in log messages
+
+    Returns:
+        Result of check(), or None on timeout / attempts exhausted
+    """
+    poller = get_readiness_poller()
+    state = poller.watch(host, port=port)
+    if max_interval is not None:
+        poller.set_max_interval(state, max_interval)
+
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not poller.wait(state, remaining):
+                logger.warning(f"{label} {host} not accessible after {timeout}s")
+                return None
+
+            attempt += 1
+            try:
+                result = check()
+                logger.info(f"{label} {host} is accessible (attempt {attempt})")
+                return result
+            except retry_on as e:
+                logger.debug(f"{label} {host} reachable but not ready yet: {e}")
+                if max_attempts > 0 and attempt >= max_attempts:
+                    logger.warning(f"{label} {host} not accessible after {max_attempts} retries")
+                    return None
+                poller.report_not_ready(state)
+    finally:
+        poller.unwatch(state)
@@ -13,6 +13,8 @@ from .api_client import (
     DeviceInfo,
     CommitResult,
     CommitStatus,
+    BatchResult,
+    BatchFailure,
     wait_for_firewall,
 )
 from .push import (
@@ -31,6 +33,8 @@ __all__ = [
     'DeviceInfo',
     'CommitResult',
     'CommitStatus',
+    'BatchResult',
+    'BatchFailure',
     'wait_for_firewall',
     # Push Orchestrator
     'FirewallPushOrchestrator',
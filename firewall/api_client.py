@@ -4,37 +4,30 @@ Firewall API Client for PAN-OS firewalls.
 Wraps the pan-os-python library to provide a clean interface for:
 - Connection and authentication
 - Configuration operations (get, set, delete)
+- Batched configuration (multi-config edits)
 - Commit operations
 - System operations (licensing, software)
 """
 
 import logging
-import time
-from typing import Dict, Any, Optional, List, Callable
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 
-try:
+from config.lazy_import import lazy_import, module_available
+
+if TYPE_CHECKING:
     from panos.firewall import Firewall
-    from panos.panorama import Panorama
-    from panos.errors import PanDeviceError, PanConnectionTimeout, PanURLError
-    from panos.device import SystemSettings
-    from panos.network import (
-        EthernetInterface,
-        Zone,
-        VirtualRouter,
-        StaticRoute,
-        IkeGateway,
-        IpsecTunnel,
-        IpsecCryptoProfile,
-        IkeCryptoProfile,
-        TunnelInterface,
-    )
-    from panos.policies import Rulebase, SecurityRule, NatRule
-    from panos.objects import AddressObject, AddressGroup, ServiceObject, Tag
-    PANOS_AVAILABLE = True
-except ImportError:
-    PANOS_AVAILABLE = False
+
+# pan-os-python is imported on first use, not when this module is imported
+PANOS_AVAILABLE = module_available("panos")
+panos_firewall = lazy_import("panos.firewall")
+panos_errors = lazy_import("panos.errors")
+panos_device = lazy_import("panos.device")
+panos_network = lazy_import("panos.network")
+panos_policies = lazy_import("panos.policies")
+panos_objects = lazy_import("panos.objects")
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +71,44 @@ class CommitResult:
         }
 
 
+@dataclass
+class BatchFailure:
+    """A single object that could not be configured in a batch."""
+    name: str
+    object_type: str
+    xpath: str
+    error: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'object_type': self.object_type,
+            'xpath': self.xpath,
+            'error': self.error,
+        }
+
+
+@dataclass
+class BatchResult:
+    """Result of flushing a configuration batch."""
+    total: int = 0
+    succeeded: List[str] = field(default_factory=list)
+    failures: List[BatchFailure] = field(default_factory=list)
+    round_trips: int = 0
+
+    @property
+    def success(self) -> bool:
+        return not self.failures
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'succeeded': self.succeeded,
+            'failures': [f.to_dict() for f in self.failures],
+            'round_trips': self.round_trips,
+        }
+
+
 @dataclass
 class DeviceInfo:
     """Firewall device information."""
@@ -147,9 +178,12 @@ class FirewallAPIClient:
         self.port = port
         self.timeout = timeout
 
-        self._firewall: Optional[Firewall] = None
+        self._firewall: Optional["Firewall"] = None
         self._connected = False
 
+        # Objects staged while a batch is active, in staging order
+        self._batch: Optional[List[Any]] = None
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to firewall."""
@@ -171,7 +205,7 @@ class FirewallAPIClient:
         logger.info(f"Connecting to firewall at {self.hostname}")
 
         try:
-            self._firewall = Firewall(
+            self._firewall = panos_firewall.Firewall(
                 hostname=self.hostname,
                 api_username=self.username,
                 api_password=self.password,
@@ -187,13 +221,13 @@ class FirewallAPIClient:
             logger.info(f"Connected to {self._firewall.hostname} ({self._firewall.serial})")
             return True
 
-        except PanConnectionTimeout as e:
+        except panos_errors.PanConnectionTimeout as e:
             self._connected = False
             raise FirewallConnectionError(f"Connection timeout: {e}")
-        except PanURLError as e:
+        except panos_errors.PanURLError as e:
             self._connected = False
             raise FirewallConnectionError(f"Connection error: {e}")
-        except PanDeviceError as e:
+        except panos_errors.PanDeviceError as e:
             self._connected = False
             raise FirewallConnectionError(f"Device error: {e}")
         except Exception as e:
@@ -211,6 +245,100 @@ class FirewallAPIClient:
         if not self.is_connected:
             raise FirewallConnectionError("Not connected to firewall. Call connect() first.")
 
+    def _apply(self, obj, parent=None):
+        """
+        Add an object to its parent and push it to the firewall.
+
+        While a batch is active the object is staged instead and sent
+        together with the rest of the batch when it is flushed.
+
+        Args:
+            obj: pan-os-python object to configure
+            parent: Parent object (default: the firewall)
+        """
+        (parent or self._firewall).add(obj)
+        if self._batch is None:
+            obj.apply()
+            return
+
+        self._batch.append(obj)
+        logger.debug(f"Staged {type(obj).__name__} '{obj.uid}' for batch")
+
+    # ========== Batched Configuration ==========
+
+    @contextmanager
+    def batch(self):
+        """
+        Stage configuration calls and send them in as few API calls as possible.
+
+        Inside the block, create_* methods stage their objects instead of
+        applying them one by one. On exit, everything is sent as one
+        multi-config request of ``edit`` actions, split in halves on
+        rejection to pinpoint failing objects (see deployment.config_batch).
+        Each object replaces its entry exactly like apply() does.
+
+        If the block raises, staged objects are discarded.
+
+        Example:
+            with client.batch() as result:
+                client.create_address_object("web", "10.0.0.10")
+                client.create_security_rule(...)
+            if not result.success:
+                ...
+
+        Yields:
+            BatchResult, filled in when the block exits
+        """
+        self._ensure_connected()
+        if self._batch is not None:
+            raise FirewallAPIError("A configuration batch is already active")
+
+        result = BatchResult()
+        self._batch = []
+        try:
+            yield result
+        except Exception:
+            logger.warning(f"Discarding {len(self._batch)} staged objects")
+            self._batch = None
+            raise
+
+        staged, self._batch = self._batch, None
+        flushed = self._flush_batch(staged)
+        result.total = flushed.total
+        result.succeeded = flushed.succeeded
+        result.failures = flushed.failures
+        result.round_trips = flushed.round_trips
+
+    def _flush_batch(self, staged: List[Any]) -> BatchResult:
+        """
+        Send staged objects to the firewall.
+
+        Args:
+            staged: Objects in staging order
+
+        Returns:
+            BatchResult with per-object failures
+        """
+        from deployment.config_batch import send_config_batch
+
+        result = BatchResult(total=len(staged))
+        if not staged:
+            return result
+
+        logger.info(f"Flushing batch: {len(staged)} objects")
+        outcome = send_config_batch(self._firewall.xapi, staged)
+        result.round_trips = outcome.round_trips
+        result.succeeded = [obj.uid for obj in outcome.applied]
+        for obj, error in outcome.failed:
+            logger.error(f"Failed to configure {type(obj).__name__} '{obj.uid}': {error}")
+            result.failures.append(BatchFailure(
+                name=obj.uid,
+                object_type=type(obj).__name__,
+                xpath=obj.xpath(),
+                error=str(error),
+            ))
+        return result
+
     # ========== Device Information ==========
 
     def get_device_info(self) -> DeviceInfo:
@@ -242,33 +370,34 @@ class FirewallAPIClient:
 
         Args:
             timeout: Maximum wait time in seconds
-            interval: Check interval in seconds
+            interval: Maximum delay between checks in seconds (backoff cap)
 
         Returns:
             True if firewall is ready
         """
+        from deployment.readiness import wait_until_ready
+
         logger.info(f"Waiting for firewall to be ready (timeout: {timeout}s)")
-        start_time = time.time()
 
-        while time.time() - start_time < timeout:
-            try:
-                if not self.is_connected:
-                    self.connect()
+        def check() -> bool:
+            if not self.is_connected:
+                self.connect()
 
-                # Check if autocommit is complete by trying to get system info
-                self._firewall.refresh_system_info()
+            # Check if autocommit is complete by trying to get system info
+            self._firewall.refresh_system_info()
 
-                # Check for any pending jobs
-                # A newly booted firewall may still be running autocommit
-                jobs = self._firewall.op("show jobs all")
-                # Parse and check if any jobs are still running
-                # For now, assume ready if we can get system info
-                logger.info("Firewall is ready")
-                return True
+            # Check for any pending jobs
+            # A newly booted firewall may still be running autocommit
+            jobs = self._firewall.op("show jobs all")
+            # Parse and check if any jobs are still running
+            # For now, assume ready if we can get system info
+            return True
 
-            except Exception as e:
-                logger.debug(f"Firewall not ready yet: {e}")
-                time.sleep(interval)
+        if wait_until_ready(
+            self.hostname, check, timeout, max_interval=interval, port=self.port, label="Firewall"
+        ):
+            logger.info("Firewall is ready")
+            return True
 
         logger.warning(f"Firewall not ready after {timeout}s")
         return False
@@ -308,7 +437,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        settings = SystemSettings()
+        settings = panos_device.SystemSettings()
         settings.hostname = hostname
         self._firewall.add(settings)
         settings.apply()
@@ -325,7 +454,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        settings = SystemSettings()
+        settings = panos_device.SystemSettings()
         settings.dns_primary = primary
         if secondary:
             settings.dns_secondary = secondary
@@ -344,7 +473,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        settings = SystemSettings()
+        settings = panos_device.SystemSettings()
         settings.ntp_primary = primary
         if secondary:
             settings.ntp_secondary = secondary
@@ -379,7 +508,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        interface = EthernetInterface(
+        interface = panos_network.EthernetInterface(
             name=name,
             mode=mode,
             comment=comment,
@@ -404,14 +533,14 @@ class FirewallAPIClient:
 
     def _add_interface_to_zone(self, interface: str, zone_name: str):
         """Add interface to a security zone."""
-        zone = Zone(name=zone_name)
+        zone = panos_network.Zone(name=zone_name)
         zone.interface = [interface]
         self._firewall.add(zone)
         zone.apply()
 
     def _add_interface_to_vr(self, interface: str, vr_name: str):
         """Add interface to a virtual router."""
-        vr = VirtualRouter(name=vr_name)
+        vr = panos_network.VirtualRouter(name=vr_name)
         self._firewall.add(vr)
         try:
             vr.refresh()
@@ -433,11 +562,10 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        zone = Zone(name=name)
+        zone = panos_network.Zone(name=name)
         if interfaces:
             zone.interface = interfaces
-        self._firewall.add(zone)
-        zone.apply()
+        self._apply(zone)
 
         logger.info(f"Created zone {name}")
 
@@ -461,10 +589,10 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        vr = VirtualRouter(name=virtual_router)
+        vr = panos_network.VirtualRouter(name=virtual_router)
         self._firewall.add(vr)
 
-        route = StaticRoute(
+        route = panos_network.StaticRoute(
             name=name,
             destination=destination,
             nexthop=nexthop,
@@ -472,8 +600,7 @@ class FirewallAPIClient:
         if interface:
             route.interface = interface
 
-        vr.add(route)
-        route.apply()
+        self._apply(route, parent=vr)
 
         logger.info(f"Created static route {name}: {destination} via {nexthop}")
 
@@ -499,7 +626,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        addr = AddressObject(name=name, description=description)
+        addr = panos_objects.AddressObject(name=name, description=description)
 
         if address_type == "ip-netmask":
             addr.value = value
@@ -515,8 +642,7 @@ class FirewallAPIClient:
         if tags:
             addr.tag = tags
 
-        self._firewall.add(addr)
-        addr.apply()
+        self._apply(addr)
 
         logger.info(f"Created address object {name}: {value}")
 
@@ -540,7 +666,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        group = AddressGroup(name=name, description=description)
+        group = panos_objects.AddressGroup(name=name, description=description)
 
         if static_members:
             group.static_value = static_members
@@ -550,8 +676,7 @@ class FirewallAPIClient:
         if tags:
             group.tag = tags
 
-        self._firewall.add(group)
-        group.apply()
+        self._apply(group)
 
         logger.info(f"Created address group {name}")
 
@@ -577,7 +702,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        svc = ServiceObject(
+        svc = panos_objects.ServiceObject(
             name=name,
             protocol=protocol,
             destination_port=destination_port,
@@ -590,8 +715,7 @@ class FirewallAPIClient:
         if tags:
             svc.tag = tags
 
-        self._firewall.add(svc)
-        svc.apply()
+        self._apply(svc)
 
         logger.info(f"Created service object {name}: {protocol}/{destination_port}")
 
@@ -629,10 +753,10 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        rulebase = Rulebase()
+        rulebase = panos_policies.Rulebase()
         self._firewall.add(rulebase)
 
-        rule = SecurityRule(
+        rule = panos_policies.SecurityRule(
             name=name,
             fromzone=source_zone,
             tozone=destination_zone,
@@ -646,8 +770,7 @@ class FirewallAPIClient:
             description=description,
         )
 
-        rulebase.add(rule)
-        rule.apply()
+        self._apply(rule, parent=rulebase)
 
         logger.info(f"Created security rule: {name}")
 
@@ -683,10 +806,10 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        rulebase = Rulebase()
+        rulebase = panos_policies.Rulebase()
         self._firewall.add(rulebase)
 
-        rule = NatRule(
+        rule = panos_policies.NatRule(
             name=name,
             fromzone=source_zone,
             tozone=destination_zone,
@@ -708,8 +831,7 @@ class FirewallAPIClient:
             if destination_translated_port:
                 rule.destination_translated_port = destination_translated_port
 
-        rulebase.add(rule)
-        rule.apply()
+        self._apply(rule, parent=rulebase)
 
         logger.info(f"Created NAT rule: {name}")
 
@@ -735,7 +857,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        profile = IkeCryptoProfile(
+        profile = panos_network.IkeCryptoProfile(
             name=name,
             dh_group=dh_group or ['group14', 'group19'],
             authentication=authentication or ['sha256', 'sha384'],
@@ -743,8 +865,7 @@ class FirewallAPIClient:
             lifetime_hours=lifetime_hours,
         )
 
-        self._firewall.add(profile)
-        profile.apply()
+        self._apply(profile)
 
         logger.info(f"Created IKE crypto profile: {name}")
 
@@ -768,7 +889,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        profile = IpsecCryptoProfile(
+        profile = panos_network.IpsecCryptoProfile(
             name=name,
             esp_encryption=esp_encryption or ['aes-256-cbc', 'aes-256-gcm'],
             esp_authentication=esp_authentication or ['sha256', 'sha384'],
@@ -776,8 +897,7 @@ class FirewallAPIClient:
             lifetime_hours=lifetime_hours,
         )
 
-        self._firewall.add(profile)
-        profile.apply()
+        self._apply(profile)
 
         logger.info(f"Created IPsec crypto profile: {name}")
 
@@ -805,7 +925,7 @@ class FirewallAPIClient:
         else:
             tunnel_num = name
 
-        tunnel = TunnelInterface(
+        tunnel = panos_network.TunnelInterface(
             name=f"tunnel.{tunnel_num}",
             comment=comment,
         )
@@ -815,7 +935,7 @@ class FirewallAPIClient:
 
         # Add to virtual router if specified
         if virtual_router:
-            vr = VirtualRouter(name=virtual_router)
+            vr = panos_network.VirtualRouter(name=virtual_router)
             self._firewall.add(vr)
             vr.refresh()
             # Add tunnel interface to VR
@@ -825,7 +945,7 @@ class FirewallAPIClient:
 
         # Add to zone if specified
         if zone:
-            z = Zone(name=zone)
+            z = panos_network.Zone(name=zone)
             self._firewall.add(z)
             z.refresh()
             if tunnel.name not in (z.interface or []):
@@ -869,7 +989,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        gateway = IkeGateway(
+        gateway = panos_network.IkeGateway(
             name=name,
             interface=interface,
             peer_ip_value=peer_ip,
@@ -891,8 +1011,7 @@ class FirewallAPIClient:
             gateway.peer_id_type = peer_id_type
             gateway.peer_id_value = peer_id_value
 
-        self._firewall.add(gateway)
-        gateway.apply()
+        self._apply(gateway)
 
         logger.info(f"Created IKE gateway: {name} -> {peer_ip}")
 
@@ -918,7 +1037,7 @@ class FirewallAPIClient:
         """
         self._ensure_connected()
 
-        tunnel = IpsecTunnel(
+        tunnel = panos_network.IpsecTunnel(
             name=name,
             tunnel_interface=tunnel_interface,
             ak_ike_gateway=ike_gateway,
@@ -929,8 +1048,7 @@ class FirewallAPIClient:
             tunnel.enable_tunnel_monitor = True
             tunnel.tunnel_monitor_dest_ip = tunnel_monitor_dest_ip
 
-        self._firewall.add(tunnel)
-        tunnel.apply()
+        self._apply(tunnel)
 
         logger.info(f"Created IPsec tunnel: {name} via {ike_gateway}")
 
@@ -1061,6 +1179,9 @@ class FirewallAPIClient:
         """
         Commit configuration changes.
 
+        The commit is always started as a job; with sync=True the job is
+        followed by the shared commit tracker instead of a blocking call.
+
         Args:
             description: Commit description
             sync: Wait for commit to complete
@@ -1075,47 +1196,47 @@ class FirewallAPIClient:
         logger.info(f"Starting commit{' (sync)' if sync else ''}")
 
         try:
-            if sync:
-                # Synchronous commit with wait
-                # Note: pan-os-python commit() doesn't accept timeout directly
-                # The timeout is set on the device object via self._firewall.timeout
-                original_timeout = getattr(self._firewall, 'timeout', None)
-                if timeout:
-                    self._firewall.timeout = timeout
-
-                try:
-                    result = self._firewall.commit(
-                        sync=True,
-                    )
-                finally:
-                    # Restore original timeout
-                    if original_timeout is not None:
-                        self._firewall.timeout = original_timeout
-
-                # The result is typically None on success or raises on error
-                return CommitResult(
-                    status=CommitStatus.SUCCESS,
-                    message="Commit successful",
-                )
-            else:
-                # Async commit - returns job ID
-                result = self._firewall.commit(
-                    sync=False,
-                )
-
-                return CommitResult(
-                    status=CommitStatus.IN_PROGRESS,
-                    job_id=str(result) if result else None,
-                    message="Commit started",
-                )
-
-        except PanDeviceError as e:
+            job_id = self._firewall.commit(
+                sync=False,
+            )
+        except panos_errors.PanDeviceError as e:
             logger.error(f"Commit failed: {e}")
             return CommitResult(
                 status=CommitStatus.FAILED,
                 message=str(e),
             )
 
+        if not job_id:
+            # pan-os-python returns None when there is nothing to commit
+            return CommitResult(
+                status=CommitStatus.SUCCESS,
+                message="No changes to commit",
+            )
+
+        if not sync:
+            return CommitResult(
+                status=CommitStatus.IN_PROGRESS,
+                job_id=str(job_id),
+                message="Commit started",
+            )
+
+        return self.wait_for_commit(str(job_id), timeout=timeout, progress_callback=progress_callback)
+
+    def get_job_status(self, job_id: str):
+        """
+        Get the parsed status of a job (``show jobs id``).
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            deployment.commit_tracker.JobStatus
+        """
+        from deployment.commit_tracker import parse_job_status
+
+        self._ensure_connected()
+        return parse_job_status(self._firewall.op(f"show jobs id {job_id}"), job_id)
+
     def get_commit_status(self, job_id: str) -> CommitResult:
         """
         Get status of an async commit job.
@@ -1126,18 +1247,8 @@ class FirewallAPIClient:
         Returns:
             CommitResult with current status
         """
-        self._ensure_connected()
-
         try:
-            result = self._firewall.op(f"show jobs id {job_id}")
-            # Parse result to determine status
-            # This is simplified - actual parsing would be more complex
-            return CommitResult(
-                status=CommitStatus.IN_PROGRESS,
-                job_id=job_id,
-                message="Checking status",
-                details={'raw': str(result)},
-            )
+            return self.commit_result_from_job(self.get_job_status(job_id))
         except Exception as e:
             return CommitResult(
                 status=CommitStatus.FAILED,
@@ -1145,6 +1256,68 @@ class FirewallAPIClient:
                 message=str(e),
             )
 
+    def start_commit_tracking(
+        self,
+        job_id: str,
+        timeout: int = 300,
+        progress_callback: Callable[[int, str], None] = None,
+    ):
+        """
+        Hand a commit job to the shared commit tracker without waiting.
+
+        Args:
+            job_id: Commit job ID
+            timeout: Commit timeout in seconds
+            progress_callback: Optional callback (percent, message)
+
+        Returns:
+            TrackedJob; pass its wait() result to commit_result_from_job()
+        """
+        from deployment.commit_tracker import get_commit_tracker
+
+        return get_commit_tracker().track(
+            self.hostname, job_id, self.get_job_status,
+            timeout=timeout, progress_callback=progress_callback,
+        )
+
+    def wait_for_commit(
+        self,
+        job_id: str,
+        timeout: int = 300,
+        progress_callback: Callable[[int, str], None] = None,
+    ) -> CommitResult:
+        """
+        Wait for a commit job using the shared commit tracker.
+
+        Args:
+            job_id: Commit job ID
+            timeout: Commit timeout in seconds
+            progress_callback: Optional callback (percent, message)
+
+        Returns:
+            CommitResult with final status
+        """
+        job = self.start_commit_tracking(job_id, timeout, progress_callback)
+        return self.commit_result_from_job(job.wait())
+
+    @staticmethod
+    def commit_result_from_job(job) -> CommitResult:
+        """Convert a JobStatus into a CommitResult."""
+        if job.success:
+            status = CommitStatus.SUCCESS
+        elif job.finished:
+            status = CommitStatus.FAILED
+        elif job.status == "PEND":
+            status = CommitStatus.PENDING
+        else:
+            status = CommitStatus.IN_PROGRESS
+        return CommitResult(
+            status=status,
+            job_id=job.job_id,
+            message=job.message,
+            details=job.to_dict(),
+        )
+
     # ========== Operational Commands ==========
 
     def op_command(self, cmd: str) -> str:
@@ -1189,47 +1362,47 @@ def wait_for_firewall(
     timeout: int = 600,
     interval: int = 30,
     max_retries: int = 0,
+    port: int = 443,
 ) -> Optional[FirewallAPIClient]:
     """
     Wait for a firewall to become accessible.
 
     Useful after Terraform deployment to wait for the firewall to boot.
+    Reachability is probed by the shared readiness poller (TCP/HTTPS with
+    exponential backoff); the API login is only attempted once the
+    management web server answers.
 
     Args:
         hostname: Firewall management IP
         username: Admin username
         password: Admin password
         timeout: Maximum wait time in seconds
-        interval: Check interval in seconds
+        interval: Maximum delay between checks in seconds (backoff cap)
         max_retries: Maximum number of connection attempts (0 = no limit, use timeout only)
+        port: HTTPS management port
 
     Returns:
         FirewallAPIClient if successful, None if timeout or max retries exceeded
     """
+    from deployment.readiness import wait_until_ready
+
     if max_retries > 0:
-        logger.info(f"Waiting for firewall {hostname} to be accessible (max {max_retries} retries, interval {interval}s)")
+        logger.info(f"Waiting for firewall {hostname} to be accessible (max {max_retries} retries, backoff up to {interval}s)")
     else:
         logger.info(f"Waiting for firewall {hostname} to be accessible (timeout: {timeout}s)")
 
-    start_time = time.time()
-    attempt = 0
-
-    while time.time() - start_time < timeout:
-        attempt += 1
-        try:
-            client = FirewallAPIClient(hostname, username, password)
-            client.connect()
-            logger.info(f"Firewall {hostname} is accessible (attempt {attempt})")
-            return client
-        except FirewallConnectionError as e:
-            logger.debug(f"Firewall not accessible yet: {e}")
-
-            # Check if max retries exceeded
-            if max_retries > 0 and attempt >= max_retries:
-                logger.warning(f"Firewall {hostname} not accessible after {max_retries} retries")
-                return None
-
-            time.sleep(interval)
-
-    logger.warning(f"Firewall {hostname} not accessible after {timeout}s")
-    return None
+    def connect() -> FirewallAPIClient:
+        client = FirewallAPIClient(hostname, username, password, port=port)
+        client.connect()
+        return client
+
+    return wait_until_ready(
+        hostname,
+        check=connect,
+        timeout=timeout,
+        retry_on=(FirewallConnectionError,),
+        max_attempts=max_retries,
+        max_interval=interval,
+        port=port,
+        label="Firewall",
+    )
@@ -309,21 +309,26 @@ class FirewallPushOrchestrator:
             return False
 
     def _configure_zones(self) -> bool:
-        """Configure security zones."""
+        """Configure security zones (sent as a single batch)."""
         try:
-            # Create trust zone
-            self._client.create_zone(
-                name="trust",
-                interfaces=["ethernet1/2"],
-            )
+            with self._client.batch() as batch:
+                # Create trust zone
+                self._client.create_zone(
+                    name="trust",
+                    interfaces=["ethernet1/2"],
+                )
 
-            # Create untrust zone
-            self._client.create_zone(
-                name="untrust",
-                interfaces=["ethernet1/1"],
-            )
+                # Create untrust zone
+                self._client.create_zone(
+                    name="untrust",
+                    interfaces=["ethernet1/1"],
+                )
 
-            return True
+            for failure in batch.failures:
+                self._result.errors.append(
+                    f"Zone config error: {failure.object_type} '{failure.name}': {failure.error}"
+                )
+            return batch.success
 
         except Exception as e:
             self._result.errors.append(f"Zone config error: {e}")
@@ -331,45 +336,56 @@ class FirewallPushOrchestrator:
             return False
 
     def _configure_policy(self) -> bool:
-        """Configure security and NAT policies."""
+        """Configure security and NAT policies (sent as a single batch)."""
         try:
-            # Create basic outbound security rule
-            self._client.create_security_rule(
-                name="allow-outbound-web",
-                source_zone=["trust"],
-                destination_zone=["untrust"],
-                source=["any"],
-                destination=["any"],
-                application=["any"],
-                service=["service-http", "service-https"],
-                action="allow",
-                log_end=True,
-                description="Allow outbound HTTP/HTTPS from trust zone",
-            )
-
-            # Create outbound NAT rule
-            # Get trust subnet for source
-            trust_subnet = self._get_trust_subnet()
-
-            self._client.create_nat_rule(
-                name="outbound-pat",
-                source_zone=["trust"],
-                destination_zone="untrust",
-                source=[trust_subnet] if trust_subnet else ["any"],
-                destination=["any"],
-                service="any",
-                source_translation_type="dynamic-ip-and-port",
-                source_translation_interface="ethernet1/1",
-                description="Outbound PAT for trust network",
-            )
+            with self._client.batch() as batch:
+                self._stage_policy()
 
-            return True
+            for failure in batch.failures:
+                self._result.errors.append(
+                    f"Policy config error: {failure.object_type} '{failure.name}': {failure.error}"
+                )
+            logger.info(f"Policy configured: {len(batch.succeeded)}/{batch.total} objects "
+                        f"in {batch.round_trips} API calls")
+            return batch.success
 
         except Exception as e:
             self._result.errors.append(f"Policy config error: {e}")
             logger.error(f"Failed to configure policy: {e}")
             return False
 
+    def _stage_policy(self):
+        """Stage the security and NAT rules (inside an active batch)."""
+        # Create basic outbound security rule
+        self._client.create_security_rule(
+            name="allow-outbound-web",
+            source_zone=["trust"],
+            destination_zone=["untrust"],
+            source=["any"],
+            destination=["any"],
+            application=["any"],
+            service=["service-http", "service-https"],
+            action="allow",
+            log_end=True,
+            description="Allow outbound HTTP/HTTPS from trust zone",
+        )
+
+        # Create outbound NAT rule
+        # Get trust subnet for source
+        trust_subnet = self._get_trust_subnet()
+
+        self._client.create_nat_rule(
+            name="outbound-pat",
+            source_zone=["trust"],
+            destination_zone="untrust",
+            source=[trust_subnet] if trust_subnet else ["any"],
+            destination=["any"],
+            service="any",
+            source_translation_type="dynamic-ip-and-port",
+            source_translation_interface="ethernet1/1",
+            description="Outbound PAT for trust network",
+        )
+
     def _get_trust_subnet(self) -> Optional[str]:
         """Get the trust subnet CIDR from deployment."""
         for subnet in self.deployment.virtual_network.subnets:
@@ -384,6 +400,7 @@ class FirewallPushOrchestrator:
                 description="Initial configuration by pa_config_lab",
                 sync=True,
                 timeout=timeout,
+                progress_callback=self._on_commit_progress,
             )
         except Exception as e:
             return CommitResult(
@@ -391,6 +408,12 @@ class FirewallPushOrchestrator:
                 message=str(e),
             )
 
+    def _on_commit_progress(self, percent: int, message: str):
+        """Stream commit job progress to the progress callback."""
+        logger.info(f"[{self.firewall_config.name}] Commit {percent}%: {message}")
+        if self._progress_callback:
+            self._progress_callback(PushPhase.COMMITTING, f"Commit {percent}%: {message}")
+
     def _verify(self) -> bool:
         """Verify configuration was applied correctly."""
         try:
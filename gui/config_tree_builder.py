@@ -14,17 +14,11 @@ from PyQt6.QtGui import QColor
 
 # Import component sections from selection tree for consistent hierarchy
 from gui.widgets.selection_tree import COMPONENT_SECTIONS
+from config.defaults.default_classifier import get_default_classifier
 
 logger = logging.getLogger(__name__)
 
 
-# Default snippet values that indicate system/predefined items
-DEFAULT_SNIPPETS = {
-    'default',           # General system defaults
-    'hip-default',       # HIP-specific defaults
-    'optional-default',  # Optional pre-built defaults
-}
-
 # Build reverse mapping from item_type to section name
 # This allows grouping items by their logical section in the tree
 ITEM_TYPE_TO_SECTION: Dict[str, str] = {}
@@ -46,6 +40,9 @@ SECTION_ORDER = [
     'Other Policies',
 ]
 
+# Data role holding the deferred child builder of a lazy tree item
+LAZY_CHILDREN_ROLE = Qt.ItemDataRole.UserRole + 1
+
 # Display names for item types (from COMPONENT_SECTIONS)
 ITEM_TYPE_DISPLAY_NAMES: Dict[str, str] = {}
 for section_name, components in COMPONENT_SECTIONS.items():
@@ -53,39 +50,51 @@ for section_name, components in COMPONENT_SECTIONS.items():
         ITEM_TYPE_DISPLAY_NAMES[item_type] = display_name
 
 
-def is_default_item(item_dict: Dict[str, Any]) -> bool:
+def is_default_item(item_dict: Dict[str, Any], item_type: Optional[str] = None) -> bool:
     """
-    Check if an item is a system default based on its snippet field.
+    Check if an item is a system default (same rules as pull filtering).
     
     Args:
         item_dict: Item dictionary containing 'snippet' field
+        item_type: Optional item type, enables the per-type default names
         
     Returns:
         True if item is a system default
     """
-    snippet = item_dict.get('snippet', '')
-    if not snippet:
-        return False
-    if snippet in DEFAULT_SNIPPETS:
-        return True
-    if snippet.endswith('-default'):
-        return True
-    return False
+    return get_default_classifier().is_default_item(item_dict, item_type)
+
+
+def classify_default_items(items: List[Dict[str, Any]], item_type: Optional[str] = None) -> List[bool]:
+    """
+    Classify a list of item dictionaries of one type in one pass.
+    
+    Returns:
+        List of is-default flags, parallel to items
+    """
+    return get_default_classifier().classify(items, item_type)
+
+
+def _sorted_custom_first(items: List[Dict[str, Any]], flags: List[bool]) -> List[Tuple[bool, Dict[str, Any]]]:
+    """(is_default, item) pairs sorted custom first, then default, alphabetically."""
+    return sorted(zip(flags, items), key=lambda pair: (pair[0], pair[1].get("name", "").lower()))
 
 
 class ConfigTreeBuilder:
     """Build configuration trees with consistent structure."""
     
-    def __init__(self, enable_checkboxes: bool = False, simplified: bool = False):
+    def __init__(self, enable_checkboxes: bool = False, simplified: bool = False, lazy: bool = False):
         """
         Initialize the tree builder.
         
         Args:
             enable_checkboxes: If True, add checkboxes to all items
             simplified: If True, use simplified structure for selection (no deep drill-down)
+            lazy: If True, item lists and key/value details are only created
+                when their parent node is first expanded
         """
         self.enable_checkboxes = enable_checkboxes
         self.simplified = simplified
+        self.lazy = lazy
     
     def build_tree(self, tree: QTreeWidget, config: Dict[str, Any]):
         """
@@ -103,6 +112,11 @@ class ConfigTreeBuilder:
         tree.clear()
         root = tree.invisibleRootItem()
         
+        if self.lazy and not getattr(tree, '_lazy_children_hooked', False):
+            # Connected once per tree - the deferred builders live on the items
+            tree.itemExpanded.connect(ConfigTreeBuilder.populate_item)
+            tree._lazy_children_hooked = True
+        
         # Build each section
         if not self.simplified:
             # Only show metadata in viewer mode
@@ -116,10 +130,87 @@ class ConfigTreeBuilder:
         self._build_infrastructure_section(root, config)
         
         # Smart expand based on config size
-        self._smart_expand(tree, root)
+        self._smart_expand(tree, root, self._count_config_items(config))
         logger.detail("  Tree building complete")
     
-    def _smart_expand(self, tree: QTreeWidget, root: QTreeWidgetItem):
+    @staticmethod
+    def populate_item(item: QTreeWidgetItem):
+        """
+        Create the deferred children of a lazy item (no-op if already populated).
+        
+        Connected to QTreeWidget.itemExpanded in lazy mode.
+        
+        Args:
+            item: Tree item being expanded
+        """
+        build_children = item.data(0, LAZY_CHILDREN_ROLE)
+        if build_children is None:
+            return
+        item.setData(0, LAZY_CHILDREN_ROLE, None)
+        build_children(item)
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
+    
+    @staticmethod
+    def populate_all(tree: QTreeWidget):
+        """
+        Create all deferred children in a tree (e.g. before a full-text search).
+        
+        Args:
+            tree: Tree built in lazy mode
+        """
+        pending = [tree.invisibleRootItem()]
+        while pending:
+            item = pending.pop()
+            ConfigTreeBuilder.populate_item(item)
+            pending.extend(item.child(i) for i in range(item.childCount()))
+    
+    def _defer_children(self, item: QTreeWidgetItem, build_children: Callable[[QTreeWidgetItem], None]):
+        """
+        Add children to an item now, or on first expand in lazy mode.
+        
+        Args:
+            item: Parent tree item
+            build_children: Callable adding the children to the given item
+        """
+        if not self.lazy:
+            build_children(item)
+            return
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+        item.setData(0, LAZY_CHILDREN_ROLE, build_children)
+    
+    def _populate_to_depth(self, root: QTreeWidgetItem, depth: int):
+        """Create deferred children of all items up to the given depth (0 = top level)."""
+        level = [root.child(i) for i in range(root.childCount())]
+        for _ in range(depth + 1):
+            next_level = []
+            for item in level:
+                self.populate_item(item)
+                next_level.extend(item.child(i) for i in range(item.childCount()))
+            level = next_level
+    
+    def _count_config_items(self, config: Dict[str, Any]) -> int:
+        """
+        Count configuration items from the config stats (or list lengths).
+        
+        Avoids walking the built tree, which in lazy mode is mostly unpopulated.
+        """
+        stats = config.get("stats") or {}
+        if stats.get("total_items"):
+            return stats["total_items"]
+        
+        total = 0
+        for kind in ("folders", "snippets"):
+            containers = config.get(kind, {})
+            if isinstance(containers, dict):
+                for container in containers.values():
+                    if isinstance(container, dict):
+                        total += sum(len(v) for v in container.values() if isinstance(v, list))
+        infrastructure = config.get("infrastructure", {})
+        if isinstance(infrastructure, dict):
+            total += sum(len(v) for v in infrastructure.values() if isinstance(v, (list, dict)))
+        return total
+    
+    def _smart_expand(self, tree: QTreeWidget, root: QTreeWidgetItem, total_objects: int):
         """
         Smart expand tree based on configuration size.
         
@@ -128,9 +219,13 @@ class ConfigTreeBuilder:
         - If < 20 objects total, expand all
         - If >= 20 objects and only 1 main section (folders/snippets/infrastructure), expand 2 levels
         - If >= 20 objects and multiple sections, expand only 1 level
+        
+        Args:
+            tree: Tree to expand
+            root: Invisible root item
+            total_objects: Number of configuration items (from _count_config_items)
         """
-        # Count total objects and sections
-        total_objects = 0
+        # Find main sections
         main_sections = []  # Folders, Snippets, Infrastructure
         metadata_item = None
         
@@ -144,14 +239,14 @@ class ConfigTreeBuilder:
                 child.setExpanded(False)
             elif child_text in ('folders', 'snippets', 'infrastructure'):
                 main_sections.append(child)
-                # Count objects in this section
-                total_objects += self._count_leaf_items(child)
         
         logger.detail(f"  Smart expand: {total_objects} objects, {len(main_sections)} main sections")
         
         if total_objects < 20:
             # Small config - expand everything except metadata
             logger.detail("  Expanding all (small config)")
+            # expandAll() doesn't emit itemExpanded, so populate first
+            self.populate_all(tree)
             tree.expandAll()
             # Re-collapse metadata
             if metadata_item:
@@ -159,6 +254,7 @@ class ConfigTreeBuilder:
         elif len(main_sections) == 1:
             # One main section - expand 2 levels
             logger.detail("  Expanding 2 levels (single section)")
+            self._populate_to_depth(root, 1)
             tree.expandToDepth(1)
             # Re-collapse metadata
             if metadata_item:
@@ -166,26 +262,12 @@ class ConfigTreeBuilder:
         else:
             # Multiple sections - expand only 1 level
             logger.detail("  Expanding 1 level (multiple sections)")
+            self._populate_to_depth(root, 0)
             tree.expandToDepth(0)
             # Re-collapse metadata
             if metadata_item:
                 metadata_item.setExpanded(False)
     
-    def _count_leaf_items(self, item: QTreeWidgetItem) -> int:
-        """Count leaf items (actual config objects) under an item."""
-        if item.childCount() == 0:
-            return 1
-        
-        count = 0
-        for i in range(item.childCount()):
-            child = item.child(i)
-            # Check if this is a config item (has data) or a container
-            child_type = child.text(1) if child.columnCount() > 1 else ''
-            if child_type and child_type not in ('container', 'section', 'info', 'dict', 'list', ''):
-                count += 1
-            count += self._count_leaf_items(child)
-        return count
-    
     def _create_item(self, texts: list, data: Any = None, item_type: str = None) -> QTreeWidgetItem:
         """
         Create a tree item with optional checkbox and data.
@@ -1057,7 +1139,8 @@ class ConfigTreeBuilder:
         display_name = display_names.get(profile_type, profile_type.replace('_', ' ').title())
         
         # Count custom vs default
-        custom_count = sum(1 for p in profiles if not is_default_item(p))
+        default_flags = classify_default_items(profiles, profile_type)
+        custom_count = default_flags.count(False)
         default_count = len(profiles) - custom_count
         
         if default_count > 0 and custom_count > 0:
@@ -1069,32 +1152,28 @@ class ConfigTreeBuilder:
         
         section = self._create_item([display_name, "list", count_str])
         
-        # Sort: custom first, then default, alphabetically
-        def sort_key(item):
-            is_def = is_default_item(item)
-            name = item.get("name", "").lower()
-            return (is_def, name)
-        
-        for profile in sorted(profiles, key=sort_key):
-            name = profile.get("name", "Unknown")
-            is_default = is_default_item(profile)
-            
-            type_indicator = f"{profile_type} (default)" if is_default else profile_type
-            
-            profile_item = self._create_item([name, type_indicator, ""], item_type="infrastructure")
-            profile_item.setData(0, Qt.ItemDataRole.UserRole, {
-                'type': 'infrastructure', 
-                'infra_type': profile_type, 
-                'data': profile,
-                'is_default': is_default
-            })
-            
-            if is_default:
-                profile_item.setForeground(0, QColor(128, 128, 128))
-                profile_item.setForeground(1, QColor(128, 128, 128))
-            
-            section.addChild(profile_item)
+        def add_profiles(section: QTreeWidgetItem):
+            # Sort: custom first, then default, alphabetically
+            for is_default, profile in _sorted_custom_first(profiles, default_flags):
+                name = profile.get("name", "Unknown")
+                
+                type_indicator = f"{profile_type} (default)" if is_default else profile_type
+                
+                profile_item = self._create_item([name, type_indicator, ""], item_type="infrastructure")
+                profile_item.setData(0, Qt.ItemDataRole.UserRole, {
+                    'type': 'infrastructure', 
+                    'infra_type': profile_type, 
+                    'data': profile,
+                    'is_default': is_default
+                })
+                
+                if is_default:
+                    profile_item.setForeground(0, QColor(128, 128, 128))
+                    profile_item.setForeground(1, QColor(128, 128, 128))
+                
+                section.addChild(profile_item)
         
+        self._defer_children(section, add_profiles)
         return section
     
     def _build_infra_type_section(
@@ -1110,9 +1189,10 @@ class ConfigTreeBuilder:
         
         # Count custom vs default for crypto profiles
         is_crypto_type = 'crypto' in item_type.lower()
+        default_flags = classify_default_items(items, item_type)
         
         if is_crypto_type:
-            custom_count = sum(1 for p in items if not is_default_item(p))
+            custom_count = default_flags.count(False)
             default_count = len(items) - custom_count
             
             if default_count > 0 and custom_count > 0:
@@ -1126,66 +1206,69 @@ class ConfigTreeBuilder:
         
         type_item = self._create_item([display_name, "list", count_str])
         
-        # Sort items: custom first, then default, alphabetically
-        def sort_key(item):
-            is_def = is_default_item(item)
-            name = item.get("name", "").lower()
-            return (is_def, name)
-        
-        sorted_items = sorted(items, key=sort_key)
-        
-        for item in sorted_items:
-            name = item.get("name", "Unknown")
-            is_default = is_default_item(item)
-            
-            if is_default:
-                type_indicator = f"{item_type} (default)"
-            else:
-                type_indicator = item_type
-            
-            item_child = self._create_item([name, type_indicator, ""], item_type="infrastructure")
-            item_child.setData(0, Qt.ItemDataRole.UserRole, {
-                'type': 'infrastructure', 
-                'infra_type': item_type, 
-                'data': item,
-                'is_default': is_default
-            })
-            
-            # Gray out default items
-            if is_default:
-                item_child.setForeground(0, QColor(128, 128, 128))
-                item_child.setForeground(1, QColor(128, 128, 128))
-            
-            type_item.addChild(item_child)
+        def add_items(type_item: QTreeWidgetItem):
+            # Sort items: custom first, then default, alphabetically
+            for is_default, item in _sorted_custom_first(items, default_flags):
+                name = item.get("name", "Unknown")
+                
+                if is_default:
+                    type_indicator = f"{item_type} (default)"
+                else:
+                    type_indicator = item_type
+                
+                item_child = self._create_item([name, type_indicator, ""], item_type="infrastructure")
+                item_child.setData(0, Qt.ItemDataRole.UserRole, {
+                    'type': 'infrastructure', 
+                    'infra_type': item_type, 
+                    'data': item,
+                    'is_default': is_default
+                })
+                
+                # Gray out default items
+                if is_default:
+                    item_child.setForeground(0, QColor(128, 128, 128))
+                    item_child.setForeground(1, QColor(128, 128, 128))
+                
+                type_item.addChild(item_child)
         
+        self._defer_children(type_item, add_items)
         parent.addChild(type_item)
     
     def _add_dict_items(self, parent: QTreeWidgetItem, data: Dict):
-        """Add dictionary items to tree, recursively expanding lists and dicts."""
+        """Add dictionary items to tree, recursively expanding lists and dicts.
+        
+        In lazy mode nested dicts/lists are expanded on first expand.
+        """
         for key, value in data.items():
             if isinstance(value, dict):
                 item = self._create_item([str(key), "dict", ""])
-                self._add_dict_items(item, value)
+                if value:
+                    self._defer_children(item, lambda it, v=value: self._add_dict_items(it, v))
                 parent.addChild(item)
             elif isinstance(value, list):
                 item = self._create_item([str(key), "list", str(len(value))])
-                # Expand list items if they're dictionaries
-                for idx, list_item in enumerate(value):
-                    if isinstance(list_item, dict):
-                        # Try to get a name for the item
-                        item_name = list_item.get("name", list_item.get("id", f"Item {idx + 1}"))
-                        child_item = self._create_item([str(item_name), "dict", ""], list_item)
-                        self._add_dict_items(child_item, list_item)
-                        item.addChild(child_item)
-                    else:
-                        # Simple value in list
-                        child_item = self._create_item([str(list_item), "value", ""])
-                        item.addChild(child_item)
+                if value:
+                    self._defer_children(item, lambda it, v=value: self._add_list_items(it, v))
                 parent.addChild(item)
             else:
                 item = self._create_item([str(key), "value", str(value)])
                 parent.addChild(item)
     
+    def _add_list_items(self, parent: QTreeWidgetItem, values: list):
+        """Add list entries to tree, expanding entries that are dictionaries."""
+        for idx, list_item in enumerate(values):
+            if isinstance(list_item, dict):
+                # Try to get a name for the item
+                item_name = list_item.get("name", list_item.get("id", f"Item {idx + 1}"))
+                child_item = self._create_item([str(item_name), "dict", ""], list_item)
+                if list_item:
+                    self._defer_children(child_item, lambda it, v=list_item: self._add_dict_items(it, v))
+                parent.addChild(child_item)
+            else:
+                # Simple value in list
+                child_item = self._create_item([str(list_item), "value", ""])
+                parent.addChild(child_item)
+    
     def _add_item_type_node(
         self, 
         parent: QTreeWidgetItem, 
@@ -1205,7 +1288,8 @@ class ConfigTreeBuilder:
             container_type: 'folder' or 'snippet'
         """
         # Count custom vs default items
-        custom_count = sum(1 for i in items_list if not is_default_item(i))
+        default_flags = classify_default_items(items_list, item_type)
+        custom_count = default_flags.count(False)
         default_count = len(items_list) - custom_count
         
         # Get display name from mapping, fallback to title case
@@ -1227,31 +1311,32 @@ class ConfigTreeBuilder:
             'item_type': item_type
         })
         
-        for item_dict in items_list:
-            item_name = item_dict.get('name', 'Unknown')
-            
-            # Add indicator for default items
-            is_default = is_default_item(item_dict)
-            if is_default:
-                display_type = f"{item_type} (default)"
-            else:
-                display_type = item_type
-            
-            item_child = self._create_item([item_name, display_type, ""], data=item_dict, item_type=item_type)
-            item_child.setData(0, Qt.ItemDataRole.UserRole, {
-                'type': item_type, 
-                container_type: container_name, 
-                'data': item_dict, 
-                'is_default': is_default
-            })
-            
-            # Visual indicator: gray out default items
-            if is_default:
-                item_child.setForeground(0, QColor(128, 128, 128))  # Gray text
-                item_child.setForeground(1, QColor(128, 128, 128))
-            
-            type_item.addChild(item_child)
+        def add_items(type_item: QTreeWidgetItem):
+            for item_dict, is_default in zip(items_list, default_flags):
+                item_name = item_dict.get('name', 'Unknown')
+                
+                # Add indicator for default items
+                if is_default:
+                    display_type = f"{item_type} (default)"
+                else:
+                    display_type = item_type
+                
+                item_child = self._create_item([item_name, display_type, ""], data=item_dict, item_type=item_type)
+                item_child.setData(0, Qt.ItemDataRole.UserRole, {
+                    'type': item_type, 
+                    container_type: container_name, 
+                    'data': item_dict, 
+                    'is_default': is_default
+                })
+                
+                # Visual indicator: gray out default items
+                if is_default:
+                    item_child.setForeground(0, QColor(128, 128, 128))  # Gray text
+                    item_child.setForeground(1, QColor(128, 128, 128))
+                
+                type_item.addChild(item_child)
         
+        self._defer_children(type_item, add_items)
         parent.addChild(type_item)
     
     def _build_folders_section_new(self, parent: QTreeWidgetItem, folders: Dict[str, Any]):
@@ -278,7 +278,8 @@ class ConfigViewerWidget(QWidget):
             logger.detail(f"  infrastructure keys: {list(self.current_config.get('infrastructure', {}).keys())}")
         logger.detail("="*80)
         
-        builder = ConfigTreeBuilder(enable_checkboxes=False)
+        # Lazy mode: item lists and raw config details are created on expand
+        builder = ConfigTreeBuilder(enable_checkboxes=False, lazy=True)
         builder.build_tree(self.tree, self.current_config)
         
         saved_name = metadata.get("saved_name")
@@ -402,6 +403,9 @@ class ConfigViewerWidget(QWidget):
                 iterator += 1
             return
 
+        # Search needs every item, so create the lazily deferred ones first
+        ConfigTreeBuilder.populate_all(self.tree)
+        
         # Hide items that don't match
         search_lower = text.lower()
         iterator = QTreeWidgetItemIterator(self.tree)
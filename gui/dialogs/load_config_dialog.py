@@ -34,6 +34,7 @@ from config.utils.encryption import (
     get_config_metadata,
     load_config_from_file,
 )
+from config.storage.config_index import ConfigIndex
 from .password_dialog import PasswordDialog
 
 logger = logging.getLogger(__name__)
@@ -167,32 +168,24 @@ class LoadConfigDialog(QDialog):
             logger.info(f"Saved folder does not exist: {saved_path}")
             return
         
-        # List files
-        files = []
-        for filename in os.listdir(saved_path):
-            if filename.endswith(('.pac', '.json')):
-                file_path = os.path.join(saved_path, filename)
-                files.append(file_path)
-        
-        # Sort by modification time (newest first)
-        files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        # List files from the directory metadata index (newest first);
+        # only new or changed files have their header read
+        files = ConfigIndex(saved_path).entries()
         
         # Populate table
-        for file_path in files:
+        for entry in files:
+            file_path = entry["path"]
             try:
-                metadata = get_config_metadata(file_path)
-                if metadata is None:
-                    metadata = {}
+                metadata = entry["metadata"]
                 
                 # Get file info
-                stat = os.stat(file_path)
-                file_size = self._format_size(stat.st_size)
-                mod_time = datetime.fromtimestamp(stat.st_mtime)
+                file_size = self._format_size(entry["size"])
+                mod_time = datetime.fromtimestamp(entry["modified"])
                 
                 # Get display name
                 name = metadata.get("name", os.path.basename(file_path))
                 date_str = mod_time.strftime("%Y-%m-%d %H:%M")
-                encrypted = metadata.get("encrypted", is_encrypted_file(file_path))
+                encrypted = entry["encrypted"]
                 
                 # Add row
                 row = self.file_table.rowCount()
@@ -221,7 +214,7 @@ class LoadConfigDialog(QDialog):
                     "path": file_path,
                     "name": name,
                     "encrypted": encrypted,
-                    "metadata": metadata,
+                    "metadata": dict(metadata, encrypted=encrypted),
                 })
                 
             except Exception as e:
@@ -290,8 +283,8 @@ class LoadConfigDialog(QDialog):
         )
         
         if file_path:
-            encrypted = is_encrypted_file(file_path)
             metadata = get_config_metadata(file_path)
+            encrypted = metadata.get("encrypted", False) if metadata else is_encrypted_file(file_path)
             name = metadata.get("name", os.path.basename(file_path)) if metadata else os.path.basename(file_path)
             self._load_file(file_path, encrypted, name)
     
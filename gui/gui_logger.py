@@ -257,7 +257,9 @@ def setup_gui_logging(logs_widget):
     Returns:
         Tuple of (original_stdout, original_stderr) for restoration if needed
     """
-    from config.logging_config import set_log_level, enable_debug_mode, disable_debug_mode
+    from config.logging_config import (
+        set_log_level, enable_debug_mode, disable_debug_mode, add_log_handler
+    )
     
     # Save original stdout/stderr
     original_stdout = sys.stdout
@@ -272,9 +274,8 @@ def setup_gui_logging(logs_widget):
     gui_handler = GUILogHandler(logs_widget)
     gui_handler.setLevel(logging.DEBUG)  # Handler accepts everything, logger filters
     
-    # Add handler to root logger
-    root_logger = logging.getLogger()
-    root_logger.addHandler(gui_handler)
+    # Add handler to the logging pipeline (driven by the background writer)
+    add_log_handler(gui_handler)
     
     # Apply the saved log level (this also handles debug mode flag)
     set_log_level(saved_level)
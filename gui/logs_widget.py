@@ -2,9 +2,16 @@
 Logs widget for displaying activity and operations.
 
 This module provides a log viewer with filtering, search, and export capabilities.
+
+Entries are kept in a bounded ring buffer with a per-level index. Appends are
+coalesced and rendered in timer-driven batches, and the display only ever
+holds the most recent window of entries that pass the filter.
 """
 
-from typing import Optional, List
+import heapq
+from collections import deque
+from itertools import islice
+from typing import Optional, List, Dict, Deque, Tuple
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget,
@@ -19,22 +26,76 @@ from PyQt6.QtWidgets import (
     QLineEdit,
 )
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor, QTextDocument
+from PyQt6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor, QTextBlockFormat
+
+
+# Level hierarchy (lower value = more severe)
+LEVEL_HIERARCHY = {
+    'error': 1,
+    'warning': 2,
+    'normal': 3,
+    'success': 3,  # Success is same priority as Normal
+    'info': 4,
+    'detail': 5,
+    'debug': 6,
+}
+
+# Color coding - includes custom log levels
+LEVEL_COLORS = {
+    "debug": "#999999",    # Light gray - verbose debugging
+    "detail": "#888888",   # Gray - API URLs, keys, values
+    "info": "#666666",     # Dark gray - per-item processing
+    "normal": "#333333",   # Near black - high-level summaries
+    "success": "#008800",  # Green - success messages
+    "warning": "#ff8800",  # Orange - warnings
+    "error": "#cc0000",    # Red - errors
+}
+
+LEVEL_ICONS = {
+    "debug": "🔍",
+    "detail": "📋",
+    "info": "ℹ",
+    "normal": "●",
+    "success": "✓",
+    "warning": "⚠",
+    "error": "✗",
+}
 
 
 class LogsWidget(QWidget):
     """Widget for viewing application logs and activity."""
 
+    # Entries kept in memory (oldest are dropped first)
+    MAX_LOG_ENTRIES = 50000
+    
+    # Entries rendered in the display (most recent that pass the filter)
+    DISPLAY_WINDOW = 5000
+    
+    # Delay for coalescing appends into one render pass
+    FLUSH_INTERVAL_MS = 100
+
     def __init__(self, parent=None):
         """Initialize the logs widget."""
         super().__init__(parent)
 
-        # No limit on log entries - logs are already rotated per session
-        # and retained based on settings (rotation count and age)
-        self.log_entries = []
+        # Ring buffer of all entries plus a per-level index into it.
+        # Each entry carries a sequence number so level deques can be merged.
+        self.log_entries: Deque[dict] = deque(maxlen=self.MAX_LOG_ENTRIES)
+        self._level_index: Dict[str, Deque[dict]] = {level: deque() for level in LEVEL_HIERARCHY}
+        self._level_counts: Dict[str, int] = {level: 0 for level in LEVEL_HIERARCHY}
+        self._next_seq = 0
+        
+        # Entries currently rendered (one text block per entry, oldest first)
+        self._displayed: Deque[dict] = deque(maxlen=self.DISPLAY_WINDOW)
+        
+        # Entries waiting for the next batched render
+        self._pending: Deque[dict] = deque(maxlen=self.DISPLAY_WINDOW)
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
         
         # Search state
-        self._search_matches: List[int] = []  # List of cursor positions for matches
+        self._search_matches: List[Tuple[dict, int]] = []  # (entry, occurrence within the entry)
         self._current_match_index: int = -1
         self._search_text: str = ""
         
@@ -134,6 +195,9 @@ class LogsWidget(QWidget):
         # Monospace font for logs
         font = QFont("Courier New", 9)
         self.log_text.setFont(font)
+        
+        # Old blocks are trimmed from the top as the window slides
+        self.log_text.document().setMaximumBlockCount(self.DISPLAY_WINDOW)
 
         self.log_text.setPlaceholderText(
             "Activity logs will appear here...\n\n"
@@ -168,16 +232,18 @@ class LogsWidget(QWidget):
                 "timestamp": timestamp,
                 "level": level.lower(),
                 "message": message,
+                "seq": self._next_seq,
             }
+            self._next_seq += 1
 
-            self.log_entries.append(entry)
+            self._store_entry(entry)
 
-            # Only display if entry passes current filter
+            # Only display if entry passes current filter; rendering is batched
             if self._should_display_entry(entry):
-                self._display_entry(entry)
+                self._pending.append(entry)
 
-            # Update stats
-            self._update_stats()
+            if not self._flush_timer.isActive():
+                self._flush_timer.start(self.FLUSH_INTERVAL_MS)
         except RuntimeError:
             # Widget was deleted or not accessible - silently ignore
             pass
@@ -185,6 +251,58 @@ class LogsWidget(QWidget):
             # Any other error - silently ignore to prevent crashes
             pass
 
+    def _store_entry(self, entry: dict):
+        """Add an entry to the ring buffer and level index, evicting the oldest."""
+        if len(self.log_entries) == self.log_entries.maxlen:
+            evicted = self.log_entries[0]
+            evicted_level = evicted["level"]
+            level_entries = self._level_index.get(evicted_level)
+            if level_entries and level_entries[0] is evicted:
+                level_entries.popleft()
+            if evicted_level in self._level_counts:
+                self._level_counts[evicted_level] -= 1
+
+        self.log_entries.append(entry)
+        level = entry["level"]
+        if level not in self._level_index:
+            # Unknown levels are indexed/filtered like debug
+            self._level_index[level] = deque()
+            self._level_counts[level] = 0
+        self._level_index[level].append(entry)
+        self._level_counts[level] += 1
+
+    def _iter_recent(self, threshold: int):
+        """
+        Iterate entries at or above the given severity, newest first.
+
+        Merges the per-level indexes instead of scanning the whole buffer.
+        """
+        sources = [
+            reversed(entries)
+            for level, entries in self._level_index.items()
+            if entries and LEVEL_HIERARCHY.get(level, 6) <= threshold
+        ]
+        return heapq.merge(*sources, key=lambda e: -e["seq"])
+
+    def _flush_pending(self):
+        """Render all pending entries in one pass and refresh stats."""
+        try:
+            if self._pending:
+                entries = list(self._pending)
+                self._pending.clear()
+                self._append_entries(entries)
+                if self._search_text:
+                    self._search_new_entries(entries)
+
+                # Auto-scroll to bottom (unless navigating search results)
+                if not self._search_matches:
+                    self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+
+            self._update_stats()
+        except RuntimeError:
+            # Widget was deleted or not accessible - silently ignore
+            pass
+
     def _should_display_entry(self, entry: dict) -> bool:
         """
         Check if an entry should be displayed based on current filter.
@@ -195,71 +313,41 @@ class LogsWidget(QWidget):
         Returns:
             True if entry passes current filter threshold
         """
-        filter_lower = self.filter_combo.currentText().lower()
-
-        # Level hierarchy (lower value = more severe)
-        level_hierarchy = {
-            'error': 1,
-            'warning': 2,
-            'normal': 3,
-            'success': 3,  # Success is same priority as Normal
-            'info': 4,
-            'detail': 5,
-            'debug': 6,
-        }
-
-        filter_threshold = level_hierarchy.get(filter_lower, 6)
-        entry_level = level_hierarchy.get(entry["level"], 6)
-
-        return entry_level <= filter_threshold
-
-    def _display_entry(self, entry: dict):
-        """Display a log entry with appropriate formatting."""
+        filter_threshold = LEVEL_HIERARCHY.get(self.filter_combo.currentText().lower(), 6)
+        return LEVEL_HIERARCHY.get(entry["level"], 6) <= filter_threshold
+
+    def _format_entry(self, entry: dict) -> str:
+        """Format a log entry as HTML."""
         level = entry["level"]
-        timestamp = entry["timestamp"]
-        message = entry["message"]
-
-        # Color coding - includes custom log levels
-        color_map = {
-            "debug": "#999999",    # Light gray - verbose debugging
-            "detail": "#888888",   # Gray - API URLs, keys, values
-            "info": "#666666",     # Dark gray - per-item processing
-            "normal": "#333333",   # Near black - high-level summaries
-            "success": "#008800",  # Green - success messages
-            "warning": "#ff8800",  # Orange - warnings
-            "error": "#cc0000",    # Red - errors
-        }
-        color = color_map.get(level, "#000000")
-
-        # Icon
-        icon_map = {
-            "debug": "🔍",
-            "detail": "📋",
-            "info": "ℹ",
-            "normal": "●",
-            "success": "✓",
-            "warning": "⚠",
-            "error": "✗",
-        }
-        icon = icon_map.get(level, "•")
-
-        # Format entry
-        formatted = (
-            f'<span style="color: gray;">[{timestamp}]</span> '
+        color = LEVEL_COLORS.get(level, "#000000")
+        icon = LEVEL_ICONS.get(level, "•")
+
+        return (
+            f'<span style="color: gray;">[{entry["timestamp"]}]</span> '
             f'<span style="color: {color}; font-weight: bold;">{icon} {level.upper()}</span> '
-            f"<span>{message}</span>"
+            f"<span>{entry['message']}</span>"
         )
 
-        # Append to display (with error handling for shutdown/threading issues)
+    def _entry_text(self, entry: dict) -> str:
+        """Plain text of an entry as rendered (used to find matching entries)."""
+        icon = LEVEL_ICONS.get(entry["level"], "•")
+        return f"[{entry['timestamp']}] {icon} {entry['level'].upper()} {entry['message']}"
+
+    def _append_entries(self, entries: List[dict]):
+        """Append entries to the display in a single edit block (one block per entry)."""
         try:
             if not self.log_text:
                 return
-            self.log_text.append(formatted)
-
-            # Auto-scroll to bottom
-            cursor = self.log_text.textCursor()
+            document = self.log_text.document()
+            cursor = QTextCursor(document)
             cursor.movePosition(QTextCursor.MoveOperation.End)
-            self.log_text.setTextCursor(cursor)
+            cursor.beginEditBlock()
+            for entry in entries:
+                if not document.isEmpty():
+                    cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+                cursor.insertHtml(self._format_entry(entry))
+            cursor.endEditBlock()
+            self._displayed.extend(entries)
         except RuntimeError:
             # Widget was deleted or not accessible - silently ignore
             pass
@@ -272,12 +360,8 @@ class LogsWidget(QWidget):
                 
             total = len(self.log_entries)
 
-            # Count by level
-            counts = {"debug": 0, "detail": 0, "info": 0, "normal": 0, "success": 0, "warning": 0, "error": 0}
-            for entry in self.log_entries:
-                level = entry["level"]
-                if level in counts:
-                    counts[level] += 1
+            # Counts are maintained incrementally by _store_entry
+            counts = self._level_counts
 
             # Combine success with normal for display (they're the same priority)
             normal_total = counts['normal'] + counts['success']
@@ -316,30 +400,24 @@ class LogsWidget(QWidget):
             filter_type: The filter level to apply
             preserve_search: If True, re-apply search highlights after filtering
         """
-        filter_lower = filter_type.lower()
-        
-        # Define log level hierarchy (lower value = more severe)
-        level_hierarchy = {
-            'error': 1,
-            'warning': 2,
-            'normal': 3,
-            'success': 3,  # Success is same priority as Normal
-            'info': 4,
-            'detail': 5,
-            'debug': 6,
-        }
-        
         # Get the threshold for the selected filter
-        filter_threshold = level_hierarchy.get(filter_lower, 6)  # Default to show all
+        filter_threshold = LEVEL_HIERARCHY.get(filter_type.lower(), 6)  # Default to show all
 
-        # Clear display
+        # Clear display (pending entries are part of the re-render below)
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._displayed.clear()
         self.log_text.clear()
+        self._search_matches.clear()
+        self._current_match_index = -1
+        self.log_text.setExtraSelections([])
 
-        # Re-display filtered entries (show entries at or above threshold severity)
-        for entry in self.log_entries:
-            entry_level = level_hierarchy.get(entry["level"], 6)
-            if entry_level <= filter_threshold:
-                self._display_entry(entry)
+        # Render only the most recent window of entries that pass the filter
+        window = list(islice(self._iter_recent(filter_threshold), self.DISPLAY_WINDOW))
+        window.reverse()
+        self._append_entries(window)
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+        self._update_stats()
         
         # Re-apply search if there was an active search
         if preserve_search and self._search_text:
@@ -360,6 +438,12 @@ class LogsWidget(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             self.log_entries.clear()
+            for level in self._level_index:
+                self._level_index[level].clear()
+                self._level_counts[level] = 0
+            self._flush_timer.stop()
+            self._pending.clear()
+            self._displayed.clear()
             self.log_text.clear()
             self._update_stats()
             self.log("Logs cleared", "info")
@@ -437,39 +521,34 @@ class LogsWidget(QWidget):
         self._search_timer.start(self._search_debounce_ms)
     
     def _execute_search(self):
-        """Execute the actual search after debounce delay."""
+        """Execute the actual search after debounce delay.
+        
+        Searches the rendered window of entries in memory (not the text
+        document). When the query extends the previous one, only the entries
+        that already matched are re-checked.
+        """
         text = self._pending_search_text
         
         # Double-check minimum length (in case timer fired after text changed)
         if len(text) < self._min_search_chars:
             return
         
-        self._search_text = text
-        self._search_matches.clear()
-        self._current_match_index = -1
-        
-        # Clear existing highlights
-        self._clear_highlights()
-        
-        # Find all matches in current view
-        document = self.log_text.document()
-        cursor = QTextCursor(document)
+        previous = self._search_text
+        refining = bool(previous) and text.lower().startswith(previous.lower())
         
-        # Highlight format for matches
-        highlight_format = QTextCharFormat()
-        highlight_format.setBackground(QColor(255, 255, 0))  # Yellow highlight
+        if refining:
+            candidates = []
+            for entry, _ in self._search_matches:
+                if not candidates or candidates[-1] is not entry:
+                    candidates.append(entry)
+            oldest_seq = self._displayed[0]["seq"] if self._displayed else 0
+            candidates = [e for e in candidates if e["seq"] >= oldest_seq]
+        else:
+            candidates = self._displayed
         
-        # Find all occurrences
-        while True:
-            cursor = document.find(text, cursor, QTextDocument.FindFlag(0))
-            if cursor.isNull():
-                break
-            
-            # Store the position
-            self._search_matches.append(cursor.selectionStart())
-            
-            # Apply highlight
-            cursor.mergeCharFormat(highlight_format)
+        self._search_text = text
+        self._search_matches = self._find_matches(candidates, text)
+        self._current_match_index = -1
         
         # Update UI
         match_count = len(self._search_matches)
@@ -482,6 +561,7 @@ class LogsWidget(QWidget):
             self.prev_btn.setEnabled(match_count > 1)
             self.next_btn.setEnabled(match_count > 1)
         else:
+            self._clear_highlights()
             # No matches in current filter - check if matches exist in other levels
             suggestion = self._check_matches_in_other_levels(text)
             self.match_label.setText("0 found")
@@ -494,10 +574,52 @@ class LogsWidget(QWidget):
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
     
+    def _find_matches(self, entries, text: str) -> List[Tuple[dict, int]]:
+        """Find all case-insensitive occurrences of text in the given entries."""
+        needle = text.lower()
+        matches = []
+        for entry in entries:
+            haystack = self._entry_text(entry).lower()
+            occurrence = 0
+            offset = haystack.find(needle)
+            while offset != -1:
+                matches.append((entry, occurrence))
+                occurrence += 1
+                offset = haystack.find(needle, offset + 1)
+        return matches
+    
+    def _search_new_entries(self, entries: List[dict]):
+        """Extend the active search with newly rendered entries."""
+        # Drop matches whose entries were trimmed from the display
+        if self._search_matches and self._displayed:
+            oldest_seq = self._displayed[0]["seq"]
+            kept = [m for m in self._search_matches if m[0]["seq"] >= oldest_seq]
+            self._current_match_index = max(
+                self._current_match_index - (len(self._search_matches) - len(kept)), 0
+            )
+            self._search_matches = kept
+        
+        new_matches = self._find_matches(entries, self._search_text)
+        if not new_matches and self._search_matches:
+            return
+        self._search_matches.extend(new_matches)
+        
+        match_count = len(self._search_matches)
+        if match_count == 0:
+            return
+        if self._current_match_index < 0:
+            self._current_match_index = 0
+        self._update_match_label()
+        self.prev_btn.setEnabled(match_count > 1)
+        self.next_btn.setEnabled(match_count > 1)
+        self._rehighlight_matches()
+    
     def _check_matches_in_other_levels(self, search_text: str) -> str:
         """
         Check if search text exists in log entries at other filter levels.
         
+        Only the level indexes hidden by the current filter are scanned.
+        
         Args:
             search_text: The text to search for
             
@@ -509,58 +631,36 @@ class LogsWidget(QWidget):
         
         search_lower = search_text.lower()
         current_filter = self.filter_combo.currentText().lower()
-        
-        # Level hierarchy for comparison
-        level_hierarchy = {
-            'error': 1,
-            'warning': 2,
-            'normal': 3,
-            'success': 3,
-            'info': 4,
-            'detail': 5,
-            'debug': 6,
-        }
-        
-        current_threshold = level_hierarchy.get(current_filter, 6)
+        current_threshold = LEVEL_HIERARCHY.get(current_filter, 6)
         
         # Count matches at each level that's currently filtered out
         matches_by_level = {}
-        
-        for entry in self.log_entries:
-            entry_level = entry["level"]
-            entry_threshold = level_hierarchy.get(entry_level, 6)
-            
-            # Only check entries that are filtered out
-            if entry_threshold > current_threshold:
-                # Check if search text is in the message
-                if search_lower in entry["message"].lower():
-                    level_name = entry_level.capitalize()
-                    if level_name not in matches_by_level:
-                        matches_by_level[level_name] = 0
-                    matches_by_level[level_name] += 1
+        for level, entries in self._level_index.items():
+            if LEVEL_HIERARCHY.get(level, 6) <= current_threshold:
+                continue
+            count = sum(1 for entry in entries if search_lower in entry["message"].lower())
+            if count:
+                matches_by_level[level.capitalize()] = count
         
         if not matches_by_level:
             return ""
         
         # Build suggestion message
         total_hidden = sum(matches_by_level.values())
-        level_details = ", ".join(f"{count} in {level}" for level, count in sorted(matches_by_level.items(), key=lambda x: level_hierarchy.get(x[0].lower(), 6)))
+        level_details = ", ".join(f"{count} in {level}" for level, count in sorted(matches_by_level.items(), key=lambda x: LEVEL_HIERARCHY.get(x[0].lower(), 6)))
         
         # Find the minimum filter level needed to see all matches
         min_level_needed = current_filter
         for level_name in matches_by_level.keys():
-            level_threshold = level_hierarchy.get(level_name.lower(), 6)
-            if level_threshold > level_hierarchy.get(min_level_needed.lower(), 6):
+            level_threshold = LEVEL_HIERARCHY.get(level_name.lower(), 6)
+            if level_threshold > LEVEL_HIERARCHY.get(min_level_needed.lower(), 6):
                 min_level_needed = level_name
         
         return f"{total_hidden} match(es) hidden by filter ({level_details}). Try changing filter to '{min_level_needed}' or lower."
     
     def _clear_highlights(self):
-        """Clear all search highlights from the text by re-rendering."""
-        # Re-apply the filter which rebuilds the display without highlights
-        # Use preserve_search=False to avoid recursion
-        current_filter = self.filter_combo.currentText()
-        self._apply_filter(current_filter, preserve_search=False)
+        """Clear all search highlights (they are extra selections, not document formatting)."""
+        self.log_text.setExtraSelections([])
     
     def _search_next(self):
         """Go to next search match."""
@@ -580,32 +680,51 @@ class LogsWidget(QWidget):
         self._go_to_match(self._current_match_index)
         self._update_match_label()
     
+    def _block_numbers(self) -> Dict[int, int]:
+        """Map rendered entries (by seq) to their text block number."""
+        return {entry["seq"]: number for number, entry in enumerate(self._displayed)}
+    
+    def _match_cursor(self, block_number: int, occurrence: int) -> Optional[QTextCursor]:
+        """Get a cursor selecting the n-th occurrence of the search text in a block."""
+        block = self.log_text.document().findBlockByNumber(block_number)
+        if not block.isValid():
+            return None
+        
+        haystack = block.text().lower()
+        needle = self._search_text.lower()
+        offset = haystack.find(needle)
+        for _ in range(occurrence):
+            if offset == -1:
+                break
+            offset = haystack.find(needle, offset + 1)
+        if offset == -1:
+            return None
+        
+        # Document positions count UTF-16 code units (emoji icons take two)
+        start = len(haystack[:offset].encode('utf-16-le')) // 2
+        length = len(haystack[offset:offset + len(needle)].encode('utf-16-le')) // 2
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + start)
+        cursor.movePosition(QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor, length)
+        return cursor
+    
     def _go_to_match(self, index: int):
         """Navigate to a specific match and highlight it distinctly, centering in view."""
         if index < 0 or index >= len(self._search_matches):
             return
         
-        position = self._search_matches[index]
-        
-        # Move cursor to match position
-        cursor = self.log_text.textCursor()
-        cursor.setPosition(position)
-        cursor.movePosition(QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor, len(self._search_text))
-        
-        # Highlight current match with orange (distinct from yellow for other matches)
-        current_format = QTextCharFormat()
-        current_format.setBackground(QColor(255, 165, 0))  # Orange for current match
-        cursor.mergeCharFormat(current_format)
+        entry, occurrence = self._search_matches[index]
+        block_number = self._block_numbers().get(entry["seq"])
+        if block_number is None:
+            return
+        cursor = self._match_cursor(block_number, occurrence)
+        if cursor is None:
+            return
         
         # Set cursor
         self.log_text.setTextCursor(cursor)
         
         # Center the match in the viewport (scroll so match is in middle)
-        # Get the cursor's block (line) number
-        block = cursor.block()
-        block_number = block.blockNumber()
-        
-        # Get the scrollbar and viewport info
         scrollbar = self.log_text.verticalScrollBar()
         
         # Calculate target scroll position to center the line
@@ -627,8 +746,6 @@ class LogsWidget(QWidget):
         if not self._search_text:
             return
         
-        document = self.log_text.document()
-        
         # Yellow for non-current matches
         yellow_format = QTextCharFormat()
         yellow_format.setBackground(QColor(255, 255, 0))
@@ -637,15 +754,21 @@ class LogsWidget(QWidget):
         orange_format = QTextCharFormat()
         orange_format.setBackground(QColor(255, 165, 0))
         
-        for i, position in enumerate(self._search_matches):
-            cursor = QTextCursor(document)
-            cursor.setPosition(position)
-            cursor.movePosition(QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor, len(self._search_text))
-            
-            if i == self._current_match_index:
-                cursor.mergeCharFormat(orange_format)
-            else:
-                cursor.mergeCharFormat(yellow_format)
+        block_numbers = self._block_numbers()
+        selections = []
+        for i, (entry, occurrence) in enumerate(self._search_matches):
+            block_number = block_numbers.get(entry["seq"])
+            if block_number is None:
+                continue
+            cursor = self._match_cursor(block_number, occurrence)
+            if cursor is None:
+                continue
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = orange_format if i == self._current_match_index else yellow_format
+            selections.append(selection)
+        
+        self.log_text.setExtraSelections(selections)
     
     def _update_match_label(self):
         """Update the match counter label."""
@@ -32,6 +32,7 @@ from gui.logs_widget import LogsWidget
 from gui.settings_dialog import SettingsDialog
 from gui.dialogs import SaveConfigDialog, LoadConfigDialog, ExportConfigDialog
 from gui.widgets.workflow_lock import WorkflowLockManager
+from gui.widgets.lazy_page import LazyPage
 
 
 class PrismaConfigMainWindow(QMainWindow):
@@ -140,13 +141,17 @@ class PrismaConfigMainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         main_layout.addWidget(self.stacked_widget)
 
-        # Create workflow pages
+        # Create workflow pages. Workflow pages are imported and built on
+        # first navigation; until then they show a placeholder.
         self._create_home_page()
-        self._create_pov_workflow_page()
-        self._create_migration_workflow_page()
-        self._create_dor_workflow_page()
-        self._create_tenant_performance_page()
-        self._create_saas_review_page()
+        self._workflow_pages = {}
+        self._pending_workflow_config = None
+        self._connection_name = None
+        self._add_lazy_page('pov_workflow', "POV Configuration", self._create_pov_workflow_page)
+        self._add_lazy_page('migration_workflow', "Configuration Migration", self._create_migration_workflow_page)
+        self._add_lazy_page('dor_workflow', "Generate DoR Data", self._create_dor_workflow_page)
+        self._add_lazy_page('tenant_performance_workflow', "Tenant Performance", self._create_tenant_performance_page)
+        self._add_lazy_page('saas_review_workflow', "SaaS Application Review", self._create_saas_review_page)
         self._create_logs_page()
 
         # Now connect the signal after everything is initialized
@@ -420,11 +425,43 @@ class PrismaConfigMainWindow(QMainWindow):
 
         return card
 
-    def _create_pov_workflow_page(self):
-        """Create the POV configuration workflow page."""
-        page = QWidget()
-        layout = QVBoxLayout(page)
+    # ========== Lazy workflow pages ==========
+
+    # Workflows that receive the API client from the connection dialog
+    _API_CLIENT_WORKFLOWS = ('migration_workflow', 'pov_workflow', 'dor_workflow', 'saas_review_workflow')
+    # Workflows that receive configurations loaded from file
+    _CONFIG_WORKFLOWS = ('migration_workflow', 'dor_workflow')
+
+    def _add_lazy_page(self, key: str, name: str, builder):
+        """Add a workflow page that is built on first navigation."""
+        page = LazyPage(name, builder)
+        page.loaded.connect(lambda widget, key=key: self._on_workflow_page_loaded(key, widget))
+        self._workflow_pages[key] = page
+        self.stacked_widget.addWidget(page)
+
+    def _workflow(self, key: str):
+        """Get a workflow widget, building its page if needed."""
+        return self._workflow_pages[key].ensure_loaded()
+
+    def _loaded_workflow(self, key: str):
+        """Get a workflow widget only if its page has been built."""
+        return self._workflow_pages[key].content
 
+    def _on_workflow_page_loaded(self, key: str, widget):
+        """Hand state collected before the page existed to a new workflow."""
+        if key in self._API_CLIENT_WORKFLOWS and self.api_client:
+            widget.set_api_client(self.api_client, self._connection_name)
+        if key in self._CONFIG_WORKFLOWS and self._pending_workflow_config is not None:
+            widget.load_configuration_from_main(self._pending_workflow_config)
+
+    pov_workflow = property(lambda self: self._workflow('pov_workflow'))
+    migration_workflow = property(lambda self: self._workflow('migration_workflow'))
+    dor_workflow = property(lambda self: self._workflow('dor_workflow'))
+    tenant_performance_workflow = property(lambda self: self._workflow('tenant_performance_workflow'))
+    saas_review_workflow = property(lambda self: self._workflow('saas_review_workflow'))
+
+    def _create_pov_workflow_page(self, layout):
+        """Create the POV configuration workflow page."""
         title = QLabel("<h2>🔧 POV Configuration Workflow</h2>")
         layout.addWidget(title)
 
@@ -439,16 +476,13 @@ class PrismaConfigMainWindow(QMainWindow):
         # Import POV workflow module
         from gui.workflows.pov_workflow import POVWorkflowWidget
 
-        self.pov_workflow = POVWorkflowWidget()
-        layout.addWidget(self.pov_workflow)
+        widget = POVWorkflowWidget()
+        layout.addWidget(widget)
 
-        self.stacked_widget.addWidget(page)
+        return widget
 
-    def _create_migration_workflow_page(self):
+    def _create_migration_workflow_page(self, layout):
         """Create the configuration migration workflow page."""
-        page = QWidget()
-        layout = QVBoxLayout(page)
-
         title = QLabel("<h2>🔄 Configuration Migration Workflow</h2>")
         layout.addWidget(title)
 
@@ -463,26 +497,23 @@ class PrismaConfigMainWindow(QMainWindow):
         # Import migration workflow module
         from gui.workflows.migration_workflow import MigrationWorkflowWidget
 
-        self.migration_workflow = MigrationWorkflowWidget()
+        widget = MigrationWorkflowWidget()
         
         # Connect signal to update main window's current_config
-        self.migration_workflow.configuration_loaded.connect(self._on_config_loaded_from_workflow)
+        widget.configuration_loaded.connect(self._on_config_loaded_from_workflow)
         
         # Connect signal to update connection status in sidebar
-        self.migration_workflow.connection_changed.connect(self._on_workflow_connection_changed)
+        widget.connection_changed.connect(self._on_workflow_connection_changed)
         
         # Connect signal to handle load file request from workflow
-        self.migration_workflow.load_file_requested.connect(self._load_configuration_file)
+        widget.load_file_requested.connect(self._load_configuration_file)
         
-        layout.addWidget(self.migration_workflow)
+        layout.addWidget(widget)
 
-        self.stacked_widget.addWidget(page)
+        return widget
 
-    def _create_dor_workflow_page(self):
+    def _create_dor_workflow_page(self, layout):
         """Create the DoR (Definition of Requirements) workflow page."""
-        page = QWidget()
-        layout = QVBoxLayout(page)
-
         title = QLabel("<h2>📋 Generate DoR Data</h2>")
         layout.addWidget(title)
 
@@ -496,17 +527,14 @@ class PrismaConfigMainWindow(QMainWindow):
 
         from gui.workflows.dor_workflow import DorWorkflowWidget
 
-        self.dor_workflow = DorWorkflowWidget()
-        self.dor_workflow.connection_changed.connect(self._on_workflow_connection_changed)
-        layout.addWidget(self.dor_workflow)
+        widget = DorWorkflowWidget()
+        widget.connection_changed.connect(self._on_workflow_connection_changed)
+        layout.addWidget(widget)
 
-        self.stacked_widget.addWidget(page)
+        return widget
 
-    def _create_tenant_performance_page(self):
+    def _create_tenant_performance_page(self, layout):
         """Create the Tenant Performance workflow page."""
-        page = QWidget()
-        layout = QVBoxLayout(page)
-
         title = QLabel("<h2>📊 Tenant Performance</h2>")
         layout.addWidget(title)
 
@@ -520,19 +548,16 @@ class PrismaConfigMainWindow(QMainWindow):
 
         from gui.workflows.tenant_performance_workflow import TenantPerformanceWidget
 
-        self.tenant_performance_workflow = TenantPerformanceWidget()
-        self.tenant_performance_workflow.connection_changed.connect(
+        widget = TenantPerformanceWidget()
+        widget.connection_changed.connect(
             self._on_workflow_connection_changed
         )
-        layout.addWidget(self.tenant_performance_workflow)
+        layout.addWidget(widget)
 
-        self.stacked_widget.addWidget(page)
+        return widget
 
-    def _create_saas_review_page(self):
+    def _create_saas_review_page(self, layout):
         """Create the SaaS Application Review workflow page."""
-        page = QWidget()
-        layout = QVBoxLayout(page)
-
         title = QLabel("<h2>🔍 SaaS Application Review</h2>")
         layout.addWidget(title)
 
@@ -546,11 +571,11 @@ class PrismaConfigMainWindow(QMainWindow):
 
         from gui.workflows.saas_review_workflow import SaaSReviewWorkflowWidget
 
-        self.saas_review_workflow = SaaSReviewWorkflowWidget()
-        self.saas_review_workflow.connection_changed.connect(self._on_workflow_connection_changed)
-        layout.addWidget(self.saas_review_workflow)
+        widget = SaaSReviewWorkflowWidget()
+        widget.connection_changed.connect(self._on_workflow_connection_changed)
+        layout.addWidget(widget)
 
-        self.stacked_widget.addWidget(page)
+        return widget
 
     def _create_logs_page(self):
         """Create the logs and monitoring page."""
@@ -633,6 +658,10 @@ class PrismaConfigMainWindow(QMainWindow):
         self.stacked_widget.setCurrentIndex(page_index)
         self._last_sidebar_row = index
 
+        page = self.stacked_widget.widget(page_index)
+        if isinstance(page, LazyPage):
+            page.load_soon()
+
         if name:
             self.statusBar().showMessage(f"Switched to: {name}")
 
@@ -667,11 +696,13 @@ class PrismaConfigMainWindow(QMainWindow):
 
                     self.statusBar().showMessage(f"Connected to {connection_name} ({tsg_id})", 5000)
 
-                    # Update workflows with connection name
-                    self.migration_workflow.set_api_client(self.api_client, connection_name)
-                    self.pov_workflow.set_api_client(self.api_client, connection_name)
-                    self.dor_workflow.set_api_client(self.api_client, connection_name)
-                    self.saas_review_workflow.set_api_client(self.api_client, connection_name)
+                    # Update built workflows with connection name; the
+                    # others receive it when they are first opened
+                    self._connection_name = connection_name
+                    for key in self._API_CLIENT_WORKFLOWS:
+                        workflow = self._loaded_workflow(key)
+                        if workflow is not None:
+                            workflow.set_api_client(self.api_client, connection_name)
 
                     # Log connection
                     self.logs_widget.log(f"Connected to {connection_name} (TSG: {tsg_id})", "success")
@@ -826,7 +857,6 @@ class PrismaConfigMainWindow(QMainWindow):
     def _resume_pov_deployment(self):
         """Open the Resume POV Deployment dialog."""
         pov_sidebar_row = 2   # sidebar row for POV Configuration
-        pov_page_index = 1    # stacked widget page index
 
         # Switch to POV Builder workflow if not already active
         if hasattr(self, 'workflow_list'):
@@ -834,8 +864,8 @@ class PrismaConfigMainWindow(QMainWindow):
             if current_row != pov_sidebar_row:
                 self.workflow_list.setCurrentRow(pov_sidebar_row)
 
-        # Get the POV Builder widget directly from stacked widget
-        pov_widget = self.stacked_widget.widget(pov_page_index)
+        # Get the POV Builder widget (builds the page if not opened yet)
+        pov_widget = self._workflow('pov_workflow')
 
         # Check if it has the resume dialog method
         if pov_widget and hasattr(pov_widget, '_show_resume_pov_dialog'):
@@ -859,8 +889,9 @@ class PrismaConfigMainWindow(QMainWindow):
                 self.workflow_list.setCurrentRow(dor_sidebar_row)
 
         # Show resume dialog
-        if hasattr(self, 'dor_workflow'):
-            self.dor_workflow._show_resume_dialog()
+        dor_workflow = self._workflow('dor_workflow')
+        if dor_workflow is not None:
+            dor_workflow._show_resume_dialog()
         else:
             QMessageBox.warning(
                 self,
@@ -1133,8 +1164,9 @@ class PrismaConfigMainWindow(QMainWindow):
         from config.utils.encryption import is_encrypted_file, get_config_metadata, load_config_from_file
         from gui.dialogs import PasswordDialog
         
-        encrypted = is_encrypted_file(file_path)
+        # Both read only the (cached) file header
         metadata = get_config_metadata(file_path)
+        encrypted = metadata.get("encrypted", False) if metadata else is_encrypted_file(file_path)
         name = metadata.get("name", os.path.basename(file_path)) if metadata else os.path.basename(file_path)
         
         password = None
@@ -1242,15 +1274,20 @@ class PrismaConfigMainWindow(QMainWindow):
         import logging
         logger = logging.getLogger(__name__)
         
+        # Workflows not opened yet receive the config when they are built
+        self._pending_workflow_config = config
+
         # Always update migration workflow if it exists (regardless of current page)
-        if hasattr(self, 'migration_workflow'):
+        migration_workflow = self._loaded_workflow('migration_workflow')
+        if migration_workflow is not None:
             logger.info("Updating migration workflow with loaded config")
-            self.migration_workflow.load_configuration_from_main(config)
+            migration_workflow.load_configuration_from_main(config)
 
         # Also update DoR workflow if it exists
-        if hasattr(self, 'dor_workflow'):
+        dor_workflow = self._loaded_workflow('dor_workflow')
+        if dor_workflow is not None:
             logger.info("Updating DoR workflow with loaded config")
-            self.dor_workflow.load_configuration_from_main(config)
+            dor_workflow.load_configuration_from_main(config)
 
         # Show message based on current page
         current_page = self.stacked_widget.currentIndex()
@@ -1280,6 +1317,10 @@ class PrismaConfigMainWindow(QMainWindow):
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("windowState", self.saveState())
 
+        # Zeroize cached encryption keys
+        from config.storage.keyring import lock_keyring
+        lock_keyring()
+
         # Accept the close event
         event.accept()
     
@@ -1397,18 +1438,24 @@ def main():
     from PyQt6.QtCore import QSettings
     settings = QSettings("PrismaAccess", "ConfigManager")
     log_level = settings.value("advanced/log_level", NORMAL, type=int)
+    structured_log = settings.value("advanced/structured_log", False, type=bool)
     
     setup_logging(
         log_file=log_file,
         level=log_level,
         console=False,  # NO console output in GUI (prevents segfaults)
         rotate=True,
-        keep_rotations=7
+        keep_rotations=7,
+        json_log_file=log_dir / "activity.jsonl" if structured_log else None
     )
     
     # Enable debug mode if DEBUG level selected
     if log_level == logging.DEBUG:
         enable_debug_mode()
+
+    # Shared Terraform provider cache / mirror
+    from gui.settings_dialog import apply_terraform_settings
+    apply_terraform_settings(settings)
     
     app = QApplication(sys.argv)
     
@@ -1443,8 +1490,15 @@ def main():
     app.setOrganizationDomain("prismaaccess.config")
 
     # Create and show main window with exception protection
+    from gui.startup_profiler import get_active_profiler
+    profiler = get_active_profiler()
     try:
+        if profiler:
+            profiler.mark("QApplication created")
         window = PrismaConfigMainWindow()
+        if profiler:
+            profiler.mark("main window constructed")
+            profiler.watch_first_paint(window)
         window.show()
     except Exception as e:
         import logging
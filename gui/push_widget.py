@@ -120,6 +120,17 @@ class PushConfigWidget(QWidget):
         self.dry_run_check.setStyleSheet("font-size: 13px; padding-right: 15px;")
         button_layout.addWidget(self.dry_run_check)
 
+        # Incremental push: skip identical items, update changed ones in place.
+        # Off by default so a push behaves as before unless the user opts in.
+        self.incremental_check = QCheckBox("Only push changes")
+        self.incremental_check.setToolTip(
+            "Compare each item with the destination and skip identical copies.\n"
+            "Changed items with Overwrite strategy are updated in place."
+        )
+        self.incremental_check.setChecked(False)
+        self.incremental_check.setStyleSheet("font-size: 13px; padding-right: 15px;")
+        button_layout.addWidget(self.incremental_check)
+
         self.push_btn = QPushButton("🚀 Push Configuration")
         self.push_btn.setMinimumWidth(180)
         self.push_btn.setMinimumHeight(40)
@@ -2639,6 +2650,7 @@ class PushConfigWidget(QWidget):
         # Hide push button and dry run checkbox during push, show cancel button
         self.push_btn.setVisible(False)
         self.dry_run_check.setVisible(False)
+        self.incremental_check.setVisible(False)
         self.return_to_selection_btn.setVisible(False)
         self.cancel_btn.setVisible(True)
 
@@ -2668,7 +2680,8 @@ class PushConfigWidget(QWidget):
             self.destination_client,
             filtered_items,
             destination_config,
-            resolution
+            resolution,
+            incremental=self.incremental_check.isChecked()
         )
         self.worker.progress.connect(self._on_push_progress, Qt.ConnectionType.QueuedConnection)
         self.worker.finished.connect(self._on_push_finished, Qt.ConnectionType.QueuedConnection)
@@ -3076,6 +3089,7 @@ class PushConfigWidget(QWidget):
         # Show push button and dry run checkbox again
         self.push_btn.setVisible(True)
         self.dry_run_check.setVisible(True)
+        self.incremental_check.setVisible(True)
         
         # Reset progress
         self.progress_bar.setValue(0)
@@ -3456,6 +3470,7 @@ class PushConfigWidget(QWidget):
         self.dry_run_check.setVisible(True)
         self.dry_run_check.setEnabled(False)
         self.dry_run_check.setChecked(False)
+        self.incremental_check.setVisible(True)
         self.validation_return_btn.setVisible(False)
         self.return_to_selection_btn.setVisible(False)
 
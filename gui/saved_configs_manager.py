@@ -10,7 +10,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from config.storage.json_storage import save_config_json
-from config.storage.crypto_utils import derive_key_secure
+from config.storage.config_index import ConfigIndex
+from config.storage.keyring import get_keyring
 
 
 class SavedConfigsManager:
@@ -28,38 +29,29 @@ class SavedConfigsManager:
         
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.index = ConfigIndex(self.base_dir, patterns=("*.json",))
 
     def list_configs(self) -> List[Dict[str, Any]]:
         """
         List all saved configurations.
 
+        Reads the directory metadata index; only files added or changed
+        since the last listing are opened.
+
         Returns:
             List of dicts with config metadata (name, path, modified_time, size, encrypted)
         """
         configs = []
         
-        for config_file in self.base_dir.glob("*.json"):
-            try:
-                stat = config_file.stat()
-                
-                # Try to determine if encrypted by reading first few bytes
-                with open(config_file, 'rb') as f:
-                    first_bytes = f.read(16)
-                    # Check if it looks like encrypted data (not valid JSON start)
-                    is_encrypted = not (first_bytes.startswith(b'{') or first_bytes.startswith(b'{\n'))
-                
-                configs.append({
-                    "name": config_file.stem,
-                    "path": str(config_file),
-                    "modified": datetime.fromtimestamp(stat.st_mtime),
-                    "size": stat.st_size,
-                    "encrypted": is_encrypted,
-                })
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Error reading {config_file}: {e}")
-                continue
+        for entry in self.index.entries():
+            configs.append({
+                "name": Path(entry["file"]).stem,
+                "path": entry["path"],
+                "modified": datetime.fromtimestamp(entry["modified"]),
+                "size": entry["size"],
+                "encrypted": entry["encrypted"],
+                "metadata": entry["metadata"],
+            })
         
         # Sort by modified time (newest first)
         configs.sort(key=lambda x: x["modified"], reverse=True)
@@ -106,7 +98,8 @@ class SavedConfigsManager:
             
             # Save with encryption if password provided
             if password:
-                cipher, salt = derive_key_secure(password)
+                # Keyring reuses this file's salt and cached key on re-save
+                cipher, salt = get_keyring().cipher(password, path=str(filepath))
                 success = save_config_json(
                     config,
                     str(filepath),
@@ -124,6 +117,10 @@ class SavedConfigsManager:
                 )
             
             if success:
+                # Metadata of encrypted configs stays in the encrypted payload
+                index_metadata = {} if password else dict(config["metadata"])
+                index_metadata.update(saved_at=config["metadata"]["saved_at"], saved_name=safe_name)
+                self.index.update(filepath, encrypted=bool(password), metadata=index_metadata)
                 return True, f"Configuration saved to {safe_name}.json"
             else:
                 return False, "Failed to save configuration"
@@ -168,7 +165,9 @@ class SavedConfigsManager:
                 
                 # Decrypt directly (extracts salt from file and uses it with password)
                 try:
-                    json_str, salt = decrypt_json_data(file_data, password=password)
+                    json_str, salt = decrypt_json_data(
+                        file_data, password=password, file_path=str(filepath)
+                    )
                     config = json.loads(json_str)
                 except Exception as e:
                     # Check if it's a decryption error (wrong password)
@@ -210,6 +209,8 @@ class SavedConfigsManager:
         
         try:
             filepath.unlink()
+            self.index.remove(filepath)
+            get_keyring().forget(str(filepath))
             return True, f"Configuration '{name}' deleted"
         except Exception as e:
             return False, f"Error deleting configuration: {str(e)}"
@@ -242,6 +243,8 @@ class SavedConfigsManager:
         
         try:
             old_path.rename(new_path)
+            self.index.rename(old_path, new_path)
+            get_keyring().forget(str(old_path))
             return True, f"Configuration renamed to '{safe_new_name}'"
         except Exception as e:
             return False, f"Error renaming configuration: {str(e)}"
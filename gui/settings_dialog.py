@@ -27,6 +27,17 @@ from PyQt6.QtCore import QSettings
 from config.logging_config import NORMAL, DETAIL, set_log_level, enable_debug_mode, disable_debug_mode
 
 
+def apply_terraform_settings(settings: QSettings):
+    """Apply the Terraform provider cache/mirror settings to new executors."""
+    from terraform.provider_cache import configure_provider_cache
+
+    configure_provider_cache(
+        shared_cache=settings.value("infrastructure/tf_shared_plugin_cache", True, type=bool),
+        provider_mirror=settings.value("infrastructure/tf_provider_mirror", "", type=str).strip() or None,
+        mirror_only=settings.value("infrastructure/tf_mirror_only", False, type=bool),
+    )
+
+
 class SettingsDialog(QDialog):
     """Dialog for application settings and preferences."""
 
@@ -220,6 +231,28 @@ class SettingsDialog(QDialog):
         )
         tf_layout.addRow("", self.tf_auto_approve_check)
 
+        self.tf_shared_cache_check = QCheckBox("Share provider plugin cache across deployments")
+        self.tf_shared_cache_check.setChecked(True)
+        self.tf_shared_cache_check.setToolTip(
+            "Install Terraform providers once into ~/.pa_config_lab/terraform/plugin-cache\n"
+            "instead of downloading them for every POV deployment"
+        )
+        tf_layout.addRow("", self.tf_shared_cache_check)
+
+        self.tf_provider_mirror_edit = QLineEdit()
+        self.tf_provider_mirror_edit.setPlaceholderText("Optional filesystem mirror directory")
+        self.tf_provider_mirror_edit.setToolTip(
+            "Directory created with 'terraform providers mirror'. Providers found here\n"
+            "are installed without contacting the registry."
+        )
+        tf_layout.addRow("Provider Mirror:", self.tf_provider_mirror_edit)
+
+        self.tf_mirror_only_check = QCheckBox("Install providers from mirror only (offline)")
+        self.tf_mirror_only_check.setToolTip(
+            "Never contact the Terraform registry; the mirror must contain every provider"
+        )
+        tf_layout.addRow("", self.tf_mirror_only_check)
+
         tf_group.setLayout(tf_layout)
         layout.addWidget(tf_group)
 
@@ -321,6 +354,14 @@ class SettingsDialog(QDialog):
         self.log_level_combo.setCurrentIndex(2)  # Default to NORMAL
         log_layout.addRow("Log Level:", self.log_level_combo)
 
+        # Structured output (takes effect on next start)
+        self.structured_log_check = QCheckBox("Also write JSON-lines trace (activity.jsonl)")
+        self.structured_log_check.setToolTip(
+            "Machine-readable log with workflow_id, endpoint, duration_ms and item_type.\n"
+            "Takes effect after restart."
+        )
+        log_layout.addRow("", self.structured_log_check)
+
         # Note: Max log entries setting removed - logs are unlimited in memory
         # since they're already rotated per session and retained based on
         # rotation count and age settings below.
@@ -407,6 +448,15 @@ class SettingsDialog(QDialog):
         self.tf_auto_approve_check.setChecked(
             self.settings.value("infrastructure/tf_auto_approve", True, type=bool)
         )
+        self.tf_shared_cache_check.setChecked(
+            self.settings.value("infrastructure/tf_shared_plugin_cache", True, type=bool)
+        )
+        self.tf_provider_mirror_edit.setText(
+            self.settings.value("infrastructure/tf_provider_mirror", "", type=str)
+        )
+        self.tf_mirror_only_check.setChecked(
+            self.settings.value("infrastructure/tf_mirror_only", False, type=bool)
+        )
 
         # Encryption
         self.min_length_spin.setValue(
@@ -442,6 +492,9 @@ class SettingsDialog(QDialog):
                 self.log_level_combo.setCurrentIndex(i)
                 break
         
+        self.structured_log_check.setChecked(
+            self.settings.value("advanced/structured_log", False, type=bool)
+        )
         self.log_rotation_spin.setValue(
             self.settings.value("advanced/log_rotation", 7, type=int)
         )
@@ -476,6 +529,10 @@ class SettingsDialog(QDialog):
         self.settings.setValue("infrastructure/device_retry_interval", self.device_retry_interval_spin.value())
         self.settings.setValue("infrastructure/device_timeout", self.device_timeout_spin.value())
         self.settings.setValue("infrastructure/tf_auto_approve", self.tf_auto_approve_check.isChecked())
+        self.settings.setValue("infrastructure/tf_shared_plugin_cache", self.tf_shared_cache_check.isChecked())
+        self.settings.setValue("infrastructure/tf_provider_mirror", self.tf_provider_mirror_edit.text().strip())
+        self.settings.setValue("infrastructure/tf_mirror_only", self.tf_mirror_only_check.isChecked())
+        apply_terraform_settings(self.settings)
 
         # Encryption
         self.settings.setValue("encryption/min_length", self.min_length_spin.value())
@@ -504,6 +561,7 @@ class SettingsDialog(QDialog):
         # Advanced - Logging
         log_level = self.log_level_combo.currentData()
         self.settings.setValue("advanced/log_level", log_level)
+        self.settings.setValue("advanced/structured_log", self.structured_log_check.isChecked())
         self.settings.setValue("advanced/log_rotation", self.log_rotation_spin.value())
         self.settings.setValue("advanced/log_age", self.log_age_spin.value())
         self.settings.setValue(
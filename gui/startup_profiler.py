@@ -0,0 +1,186 @@
+"""
+GUI startup profiler (``run_gui.py --profile-startup``).
+
+Records, like ``python -X importtime`` but without restarting the
+interpreter:
+
+- per-module import cost (self and cumulative), via a meta path hook that
+  times each module's execution
+- startup milestones (main window constructed, lazy pages built)
+- time to first paint of the main window
+
+The report is printed to stderr and written to logs/startup_profile.txt
+once the main window has painted.
+"""
+
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_active: Optional["StartupProfiler"] = None
+_active_lock = threading.Lock()
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module() of one module."""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(MetaPathFinder):
+    """Meta path finder that wraps the loaders found by the other finders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import timings and startup milestones."""
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            start: perf_counter() value of process start (default: now)
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self.imports: Dict[str, Tuple[float, float]] = {}  # name -> (self, cumulative)
+        self.milestones: List[Tuple[str, float, Optional[float]]] = []
+        self.first_paint: Optional[float] = None
+        self._stack: List[List] = []  # [name, start, child time]
+        self._finder = _TimingFinder(self)
+        self._event_filter = None
+
+    # ========== Import timing ==========
+
+    def install(self):
+        """Start timing imports."""
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        """Stop timing imports."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _enter(self, name: str):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self, name: str):
+        entry = self._stack.pop()
+        cumulative = time.perf_counter() - entry[1]
+        self.imports[name] = (cumulative - entry[2], cumulative)
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+    # ========== Milestones ==========
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def mark(self, label: str, duration: Optional[float] = None):
+        """Record a milestone at the current time (with an optional duration)."""
+        self.milestones.append((label, self.elapsed(), duration))
+
+    def watch_first_paint(self, window):
+        """Report once the window has painted for the first time."""
+        from PyQt6.QtCore import QObject, QEvent, QTimer
+
+        profiler = self
+
+        class _PaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint and profiler.first_paint is None:
+                    profiler.first_paint = profiler.elapsed()
+                    # Report after this paint completes
+                    QTimer.singleShot(0, profiler.finish)
+                return False
+
+        self._event_filter = _PaintFilter(window)
+        window.installEventFilter(self._event_filter)
+
+    # ========== Report ==========
+
+    def report(self, top: int = 25) -> str:
+        """Format the startup report."""
+        lines = ["=" * 78, "STARTUP PROFILE", "=" * 78]
+        if self.first_paint is not None:
+            lines.append(f"Time to first paint: {self.first_paint:.3f}s")
+        for label, at, duration in self.milestones:
+            suffix = f" ({duration:.3f}s)" if duration is not None else ""
+            lines.append(f"  {at:8.3f}s  {label}{suffix}")
+
+        total_imports = sum(self_time for self_time, _ in self.imports.values())
+        lines.append("")
+        lines.append(f"Imports: {len(self.imports)} modules, {total_imports:.3f}s total")
+        lines.append(f"{'self (ms)':>10} {'cumul (ms)':>11}  module")
+        ranked = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (self_time, cumulative) in ranked[:top]:
+            lines.append(f"{self_time * 1000:10.1f} {cumulative * 1000:11.1f}  {name}")
+
+        lines.append("")
+        lines.append("Top self time:")
+        for name, (self_time, cumulative) in sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:top // 2]:
+            lines.append(f"{self_time * 1000:10.1f} {cumulative * 1000:11.1f}  {name}")
+        lines.append("=" * 78)
+        return "\n".join(lines)
+
+    def finish(self):
+        """Stop profiling imports and emit the report."""
+        self.uninstall()
+        text = self.report()
+        print(text, file=sys.stderr)
+        try:
+            log_dir = Path(__file__).parent.parent / "logs"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            (log_dir / "startup_profile.txt").write_text(text + "\n")
+        except OSError:
+            pass
+
+
+def start_profiler(start: Optional[float] = None) -> StartupProfiler:
+    """Start the process-wide startup profiler."""
+    global _active
+    with _active_lock:
+        if _active is None:
+            _active = StartupProfiler(start)
+            _active.install()
+        return _active
+
+
+def get_active_profiler() -> Optional[StartupProfiler]:
+    """Get the running startup profiler, if --profile-startup is active."""
+    return _active
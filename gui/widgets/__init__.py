@@ -6,11 +6,12 @@ from gui.widgets.tenant_selector import TenantSelectorWidget
 from gui.widgets.results_panel import ResultsPanel
 from gui.widgets.selection_tree import SelectionTreeWidget, COMPONENT_TYPES
 from gui.widgets.infrastructure_tree import InfrastructureTreeWidget
-from gui.widgets.selection_row import SelectionRow
+from gui.widgets.selection_model import SelectionNode, SelectionTreeModel
 from gui.widgets.selection_list import SelectionListWidget
 from gui.widgets.no_scroll_combo import NoScrollComboBox
 from gui.widgets.live_log_viewer import LiveLogViewer
 from gui.widgets.workflow_lock import WorkflowLockManager
+from gui.widgets.lazy_page import LazyPage
 
 __all__ = [
     'TenantSelectorWidget',
@@ -18,9 +19,11 @@ __all__ = [
     'SelectionTreeWidget',
     'COMPONENT_TYPES',
     'InfrastructureTreeWidget',
-    'SelectionRow',
+    'SelectionNode',
+    'SelectionTreeModel',
     'SelectionListWidget',
     'NoScrollComboBox',
     'LiveLogViewer',
     'WorkflowLockManager',
+    'LazyPage',
 ]
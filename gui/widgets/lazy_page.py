@@ -0,0 +1,94 @@
+"""
+Lazily constructed stacked-widget page.
+
+Workflow pages are expensive to import and build. A LazyPage shows a light
+placeholder until the page is first needed and only then runs its builder,
+so startup does not pay for workflows the user never opens.
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+logger = logging.getLogger(__name__)
+
+
+class LazyPage(QWidget):
+    """
+    Page whose content is built on first use.
+
+    The builder receives the page's layout, adds its widgets to it and
+    returns the main content widget (e.g. the workflow widget).
+    """
+
+    loaded = pyqtSignal(object)  # content widget
+
+    def __init__(self, name: str, builder: Callable[[QVBoxLayout], QWidget], parent=None):
+        """
+        Initialize the page.
+
+        Args:
+            name: Display name used in the placeholder and logs
+            builder: Called once with the page layout; returns the content widget
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.name = name
+        self._builder = builder
+        self._content: Optional[QWidget] = None
+        self._building = False
+
+        self._layout = QVBoxLayout(self)
+        self._placeholder = QLabel(f"Loading {name}...")
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._placeholder.setStyleSheet("color: gray; font-size: 14px;")
+        self._layout.addWidget(self._placeholder)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._content is not None
+
+    @property
+    def content(self) -> Optional[QWidget]:
+        """Content widget, or None if the page has not been built yet."""
+        return self._content
+
+    def ensure_loaded(self) -> Optional[QWidget]:
+        """Build the page now if needed and return its content widget."""
+        if self._content is not None or self._building:
+            return self._content
+
+        self._building = True
+        start = time.perf_counter()
+        try:
+            self._layout.removeWidget(self._placeholder)
+            self._placeholder.hide()
+            self._content = self._builder(self._layout)
+        except Exception as e:
+            logger.error(f"Failed to build {self.name} page: {e}", exc_info=True)
+            self._placeholder.setText(f"{self.name} could not be loaded:\n{e}")
+            self._layout.addWidget(self._placeholder)
+            self._placeholder.show()
+            return None
+        finally:
+            self._building = False
+
+        self._placeholder.deleteLater()
+        elapsed = time.perf_counter() - start
+        logger.info(f"Built {self.name} page in {elapsed:.2f}s")
+
+        from gui.startup_profiler import get_active_profiler
+        profiler = get_active_profiler()
+        if profiler:
+            profiler.mark(f"page built: {self.name}", elapsed)
+
+        self.loaded.emit(self._content)
+        return self._content
+
+    def load_soon(self):
+        """Build the page on the next event-loop turn (after the placeholder paints)."""
+        if self._content is None:
+            QTimer.singleShot(0, self.ensure_loaded)
@@ -4,10 +4,16 @@ Live Log Viewer Widget - Embeddable real-time activity log viewer.
 This module provides a live log viewer that can be embedded in any workflow
 to show real-time activity log updates during operations like validation and push.
 It mirrors the functionality of the main LogsWidget but is designed for inline use.
+
+Tailing runs on a background thread (LogTailWorker) that keeps the log file
+open, reads new data in bounded chunks, parses and pre-filters lines, and
+hands the widget batches that are rendered a capped number per frame.
 """
 
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Deque, Tuple
+from collections import deque
 from datetime import datetime
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -21,11 +27,372 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor, QTextDocument
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtGui import (
+    QFont,
+    QTextCursor,
+    QTextCharFormat,
+    QTextBlockFormat,
+    QColor,
+    QTextDocument,
+)
 import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+# Lower value = more severe; entries show when their rank <= filter rank
+LEVEL_HIERARCHY = {
+    'error': 1,
+    'warning': 2,
+    'normal': 3,
+    'success': 3,
+    'info': 4,
+    'detail': 5,
+    'debug': 6,
+}
+
+# Color coding for dark theme
+LEVEL_COLORS = {
+    "debug": "#6a9955",    # Green-gray
+    "detail": "#808080",   # Gray
+    "info": "#9cdcfe",     # Light blue
+    "normal": "#d4d4d4",   # Light gray (default text)
+    "success": "#4ec9b0",  # Cyan
+    "warning": "#dcdcaa",  # Yellow
+    "error": "#f44747",    # Red
+}
+
+LEVEL_ICONS = {
+    "debug": "🔍",
+    "detail": "📋",
+    "info": "ℹ",
+    "normal": "●",
+    "success": "✓",
+    "warning": "⚠",
+    "error": "✗",
+}
+
+# (marker, level) pairs checked in order when parsing a line
+_LEVEL_MARKERS = [
+    ("DEBUG", "debug"),
+    ("DETAIL", "detail"),
+    ("NORMAL", "normal"),
+    ("WARNING", "warning"),
+    ("ERROR", "error"),
+    ("INFO", "info"),
+]
+
+
+def parse_log_line(line: str) -> Optional[dict]:
+    """
+    Parse an activity log line into an entry dict.
+
+    Args:
+        line: Raw line from the activity log (without newline)
+
+    Returns:
+        Dict with timestamp, level and message, or None for blank lines
+    """
+    line = line.strip()
+    if not line:
+        return None
+
+    # Parse log level from line
+    level = "info"
+    for marker, marker_level in _LEVEL_MARKERS:
+        if f" - {marker} - " in line or f"[{marker}]" in line:
+            level = marker_level
+            break
+
+    # Try to extract timestamp
+    timestamp = None
+    if line[0].isdigit() and len(line) > 19:
+        # Might have timestamp at start
+        try:
+            datetime.strptime(line[:19], "%Y-%m-%d %H:%M:%S")
+            timestamp = line[11:19]  # Just time portion
+            line = line[22:].strip() if len(line) > 22 else line
+        except ValueError:
+            pass
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%H:%M:%S")
+
+    # Strip common prefixes
+    for marker, _ in _LEVEL_MARKERS:
+        prefix = f" - {marker} - "
+        if prefix in line:
+            line = line.split(prefix, 1)[-1]
+            break
+
+    return {
+        "timestamp": timestamp,
+        "level": level,
+        "message": line,
+    }
+
+
+class LogFileTailer:
+    """
+    Incremental reader for a growing log file.
+
+    Keeps the file handle open between polls and reads at most
+    ``max_bytes_per_poll`` per call in ``chunk_size`` reads. Rotation is
+    detected by a change of inode (or device) on the path, truncation by
+    the file shrinking below the current position. Partial trailing lines
+    are buffered until their newline arrives.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_BYTES_PER_POLL = 1024 * 1024
+    MAX_LINE_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = CHUNK_SIZE,
+        max_bytes_per_poll: int = MAX_BYTES_PER_POLL
+    ):
+        """
+        Initialize the tailer.
+
+        Args:
+            path: Path of the log file to follow
+            chunk_size: Bytes per read() call
+            max_bytes_per_poll: Upper bound on bytes consumed per poll()
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.max_bytes_per_poll = max_bytes_per_poll
+        self._handle = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._buffer = b""
+        self.has_backlog = False
+
+    def open(self, from_end: bool = True) -> bool:
+        """
+        Open the file (if it exists).
+
+        Args:
+            from_end: Start at the end of the file (only follow new data)
+
+        Returns:
+            True if the file is open
+        """
+        self.close()
+        try:
+            self._handle = open(self.path, 'rb')
+            st = os.fstat(self._handle.fileno())
+        except OSError:
+            self._handle = None
+            return False
+
+        self._identity = (st.st_dev, st.st_ino)
+        if from_end:
+            self._handle.seek(0, os.SEEK_END)
+        return True
+
+    def close(self):
+        """Close the file handle and drop any buffered partial line."""
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+        self._handle = None
+        self._identity = None
+        self._buffer = b""
+        self.has_backlog = False
+
+    def poll(self) -> List[str]:
+        """
+        Read newly appended complete lines.
+
+        Returns:
+            List of decoded lines (may be empty). ``has_backlog`` is set when
+            the byte budget ran out before reaching the end of the file.
+        """
+        if self._handle is None:
+            # File may not exist yet; new files are read from the start
+            if not self.open(from_end=False):
+                return []
+
+        lines = self._read_available()
+
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            # Path removed; keep the handle until a new file appears
+            return lines
+
+        if (st.st_dev, st.st_ino) != self._identity:
+            # Rotated/replaced: finish the old file, then follow the new one
+            if not self.has_backlog:
+                if self._buffer:
+                    lines.append(self._buffer.decode('utf-8', errors='replace'))
+                if self.open(from_end=False):
+                    lines.extend(self._read_available())
+        elif st.st_size < self._handle.tell():
+            # Truncated in place
+            self._handle.seek(0)
+            self._buffer = b""
+            lines.extend(self._read_available())
+
+        return lines
+
+    def read_last_lines(self, num_lines: int) -> List[str]:
+        """
+        Read the last lines of the file by scanning backwards in chunks.
+
+        Does not move the tail position.
+
+        Args:
+            num_lines: Number of lines to return
+
+        Returns:
+            Up to num_lines decoded lines, oldest first
+        """
+        if num_lines <= 0:
+            return []
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                position = f.tell()
+                data = b""
+                while position > 0 and data.count(b"\n") <= num_lines:
+                    step = min(self.chunk_size, position)
+                    position -= step
+                    f.seek(position)
+                    data = f.read(step) + data
+        except OSError:
+            return []
+
+        lines = data.decode('utf-8', errors='replace').splitlines()
+        return lines[-num_lines:]
+
+    def _read_available(self) -> List[str]:
+        """Read up to the per-poll byte budget from the open handle."""
+        budget = self.max_bytes_per_poll
+        self.has_backlog = False
+        lines: List[str] = []
+
+        while budget > 0:
+            try:
+                chunk = self._handle.read(min(self.chunk_size, budget))
+            except OSError:
+                break
+            if not chunk:
+                break
+            budget -= len(chunk)
+
+            data = self._buffer + chunk
+            complete, _, self._buffer = data.rpartition(b"\n")
+            if complete:
+                lines.extend(complete.decode('utf-8', errors='replace').split("\n"))
+            if len(self._buffer) > self.MAX_LINE_BYTES:
+                # Runaway line without newline: emit what we have
+                lines.append(self._buffer.decode('utf-8', errors='replace'))
+                self._buffer = b""
+        else:
+            self.has_backlog = True
+
+        return lines
+
+
+class LogTailWorker(QThread):
+    """
+    Background thread that follows a log file for LiveLogViewer.
+
+    Lines are parsed and checked against the current filter threshold here,
+    so the UI thread only stores entries and renders the visible ones.
+    """
+
+    # all parsed entries, entries passing the filter, threshold used to filter
+    entries_ready = pyqtSignal(list, list, int)
+
+    # Idle sleeps are split into slices so interruption is noticed quickly
+    SLEEP_SLICE_MS = 50
+
+    def __init__(self, tailer: LogFileTailer, poll_interval_ms: int, threshold: int, parent=None):
+        """
+        Initialize the worker.
+
+        Args:
+            tailer: LogFileTailer (opened by the caller)
+            poll_interval_ms: Sleep between polls when the file is idle
+            threshold: Initial filter rank (see LEVEL_HIERARCHY)
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.tailer = tailer
+        self.poll_interval_ms = poll_interval_ms
+        self.threshold = threshold
+
+    def set_threshold(self, threshold: int):
+        """Update the filter rank used for pre-filtering."""
+        self.threshold = threshold
+
+    def stop(self):
+        """Ask the thread to finish after the current poll."""
+        self.requestInterruption()
+
+    def run(self):
+        """Poll the tailer until interrupted."""
+        while not self.isInterruptionRequested():
+            try:
+                lines = self.tailer.poll()
+            except Exception as e:
+                logger.debug(f"Live log tail failed: {e}")
+                lines = []
+
+            if lines:
+                threshold = self.threshold
+                entries = []
+                visible = []
+                for line in lines:
+                    entry = parse_log_line(line)
+                    if entry is None:
+                        continue
+                    entries.append(entry)
+                    if LEVEL_HIERARCHY.get(entry["level"], 6) <= threshold:
+                        visible.append(entry)
+                if entries:
+                    self.entries_ready.emit(entries, visible, threshold)
+
+            if not self.tailer.has_backlog:
+                self._idle()
+
+        self.tailer.close()
+
+    def _idle(self):
+        """Sleep for the poll interval, waking early on interruption."""
+        remaining = self.poll_interval_ms
+        while remaining > 0 and not self.isInterruptionRequested():
+            step = min(remaining, self.SLEEP_SLICE_MS)
+            self.msleep(step)
+            remaining -= step
+
+
+# Tail threads that outlived their bounded stop wait, kept alive until they finish
+_detached_workers: set = set()
+
+
+def shutdown_tail_worker(worker: LogTailWorker, timeout_ms: int):
+    """
+    Interrupt a tail thread and wait at most timeout_ms for it to exit.
+
+    A thread still running after the wait is detached from its parent and
+    kept referenced until it finishes, so destroying the parent widget never
+    destroys a running QThread.
+    """
+    worker.stop()
+    if worker.wait(timeout_ms):
+        return
+    logger.debug("Live log tail thread still running after stop, detaching it")
+    worker.setParent(None)
+    _detached_workers.add(worker)
+    worker.finished.connect(partial(_detached_workers.discard, worker))
+
 
 class LiveLogViewer(QWidget):
     """
@@ -36,7 +403,7 @@ class LiveLogViewer(QWidget):
     and displays new entries as they occur.
     
     Features:
-    - Live log updates via QTimer polling
+    - Live log updates via a background tail thread
     - Search with highlighting
     - Filter by log level
     - Export to file
@@ -47,6 +414,13 @@ class LiveLogViewer(QWidget):
     # Signal emitted when close button is clicked
     close_requested = pyqtSignal()
     
+    # Rendering budget: entries appended per frame and frame interval
+    MAX_ENTRIES_PER_FRAME = 200
+    FRAME_INTERVAL_MS = 33
+    
+    # Longest the UI thread waits for the tail thread to stop
+    STOP_TIMEOUT_MS = 1000
+    
     def __init__(
         self,
         parent=None,
@@ -54,7 +428,8 @@ class LiveLogViewer(QWidget):
         title: str = "Live Activity Log",
         show_close_button: bool = True,
         poll_interval_ms: int = 500,
-        compact: bool = False
+        compact: bool = False,
+        max_lines: int = 5000
     ):
         """
         Initialize the live log viewer.
@@ -66,6 +441,7 @@ class LiveLogViewer(QWidget):
             show_close_button: Whether to show a close button
             poll_interval_ms: How often to check for new log entries
             compact: If True, use more compact layout
+            max_lines: Maximum number of entries kept in memory and on screen
         """
         super().__init__(parent)
         self.log_file = log_file
@@ -74,9 +450,11 @@ class LiveLogViewer(QWidget):
         self.poll_interval_ms = poll_interval_ms
         self.compact = compact
         
-        # State
-        self._last_file_position = 0
-        self._log_entries: List[dict] = []
+        self.max_lines = max_lines
+        
+        # State (bounded: oldest entries are dropped past max_lines)
+        self._log_entries: Deque[dict] = deque(maxlen=max_lines)
+        self._level_counts: dict = {}
         self._auto_scroll = True
         self._is_live = False
         
@@ -93,9 +471,15 @@ class LiveLogViewer(QWidget):
         self._min_search_chars: int = 3
         self._search_debounce_ms: int = 250
         
-        # Poll timer for live updates
-        self._poll_timer = QTimer()
-        self._poll_timer.timeout.connect(self._poll_log_file)
+        # Background tailer (created by start_live)
+        self._tail_worker: Optional[LogTailWorker] = None
+        self._shutdown_connections: List[Tuple[object, object]] = []
+        
+        # Entries waiting to be rendered, drained MAX_ENTRIES_PER_FRAME at a time
+        self._pending: Deque[dict] = deque(maxlen=max_lines)
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
         
         self._init_ui()
     
@@ -230,6 +614,7 @@ class LiveLogViewer(QWidget):
         # Monospace font
         font = QFont("Courier New", 9)
         self.log_text.setFont(font)
+        self.log_text.document().setMaximumBlockCount(self.max_lines)
         
         self.log_text.setPlaceholderText(
             "Live activity log will appear here...\n\n"
@@ -270,23 +655,24 @@ class LiveLogViewer(QWidget):
         
         self._is_live = True
         
-        # Reset file position to end (only show new entries)
-        try:
-            if os.path.exists(self.log_file):
-                with open(self.log_file, 'r') as f:
-                    f.seek(0, 2)  # Seek to end
-                    self._last_file_position = f.tell()
-        except Exception:
-            self._last_file_position = 0
+        # Follow from the current end of file (only show new entries)
+        tailer = LogFileTailer(self.log_file)
+        tailer.open(from_end=True)
+        self._tail_worker = LogTailWorker(
+            tailer,
+            self.poll_interval_ms,
+            self._filter_threshold(),
+            parent=self,
+        )
+        self._tail_worker.entries_ready.connect(self._on_entries_ready)
+        self._connect_shutdown(self._tail_worker)
+        self._tail_worker.start()
         
         # Update live indicator
         self.live_indicator.setText("🔴")
         self.live_indicator.setToolTip("Live - monitoring for new entries")
         self.live_indicator.setStyleSheet("color: #e00; font-size: 10px;")
         
-        # Start polling
-        self._poll_timer.start(self.poll_interval_ms)
-        
         # Add initial message
         self._add_entry({
             "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -300,7 +686,7 @@ class LiveLogViewer(QWidget):
             return
         
         self._is_live = False
-        self._poll_timer.stop()
+        self._stop_tail_worker()
         
         # Update live indicator
         self.live_indicator.setText("⚫")
@@ -314,10 +700,49 @@ class LiveLogViewer(QWidget):
             "message": "⚫ Live monitoring stopped."
         })
     
+    def _connect_shutdown(self, worker: LogTailWorker):
+        """
+        Stop the tail thread when the application quits or this widget is
+        destroyed, even if stop_live()/closeEvent never ran.
+        """
+        # destroyed fires while the widget is being torn down, so the slot
+        # must not go through self
+        timeout_ms = self.STOP_TIMEOUT_MS
+        self._shutdown_connections.append((
+            self.destroyed,
+            self.destroyed.connect(lambda *_: shutdown_tail_worker(worker, timeout_ms)),
+        ))
+        app = QApplication.instance()
+        if app is not None:
+            self._shutdown_connections.append((
+                app.aboutToQuit,
+                app.aboutToQuit.connect(self._stop_tail_worker),
+            ))
+    
+    def _stop_tail_worker(self):
+        """Stop the tail thread and wait (bounded) for it to release the file."""
+        worker = self._tail_worker
+        if worker is None:
+            return
+        self._tail_worker = None
+        for signal, connection in self._shutdown_connections:
+            try:
+                signal.disconnect(connection)
+            except (TypeError, RuntimeError):
+                pass
+        self._shutdown_connections.clear()
+        try:
+            worker.entries_ready.disconnect(self._on_entries_ready)
+        except (TypeError, RuntimeError):
+            pass
+        shutdown_tail_worker(worker, self.STOP_TIMEOUT_MS)
+    
     def load_recent(self, num_lines: int = 100):
         """
         Load recent log entries from file.
         
+        Only the tail of the file is read, so this stays cheap on large logs.
+        
         Args:
             num_lines: Number of recent lines to load
         """
@@ -325,169 +750,106 @@ class LiveLogViewer(QWidget):
             if not os.path.exists(self.log_file):
                 return
             
-            with open(self.log_file, 'r') as f:
-                lines = f.readlines()
-                recent_lines = lines[-num_lines:] if len(lines) > num_lines else lines
-                
-                for line in recent_lines:
-                    self._parse_and_add_line(line.strip())
-                
-                # Update file position
-                self._last_file_position = f.tell()
+            lines = LogFileTailer(self.log_file).read_last_lines(num_lines)
         except Exception as e:
             self._add_entry({
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "level": "error",
                 "message": f"Error loading log file: {e}"
             })
+            return
+        
+        entries = [e for e in (parse_log_line(line) for line in lines) if e is not None]
+        self._enqueue_entries(entries, [e for e in entries if self._should_display_entry(e)])
     
     def clear(self):
         """Clear all displayed log entries."""
         self._log_entries.clear()
+        self._level_counts.clear()
+        self._pending.clear()
         self.log_text.clear()
         self._update_status()
     
-    def _poll_log_file(self):
-        """Poll log file for new entries."""
-        try:
-            if not os.path.exists(self.log_file):
-                return
-            
-            with open(self.log_file, 'r') as f:
-                # Check if file was truncated/rotated
-                f.seek(0, 2)
-                current_size = f.tell()
-                
-                if current_size < self._last_file_position:
-                    # File was truncated - start from beginning
-                    self._last_file_position = 0
-                
-                # Read new content
-                f.seek(self._last_file_position)
-                new_content = f.read()
-                self._last_file_position = f.tell()
-                
-                if new_content:
-                    for line in new_content.splitlines():
-                        if line.strip():
-                            self._parse_and_add_line(line.strip())
-        except Exception:
-            pass  # Silently ignore poll errors
+    def closeEvent(self, event):
+        """Stop tailing when the widget is closed."""
+        self._stop_tail_worker()
+        super().closeEvent(event)
     
-    def _parse_and_add_line(self, line: str):
-        """Parse a log line and add it to the display."""
-        if not line:
-            return
-        
-        # Parse log level from line
-        level = "info"
-        if " - DEBUG - " in line or "[DEBUG]" in line:
-            level = "debug"
-        elif " - DETAIL - " in line or "[DETAIL]" in line:
-            level = "detail"
-        elif " - NORMAL - " in line or "[NORMAL]" in line:
-            level = "normal"
-        elif " - WARNING - " in line or "[WARNING]" in line:
-            level = "warning"
-        elif " - ERROR - " in line or "[ERROR]" in line:
-            level = "error"
-        elif " - INFO - " in line or "[INFO]" in line:
-            level = "info"
-        
-        # Try to extract timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        if line and line[0].isdigit() and len(line) > 19:
-            # Might have timestamp at start
-            possible_ts = line[:19]
-            try:
-                datetime.strptime(possible_ts, "%Y-%m-%d %H:%M:%S")
-                timestamp = line[11:19]  # Just time portion
-                line = line[22:].strip() if len(line) > 22 else line
-            except ValueError:
-                pass
-        
-        # Strip common prefixes
-        for prefix in [" - DEBUG - ", " - DETAIL - ", " - NORMAL - ", " - INFO - ", " - WARNING - ", " - ERROR - "]:
-            if prefix in line:
-                line = line.split(prefix, 1)[-1]
-                break
-        
-        entry = {
-            "timestamp": timestamp,
-            "level": level,
-            "message": line
-        }
-        
-        self._add_entry(entry)
+    def _on_entries_ready(self, entries: list, visible: list, threshold: int):
+        """Receive a parsed batch from the tail worker."""
+        if self._tail_worker is None:
+            return  # Late batch from a stopped worker
+        
+        # Batch was parsed before a filter change - filter it again here
+        if threshold != self._filter_threshold():
+            visible = [e for e in entries if self._should_display_entry(e)]
+        self._enqueue_entries(entries, visible)
     
     def _add_entry(self, entry: dict):
         """Add a log entry and display it if it passes the filter."""
-        self._log_entries.append(entry)
-        
-        # Check if entry passes current filter
-        if self._should_display_entry(entry):
-            self._display_entry(entry)
-        
+        visible = [entry] if self._should_display_entry(entry) else []
+        self._enqueue_entries([entry], visible)
+    
+    def _enqueue_entries(self, entries: List[dict], visible: List[dict]):
+        """Store entries and queue the visible ones for the next frame."""
+        for entry in entries:
+            if len(self._log_entries) == self._log_entries.maxlen:
+                evicted = self._log_entries[0]["level"]
+                self._level_counts[evicted] = self._level_counts.get(evicted, 1) - 1
+            self._log_entries.append(entry)
+            self._level_counts[entry["level"]] = self._level_counts.get(entry["level"], 0) + 1
+        
+        # Pending is bounded too; older lines would scroll out of the document anyway
+        self._pending.extend(visible)
+        
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self.FRAME_INTERVAL_MS)
+    
+    def _flush_pending(self):
+        """Render up to MAX_ENTRIES_PER_FRAME queued entries, then reschedule."""
+        batch = []
+        while self._pending and len(batch) < self.MAX_ENTRIES_PER_FRAME:
+            batch.append(self._pending.popleft())
+        
+        if batch:
+            self._append_entries(batch)
         self._update_status()
+        
+        if self._pending:
+            self._flush_timer.start(self.FRAME_INTERVAL_MS)
+    
+    def _filter_threshold(self) -> int:
+        """Rank of the currently selected filter level."""
+        return LEVEL_HIERARCHY.get(self.filter_combo.currentText().lower(), 6)
     
     def _should_display_entry(self, entry: dict) -> bool:
         """Check if an entry should be displayed based on current filter."""
-        filter_lower = self.filter_combo.currentText().lower()
-        
-        level_hierarchy = {
-            'error': 1,
-            'warning': 2,
-            'normal': 3,
-            'success': 3,
-            'info': 4,
-            'detail': 5,
-            'debug': 6,
-        }
-        
-        filter_threshold = level_hierarchy.get(filter_lower, 6)
-        entry_level = level_hierarchy.get(entry["level"], 6)
-        
-        return entry_level <= filter_threshold
+        return LEVEL_HIERARCHY.get(entry["level"], 6) <= self._filter_threshold()
     
-    def _display_entry(self, entry: dict):
-        """Display a log entry with appropriate formatting."""
+    def _format_entry(self, entry: dict) -> str:
+        """Format a log entry as HTML."""
         level = entry["level"]
-        timestamp = entry["timestamp"]
-        message = entry["message"]
-        
-        # Color coding for dark theme
-        color_map = {
-            "debug": "#6a9955",    # Green-gray
-            "detail": "#808080",   # Gray
-            "info": "#9cdcfe",     # Light blue
-            "normal": "#d4d4d4",   # Light gray (default text)
-            "success": "#4ec9b0",  # Cyan
-            "warning": "#dcdcaa",  # Yellow
-            "error": "#f44747",    # Red
-        }
-        color = color_map.get(level, "#d4d4d4")
-        
-        # Icon
-        icon_map = {
-            "debug": "🔍",
-            "detail": "📋",
-            "info": "ℹ",
-            "normal": "●",
-            "success": "✓",
-            "warning": "⚠",
-            "error": "✗",
-        }
-        icon = icon_map.get(level, "•")
-        
-        # Format entry
-        formatted = (
-            f'<span style="color: #888;">[{timestamp}]</span> '
+        color = LEVEL_COLORS.get(level, "#d4d4d4")
+        icon = LEVEL_ICONS.get(level, "•")
+        
+        return (
+            f'<span style="color: #888;">[{entry["timestamp"]}]</span> '
             f'<span style="color: {color};">{icon}</span> '
-            f'<span style="color: {color};">{message}</span>'
+            f'<span style="color: {color};">{entry["message"]}</span>'
         )
-        
+    
+    def _append_entries(self, entries: List[dict]):
+        """Append entries to the display in a single edit block (one block per entry)."""
         try:
-            self.log_text.append(formatted)
+            document = self.log_text.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.beginEditBlock()
+            for entry in entries:
+                if not document.isEmpty():
+                    cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+                cursor.insertHtml(self._format_entry(entry))
+            cursor.endEditBlock()
             
             # Auto-scroll if enabled
             if self._auto_scroll:
@@ -500,29 +862,25 @@ class LiveLogViewer(QWidget):
     def _update_status(self):
         """Update the status bar."""
         total = len(self._log_entries)
-        
-        # Count by level
-        counts = {"error": 0, "warning": 0}
-        for entry in self._log_entries:
-            level = entry["level"]
-            if level in counts:
-                counts[level] += 1
+        errors = self._level_counts.get("error", 0)
+        warnings = self._level_counts.get("warning", 0)
         
         status_parts = [f"{total} entries"]
-        if counts["error"] > 0:
-            status_parts.append(f"❌ {counts['error']} errors")
-        if counts["warning"] > 0:
-            status_parts.append(f"⚠ {counts['warning']} warnings")
+        if errors > 0:
+            status_parts.append(f"❌ {errors} errors")
+        if warnings > 0:
+            status_parts.append(f"⚠ {warnings} warnings")
         
         self.status_label.setText(" | ".join(status_parts))
     
     def _on_filter_changed(self, filter_type: str):
         """Handle filter change - re-render all entries."""
-        self.log_text.clear()
+        if self._tail_worker is not None:
+            self._tail_worker.set_threshold(self._filter_threshold())
         
-        for entry in self._log_entries:
-            if self._should_display_entry(entry):
-                self._display_entry(entry)
+        self._pending.clear()
+        self.log_text.clear()
+        self._append_entries([e for e in self._log_entries if self._should_display_entry(e)])
         
         # Re-apply search if active
         if self._search_text:
@@ -2,7 +2,10 @@
 Selection List Widget - Card-based hierarchical selection for push configuration.
 
 This module provides the main selection list that displays configuration items
-as card-style rows with expand/collapse, checkboxes, and detail panels.
+as card-style rows with expand/collapse, checkboxes, and a detail panel.
+
+Rows are SelectionNode objects shown through a SelectionTreeModel/QTreeView,
+so large configurations don't instantiate a widget per item.
 """
 
 import logging
@@ -14,8 +17,9 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QComboBox,
-    QScrollArea,
     QFrame,
+    QTreeView,
+    QSplitter,
     QPushButton,
     QCheckBox,
     QGroupBox,
@@ -24,7 +28,12 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QThread
 
-from gui.widgets.selection_row import SelectionRow
+from gui.widgets.selection_model import (
+    SelectionNode,
+    SelectionTreeModel,
+    SelectionItemDelegate,
+    SelectionDetailPanel,
+)
 from gui.widgets.tenant_selector import TenantSelectorWidget
 from gui.widgets.selection_tree import COMPONENT_SECTIONS
 
@@ -125,7 +134,7 @@ class SelectionListWidget(QWidget):
     1. Title: "Select Components to Push"
     2. Destination Tenant Selector
     3. Push Configuration (Default Strategy)
-    4. Component List (scrollable card rows)
+    4. Component List (tree view of card rows + shared detail panel)
     5. Summary bar
     """
     
@@ -161,9 +170,9 @@ class SelectionListWidget(QWidget):
         self._destination_connected = False
         
         # All selection rows (flat list for easy access)
-        self._all_rows: List[SelectionRow] = []
+        self._all_rows: List[SelectionNode] = []
         # Top-level rows only
-        self._top_rows: List[SelectionRow] = []
+        self._top_rows: List[SelectionNode] = []
         
         self._init_ui()
     
@@ -292,24 +301,7 @@ class SelectionListWidget(QWidget):
         
         layout.addLayout(config_row)
         
-        # === Scrollable Component List ===
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                background-color: #ffffff;
-            }
-        """)
-        
-        self.list_container = QWidget()
-        self.list_layout = QVBoxLayout(self.list_container)
-        self.list_layout.setSpacing(4)
-        self.list_layout.setContentsMargins(8, 8, 8, 8)
-        self.list_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
+        # === Component List (model/view) ===
         # Placeholder when no config loaded
         self.placeholder_label = QLabel(
             "⏳ No configuration loaded.\n\n"
@@ -317,10 +309,41 @@ class SelectionListWidget(QWidget):
         )
         self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.placeholder_label.setStyleSheet("color: #999; padding: 40px; font-size: 14px;")
-        self.list_layout.addWidget(self.placeholder_label)
-        
-        scroll_area.setWidget(self.list_container)
-        layout.addWidget(scroll_area, stretch=1)
+        layout.addWidget(self.placeholder_label)
+        
+        self.selection_model = SelectionTreeModel(self)
+        self.selection_model.check_state_changed.connect(self._on_row_selection_changed)
+        
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.selection_model)
+        self.tree_view.setItemDelegate(SelectionItemDelegate(self.tree_view))
+        self.tree_view.setHeaderHidden(True)
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setIndentation(24)
+        self.tree_view.setMouseTracking(True)
+        self.tree_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tree_view.setStyleSheet("""
+            QTreeView {
+                border: 1px solid #dee2e6;
+                border-radius: 6px;
+                background-color: #ffffff;
+                padding: 4px;
+            }
+        """)
+        self.tree_view.selectionModel().currentChanged.connect(self._on_current_row_changed)
+        self.tree_view.setVisible(False)
+        
+        # Shared detail panel for the current row
+        self.detail_panel = SelectionDetailPanel()
+        self.detail_panel.destination_changed.connect(self._on_row_detail_changed)
+        
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(self.tree_view)
+        splitter.addWidget(self.detail_panel)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+        splitter.setChildrenCollapsible(False)
+        layout.addWidget(splitter, stretch=1)
     
     def set_config(self, config: Dict[str, Any]):
         """
@@ -335,6 +358,7 @@ class SelectionListWidget(QWidget):
         if not config:
             self._clear_list()
             self.placeholder_label.setVisible(True)
+            self.tree_view.setVisible(False)
             self.select_all_check.setEnabled(False)
             self.continue_btn.setEnabled(False)
             self.source_folders = []
@@ -351,12 +375,13 @@ class SelectionListWidget(QWidget):
         
         self._build_selection_list()
         self.placeholder_label.setVisible(False)
+        self.tree_view.setVisible(True)
         self.select_all_check.setEnabled(True)
         
         # Auto-select all items when config is loaded
         self.select_all_check.setChecked(True)
         for row in self._top_rows:
-            row.set_checked(True)
+            self.selection_model.set_node_checked(row, True)
         
         self._update_summary()
     
@@ -428,6 +453,7 @@ class SelectionListWidget(QWidget):
             for row in self._all_rows:
                 row.set_available_folders(self.destination_folders)
                 row.set_available_snippets(self.destination_snippets)
+            self.detail_panel.refresh()
         else:
             self.destination_folders = []
             self.destination_snippets = []
@@ -437,6 +463,7 @@ class SelectionListWidget(QWidget):
             for row in self._all_rows:
                 row.set_available_folders([])
                 row.set_available_snippets([])
+            self.detail_panel.refresh()
     
     def get_destination_api_client(self):
         """Get the destination tenant API client."""
@@ -461,16 +488,10 @@ class SelectionListWidget(QWidget):
     
     def _clear_list(self):
         """Clear all rows from the list."""
-        for row in self._all_rows:
-            row.deleteLater()
+        self.detail_panel.set_node(None)
+        self.selection_model.clear()
         self._all_rows.clear()
         self._top_rows.clear()
-        
-        # Clear layout
-        while self.list_layout.count() > 1:  # Keep placeholder
-            item = self.list_layout.takeAt(1)
-            if item.widget():
-                item.widget().deleteLater()
     
     # Folder display name mapping
     FOLDER_DISPLAY_NAMES = {
@@ -624,8 +645,7 @@ class SelectionListWidget(QWidget):
 
                     # Disable checkbox for empty snippets - nothing to push
                     if not has_items:
-                        snippet_row.checkbox.setEnabled(False)
-                        snippet_row.checkbox.setToolTip("Empty snippet - no items to push")
+                        snippet_row.set_enabled(False, "Empty snippet - no items to push")
 
                     # Add snippet contents if any
                     if snippet_data and has_items:
@@ -873,17 +893,19 @@ class SelectionListWidget(QWidget):
                         )
                         type_row.add_child(item_row)
         
+        self.selection_model.set_top_nodes(self._top_rows)
+        
         # Expand top level and select all by default
         for row in self._top_rows:
-            row.set_expanded(True)
-            row.set_checked(True)
+            self.tree_view.expand(self.selection_model.index_for_node(row))
+            self.selection_model.set_node_checked(row, True)
         
         # Update select all checkbox to reflect the state
         self.select_all_check.blockSignals(True)
         self.select_all_check.setChecked(True)
         self.select_all_check.blockSignals(False)
     
-    def _add_folder_contents_new_format(self, parent_row: SelectionRow, items_dict: Dict, container_name: str, level: int, is_snippet: bool = False):
+    def _add_folder_contents_new_format(self, parent_row: SelectionNode, items_dict: Dict, container_name: str, level: int, is_snippet: bool = False):
         """
         Add folder/snippet contents from new config format with section groupings.
 
@@ -1011,7 +1033,7 @@ class SelectionListWidget(QWidget):
                 )
                 type_row.add_child(item_row)
     
-    def _add_ipsec_hierarchy(self, parent_row: SelectionRow, items_by_type: Dict, folder_name: str, level: int):
+    def _add_ipsec_hierarchy(self, parent_row: SelectionNode, items_by_type: Dict, folder_name: str, level: int):
         """
         Add IPsec hierarchy to a parent row (Remote Networks or Service Connections).
         
@@ -1131,7 +1153,7 @@ class SelectionListWidget(QWidget):
                     )
                     ipsec_crypto_row.add_child(item_row)
     
-    def _add_folder_contents(self, folder_row: SelectionRow, folder: Dict, level: int):
+    def _add_folder_contents(self, folder_row: SelectionNode, folder: Dict, level: int):
         """Add folder contents (rules, objects, profiles) to folder row - legacy format."""
         # Security Rules
         rules = folder.get('security_rules', [])
@@ -1230,7 +1252,7 @@ class SelectionListWidget(QWidget):
         data: Dict = None,
         level: int = 0,
         has_children: bool = False
-    ) -> SelectionRow:
+    ) -> SelectionNode:
         """Create a selection row."""
         # Only show destination folders/snippets if connected to destination tenant
         # Otherwise show empty list (dropdown will only have: inherit, original, new snippet)
@@ -1241,45 +1263,54 @@ class SelectionListWidget(QWidget):
             available_folders = []
             available_snippets = []
         
-        row = SelectionRow(
+        row = SelectionNode(
             label=label,
             item_type=item_type,
             data=data,
             level=level,
             has_children=has_children,
-            parent_widget=self.list_container,
             available_folders=available_folders,
             available_snippets=available_snippets,
             default_push_strategy=self.default_strategy_combo.currentText().lower(),
             config_metadata=self.config_metadata,
         )
         
-        # Connect signals
-        row.selection_changed.connect(self._on_row_selection_changed)
-        row.detail_changed.connect(self._on_row_detail_changed)
-        
         self._all_rows.append(row)
         return row
     
-    def _add_top_row(self, row: SelectionRow):
-        """Add a top-level row to the list."""
+    def _add_top_row(self, row: SelectionNode):
+        """Add a top-level row to the list (shown once the list is built)."""
         self._top_rows.append(row)
-        self.list_layout.addWidget(row)
     
-    def _on_row_selection_changed(self, row: SelectionRow, is_checked: bool):
+    def _on_row_selection_changed(self, row: SelectionNode, is_checked: bool):
         """Handle row selection change."""
+        # Collapse children when unchecking
+        if not is_checked and row.has_children:
+            self._collapse_recursive(row)
         self._update_summary()
     
-    def _on_row_detail_changed(self, row: SelectionRow):
+    def _collapse_recursive(self, row: SelectionNode):
+        """Collapse a row and all of its expanded descendants."""
+        for node in row.iter_subtree():
+            if node.fetched_count:
+                self.tree_view.collapse(self.selection_model.index_for_node(node))
+    
+    def _on_current_row_changed(self, current, previous):
+        """Show the detail panel for the current row."""
+        self.detail_panel.set_node(self.selection_model.node_from_index(current) if current.isValid() else None)
+    
+    def _on_row_detail_changed(self, row: SelectionNode, auto_select: bool):
         """Handle row detail settings change."""
-        # Could trigger validation or preview updates
-        pass
+        # Auto-select the item for push when its settings are customized
+        if auto_select:
+            self.selection_model.set_node_checked(row, True)
+        self.selection_model.refresh_node(row)
     
     def _on_select_all(self, state):
         """Handle select all checkbox."""
         is_checked = state == Qt.CheckState.Checked.value
         for row in self._top_rows:
-            row.set_checked(is_checked)
+            self.selection_model.set_node_checked(row, is_checked)
         self._update_summary()
     
     def _on_default_strategy_changed(self, strategy: str):
@@ -1287,6 +1318,7 @@ class SelectionListWidget(QWidget):
         strategy_lower = strategy.lower()
         for row in self._all_rows:
             row.update_default_strategy(strategy_lower)
+        self.detail_panel.refresh()
     
     # Folders that cannot be pushed to (read-only or special)
     # These are specifically folders under "Prisma Access" that are not directly editable
@@ -1434,13 +1466,11 @@ class SelectionListWidget(QWidget):
         """Expand all rows."""
         for row in self._all_rows:
             if row.has_children:
-                row.set_expanded(True)
+                self.tree_view.expand(self.selection_model.index_for_node(row))
     
     def _collapse_all(self):
         """Collapse all rows."""
-        for row in self._all_rows:
-            if row.has_children:
-                row.set_expanded(False)
+        self.tree_view.collapseAll()
     
     def _update_summary(self):
         """Update the continue button state based on selection."""
@@ -1530,7 +1560,7 @@ class SelectionListWidget(QWidget):
         # Track container-level destination settings (for rename/new snippet operations)
         container_destinations = {}  # source_name -> destination_settings
         
-        def collect_container_destinations(row: SelectionRow):
+        def collect_container_destinations(row: SelectionNode):
             """First pass: collect destination settings from container rows."""
             if row.has_children and row.item_type in ('folder', 'snippet'):
                 source_name = row.label_text
@@ -1554,7 +1584,7 @@ class SelectionListWidget(QWidget):
         for row in self._top_rows:
             collect_container_destinations(row)
         
-        def collect_recursive(row: SelectionRow):
+        def collect_recursive(row: SelectionNode):
             # Only collect checked leaf items (actual config objects)
             if row.is_checked() and not row.has_children:
                 data = row.get_data()
@@ -1744,7 +1774,7 @@ class SelectionListWidget(QWidget):
                 items_to_add[key] = item
                 logger.info(f"  Looking for: {item_type} '{name}' in '{container or 'any'}'")
         
-        def find_and_check_rows(row: 'SelectionRow', current_container: str = None):
+        def find_and_check_rows(row: SelectionNode, current_container: str = None):
             """Recursively find and check rows matching items to add."""
             # Track container as we traverse
             row_container = current_container
@@ -1784,7 +1814,7 @@ class SelectionListWidget(QWidget):
                     if not row.is_checked():
                         container_info = row_data_container or row_container or 'unknown'
                         logger.info(f"  [OK] Selecting: {row_type} '{row_name}' from '{container_info}'")
-                        row.set_checked(True)
+                        self.selection_model.set_node_checked(row, True)
                     
                     # Apply target destination if specified (from dependency resolution)
                     target_dest = item_info.get('target_destination')
@@ -1817,6 +1847,10 @@ class SelectionListWidget(QWidget):
         for row in self._top_rows:
             find_and_check_rows(row)
         
+        # Repaint status of rows whose destination was set
+        self.selection_model.refresh_all()
+        self.detail_panel.refresh()
+        
         # Log any items not found
         if items_to_add:
             logger.warning(f"Could not find rows for {len(items_to_add)} items:")
@@ -0,0 +1,1265 @@
+"""
+Selection Model - Model/view implementation of the push selection hierarchy.
+
+The selection hierarchy is built from widget-free nodes and shown in a
+QTreeView instead of one widget per item:
+- SelectionNode: lightweight, widget-free node holding the selection and
+  destination state of a folder, snippet, type container or config item
+- SelectionTreeModel: QAbstractItemModel over the node tree. Children are
+  exposed to the view lazily (only when their parent is expanded) and
+  tri-state check propagation is done in the model
+- SelectionItemDelegate: paints the card-style rows (checkbox, label, type
+  badge, customization status and child count) without per-row widgets
+- SelectionDetailPanel: a single shared detail panel (source metadata,
+  destination settings, config preview) for the current node
+
+SelectionNode exposes the row API used by selection collection
+(is_checked, get_children, get_data, get_destination_settings,
+set_destination, ...).
+"""
+
+import logging
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+from PyQt6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QFrame,
+    QLineEdit,
+    QTextEdit,
+    QRadioButton,
+    QButtonGroup,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QStyle,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractItemModel,
+    QModelIndex,
+    QRect,
+    QSize,
+)
+from PyQt6.QtGui import QFont, QColor, QPen, QPainter, QFontMetrics
+
+from gui.widgets.no_scroll_combo import NoScrollComboBox
+
+logger = logging.getLogger(__name__)
+
+
+# Location values that are not real folders/snippets
+SPECIAL_LOCATIONS = ("inherit", "new_snippet", "rename_snippet")
+
+TYPE_ICONS = {
+    'folder': '📁',
+    'snippet': '📄',
+    'security_rule': '🔒',
+    'rule': '🔒',
+    'address': '📍',
+    'address_group': '📍',
+    'service': '🔌',
+    'service_group': '🔌',
+    'application': '📱',
+    'application_group': '📱',
+    'application_filter': '🔍',
+    'tag': '🏷️',
+    'schedule': '📅',
+    'infrastructure': '🏗️',
+    'remote_network': '🌐',
+    'service_connection': '🔗',
+    'ipsec_tunnel': '🔐',
+    'ike_gateway': '🚪',
+    'agent_profile': '👤',
+}
+
+# Required folder shown as source location for infrastructure items
+INFRA_FOLDERS = {
+    'remote_network': 'Remote Networks',
+    'service_connection': 'Service Connections',
+    'ipsec_tunnel': 'Remote Networks / Service Connections',
+    'ike_gateway': 'Remote Networks / Service Connections',
+    'ike_crypto_profile': 'Remote Networks / Service Connections',
+    'ipsec_crypto_profile': 'Remote Networks / Service Connections',
+    'agent_profile': 'Mobile Users',
+    'bandwidth_allocation': 'Remote Networks',
+}
+
+
+class SelectionNode:
+    """
+    A node in the push selection hierarchy.
+
+    Holds the selection and destination state of one row without any
+    widgets, so building the hierarchy for large configurations is cheap.
+    """
+
+    # Folder display name mapping
+    FOLDER_DISPLAY_NAMES = {
+        'All': 'Global',
+        'Shared': 'Prisma Access',
+        'Mobile Users Container': 'Mobile Users Container',
+        'Mobile Users': 'Mobile Users',
+        'Mobile Users Explicit Proxy': 'Mobile Users Explicit Proxy',
+        'Remote Networks': 'Remote Networks',
+        'Service Connections': 'Service Connections',
+    }
+
+    # Folders that cannot be pushed to (read-only or special)
+    # Note: "Remote Networks" IS a valid Security Policy folder and should NOT be filtered
+    NON_EDITABLE_FOLDERS = {
+        'ngfw-shared',
+        'colo-connect', 'colo connect',
+        'service-connections', 'service connections',
+        'predefined', 'default',
+    }
+
+    # Snippets are pre-filtered by type='Custom' in selection_list.py
+    DEFAULT_SNIPPETS = set()
+
+    # Keys to exclude from config preview (metadata and internal fields)
+    EXCLUDED_CONFIG_KEYS = {
+        'id', 'folder', 'snippet', 'is_default', 'item_type',
+        'push_strategy', '_pull_date', '_source', '_metadata',
+        'position', 'device_group', 'type',
+        'deleted', 'delete_success',
+        'metadata',
+    }
+
+    def __init__(
+        self,
+        label: str,
+        item_type: str,
+        data: Optional[Dict[str, Any]] = None,
+        level: int = 0,
+        has_children: bool = False,
+        available_folders: Optional[List[str]] = None,
+        available_snippets: Optional[List[str]] = None,
+        default_push_strategy: str = "skip",
+        config_metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the selection node.
+
+        Args:
+            label: Display label for the node
+            item_type: Type of item (folder, snippet, rule, object, etc.)
+            data: The configuration data for this item
+            level: Hierarchy level (0 = top level)
+            has_children: Whether this node has child nodes
+            available_folders: List of available destination folders
+            available_snippets: List of available destination snippets
+            default_push_strategy: Default push strategy (skip/overwrite/rename)
+            config_metadata: Config-level metadata (tenant name, version, dates)
+        """
+        self.label_text = label
+        self.item_type = item_type
+        self.data = data or {}
+        self.level = level
+        self.has_children = has_children
+        self.available_folders = available_folders or []
+        self.available_snippets = available_snippets or []
+        self.default_push_strategy = default_push_strategy
+        self.config_metadata = config_metadata or {}
+
+        # Selection state
+        self._is_checked = False
+        self._is_partial = False
+        self._enabled = True
+        self._tooltip = ""
+        self._children: List['SelectionNode'] = []
+        self._parent_row: Optional['SelectionNode'] = None
+        self._row = 0
+
+        # Number of children exposed to the model (lazy population)
+        self._fetched = 0
+
+        # Cached (inherited, customized) leaf descendant counts for status_text()
+        self._child_counts: Optional[Tuple[int, int]] = None
+
+        # Destination settings (per-item overrides)
+        self._destination_folder = "inherit"
+        self._destination_name = self.data.get('name', label)
+        self._push_strategy = default_push_strategy
+        self._is_dest_new_snippet = False
+        self._dest_is_existing_snippet = False
+        self._new_snippet_name = ""
+        self._include_dependencies = True
+
+        # Track original values to detect customization
+        self._original_folder = self.data.get('folder', '')
+        self._original_name = self.data.get('name', label)
+        self._original_strategy = default_push_strategy
+
+        self._is_customized = False
+
+    # === Characteristics ===
+
+    @property
+    def is_leaf_item(self) -> bool:
+        """Leaf items have no children and carry config data."""
+        return not self.has_children and bool(self.data.get('name'))
+
+    @property
+    def is_configurable_container(self) -> bool:
+        """Any container with children has destination/strategy options."""
+        return self.has_children
+
+    @property
+    def is_snippet_container(self) -> bool:
+        """Top-level snippets with children can be renamed."""
+        return self.item_type == 'snippet' and self.has_children
+
+    @property
+    def has_detail_panel(self) -> bool:
+        """Whether this node has destination settings to edit."""
+        return self.is_leaf_item or self.is_configurable_container
+
+    def type_badge(self) -> str:
+        """Format the type badge text."""
+        icon = TYPE_ICONS.get(self.item_type, '📦')
+        return f"{icon} {self.item_type.replace('_', ' ').title()}"
+
+    def status_text(self) -> Tuple[str, bool]:
+        """
+        Get the inherit/customized status shown next to the label.
+
+        Returns:
+            Tuple of (text, is_customized); text is empty when nothing to show
+        """
+        if self.is_leaf_item:
+            if self._is_customized:
+                return "⚙ customized", True
+            return "↩ inherit", False
+
+        if not self._children:
+            return "", False
+
+        inherited, customized = self._count_child_customization()
+        if self._is_customized:
+            text = "⚙ customized"
+            if inherited > 0 or customized > 0:
+                text += f" (↩{inherited}|⚙{customized})"
+            return text, True
+        if customized > 0:
+            return f"↩ {inherited} | ⚙ {customized}", True
+        return "", False
+
+    def _count_child_customization(self) -> Tuple[int, int]:
+        """Count inherited vs customized leaf descendants (cached).
+
+        Returns:
+            tuple: (inherited_count, customized_count)
+        """
+        if self._child_counts is None:
+            self._child_counts = self._walk_child_customization()
+        return self._child_counts
+
+    def _walk_child_customization(self) -> Tuple[int, int]:
+        """Count inherited vs customized leaf descendants with a subtree walk."""
+        inherited = 0
+        customized = 0
+        stack = list(self._children)
+        while stack:
+            node = stack.pop()
+            if node._children:
+                stack.extend(node._children)
+            elif node.data.get('name'):
+                if node._is_customized:
+                    customized += 1
+                else:
+                    inherited += 1
+        return inherited, customized
+
+    # === Tree ===
+
+    def add_child(self, child: 'SelectionNode'):
+        """Add a child node."""
+        child._parent_row = self
+        child._row = len(self._children)
+        self._children.append(child)
+        self.has_children = True
+        self.invalidate_child_counts()
+
+    def invalidate_child_counts(self):
+        """Drop the cached customization counts of this node and its ancestors."""
+        node = self
+        while node is not None:
+            node._child_counts = None
+            node = node._parent_row
+
+    @property
+    def fetched_count(self) -> int:
+        """Number of children currently exposed to the model."""
+        return self._fetched
+
+    def get_children(self) -> List['SelectionNode']:
+        """Get child nodes."""
+        return self._children
+
+    def get_data(self) -> Dict[str, Any]:
+        """Get the item data."""
+        return self.data
+
+    def iter_subtree(self) -> Iterator['SelectionNode']:
+        """Iterate over this node and all its descendants (pre-order)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node._children))
+
+    # === Check state ===
+
+    def set_checked(self, checked: bool):
+        """Set the checked state of this node and all descendants."""
+        for node in self.iter_subtree():
+            node._is_checked = checked
+            node._is_partial = False
+
+    def is_checked(self) -> bool:
+        """Check if this node is checked."""
+        return self._is_checked
+
+    def is_partial(self) -> bool:
+        """Check if this node is in partial state."""
+        return self._is_partial
+
+    def check_state(self) -> Qt.CheckState:
+        """Get the tri-state check state."""
+        if self._is_partial:
+            return Qt.CheckState.PartiallyChecked
+        return Qt.CheckState.Checked if self._is_checked else Qt.CheckState.Unchecked
+
+    def _update_check_state_from_children(self) -> bool:
+        """Update this node's check state from its children.
+
+        Returns:
+            True if the state changed
+        """
+        if not self._children:
+            return False
+
+        checked_count = 0
+        partial_count = 0
+        for child in self._children:
+            if child._is_checked:
+                checked_count += 1
+            elif child._is_partial:
+                partial_count += 1
+
+        old = (self._is_checked, self._is_partial)
+        if checked_count == 0 and partial_count == 0:
+            self._is_checked, self._is_partial = False, False
+        elif checked_count == len(self._children):
+            self._is_checked, self._is_partial = True, False
+        else:
+            self._is_checked, self._is_partial = False, True
+        return old != (self._is_checked, self._is_partial)
+
+    def set_enabled(self, enabled: bool, tooltip: str = ""):
+        """Enable/disable the checkbox for this node."""
+        self._enabled = enabled
+        self._tooltip = tooltip
+
+    def is_enabled(self) -> bool:
+        """Check if the checkbox for this node is enabled."""
+        return self._enabled
+
+    # === Destination ===
+
+    def _get_display_name(self, name: str) -> str:
+        """Get display name for a folder/snippet (e.g., 'All' -> 'Global')."""
+        return self.FOLDER_DISPLAY_NAMES.get(name, name)
+
+    def _is_editable_destination(self, name: str, is_snippet: bool = False) -> bool:
+        """Check if a folder/snippet can be used as a push destination."""
+        if not name:
+            return False
+
+        normalized = name.lower().replace('-', ' ')
+        blocklist = self.DEFAULT_SNIPPETS if is_snippet else self.NON_EDITABLE_FOLDERS
+        for blocked in blocklist:
+            if normalized == blocked.lower().replace('-', ' '):
+                return False
+        return True
+
+    def _source_location(self) -> str:
+        """Get the location this item was pulled from."""
+        return self.data.get('folder', '') or self.data.get('snippet', '') or ''
+
+    def location_options(self) -> List[Optional[Tuple[str, str]]]:
+        """
+        Get the options for the destination location dropdown.
+
+        Before the destination tenant is connected: inherit, original
+        location and new snippet (rename snippet for snippet containers).
+        After: the above plus the filtered destination folders/snippets.
+
+        Returns:
+            List of (display_text, value) tuples; None marks a separator
+        """
+        options: List[Optional[Tuple[str, str]]] = [("⬆ Inherit from Parent", "inherit")]
+
+        source_folder = self.data.get('folder', '')
+        source_snippet = self.data.get('snippet', '')
+        current_location = self._source_location()
+        if current_location:
+            emoji = "📄" if source_snippet and not source_folder else "📁"
+            options.append(
+                (f"{emoji} {self._get_display_name(current_location)} (original)", current_location)
+            )
+
+        if self.is_snippet_container:
+            options.append(("✏️ Rename Snippet", "rename_snippet"))
+        else:
+            options.append(("➕ New Snippet", "new_snippet"))
+
+        folders = [
+            f for f in self.available_folders
+            if f and f != current_location and self._is_editable_destination(f, is_snippet=False)
+        ]
+        snippets = [
+            s for s in self.available_snippets
+            if s and s != current_location and self._is_editable_destination(s, is_snippet=True)
+        ]
+        if folders or snippets:
+            options.append(None)
+            options.extend((f"📁 {self._get_display_name(f)}", f) for f in folders)
+            options.extend((f"📄 {s}", s) for s in snippets)
+
+        return options
+
+    def update_destination(
+        self,
+        location: str,
+        name: str,
+        strategy: str,
+        new_snippet_name: str = "",
+        include_dependencies: bool = True,
+    ) -> bool:
+        """
+        Apply destination settings edited in the detail panel.
+
+        The Rename strategy appends "-copy" to an unedited name, renaming a
+        snippet container selects "Rename Snippet", and container settings
+        are propagated to all children.
+
+        Args:
+            location: Location dropdown value (folder/snippet or special value)
+            name: Destination name
+            strategy: Push strategy (skip/overwrite/rename)
+            new_snippet_name: Name for a new snippet
+            include_dependencies: Include dependencies (vs. create duplicates)
+
+        Returns:
+            True if the node became customized and should be auto-selected
+        """
+        old_folder = self._destination_folder
+        old_strategy = self._push_strategy
+        old_name = self._destination_name
+
+        self._destination_folder = location or "inherit"
+        self._destination_name = name
+        self._push_strategy = strategy.lower()
+        self._new_snippet_name = new_snippet_name
+        self._include_dependencies = include_dependencies
+        self._dest_is_existing_snippet = (
+            self._destination_folder not in SPECIAL_LOCATIONS
+            and self._destination_folder != self._source_location()
+            and self._destination_folder in self.available_snippets
+        )
+
+        # Auto-append "-copy" when Rename strategy is selected (if name hasn't been edited)
+        if self._push_strategy == 'rename' and old_strategy != 'rename':
+            if self._destination_name == self._original_name:
+                self._destination_name = f"{self._original_name}-copy"
+        elif self._push_strategy != 'rename' and old_strategy == 'rename':
+            if self._destination_name == f"{self._original_name}-copy":
+                self._destination_name = self._original_name
+
+        # Snippet containers: auto-select "Rename Snippet" when the name changes
+        if self.is_snippet_container and self._destination_name != old_name:
+            if self._destination_folder not in ("rename_snippet", "new_snippet"):
+                logger.debug(f"Auto-selecting 'Rename Snippet' for container '{self.label_text}' because name changed")
+                self._destination_folder = "rename_snippet"
+
+        self._is_customized = (
+            self._destination_folder != "inherit"
+            or self._destination_name != self._original_name
+            or self._push_strategy != self._original_strategy
+        )
+
+        if old_folder != self._destination_folder and self._children:
+            if self._destination_folder != "inherit":
+                self._propagate_folder_to_children(self._destination_folder)
+
+        if self._children:
+            self._propagate_container_settings_to_children()
+
+        return self._is_customized and not self._is_checked
+
+    def _propagate_folder_to_children(
+        self,
+        folder: str,
+        is_new_snippet: bool = False,
+        is_existing_snippet: bool = False,
+        strategy: str = None
+    ):
+        """Propagate destination folder (and optionally strategy) to all descendants."""
+        for node in self.iter_subtree():
+            if node is self:
+                continue
+            node._destination_folder = folder
+            node._is_dest_new_snippet = is_new_snippet
+            node._dest_is_existing_snippet = is_existing_snippet
+            if strategy:
+                node._push_strategy = strategy.lower()
+
+    def _propagate_container_settings_to_children(self):
+        """Propagate the container's destination settings to all children."""
+        dest_folder = self._destination_folder
+        is_new_snippet = False
+        is_existing_snippet = self._dest_is_existing_snippet
+
+        if dest_folder == "new_snippet" and self._new_snippet_name:
+            dest_folder = self._new_snippet_name
+            is_new_snippet = True
+            is_existing_snippet = False
+
+        if dest_folder == "rename_snippet":
+            dest_folder = self._renamed_snippet_name()
+            logger.debug(f"Propagating rename: using '{dest_folder}'")
+            is_new_snippet = True
+            is_existing_snippet = False
+
+        strategy = self._push_strategy
+        if dest_folder and dest_folder != "inherit":
+            self._propagate_folder_to_children(dest_folder, is_new_snippet, is_existing_snippet, strategy)
+        elif strategy:
+            self._propagate_folder_to_children(self._destination_folder, is_new_snippet, is_existing_snippet, strategy)
+
+    def _renamed_snippet_name(self) -> str:
+        """Get the new name for a renamed snippet (edited name or original + '-copy')."""
+        current_name = self._destination_name
+        if current_name and current_name != self._original_name:
+            return current_name
+        return self._get_truncated_copy_name(self._original_name)
+
+    def set_destination(self, folder: str, is_existing_snippet: bool = False, is_new_snippet: bool = False):
+        """Set the destination for this item programmatically.
+
+        Used when adding items as dependencies - they should inherit the same
+        destination as the item that requires them.
+
+        Args:
+            folder: The destination folder/snippet name
+            is_existing_snippet: True if destination is an existing snippet
+            is_new_snippet: True if destination is a new snippet being created
+        """
+        logger.debug(f"set_destination for '{self.label_text}': folder='{folder}', "
+                     f"is_existing_snippet={is_existing_snippet}, is_new_snippet={is_new_snippet}")
+
+        if is_existing_snippet and folder:
+            self._destination_folder = folder
+        elif is_new_snippet:
+            self._destination_folder = "new_snippet"
+        elif folder and folder != "inherit":
+            self._destination_folder = folder
+        else:
+            self._destination_folder = "inherit"
+
+        self._dest_is_existing_snippet = is_existing_snippet
+        self._is_dest_new_snippet = is_new_snippet
+
+    def get_destination_settings(self) -> Dict[str, Any]:
+        """Get the destination settings for this item."""
+        effective_folder = self._get_effective_folder()
+        is_rename = self._destination_folder == "rename_snippet"
+        is_new = self._destination_folder == "new_snippet"
+        is_dest_new_snippet = self._is_dest_new_snippet
+        is_existing_snippet = self._dest_is_existing_snippet
+
+        settings = {
+            'folder': effective_folder,
+            'name': self._destination_name,
+            'strategy': self._push_strategy,
+            'is_inherited': self._destination_folder == "inherit",
+            'is_new_snippet': is_new or is_rename or is_dest_new_snippet,
+            'is_rename_snippet': is_rename,
+            'is_existing_snippet': is_existing_snippet and not is_new and not is_rename and not is_dest_new_snippet,
+        }
+
+        if is_new:
+            settings['new_snippet_name'] = self._new_snippet_name
+            settings['include_dependencies'] = self._include_dependencies
+            settings['create_duplicates'] = not self._include_dependencies
+        elif is_rename:
+            settings['new_snippet_name'] = self._renamed_snippet_name()
+            settings['include_dependencies'] = True
+            settings['create_duplicates'] = False
+        elif is_dest_new_snippet:
+            # Child of a container that's being renamed/created as new snippet
+            settings['new_snippet_name'] = effective_folder
+            settings['include_dependencies'] = True
+            settings['create_duplicates'] = False
+
+        return settings
+
+    def _get_truncated_copy_name(self, original_name: str, max_length: int = 55) -> str:
+        """
+        Get a copy name that fits within the max length.
+
+        Args:
+            original_name: The original name
+            max_length: Maximum allowed length (default 55 for Prisma Access)
+
+        Returns:
+            Name with '-copy' suffix, truncated if needed
+        """
+        suffix = "-copy"
+        if len(original_name) + len(suffix) <= max_length:
+            return original_name + suffix
+        return original_name[:max_length - len(suffix)] + suffix
+
+    def _get_effective_folder(self) -> str:
+        """Get the effective folder, resolving inheritance."""
+        node = self
+        while node is not None:
+            if node._destination_folder != "inherit":
+                return node._destination_folder
+            node = node._parent_row
+        return self._original_folder
+
+    def set_available_folders(self, folders: List[str]):
+        """Update the available destination folders."""
+        self.available_folders = folders
+
+    def set_available_snippets(self, snippets: List[str]):
+        """Update the available destination snippets."""
+        self.available_snippets = snippets
+
+    def update_default_strategy(self, strategy: str):
+        """Update the default push strategy.
+
+        Items that were using the old default follow the new one without
+        being marked as customized.
+        """
+        old_default = self.default_push_strategy
+        self.default_push_strategy = strategy
+        if self._push_strategy == old_default:
+            self._push_strategy = strategy
+            self._original_strategy = strategy
+
+    def format_config_preview(self) -> str:
+        """Format config data as key=value pairs, excluding metadata fields."""
+        if not self.data:
+            return "No configuration data"
+
+        lines = []
+        for key, value in self.data.items():
+            if key.startswith('_') or key in self.EXCLUDED_CONFIG_KEYS:
+                continue
+
+            if isinstance(value, dict):
+                if value:
+                    lines.append(f"{key}:")
+                    for k, v in value.items():
+                        if not k.startswith('_'):
+                            lines.append(f"  {k} = {v}")
+            elif isinstance(value, list):
+                if len(value) == 0:
+                    continue
+                elif len(value) <= 3:
+                    simple_items = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            simple_items.append(item.get('name', item.get('member', str(item))))
+                        else:
+                            simple_items.append(str(item))
+                    lines.append(f"{key} = {simple_items}")
+                else:
+                    lines.append(f"{key} = [{len(value)} items]")
+            else:
+                lines.append(f"{key} = {value}")
+
+        return "\n".join(lines) if lines else "No configuration data"
+
+
+class SelectionTreeModel(QAbstractItemModel):
+    """
+    Tree model over SelectionNode objects.
+
+    Children of a node are only inserted into the model when the view asks
+    for them (canFetchMore/fetchMore on expand), so a large configuration
+    only costs model rows for the branches the user actually opens.
+    """
+
+    NodeRole = Qt.ItemDataRole.UserRole + 1
+    TypeBadgeRole = Qt.ItemDataRole.UserRole + 2
+    StatusRole = Qt.ItemDataRole.UserRole + 3
+    CountRole = Qt.ItemDataRole.UserRole + 4
+
+    # Emitted when the user (or a caller) changes a node's check state
+    check_state_changed = pyqtSignal(object, bool)  # (node, is_checked)
+
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._root = SelectionNode("", "root")
+        self.dataChanged.connect(self._on_data_changed)
+
+    # === Population ===
+
+    def set_top_nodes(self, nodes: List[SelectionNode]):
+        """Replace the model contents with the given top-level nodes."""
+        self.beginResetModel()
+        self._root = SelectionNode("", "root")
+        for node in nodes:
+            self._root.add_child(node)
+            node._parent_row = None
+        self._root._fetched = len(nodes)
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all nodes."""
+        self.set_top_nodes([])
+
+    def top_nodes(self) -> List[SelectionNode]:
+        """Get the top-level nodes."""
+        return self._root._children
+
+    def _parent_of(self, node: SelectionNode) -> SelectionNode:
+        """Get the parent node, treating top-level nodes as children of the root."""
+        return node._parent_row or self._root
+
+    # === QAbstractItemModel interface ===
+
+    def node_from_index(self, index: QModelIndex) -> SelectionNode:
+        """Get the node for an index (root for invalid index)."""
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        parent_node = self.node_from_index(parent)
+        if column != 0 or row < 0 or row >= parent_node._fetched:
+            return QModelIndex()
+        return self.createIndex(row, 0, parent_node._children[row])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        parent_node = node._parent_row
+        if parent_node is None:
+            return QModelIndex()
+        return self.createIndex(parent_node._row, 0, parent_node)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return self.node_from_index(parent)._fetched
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return bool(self.node_from_index(parent)._children)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self.node_from_index(parent)
+        return node._fetched < len(node._children)
+
+    def fetchMore(self, parent: QModelIndex):
+        node = self.node_from_index(parent)
+        remaining = len(node._children) - node._fetched
+        if remaining <= 0:
+            return
+        self.beginInsertRows(parent, node._fetched, len(node._children) - 1)
+        node._fetched = len(node._children)
+        self.endInsertRows()
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        node = index.internalPointer()
+        flags = Qt.ItemFlag.ItemIsSelectable
+        if node.is_enabled():
+            flags |= Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.label_text
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return node.check_state()
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return node._tooltip or None
+        if role == self.NodeRole:
+            return node
+        if role == self.TypeBadgeRole:
+            return node.type_badge()
+        if role == self.StatusRole:
+            return node.status_text()
+        if role == self.CountRole:
+            return f"({len(node._children)})" if node._children else ""
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        # Clicking a partial checkbox fully selects
+        state = Qt.CheckState(value) if not isinstance(value, Qt.CheckState) else value
+        self.set_node_checked(index.internalPointer(), state != Qt.CheckState.Unchecked)
+        return True
+
+    # === Node helpers ===
+
+    def index_for_node(self, node: SelectionNode) -> QModelIndex:
+        """Get the model index for a node, fetching its ancestors' children if needed."""
+        if node is self._root or node is None:
+            return QModelIndex()
+        parent_node = self._parent_of(node)
+        parent_index = self.index_for_node(parent_node) if parent_node is not self._root else QModelIndex()
+        if node._row >= parent_node._fetched:
+            self.fetchMore(parent_index)
+        return self.createIndex(node._row, 0, node)
+
+    def set_node_checked(self, node: SelectionNode, checked: bool):
+        """
+        Set a node's check state with tri-state propagation.
+
+        Descendants take the same state and ancestors are recomputed as
+        checked/partial/unchecked from their children.
+        """
+        node.set_checked(checked)
+        self._emit_subtree_changed(node)
+
+        parent = node._parent_row
+        while parent is not None:
+            parent._update_check_state_from_children()
+            self._emit_node_changed(parent)
+            parent = parent._parent_row
+
+        self.check_state_changed.emit(node, checked)
+
+    def refresh_node(self, node: SelectionNode):
+        """Repaint a node, its fetched descendants and its ancestors (status tallies)."""
+        self._emit_subtree_changed(node)
+        parent = node._parent_row
+        while parent is not None:
+            self._emit_node_changed(parent)
+            parent = parent._parent_row
+
+    def refresh_all(self):
+        """Repaint all fetched rows."""
+        for node in self._root._children[:self._root._fetched]:
+            self._emit_subtree_changed(node)
+
+    def iter_nodes(self) -> Iterator[SelectionNode]:
+        """Iterate over all nodes (pre-order), fetched or not."""
+        for top in self._root._children:
+            yield from top.iter_subtree()
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=None):
+        """Invalidate cached status counts of changed rows and their ancestors."""
+        if not top_left.isValid():
+            return
+        parent_node = self._parent_of(top_left.internalPointer())
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            parent_node._children[row]._child_counts = None
+        parent_node.invalidate_child_counts()
+
+    def _emit_node_changed(self, node: SelectionNode):
+        """Emit dataChanged for a single node if it is exposed to the view."""
+        if node._row < self._parent_of(node)._fetched:
+            idx = self.createIndex(node._row, 0, node)
+            self.dataChanged.emit(idx, idx)
+
+    def _emit_subtree_changed(self, node: SelectionNode):
+        """Emit dataChanged for a node and, per parent, its fetched children range."""
+        self._emit_node_changed(node)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current._fetched:
+                first = self.createIndex(0, 0, current._children[0])
+                last = self.createIndex(current._fetched - 1, 0, current._children[current._fetched - 1])
+                self.dataChanged.emit(first, last)
+                stack.extend(current._children[:current._fetched])
+
+
+class SelectionItemDelegate(QStyledItemDelegate):
+    """
+    Paints selection rows as cards: checkbox and label (via the base
+    delegate), type badge, inherit/customized status and child count.
+    """
+
+    ROW_HEIGHT = 34
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        size = super().sizeHint(option, index)
+        return QSize(size.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card background
+        card = option.rect.adjusted(1, 2, -2, -2)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        if selected:
+            background, border = QColor("#e8f5e9"), QColor("#4CAF50")
+        elif hovered:
+            background, border = QColor("#e9ecef"), QColor("#adb5bd")
+        else:
+            background, border = QColor("#f8f9fa"), QColor("#dee2e6")
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(background)
+        painter.drawRoundedRect(card, 6, 6)
+
+        # Right side: count, then status and type badge
+        small_font = QFont(option.font)
+        small_font.setPointSizeF(max(option.font.pointSizeF() - 1.5, 7.0))
+        metrics = QFontMetrics(small_font)
+        painter.setFont(small_font)
+        right = card.right() - 8
+
+        count = index.data(SelectionTreeModel.CountRole)
+        if count:
+            width = metrics.horizontalAdvance(count)
+            painter.setPen(QColor("#6c757d"))
+            painter.drawText(QRect(right - width, card.top(), width, card.height()),
+                             Qt.AlignmentFlag.AlignVCenter, count)
+            right -= width + 10
+
+        status, customized = index.data(SelectionTreeModel.StatusRole) or ("", False)
+        right = self._draw_pill(
+            painter, metrics, status, right, card,
+            QColor("#FF9800") if customized else QColor("#4CAF50"),
+            QColor("#FFF3E0") if customized else QColor("#E8F5E9"),
+        )
+        right = self._draw_pill(
+            painter, metrics, index.data(SelectionTreeModel.TypeBadgeRole),
+            right, card, QColor("#6c757d"), QColor("#e9ecef"),
+        )
+        painter.restore()
+
+        # Checkbox and label, clipped before the badges
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.rect = QRect(card.left() + 4, option.rect.top(), max(right - card.left() - 4, 0), option.rect.height())
+        opt.state &= ~(QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_HasFocus)
+        opt.backgroundBrush = QColor(0, 0, 0, 0)
+        label_font = QFont(opt.font)
+        label_font.setWeight(QFont.Weight.Medium)
+        opt.font = label_font
+        widget = option.widget
+        style = widget.style() if widget else None
+        if style:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+        else:
+            super().paint(painter, opt, index)
+
+    def _draw_pill(self, painter: QPainter, metrics: QFontMetrics, text: str, right: int,
+                   card: QRect, fg: QColor, bg: QColor) -> int:
+        """Draw a rounded badge ending at ``right``; returns the new right edge."""
+        if not text:
+            return right
+        width = metrics.horizontalAdvance(text) + 16
+        height = metrics.height() + 4
+        rect = QRect(right - width, card.center().y() - height // 2, width, height)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, height / 2, height / 2)
+        painter.setPen(fg)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        return rect.left() - 8
+
+
+class SelectionDetailPanel(QFrame):
+    """
+    Shared detail panel for the current selection node.
+
+    Shows source metadata, destination settings (name, strategy, location,
+    new snippet options) and a config preview. Edits are written back to the
+    node; ``destination_changed`` tells the owner to repaint/auto-select.
+    """
+
+    destination_changed = pyqtSignal(object, bool)  # (node, auto_select)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """Initialize the detail panel."""
+        super().__init__(parent)
+        self.setObjectName("detailPanel")
+        self._node: Optional[SelectionNode] = None
+        self._init_ui()
+        self.setVisible(False)
+
+    def _init_ui(self):
+        """Initialize the user interface."""
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(20)
+
+        # === Left Column: Source metadata ===
+        left_frame = QFrame()
+        left_frame.setObjectName("metadataFrame")
+        left_layout = QVBoxLayout(left_frame)
+        left_layout.setContentsMargins(12, 12, 12, 12)
+        left_layout.setSpacing(4)
+        left_layout.addWidget(QLabel("<b>Source</b>"))
+        self.source_label = QLabel("")
+        self.source_label.setStyleSheet("font-size: 11px;")
+        self.source_label.setWordWrap(True)
+        left_layout.addWidget(self.source_label)
+        left_layout.addStretch()
+        layout.addWidget(left_frame, stretch=1)
+
+        # === Center Column: Destination settings ===
+        center_frame = QFrame()
+        center_frame.setObjectName("destinationFrame")
+        center_layout = QVBoxLayout(center_frame)
+        center_layout.setContentsMargins(12, 12, 12, 12)
+        center_layout.setSpacing(8)
+        center_layout.addWidget(QLabel("<b>Destination</b>"))
+
+        name_row = QHBoxLayout()
+        name_row.addWidget(QLabel("Name:"))
+        self.dest_name_edit = QLineEdit()
+        self.dest_name_edit.setMaxLength(55)  # Prisma Access name limit
+        self.dest_name_edit.textChanged.connect(self._on_changed)
+        name_row.addWidget(self.dest_name_edit, stretch=1)
+        center_layout.addLayout(name_row)
+
+        strategy_row = QHBoxLayout()
+        strategy_row.addWidget(QLabel("Strategy:"))
+        self.strategy_combo = NoScrollComboBox()
+        self.strategy_combo.addItems(["Skip", "Overwrite", "Rename"])
+        self.strategy_combo.currentTextChanged.connect(self._on_changed)
+        strategy_row.addWidget(self.strategy_combo, stretch=1)
+        center_layout.addLayout(strategy_row)
+
+        folder_row = QHBoxLayout()
+        folder_row.addWidget(QLabel("Location:"))
+        self.dest_folder_combo = NoScrollComboBox()
+        self.dest_folder_combo.currentIndexChanged.connect(self._on_changed)
+        folder_row.addWidget(self.dest_folder_combo, stretch=1)
+        center_layout.addLayout(folder_row)
+
+        # Dependency options (leaf items with "New Snippet" only)
+        self.dependency_widget = QWidget()
+        dependency_layout = QVBoxLayout(self.dependency_widget)
+        dependency_layout.setContentsMargins(0, 4, 0, 0)
+        dependency_layout.setSpacing(2)
+        self.dependency_button_group = QButtonGroup(self)
+        self.include_deps_radio = QRadioButton("Include Dependencies")
+        self.include_deps_radio.setChecked(True)
+        self.include_deps_radio.setToolTip("Pull required dependencies into the new snippet")
+        self.include_deps_radio.setStyleSheet("font-size: 11px;")
+        self.dependency_button_group.addButton(self.include_deps_radio, 0)
+        dependency_layout.addWidget(self.include_deps_radio)
+        self.create_dups_radio = QRadioButton("Create Duplicates")
+        self.create_dups_radio.setToolTip("Create duplicate objects instead of referencing existing ones")
+        self.create_dups_radio.setStyleSheet("font-size: 11px;")
+        self.dependency_button_group.addButton(self.create_dups_radio, 1)
+        dependency_layout.addWidget(self.create_dups_radio)
+        self.include_deps_radio.toggled.connect(self._on_changed)
+        center_layout.addWidget(self.dependency_widget)
+
+        self.new_snippet_widget = QWidget()
+        new_snippet_layout = QHBoxLayout(self.new_snippet_widget)
+        new_snippet_layout.setContentsMargins(0, 0, 0, 0)
+        new_snippet_layout.addWidget(QLabel("Snippet Name:"))
+        self.new_snippet_edit = QLineEdit()
+        self.new_snippet_edit.setPlaceholderText("Enter new snippet name...")
+        self.new_snippet_edit.setMaxLength(55)
+        self.new_snippet_edit.textChanged.connect(self._on_changed)
+        new_snippet_layout.addWidget(self.new_snippet_edit, stretch=1)
+        center_layout.addWidget(self.new_snippet_widget)
+
+        center_layout.addStretch()
+        layout.addWidget(center_frame, stretch=1)
+
+        # === Right Column: Config preview / container help ===
+        right_frame = QFrame()
+        right_frame.setObjectName("configFrame")
+        right_layout = QVBoxLayout(right_frame)
+        right_layout.setContentsMargins(12, 12, 12, 12)
+        right_layout.setSpacing(8)
+        self.right_title = QLabel("<b>Configuration</b>")
+        right_layout.addWidget(self.right_title)
+
+        self.config_preview = QTextEdit()
+        self.config_preview.setReadOnly(True)
+        self.config_preview.setFont(QFont("Courier New", 9))
+        self.config_preview.setMinimumHeight(120)
+        right_layout.addWidget(self.config_preview, stretch=1)
+
+        self.container_help = QLabel(
+            "💡 <b>Tip:</b> Changes to this container's destination "
+            "will apply to all items within it.<br><br>"
+            "• Select a new location to move all items<br>"
+            "• Create a new snippet to group items together<br>"
+            "• Child items can still override these settings"
+        )
+        self.container_help.setWordWrap(True)
+        self.container_help.setStyleSheet("color: #666; padding: 8px; background: #f5f5f5; border-radius: 4px;")
+        right_layout.addWidget(self.container_help)
+        layout.addWidget(right_frame, stretch=2)
+
+        self.setStyleSheet("""
+            #detailPanel {
+                background-color: #ffffff;
+                border: 1px solid #dee2e6;
+                border-radius: 6px;
+            }
+            #metadataFrame, #destinationFrame, #configFrame {
+                background-color: #f8f9fa;
+                border: 1px solid #e9ecef;
+                border-radius: 4px;
+            }
+            QComboBox, QLineEdit {
+                padding: 6px;
+                border: 1px solid #ced4da;
+                border-radius: 4px;
+                background-color: white;
+                color: #333333;
+            }
+            QTextEdit {
+                border: 1px solid #e9ecef;
+                border-radius: 4px;
+                background-color: #f8f9fa;
+            }
+        """)
+
+    def node(self) -> Optional[SelectionNode]:
+        """Get the node currently shown."""
+        return self._node
+
+    def set_node(self, node: Optional[SelectionNode]):
+        """Show the settings of a node (hides the panel for nodes without details)."""
+        self._node = node
+        if node is None or not node.has_detail_panel:
+            self.setVisible(False)
+            return
+        self.refresh()
+        self.setVisible(True)
+
+    def refresh(self):
+        """Reload all fields from the current node."""
+        node = self._node
+        if node is None:
+            return
+
+        widgets = (self.dest_name_edit, self.strategy_combo, self.dest_folder_combo,
+                   self.new_snippet_edit, self.include_deps_radio)
+        for widget in widgets:
+            widget.blockSignals(True)
+
+        self.source_label.setText(self._format_source(node))
+
+        if self.dest_name_edit.text() != node._destination_name:
+            self.dest_name_edit.setText(node._destination_name)
+        can_rename = node.is_leaf_item or node.is_snippet_container
+        self.dest_name_edit.setEnabled(can_rename)
+        self.dest_name_edit.setToolTip("" if can_rename else "Container names cannot be changed")
+
+        self.strategy_combo.setCurrentText(node._push_strategy.capitalize())
+
+        self.dest_folder_combo.clear()
+        current = 0
+        for option in node.location_options():
+            if option is None:
+                self.dest_folder_combo.insertSeparator(self.dest_folder_combo.count())
+                continue
+            text, value = option
+            if value == node._destination_folder:
+                current = self.dest_folder_combo.count()
+            self.dest_folder_combo.addItem(text, value)
+        self.dest_folder_combo.setCurrentIndex(current)
+
+        if self.new_snippet_edit.text() != node._new_snippet_name:
+            self.new_snippet_edit.setText(node._new_snippet_name)
+        self.include_deps_radio.setChecked(node._include_dependencies)
+        self.create_dups_radio.setChecked(not node._include_dependencies)
+
+        for widget in widgets:
+            widget.blockSignals(False)
+
+        self._update_visibility()
+
+        self.config_preview.setVisible(node.is_leaf_item)
+        self.container_help.setVisible(not node.is_leaf_item)
+        self.right_title.setText("<b>Configuration</b>" if node.is_leaf_item else "<b>Container Settings</b>")
+        if node.is_leaf_item:
+            self.config_preview.setPlainText(node.format_config_preview())
+
+    def _update_visibility(self):
+        """Show new snippet/dependency options for the selected location."""
+        node = self._node
+        is_new_snippet = self.dest_folder_combo.currentData() == "new_snippet"
+        self.new_snippet_widget.setVisible(is_new_snippet and not node.is_snippet_container)
+        self.dependency_widget.setVisible(is_new_snippet and node.is_leaf_item)
+
+    def _format_source(self, node: SelectionNode) -> str:
+        """Format the source metadata column."""
+        lines = []
+        tenant_name = node.config_metadata.get('source_tenant', '')
+        if tenant_name:
+            lines.append(f"🏢 <b>Tenant:</b> {tenant_name}")
+
+        source_folder = node.data.get('folder', '')
+        source_snippet = node.data.get('snippet', '')
+        if source_folder:
+            lines.append(f"📁 <b>Location:</b> {source_folder}")
+        elif source_snippet:
+            lines.append(f"📄 <b>Location:</b> {source_snippet}")
+        elif node.item_type in INFRA_FOLDERS:
+            lines.append(f"🏗️ <b>Location:</b> {INFRA_FOLDERS[node.item_type]}")
+
+        version = node.config_metadata.get('program_version', '')
+        if version:
+            lines.append(f"📦 <b>Version:</b> {version}")
+
+        metadata = node.data.get('metadata', {}) if isinstance(node.data.get('metadata'), dict) else {}
+        display_date = (metadata.get('updated', '') or metadata.get('created', '')
+                        or node.config_metadata.get('modified_at', '')
+                        or node.config_metadata.get('created_at', ''))
+        if display_date:
+            try:
+                from datetime import datetime
+                if 'T' in display_date:
+                    dt = datetime.fromisoformat(display_date.replace('Z', '+00:00'))
+                    display_date = dt.strftime('%Y-%m-%d %H:%M')
+            except ValueError:
+                pass
+            lines.append(f"📅 <b>Pulled:</b> {display_date}")
+
+        return "<br>".join(lines)
+
+    def _on_changed(self, *args):
+        """Write the edited destination settings back to the node."""
+        node = self._node
+        if node is None:
+            return
+
+        auto_select = node.update_destination(
+            location=self.dest_folder_combo.currentData() or "inherit",
+            name=self.dest_name_edit.text(),
+            strategy=self.strategy_combo.currentText(),
+            new_snippet_name=self.new_snippet_edit.text(),
+            include_dependencies=self.include_deps_radio.isChecked(),
+        )
+
+        # The node may have adjusted the name (-copy) or location (rename snippet)
+        self.refresh()
+        self.destination_changed.emit(node, auto_select)
@@ -97,9 +97,12 @@ class TerraformWorker(QThread):
 
             self.progress.emit("Generating bootstrap configuration...", 60)
 
-            files_created = result.get('files', [])
-            self.log_message.emit(f"Generated {len(files_created)} Terraform files")
-            for f in files_created:
+            files_created = result.get('files_created', [])
+            files_changed = result.get('files_changed', [])
+            self.log_message.emit(
+                f"Generated {len(files_created)} Terraform files ({len(files_changed)} changed)"
+            )
+            for f in files_changed:
                 self.log_message.emit(f"  - {f}")
 
             self.progress.emit("Terraform configuration ready", 100)
@@ -134,6 +137,10 @@ class TerraformWorker(QThread):
         result = executor.init()
 
         if result.success:
+            if result.cached:
+                self.log_message.emit("Providers and lock file unchanged, skipped terraform init")
+            else:
+                self.log_message.emit(f"Terraform init completed in {result.duration_s}s")
             self.progress.emit("Terraform initialized", 100)
             self.finished.emit(True, "Terraform initialized successfully", {})
         else:
@@ -400,8 +407,19 @@ class TerraformWorker(QThread):
                 # Log other significant lines (not indented detail)
                 self.log_message.emit(clean_line)
 
+        # Apply the plan saved by _plan_only() if nothing changed since
+        saved_plan = executor.saved_plan(var_file)
+        if saved_plan and not saved_plan['has_changes']:
+            self.log_message.emit("No infrastructure changes in plan, skipping apply")
+            output_result = executor.output()
+            outputs = output_result.outputs if output_result.success else {}
+            self.progress.emit("Deployment complete", 100)
+            self.finished.emit(True, "Infrastructure already up to date", outputs)
+            return
+
         self.progress.emit("Deploying infrastructure...", 30)
         result = executor.apply(
+            plan_file=saved_plan['path'] if saved_plan else None,
             var_file=var_file,
             auto_approve=self.auto_approve,
             progress_callback=progress_callback
@@ -575,9 +593,13 @@ class TerraformWorker(QThread):
                 output_dir=self.output_dir,
             )
             result = generator.generate()
-            files = result.get('files_created', result.get('files', []))
-            self.log_message.emit(f"Generated {len(files)} Terraform files:")
-            for f in files:
+            files = result.get('files_created', [])
+            changed = result.get('files_changed', [])
+            if not changed:
+                self.log_message.emit(f"All {len(files)} Terraform files unchanged")
+                return True
+            self.log_message.emit(f"Generated {len(files)} Terraform files ({len(changed)} changed):")
+            for f in changed:
                 self.log_message.emit(f"  - {f}")
             return True
         except Exception as e:
@@ -636,7 +658,10 @@ class TerraformWorker(QThread):
             self.finished.emit(False, clean_error, {})
             return False
 
-        self.log_message.emit("Terraform initialized successfully")
+        if result.cached:
+            self.log_message.emit("Providers and lock file unchanged, skipped terraform init")
+        else:
+            self.log_message.emit(f"Terraform initialized successfully in {result.duration_s}s")
         return True
 
     def _plan_only(self) -> bool:
@@ -667,7 +692,7 @@ class TerraformWorker(QThread):
                 if "Plan:" in clean_line:
                     self.progress.emit(clean_line, 55)
 
-        result = executor.plan(var_file=var_file, progress_callback=plan_callback)
+        result = executor.plan(var_file=var_file, progress_callback=plan_callback, reuse=True)
 
         if not result.success:
             # Clean ANSI codes from error
@@ -694,7 +719,11 @@ class TerraformWorker(QThread):
 
         # Log plan summary
         changes = result.changes
-        if changes:
+        if result.cached:
+            self.log_message.emit("[plan] Configuration, variables and state unchanged - reusing saved plan")
+        if not result.has_changes:
+            self.log_message.emit("No changes. Infrastructure matches the configuration.")
+        elif changes:
             summary = f"Plan: {changes.get('add', 0)} to add, {changes.get('change', 0)} to change, {changes.get('destroy', 0)} to destroy"
             self.log_message.emit(summary)
 
@@ -43,6 +43,9 @@ class PullWorker(QThread):
 
     def run(self):
         """Run the pull operation."""
+        from config.logging_config import bind_log_context, new_workflow_id
+        bind_log_context(workflow_id=new_workflow_id('pull'))
+
         import logging
         logger = logging.getLogger(__name__)
         
@@ -584,6 +587,9 @@ class PushWorker(QThread):
 
     def run(self):
         """Run the push operation."""
+        from config.logging_config import bind_log_context, new_workflow_id
+        bind_log_context(workflow_id=new_workflow_id('push'))
+
         try:
             from prisma.push.push_orchestrator import PushOrchestrator
             from prisma.push.conflict_resolver import ConflictResolution
@@ -662,6 +668,7 @@ class SelectivePushWorker(QThread):
         selected_items: Dict[str, Any],
         destination_config: Optional[Dict[str, Any]],
         conflict_resolution: str = "SKIP",
+        incremental: bool = False,
     ):
         """
         Initialize the selective push worker.
@@ -671,16 +678,21 @@ class SelectivePushWorker(QThread):
             selected_items: Dictionary of selected items to push
             destination_config: Optional destination config for conflict detection
             conflict_resolution: How to handle conflicts (SKIP, OVERWRITE, RENAME)
+            incremental: Only push items that differ from the destination
         """
         super().__init__()
         self.api_client = api_client
         self.selected_items = selected_items
         self.destination_config = destination_config
         self.conflict_resolution = conflict_resolution
+        self.incremental = incremental
         self.results = None
 
     def run(self):
         """Run the selective push operation."""
+        from config.logging_config import bind_log_context, new_workflow_id
+        bind_log_context(workflow_id=new_workflow_id('push'))
+
         try:
             # Use the new V2 orchestrator
             from prisma.push.push_orchestrator_v2 import PushOrchestratorV2
@@ -701,7 +713,8 @@ class SelectivePushWorker(QThread):
             # Push selected items
             result = orchestrator.push_selected_items(
                 self.selected_items,
-                self.destination_config
+                self.destination_config,
+                incremental=self.incremental
             )
 
             self.results = result
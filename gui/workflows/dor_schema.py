@@ -12,6 +12,9 @@ This module provides:
 from typing import Dict, Any, List, Optional, Set
 import logging
 
+# Default snippet names shared with pull filtering
+from config.defaults.default_classifier import DEFAULT_SNIPPETS
+
 logger = logging.getLogger(__name__)
 
 # Feature detection map: maps DoR feature keys to profile types and known defaults
@@ -65,12 +68,6 @@ DOR_FEATURE_MAP = {
     },
 }
 
-# Default snippet names from PullOrchestrator
-DEFAULT_SNIPPETS = {
-    'default', 'hip-default', 'optional-default',
-    'Web Security Global', 'PA_predefined_embargo_rule',
-    'best-practice', 'decrypt-bypass', 'Block-brute-force',
-}
 
 
 def detect_feature(config, feature_key: str) -> Dict[str, Any]:
@@ -13,6 +13,7 @@ from .api_client import (
     PanoramaInfo,
     CommitResult,
     LicenseStatus,
+    ProvisioningResult,
     wait_for_panorama,
 )
 from .push import (
@@ -31,6 +32,7 @@ __all__ = [
     'PanoramaInfo',
     'CommitResult',
     'LicenseStatus',
+    'ProvisioningResult',
     'wait_for_panorama',
     # Push Orchestrator
     'PanoramaPushOrchestrator',
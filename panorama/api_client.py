@@ -4,25 +4,26 @@ Panorama API Client for Panorama management servers.
 Wraps the pan-os-python library to provide a clean interface for:
 - Connection and authentication
 - Device management
-- Template and device group operations
+- Template and device group operations (including bulk provisioning)
 - Plugin management
 - Commit operations
 """
 
 import logging
-import time
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 
-try:
-    from panos.panorama import Panorama, DeviceGroup, Template, TemplateStack
-    from panos.firewall import Firewall
-    from panos.errors import PanDeviceError, PanConnectionTimeout, PanURLError
-    from panos.device import SystemSettings
-    PANOS_AVAILABLE = True
-except ImportError:
-    PANOS_AVAILABLE = False
+from config.lazy_import import lazy_import, module_available
+
+if TYPE_CHECKING:
+    from panos.panorama import Panorama
+
+# pan-os-python is imported on first use, not when this module is imported
+PANOS_AVAILABLE = module_available("panos")
+panos_panorama = lazy_import("panos.panorama")
+panos_errors = lazy_import("panos.errors")
+panos_device = lazy_import("panos.device")
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +88,34 @@ class CommitResult:
         }
 
 
+@dataclass
+class ProvisioningResult:
+    """Result of bulk template/template stack/device group provisioning."""
+    templates_created: List[str] = field(default_factory=list)
+    template_stacks_created: List[str] = field(default_factory=list)
+    device_groups_created: List[str] = field(default_factory=list)
+    already_present: List[str] = field(default_factory=list)
+    failures: Dict[Tuple[str, str], str] = field(default_factory=dict)  # (kind, name) -> error
+    round_trips: int = 0
+
+    @property
+    def success(self) -> bool:
+        return not self.failures
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'templates_created': self.templates_created,
+            'template_stacks_created': self.template_stacks_created,
+            'device_groups_created': self.device_groups_created,
+            'already_present': self.already_present,
+            'failures': [
+                {'kind': kind, 'name': name, 'error': error}
+                for (kind, name), error in self.failures.items()
+            ],
+            'round_trips': self.round_trips,
+        }
+
+
 class PanoramaAPIClient:
     """
     PAN-OS Panorama API client.
@@ -127,7 +156,7 @@ class PanoramaAPIClient:
         self.port = port
         self.timeout = timeout
 
-        self._panorama: Optional[Panorama] = None
+        self._panorama: Optional["Panorama"] = None
         self._connected = False
 
     @property
@@ -151,7 +180,7 @@ class PanoramaAPIClient:
         logger.info(f"Connecting to Panorama at {self.hostname}")
 
         try:
-            self._panorama = Panorama(
+            self._panorama = panos_panorama.Panorama(
                 hostname=self.hostname,
                 api_username=self.username,
                 api_password=self.password,
@@ -167,13 +196,13 @@ class PanoramaAPIClient:
             logger.info(f"Connected to {self._panorama.hostname} ({self._panorama.serial})")
             return True
 
-        except PanConnectionTimeout as e:
+        except panos_errors.PanConnectionTimeout as e:
             self._connected = False
             raise PanoramaConnectionError(f"Connection timeout: {e}")
-        except PanURLError as e:
+        except panos_errors.PanURLError as e:
             self._connected = False
             raise PanoramaConnectionError(f"Connection error: {e}")
-        except PanDeviceError as e:
+        except panos_errors.PanDeviceError as e:
             self._connected = False
             raise PanoramaConnectionError(f"Device error: {e}")
         except Exception as e:
@@ -219,26 +248,26 @@ class PanoramaAPIClient:
 
         Args:
             timeout: Maximum wait time in seconds
-            interval: Check interval in seconds
+            interval: Maximum delay between checks in seconds (backoff cap)
 
         Returns:
             True if Panorama is ready
         """
-        logger.info(f"Waiting for Panorama to be ready (timeout: {timeout}s)")
-        start_time = time.time()
+        from deployment.readiness import wait_until_ready
 
-        while time.time() - start_time < timeout:
-            try:
-                if not self.is_connected:
-                    self.connect()
+        logger.info(f"Waiting for Panorama to be ready (timeout: {timeout}s)")
 
-                self._panorama.refresh_system_info()
-                logger.info("Panorama is ready")
-                return True
+        def check() -> bool:
+            if not self.is_connected:
+                self.connect()
+            self._panorama.refresh_system_info()
+            return True
 
-            except Exception as e:
-                logger.debug(f"Panorama not ready yet: {e}")
-                time.sleep(interval)
+        if wait_until_ready(
+            self.hostname, check, timeout, max_interval=interval, port=self.port, label="Panorama"
+        ):
+            logger.info("Panorama is ready")
+            return True
 
         logger.warning(f"Panorama not ready after {timeout}s")
         return False
@@ -351,7 +380,8 @@ class PanoramaAPIClient:
 
         Args:
             name: Device group name
-            description: Optional description
+            description: Optional description (not applied: pan-os-python's
+                DeviceGroup has no description parameter)
 
         Returns:
             True if created successfully
@@ -359,7 +389,7 @@ class PanoramaAPIClient:
         self._ensure_connected()
 
         try:
-            dg = DeviceGroup(name=name, description=description)
+            dg = panos_panorama.DeviceGroup(name=name)
             self._panorama.add(dg)
             dg.apply()
             logger.info(f"Created device group: {name}")
@@ -378,7 +408,7 @@ class PanoramaAPIClient:
         self._ensure_connected()
 
         try:
-            dgs = DeviceGroup.refreshall(self._panorama)
+            dgs = panos_panorama.DeviceGroup.refreshall(self._panorama)
             return [dg.name for dg in dgs]
         except Exception as e:
             logger.error(f"Failed to get device groups: {e}")
@@ -400,7 +430,7 @@ class PanoramaAPIClient:
         self._ensure_connected()
 
         try:
-            template = Template(name=name, description=description)
+            template = panos_panorama.Template(name=name, description=description)
             self._panorama.add(template)
             template.apply()
             logger.info(f"Created template: {name}")
@@ -429,7 +459,7 @@ class PanoramaAPIClient:
         self._ensure_connected()
 
         try:
-            stack = TemplateStack(name=name, templates=templates, description=description)
+            stack = panos_panorama.TemplateStack(name=name, templates=templates, description=description)
             self._panorama.add(stack)
             stack.apply()
             logger.info(f"Created template stack: {name}")
@@ -448,12 +478,121 @@ class PanoramaAPIClient:
         self._ensure_connected()
 
         try:
-            templates = Template.refreshall(self._panorama)
+            templates = panos_panorama.Template.refreshall(self._panorama)
             return [t.name for t in templates]
         except Exception as e:
             logger.error(f"Failed to get templates: {e}")
             return []
 
+    def get_template_stacks(self) -> List[str]:
+        """
+        Get list of template stacks.
+
+        Returns:
+            List of template stack names
+        """
+        self._ensure_connected()
+
+        try:
+            stacks = panos_panorama.TemplateStack.refreshall(self._panorama)
+            return [s.name for s in stacks]
+        except Exception as e:
+            logger.error(f"Failed to get template stacks: {e}")
+            return []
+
+    # ========== Bulk Provisioning ==========
+
+    def provision(
+        self,
+        templates: Optional[List[str]] = None,
+        template_stacks: Optional[Dict[str, List[str]]] = None,
+        device_groups: Optional[List[str]] = None,
+        descriptions: Optional[Dict[str, str]] = None,
+    ) -> ProvisioningResult:
+        """
+        Create templates, template stacks and device groups in bulk.
+
+        Existing objects are fetched once per kind and skipped. Missing ones
+        are sent in a single multi-config request (templates before stacks,
+        so stacks can reference them). If that is rejected, it is split in
+        halves down to single edits to pinpoint failures
+        (see deployment.config_batch).
+
+        Args:
+            templates: Template names
+            template_stacks: Template stack name -> ordered template names
+            device_groups: Device group names
+            descriptions: Optional name -> description (templates and stacks)
+
+        Returns:
+            ProvisioningResult with created/skipped names and failures keyed by (kind, name)
+        """
+        from deployment.config_batch import send_config_batch
+
+        self._ensure_connected()
+        descriptions = descriptions or {}
+        result = ProvisioningResult()
+
+        # (kind, name, object) to create, in dependency order
+        wanted: List[Tuple[str, str, Any]] = []
+
+        if templates:
+            existing = set(self.get_templates())
+            result.round_trips += 1
+            for name in templates:
+                if name in existing:
+                    result.already_present.append(name)
+                else:
+                    wanted.append(('template', name, panos_panorama.Template(
+                        name=name, description=descriptions.get(name, ""))))
+
+        if template_stacks:
+            existing = set(self.get_template_stacks())
+            result.round_trips += 1
+            for name, members in template_stacks.items():
+                if name in existing:
+                    result.already_present.append(name)
+                else:
+                    wanted.append(('template_stack', name, panos_panorama.TemplateStack(
+                        name=name, templates=members, description=descriptions.get(name, ""))))
+
+        if device_groups:
+            existing = set(self.get_device_groups())
+            result.round_trips += 1
+            for name in device_groups:
+                if name in existing:
+                    result.already_present.append(name)
+                else:
+                    # DeviceGroup has no description parameter in pan-os-python
+                    wanted.append(('device_group', name, panos_panorama.DeviceGroup(name=name)))
+
+        if result.already_present:
+            logger.info(f"Already present, skipping: {result.already_present}")
+        if not wanted:
+            logger.info("Nothing to provision")
+            return result
+
+        # id(object) -> (kind, name)
+        entries: Dict[int, Tuple[str, str]] = {}
+        for kind, name, obj in wanted:
+            self._panorama.add(obj)
+            entries[id(obj)] = (kind, name)
+
+        logger.info(f"Provisioning {len(wanted)} objects")
+        outcome = send_config_batch(self._panorama.xapi, [obj for _, _, obj in wanted])
+        result.round_trips += outcome.round_trips
+        for obj in outcome.applied:
+            kind, name = entries[id(obj)]
+            getattr(result, f"{kind}s_created").append(name)
+        for obj, error in outcome.failed:
+            kind, name = entries[id(obj)]
+            logger.error(f"Failed to create {kind} {name}: {error}")
+            result.failures[(kind, name)] = str(error)
+
+        logger.info(f"Provisioned {len(wanted) - len(result.failures)}/{len(wanted)} objects "
+                    f"in {result.round_trips} requests")
+        return result
+
     # ========== Managed Device Operations ==========
 
     def get_managed_devices(self) -> List[Dict[str, Any]]:
@@ -490,7 +629,7 @@ class PanoramaAPIClient:
         """
         self._ensure_connected()
 
-        settings = SystemSettings()
+        settings = panos_device.SystemSettings()
         settings.hostname = hostname
         self._panorama.add(settings)
         settings.apply()
@@ -507,7 +646,7 @@ class PanoramaAPIClient:
         """
         self._ensure_connected()
 
-        settings = SystemSettings()
+        settings = panos_device.SystemSettings()
         settings.dns_primary = primary
         if secondary:
             settings.dns_secondary = secondary
@@ -526,7 +665,7 @@ class PanoramaAPIClient:
         """
         self._ensure_connected()
 
-        settings = SystemSettings()
+        settings = panos_device.SystemSettings()
         settings.ntp_primary = primary
         if secondary:
             settings.ntp_secondary = secondary
@@ -542,14 +681,19 @@ class PanoramaAPIClient:
         description: str = "",
         sync: bool = True,
         timeout: int = 300,
+        progress_callback: Callable[[int, str], None] = None,
     ) -> CommitResult:
         """
         Commit configuration changes to Panorama.
 
+        The commit is always started as a job; with sync=True the job is
+        followed by the shared commit tracker instead of a blocking call.
+
         Args:
             description: Commit description
             sync: Wait for commit to complete
             timeout: Commit timeout in seconds
+            progress_callback: Optional callback for progress updates (percent, message)
 
         Returns:
             CommitResult with commit status
@@ -559,79 +703,158 @@ class PanoramaAPIClient:
         logger.info(f"Starting Panorama commit{' (sync)' if sync else ''}")
 
         try:
-            if sync:
-                original_timeout = getattr(self._panorama, 'timeout', None)
-                if timeout:
-                    self._panorama.timeout = timeout
-                try:
-                    result = self._panorama.commit(
-                        sync=True,
-                    )
-                finally:
-                    if original_timeout is not None:
-                        self._panorama.timeout = original_timeout
-                return CommitResult(
-                    success=True,
-                    message="Commit successful",
-                )
-            else:
-                result = self._panorama.commit(
-                    sync=False,
-                )
-                return CommitResult(
-                    success=True,
-                    job_id=str(result) if result else None,
-                    message="Commit started",
-                )
-
-        except PanDeviceError as e:
+            job_id = self._panorama.commit(
+                sync=False,
+            )
+        except panos_errors.PanDeviceError as e:
             logger.error(f"Commit failed: {e}")
             return CommitResult(
                 success=False,
                 message=str(e),
             )
 
+        if not job_id:
+            # pan-os-python returns None when there is nothing to commit
+            return CommitResult(
+                success=True,
+                message="No changes to commit",
+            )
+
+        if not sync:
+            return CommitResult(
+                success=True,
+                job_id=str(job_id),
+                message="Commit started",
+            )
+
+        return self.wait_for_commit(str(job_id), timeout=timeout, progress_callback=progress_callback)
+
     def commit_all(
         self,
         device_groups: List[str] = None,
         templates: List[str] = None,
         sync: bool = True,
         timeout: int = 600,
+        progress_callback: Callable[[int, str], None] = None,
     ) -> CommitResult:
         """
         Push configuration to managed devices.
 
+        One commit-all job is started per device group; all jobs are
+        followed concurrently by the shared commit tracker.
+
         Args:
             device_groups: Device groups to push (or all)
             templates: Templates to push (or all)
             sync: Wait for commit to complete
             timeout: Commit timeout in seconds
+            progress_callback: Optional callback for progress updates (percent, message)
 
         Returns:
-            CommitResult with commit status
+            CommitResult with commit status (details['jobs'] per job)
         """
         self._ensure_connected()
 
         logger.info("Starting commit-all to managed devices")
 
+        job_ids: Dict[str, str] = {}
         try:
-            # This would use commit_all or push_to_devices in pan-os-python
-            # Simplified implementation
-            result = self._panorama.commit_all(
-                sync=sync,
-                timeout=timeout,
-            )
-            return CommitResult(
-                success=True,
-                message="Commit-all successful",
-            )
+            for dg in device_groups or [None]:
+                job_id = self._panorama.commit_all(
+                    sync=False,
+                    devicegroup=dg,
+                    include_template=bool(templates),
+                )
+                if job_id:
+                    job_ids[dg or 'all'] = str(job_id)
         except Exception as e:
             logger.error(f"Commit-all failed: {e}")
             return CommitResult(
                 success=False,
+                job_id=','.join(job_ids.values()) or None,
                 message=str(e),
             )
 
+        if not job_ids:
+            return CommitResult(success=True, message="Nothing to push")
+
+        if not sync:
+            return CommitResult(
+                success=True,
+                job_id=','.join(job_ids.values()),
+                message="Commit-all started",
+                details={'jobs': job_ids},
+            )
+
+        from deployment.commit_tracker import get_commit_tracker
+
+        tracker = get_commit_tracker()
+        tracked = [
+            tracker.track(
+                f"{self.hostname}:{target}", job_id, self.get_job_status,
+                timeout=timeout,
+                progress_callback=(
+                    (lambda pct, msg, t=target: progress_callback(pct, f"[{t}] {msg}"))
+                    if progress_callback else None
+                ),
+            )
+            for target, job_id in job_ids.items()
+        ]
+        statuses = [job.wait() for job in tracked]
+
+        failed = [s for s in statuses if not s.success]
+        return CommitResult(
+            success=not failed,
+            job_id=','.join(job_ids.values()),
+            message="Commit-all successful" if not failed else "; ".join(s.message for s in failed),
+            details={'jobs': {t: s.to_dict() for t, s in zip(job_ids, statuses)}},
+        )
+
+    def get_job_status(self, job_id: str):
+        """
+        Get the parsed status of a job (``show jobs id``).
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            deployment.commit_tracker.JobStatus
+        """
+        from deployment.commit_tracker import parse_job_status
+
+        self._ensure_connected()
+        return parse_job_status(self._panorama.op(f"show jobs id {job_id}"), job_id)
+
+    def wait_for_commit(
+        self,
+        job_id: str,
+        timeout: int = 300,
+        progress_callback: Callable[[int, str], None] = None,
+    ) -> CommitResult:
+        """
+        Wait for a commit job using the shared commit tracker.
+
+        Args:
+            job_id: Commit job ID
+            timeout: Commit timeout in seconds
+            progress_callback: Optional callback (percent, message)
+
+        Returns:
+            CommitResult with final status
+        """
+        from deployment.commit_tracker import get_commit_tracker
+
+        job = get_commit_tracker().track(
+            self.hostname, job_id, self.get_job_status,
+            timeout=timeout, progress_callback=progress_callback,
+        ).wait()
+        return CommitResult(
+            success=job.success,
+            job_id=job.job_id,
+            message=job.message,
+            details=job.to_dict(),
+        )
+
     # ========== Operational Commands ==========
 
     def op_command(self, cmd: str) -> str:
@@ -668,32 +891,41 @@ def wait_for_panorama(
     password: str = None,
     timeout: int = 600,
     interval: int = 30,
+    port: int = 443,
 ) -> Optional[PanoramaAPIClient]:
     """
     Wait for Panorama to become accessible.
 
+    Reachability is probed by the shared readiness poller (TCP/HTTPS with
+    exponential backoff); the API login is only attempted once the
+    management web server answers.
+
     Args:
         hostname: Panorama management IP
         username: Admin username
         password: Admin password
         timeout: Maximum wait time in seconds
-        interval: Check interval in seconds
+        interval: Maximum delay between checks in seconds (backoff cap)
+        port: HTTPS management port
 
     Returns:
         PanoramaAPIClient if successful, None if timeout
     """
+    from deployment.readiness import wait_until_ready
+
     logger.info(f"Waiting for Panorama {hostname} to be accessible (timeout: {timeout}s)")
-    start_time = time.time()
 
-    while time.time() - start_time < timeout:
-        try:
-            client = PanoramaAPIClient(hostname, username, password)
-            client.connect()
-            logger.info(f"Panorama {hostname} is accessible")
-            return client
-        except PanoramaConnectionError as e:
-            logger.debug(f"Panorama not accessible yet: {e}")
-            time.sleep(interval)
-
-    logger.warning(f"Panorama {hostname} not accessible after {timeout}s")
-    return None
+    def connect() -> PanoramaAPIClient:
+        client = PanoramaAPIClient(hostname, username, password, port=port)
+        client.connect()
+        return client
+
+    return wait_until_ready(
+        hostname,
+        check=connect,
+        timeout=timeout,
+        retry_on=(PanoramaConnectionError,),
+        max_interval=interval,
+        port=port,
+        label="Panorama",
+    )
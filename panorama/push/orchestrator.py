@@ -176,15 +176,11 @@ class PanoramaPushOrchestrator:
             if not self._configure_device():
                 return self._fail("Failed to configure device settings")
 
-            # Phase 6: Create templates
-            self._update_phase(PushPhase.CREATING_TEMPLATES, "Creating templates")
-            if not self._create_templates():
-                return self._fail("Failed to create templates")
-
-            # Phase 7: Create device groups
-            self._update_phase(PushPhase.CREATING_DEVICE_GROUPS, "Creating device groups")
-            if not self._create_device_groups():
-                return self._fail("Failed to create device groups")
+            # Phase 6-7: Create templates, template stack and device groups (one batch)
+            self._update_phase(PushPhase.CREATING_TEMPLATES, "Creating templates and device groups")
+            if not self._provision():
+                return self._fail("Failed to create templates/device groups")
+            self._update_phase(PushPhase.CREATING_DEVICE_GROUPS, "Templates and device groups created")
 
             # Phase 8: Commit
             self._update_phase(PushPhase.COMMITTING, "Committing configuration")
@@ -312,56 +308,48 @@ class PanoramaPushOrchestrator:
             logger.error(f"Failed to configure device: {e}")
             return False
 
-    def _create_templates(self) -> bool:
-        """Create templates and template stacks."""
+    @staticmethod
+    def _names(entries: List[Any]) -> List[str]:
+        """Get names from a list of names or {'name': ...} dicts."""
+        names = []
+        for entry in entries or []:
+            name = entry.get('name') if isinstance(entry, dict) else entry
+            if name:
+                names.append(name)
+        return names
+
+    def _provision(self) -> bool:
+        """Create templates, the template stack and device groups in bulk."""
         try:
-            templates = getattr(self.panorama_config, 'templates', [])
-
-            # Create base templates
-            for template_name in templates:
-                if self._client.create_template(
-                    name=template_name,
-                    description=f"Template created by pa_config_lab"
-                ):
-                    self._result.templates_created.append(template_name)
-                    logger.info(f"Created template: {template_name}")
-
-            # Create template stack if templates exist
+            templates = self._names(getattr(self.panorama_config, 'templates', []))
+            device_groups = self._names(getattr(self.panorama_config, 'device_groups', []))
+
+            template_stacks = {}
+            descriptions = {name: "Template created by pa_config_lab" for name in templates}
+            descriptions.update({name: "Device group created by pa_config_lab" for name in device_groups})
             if templates:
                 stack_name = f"{self.panorama_config.name}-stack"
-                if self._client.create_template_stack(
-                    name=stack_name,
-                    templates=templates,
-                    description=f"Template stack for {self.panorama_config.name}"
-                ):
-                    self._result.templates_created.append(stack_name)
-                    logger.info(f"Created template stack: {stack_name}")
-
-            return True
-
-        except Exception as e:
-            self._result.errors.append(f"Template creation error: {e}")
-            logger.error(f"Failed to create templates: {e}")
-            return False
-
-    def _create_device_groups(self) -> bool:
-        """Create device groups."""
-        try:
-            device_groups = getattr(self.panorama_config, 'device_groups', [])
+                template_stacks[stack_name] = templates
+                descriptions[stack_name] = f"Template stack for {self.panorama_config.name}"
+
+            result = self._client.provision(
+                templates=templates,
+                template_stacks=template_stacks,
+                device_groups=device_groups,
+                descriptions=descriptions,
+            )
 
-            for dg_name in device_groups:
-                if self._client.create_device_group(
-                    name=dg_name,
-                    description=f"Device group created by pa_config_lab"
-                ):
-                    self._result.device_groups_created.append(dg_name)
-                    logger.info(f"Created device group: {dg_name}")
+            self._result.templates_created.extend(result.templates_created)
+            self._result.templates_created.extend(result.template_stacks_created)
+            self._result.device_groups_created.extend(result.device_groups_created)
+            for (kind, name), error in result.failures.items():
+                self._result.errors.append(f"Provisioning error: {kind} {name}: {error}")
 
-            return True
+            return result.success
 
         except Exception as e:
-            self._result.errors.append(f"Device group creation error: {e}")
-            logger.error(f"Failed to create device groups: {e}")
+            self._result.errors.append(f"Template/device group creation error: {e}")
+            logger.error(f"Failed to create templates/device groups: {e}")
             return False
 
     def _commit(self, timeout: int) -> APICommitResult:
@@ -371,6 +359,7 @@ class PanoramaPushOrchestrator:
                 description="Initial configuration by pa_config_lab",
                 sync=True,
                 timeout=timeout,
+                progress_callback=self._on_commit_progress,
             )
         except Exception as e:
             return APICommitResult(
@@ -378,6 +367,12 @@ class PanoramaPushOrchestrator:
                 message=str(e),
             )
 
+    def _on_commit_progress(self, percent: int, message: str):
+        """Stream commit job progress to the progress callback."""
+        logger.info(f"[{self.panorama_config.name}] Commit {percent}%: {message}")
+        if self._progress_callback:
+            self._progress_callback(PushPhase.COMMITTING, f"Commit {percent}%: {message}")
+
     def _verify(self) -> bool:
         """Verify configuration was applied correctly."""
         try:
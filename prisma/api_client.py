@@ -211,8 +211,10 @@ class PrismaAccessAPIClient:
             ValidationError: If request validation fails
         """
         logger.detail(f"API {method} request to {url}")
-        logger.debug(f"Request params: {params}")
-        if data:
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Request params: {params}")
+        if data and debug_enabled:
             import json
             logger.debug(f"Request body: {json.dumps(data, indent=2)}")
         
@@ -248,8 +250,16 @@ class PrismaAccessAPIClient:
             )
             
             duration = (datetime.now() - start_time).total_seconds()
-            logger.info(f"API response: {response.status_code} in {duration:.2f}s")
-            logger.debug(f"Response headers: {dict(response.headers)}")
+            logger.info(
+                f"API response: {response.status_code} in {duration:.2f}s",
+                extra={
+                    'endpoint': f"{method.upper()} {url}",
+                    'duration_ms': round(duration * 1000, 1),
+                    'item_type': item_type,
+                },
+            )
+            if debug_enabled:
+                logger.debug(f"Response headers: {dict(response.headers)}")
             
             # Check for HTTP errors
             if not response.ok:
@@ -442,7 +452,9 @@ class PrismaAccessAPIClient:
             logger.debug(f"Update URL: {url}")
             
             # Get data from item (removes internal fields)
-            data = item.to_dict()
+            data = item.to_dict(include_id=False)
+            for field in ('item_type', 'is_default', 'push_strategy', 'deleted', 'delete_success', 'metadata'):
+                data.pop(field, None)
             logger.debug(f"Update data prepared: {len(data)} fields")
             
             # Make request
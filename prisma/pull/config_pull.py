@@ -85,7 +85,7 @@ def pull_configuration(
             import getpass
 
             password = getpass.getpass("Enter password for encryption: ")
-            cipher, salt = derive_key(password)
+            cipher, salt = derive_key(password, file_path=save_to_file)
         elif not encrypt:
             cipher = None
             salt = None
@@ -12,7 +12,8 @@ For Prisma Access, querying bottom-level folders (Mobile Users, Remote Networks,
 Explicit Proxy) automatically includes inherited configs from parent folders.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
@@ -27,10 +28,48 @@ from config.workflows.workflow_utils import (
 )
 from config.models.factory import ConfigItemFactory
 from config.models.base import ConfigItem
+from config.logging_config import log_context
+from config.defaults.default_classifier import (
+    DEFAULT_ITEM_NAMES,
+    DEFAULT_SNIPPETS,
+    get_default_classifier,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PullChangeSummary:
+    """
+    Changes applied to a Configuration by an incremental re-pull.
+
+    Entries are paths like 'folder:Shared/address_object/web-server'
+    (same format as Configuration.diff()).
+    """
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    lists_fetched: int = 0
+    lists_failed: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any item was added, modified or removed."""
+        return bool(self.added or self.modified or self.removed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for display/serialization."""
+        return {
+            'added': self.added,
+            'modified': self.modified,
+            'removed': self.removed,
+            'unchanged': self.unchanged,
+            'lists_fetched': self.lists_fetched,
+            'lists_failed': self.lists_failed,
+        }
+
+
 class PullOrchestrator:
     """
     Orchestrate the complete configuration pull process.
@@ -178,71 +217,10 @@ class PullOrchestrator:
         'service_connection': 'Service Connections',
     }
     
-    # Default snippet values that indicate system/predefined items
-    # These should be filtered when include_defaults=False
-    DEFAULT_SNIPPETS = {
-        'default',           # General system defaults (crypto profiles, tags, addresses)
-        'hip-default',       # HIP-specific defaults (HIP objects and profiles)
-        'optional-default',  # Optional pre-built defaults
-        # Named default snippets from Prisma Access
-        'Web Security Global',
-        'PA_predefined_embargo_rule',
-        'best-practice',
-        'decrypt-bypass',
-        'Block-brute-force',
-    }
-
-    # Default item names by type - these are system-provided items that should be
-    # filtered when include_defaults=False, regardless of which snippet they're in
-    DEFAULT_ITEM_NAMES = {
-        'address_object': {
-            'Palo Alto Networks Sinkhole',
-        },
-        'application_filter': {
-            'general-browsing',
-            'All New apps',
-            'DLP App Exclusion',
-        },
-        'service_object': {
-            'service-http',
-            'service-https',
-        },
-        'tag': {
-            'Sanctioned',
-            'Tolerated',
-            'empty',
-        },
-        'external_dynamic_list': {
-            'Palo Alto Networks - Authentication Portal Exclude List',
-        },
-        'profile_group': {
-            'best-practice',
-            'Explicit Proxy - Unknown Users',
-        },
-        'anti_spyware_profile': {
-            'best-practice',
-        },
-        'vulnerability_profile': {
-            'best-practice',
-        },
-        'wildfire_profile': {
-            'best-practice',
-        },
-        'dns_security_profile': {
-            'best-practice',
-        },
-        'url_access_profile': {
-            'best-practice',
-            'Explicit Proxy - Unknown Users',
-        },
-        'file_blocking_profile': {
-            'best-practice',
-        },
-        'decryption_profile': {
-            'best-practice',
-            'web-security-default',
-        },
-    }
+    # Default snippet values and per-type default item names, filtered when
+    # include_defaults=False (see config.defaults.default_classifier)
+    DEFAULT_SNIPPETS = DEFAULT_SNIPPETS
+    DEFAULT_ITEM_NAMES = DEFAULT_ITEM_NAMES
     
     def __init__(
         self,
@@ -346,23 +324,23 @@ class PullOrchestrator:
         Returns:
             True if item is a system default, False if custom/user-created
         """
-        snippet = item_data.get('snippet', '')
-        item_name = item_data.get('name', '')
-
-        # Check if item name is in the default names list for this type
-        if item_type and item_type in self.DEFAULT_ITEM_NAMES:
-            if item_name in self.DEFAULT_ITEM_NAMES[item_type]:
-                return True
-
-        # Check known default snippet values
-        if snippet and snippet in self.DEFAULT_SNIPPETS:
-            return True
-
-        # Check for any snippet ending in -default (catch future patterns)
-        if snippet and snippet.endswith('-default'):
-            return True
+        return get_default_classifier().is_default_item(item_data, item_type)
+    
+    def _default_flags(self, raw_items: List[dict], item_type: str) -> List[bool]:
+        """
+        Classify a fetched type list as default/custom in one pass.
         
-        return False
+        Args:
+            raw_items: Raw item dictionaries from the API response
+            item_type: Item type of the list
+            
+        Returns:
+            Is-default flags parallel to raw_items; all False when
+            include_defaults is set (nothing is filtered)
+        """
+        if self.config.include_defaults:
+            return [False] * len(raw_items)
+        return get_default_classifier().classify(raw_items, item_type)
     
     def _calculate_progress_ranges(
         self, 
@@ -792,6 +770,304 @@ class PullOrchestrator:
         
         return result
     
+    # (item_type, folder) lists re-fetched for infrastructure during refresh().
+    # folder=None means the global endpoint (folder comes from INFRASTRUCTURE_FOLDER_MAP).
+    INFRASTRUCTURE_REFRESH_LISTS = [
+        ('remote_network', None),
+        ('service_connection', None),
+        *[
+            (item_type, folder)
+            for folder in ('Remote Networks', 'Service Connections')
+            for item_type in ('ipsec_tunnel', 'ike_gateway', 'ike_crypto_profile',
+                              'ipsec_crypto_profile', 'qos_profile')
+        ],
+        ('agent_profile', 'Mobile Users'),
+    ]
+
+    def refresh(
+        self,
+        configuration,
+        folder_filter: Optional[Dict[str, List[str]]] = None,
+        snippet_filter: Optional[Dict[str, List[str]]] = None,
+        include_infrastructure: Optional[bool] = None,
+    ) -> Tuple[WorkflowResult, PullChangeSummary]:
+        """
+        Incrementally re-pull an existing configuration.
+
+        Re-fetches each (location, type) list for the folders and snippets
+        already present in the configuration and reconciles it with the
+        stored items by id (falling back to name) and content fingerprint.
+        Only changed items are touched:
+
+        - New items are appended to their container
+        - Changed items are replaced in place (same position)
+        - Items missing from a successfully fetched list are removed
+
+        Lists that fail to fetch never cause removals, so a transient API
+        error cannot wipe part of the configuration.
+
+        Args:
+            configuration: Configuration to refresh (modified in place)
+            folder_filter: Optional {folder: [types]} (empty list = all types);
+                defaults to all folder types for every folder in the configuration
+            snippet_filter: Optional {snippet: [types]} (empty list = all types);
+                defaults to all snippet types for every snippet in the configuration
+            include_infrastructure: Refresh infrastructure items
+                (default: only if the configuration already has some)
+
+        Returns:
+            Tuple of (WorkflowResult, PullChangeSummary)
+        """
+        logger.normal("=" * 80)
+        logger.normal("STARTING INCREMENTAL PULL")
+        logger.normal("=" * 80)
+
+        result = WorkflowResult(operation='refresh')
+        summary = PullChangeSummary()
+        if include_infrastructure is None:
+            include_infrastructure = bool(configuration.infrastructure.items)
+
+        # Build the list of (container kind, container name, item type, query) to fetch
+        lists: List[Tuple[str, str, str, Optional[str]]] = []
+        for folder in configuration.folders:
+            types = self.FOLDER_TYPES
+            if folder_filter is not None:
+                if folder not in folder_filter:
+                    continue
+                if folder_filter[folder]:
+                    types = [t for t in self.FOLDER_TYPES if t in folder_filter[folder]]
+            lists.extend(('folder', folder, t, folder) for t in types if is_folder_allowed(t, folder))
+        for snippet in configuration.snippets:
+            types = self.SNIPPET_TYPES
+            if snippet_filter is not None:
+                if snippet not in snippet_filter:
+                    continue
+                if snippet_filter[snippet]:
+                    types = [t for t in self.SNIPPET_TYPES if t in snippet_filter[snippet]]
+            lists.extend(('snippet', snippet, t, snippet) for t in types)
+        if include_infrastructure:
+            lists.extend(('infrastructure', 'infrastructure', t, f) for t, f in self.INFRASTRUCTURE_REFRESH_LISTS)
+
+        lists = [l for l in lists if hasattr(ConfigItemFactory.get_model_class(l[2]), 'api_endpoint')]
+
+        logger.info(f"Refreshing {len(lists)} lists ({len(configuration.folders)} folders, "
+                    f"{len(configuration.snippets)} snippets, infrastructure={include_infrastructure})")
+
+        # Items already reconciled in this refresh (parent folder items show up in child queries)
+        seen: Set[Tuple[str, str, str, str]] = set()
+
+        try:
+            for idx, (kind, container_name, item_type, query) in enumerate(lists, 1):
+                if self._cancelled:
+                    logger.info("Refresh cancelled by user")
+                    result.cancelled = True
+                    return result, summary
+
+                self._emit_progress(
+                    f"[{idx}/{len(lists)}] Checking {self.get_display_name(container_name)}: "
+                    f"{item_type.replace('_', ' ').title()}...",
+                    5 + int(85 * (idx - 1) / max(len(lists), 1))
+                )
+
+                with log_context(item_type=item_type):
+                    fetched = self._fetch_item_list(item_type, kind, query, result)
+                    if fetched is None:
+                        summary.lists_failed += 1
+                        continue
+                    summary.lists_fetched += 1
+
+                    if kind == 'infrastructure':
+                        self._reconcile_list(
+                            configuration.infrastructure, 'infrastructure', item_type, fetched,
+                            lambda i, q=query: q is None or i.folder == q,
+                            seen, summary
+                        )
+                        continue
+
+                    # Route items to the container they actually belong to
+                    containers = configuration.folders if kind == 'folder' else configuration.snippets
+                    routed: Dict[str, List[ConfigItem]] = {container_name: []}
+                    for item in fetched:
+                        target = getattr(item, kind, None) or container_name
+                        if target in containers:
+                            routed.setdefault(target, []).append(item)
+
+                    for target, target_items in routed.items():
+                        # Only the directly queried container is authoritative for removals
+                        self._reconcile_list(
+                            containers[target], f"{kind}:{target}", item_type, target_items,
+                            (lambda i: True) if target == container_name else None,
+                            seen, summary
+                        )
+
+            if summary.has_changes:
+                configuration.modified_at = datetime.now().isoformat()
+
+            result.items_created = len(summary.added)
+            result.items_updated = len(summary.modified)
+            result.items_deleted = len(summary.removed)
+            result.configuration = configuration
+            result.mark_complete()
+            result.success = summary.lists_failed == 0 and not result.errors
+
+            self._emit_progress("Refresh complete", 100)
+            logger.normal(f"REFRESH COMPLETE: {len(summary.added)} added, {len(summary.modified)} modified, "
+                          f"{len(summary.removed)} removed, {summary.unchanged} unchanged "
+                          f"({summary.lists_fetched} lists fetched, {summary.lists_failed} failed)")
+
+        except Exception as e:
+            result.success = False
+            logger.error(f"Refresh failed: {e}", exc_info=True)
+            result.add_error(
+                item_type='workflow',
+                item_name='refresh',
+                operation='refresh',
+                error_type=type(e).__name__,
+                message=str(e)
+            )
+
+        return result, summary
+
+    def _fetch_item_list(
+        self,
+        item_type: str,
+        kind: str,
+        query: Optional[str],
+        result: WorkflowResult
+    ) -> Optional[List[ConfigItem]]:
+        """
+        Fetch one (location, type) list and build ConfigItems.
+
+        Applies the same default/config filtering as pull_all(), but always
+        fetches from the API instead of the response cache.
+
+        Args:
+            item_type: Item type to fetch
+            kind: 'folder', 'snippet' or 'infrastructure'
+            query: Folder/snippet name for the query (None = global endpoint)
+            result: WorkflowResult for error tracking
+
+        Returns:
+            List of ConfigItem instances, or None if the list could not be fetched
+        """
+        model_class = ConfigItemFactory.get_model_class(item_type)
+        if not model_class or not hasattr(model_class, 'api_endpoint'):
+            logger.debug(f"  Skipping {item_type} (no model/endpoint)")
+            return None
+
+        from urllib.parse import quote
+        url = model_class.api_endpoint
+        if query is not None:
+            param = 'snippet' if kind == 'snippet' else 'folder'
+            url = f"{url}?{param}={quote(query, safe='')}"
+
+        try:
+            # Bypass the response cache: a refresh right after a pull/push must see the live list
+            response = self.api_client._make_request("GET", url, use_cache=False, item_type=item_type)
+        except Exception as e:
+            handle_workflow_error(e, None, f'fetch_{item_type}_from_{query or "global"}', result, self.config)
+            return None
+
+        raw_items = []
+        if isinstance(response, dict) and 'data' in response:
+            raw_items = response['data']
+        elif isinstance(response, list):
+            raw_items = response
+
+        items = []
+        default_flags = self._default_flags(raw_items, item_type)
+        for raw_item, is_default in zip(raw_items, default_flags):
+            try:
+                if kind == 'infrastructure' and 'folder' not in raw_item and 'snippet' not in raw_item:
+                    raw_item['folder'] = query or self.INFRASTRUCTURE_FOLDER_MAP.get(item_type)
+                    if not raw_item['folder']:
+                        continue
+
+                if is_default:
+                    result.items_skipped += 1
+                    continue
+
+                item = ConfigItemFactory.create_from_dict(item_type, raw_item)
+                if kind != 'infrastructure' and not self.config.should_process_item(item):
+                    result.items_skipped += 1
+                    continue
+
+                items.append(item)
+                result.items_processed += 1
+            except Exception as e:
+                handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
+
+        return items
+
+    def _reconcile_list(
+        self,
+        container,
+        prefix: str,
+        item_type: str,
+        fetched: List[ConfigItem],
+        scope,
+        seen: Set[Tuple[str, str, str, str]],
+        summary: PullChangeSummary
+    ) -> None:
+        """
+        Reconcile one fetched list with the items stored in a container.
+
+        Args:
+            container: FolderConfig, SnippetConfig or InfrastructureConfig
+            prefix: Path prefix for the summary (e.g. 'folder:Shared')
+            item_type: Item type of the list
+            fetched: Freshly fetched items for this container/type
+            scope: Predicate selecting the stored items this list is authoritative
+                for (removals), or None if the list is partial (no removals)
+            seen: Keys already reconciled in this refresh
+            summary: PullChangeSummary to update
+        """
+        existing = [
+            item for item in container.get_items_by_type(item_type)
+            if scope is None or scope(item)
+        ]
+        by_id = {item.id: item for item in existing if item.id}
+        by_name = {item.name: item for item in existing}
+        positions = {id(item): pos for pos, item in enumerate(container.items)}
+        matched: Set[int] = set()
+
+        for new_item in fetched:
+            old_item = by_id.get(new_item.id) if new_item.id else None
+            if old_item is None:
+                old_item = by_name.get(new_item.name)
+
+            key = (prefix, item_type, getattr(new_item, 'folder', None) or '', new_item.id or new_item.name)
+            if key in seen:
+                if old_item is not None:
+                    matched.add(id(old_item))
+                continue
+            seen.add(key)
+
+            path = f"{prefix}/{item_type}/{new_item.name}"
+            if old_item is None:
+                container.add_item(new_item)
+                summary.added.append(path)
+                continue
+
+            matched.add(id(old_item))
+            if old_item.fingerprint == new_item.fingerprint:
+                summary.unchanged += 1
+            else:
+                container.items[positions[id(old_item)]] = new_item
+                summary.modified.append(path)
+                logger.detail(f"  Modified: {path}")
+
+        if scope is None:
+            return
+
+        stale = [item for item in existing if id(item) not in matched]
+        if stale:
+            stale_ids = {id(item) for item in stale}
+            container.items = [item for item in container.items if id(item) not in stale_ids]
+            for item in stale:
+                summary.removed.append(f"{prefix}/{item_type}/{item.name}")
+                logger.detail(f"  Removed: {prefix}/{item_type}/{item.name}")
+
     def _get_folders(self, folder_list: Optional[List[str]] = None) -> List[str]:
         """
         Get list of folders to process.
@@ -1019,89 +1295,91 @@ class PullOrchestrator:
                 
                 logger.debug(f"  [{type_idx}/{len(types_to_query)}] Processing {item_type}")
                 
-                try:
-                    # Check if this type is allowed in this folder (uses centralized restrictions)
-                    if not is_folder_allowed(item_type, folder):
-                        logger.debug(f"  Skipping {item_type} in folder '{folder}' (API restriction)")
-                        continue
+                with log_context(item_type=item_type):
+                    try:
+                        # Check if this type is allowed in this folder (uses centralized restrictions)
+                        if not is_folder_allowed(item_type, folder):
+                            logger.debug(f"  Skipping {item_type} in folder '{folder}' (API restriction)")
+                            continue
                     
-                    # Get model class for this type
-                    logger.debug(f"  Getting model class for {item_type}")
-                    model_class = ConfigItemFactory.get_model_class(item_type)
-                    if not model_class or not hasattr(model_class, 'api_endpoint'):
-                        logger.debug(f"  Skipping {item_type} (no model/endpoint)")
-                        continue
+                        # Get model class for this type
+                        logger.debug(f"  Getting model class for {item_type}")
+                        model_class = ConfigItemFactory.get_model_class(item_type)
+                        if not model_class or not hasattr(model_class, 'api_endpoint'):
+                            logger.debug(f"  Skipping {item_type} (no model/endpoint)")
+                            continue
                     
-                    logger.debug(f"  Model class: {model_class.__name__}")
-                    logger.debug(f"  API endpoint: {model_class.api_endpoint}")
+                        logger.debug(f"  Model class: {model_class.__name__}")
+                        logger.debug(f"  API endpoint: {model_class.api_endpoint}")
                     
-                    # Fetch items for this type in this folder
-                    from urllib.parse import quote
-                    encoded_folder = quote(folder, safe='')
-                    url = f"{model_class.api_endpoint}?folder={encoded_folder}"
-                    logger.detail(f"  Fetching from: {url}")
+                        # Fetch items for this type in this folder
+                        from urllib.parse import quote
+                        encoded_folder = quote(folder, safe='')
+                        url = f"{model_class.api_endpoint}?folder={encoded_folder}"
+                        logger.detail(f"  Fetching from: {url}")
                     
-                    response = self.api_client._make_request("GET", url, item_type=item_type)
+                        response = self.api_client._make_request("GET", url, item_type=item_type)
                     
-                    # Extract items
-                    raw_items = []
-                    if isinstance(response, dict) and 'data' in response:
-                        raw_items = response['data']
-                        logger.detail(f"  Response contains 'data' with {len(raw_items)} items")
-                    elif isinstance(response, list):
-                        raw_items = response
-                        logger.detail(f"  Response is list with {len(raw_items)} items")
-                    else:
-                        logger.detail(f"  Response format unexpected: {type(response)}")
+                        # Extract items
+                        raw_items = []
+                        if isinstance(response, dict) and 'data' in response:
+                            raw_items = response['data']
+                            logger.detail(f"  Response contains 'data' with {len(raw_items)} items")
+                        elif isinstance(response, list):
+                            raw_items = response
+                            logger.detail(f"  Response is list with {len(raw_items)} items")
+                        else:
+                            logger.detail(f"  Response format unexpected: {type(response)}")
                     
-                    if raw_items:
-                        logger.info(f"  {item_type}: {len(raw_items)} items retrieved")
-                        logger.detail(f"  First item keys: {list(raw_items[0].keys()) if raw_items else 'none'}")
+                        if raw_items:
+                            logger.info(f"  {item_type}: {len(raw_items)} items retrieved")
+                            logger.detail(f"  First item keys: {list(raw_items[0].keys()) if raw_items else 'none'}")
                     
-                    # Instantiate items
-                    items = []
-                    skipped_count = 0
-                    default_count = 0
+                        # Instantiate items
+                        items = []
+                        skipped_count = 0
+                        default_count = 0
                     
-                    for item_idx, raw_item in enumerate(raw_items):
-                        item_name = raw_item.get('name', f'item_{item_idx}')
-                        logger.debug(f"    [{item_idx+1}/{len(raw_items)}] Creating {item_type} '{item_name}'")
+                        default_flags = self._default_flags(raw_items, item_type)
+                        for item_idx, (raw_item, is_default) in enumerate(zip(raw_items, default_flags)):
+                            item_name = raw_item.get('name', f'item_{item_idx}')
+                            logger.debug(f"    [{item_idx+1}/{len(raw_items)}] Creating {item_type} '{item_name}'")
                         
-                        try:
-                            # Check defaults BEFORE creating ConfigItem (more efficient)
-                            # Use snippet field from raw API response
-                            if not self.config.include_defaults and self._is_default_item(raw_item, item_type):
-                                snippet_val = raw_item.get('snippet', '')
-                                logger.debug(f"    Skipping '{item_name}' (default item, snippet='{snippet_val}')")
-                                result.items_skipped += 1
-                                default_count += 1
-                                continue
+                            try:
+                                # Check defaults BEFORE creating ConfigItem (more efficient)
+                                # Use snippet field from raw API response
+                                if is_default:
+                                    snippet_val = raw_item.get('snippet', '')
+                                    logger.debug(f"    Skipping '{item_name}' (default item, snippet='{snippet_val}')")
+                                    result.items_skipped += 1
+                                    default_count += 1
+                                    continue
                             
-                            item = ConfigItemFactory.create_from_dict(item_type, raw_item)
-                            logger.debug(f"    Created {item_type} '{item.name}'")
+                                item = ConfigItemFactory.create_from_dict(item_type, raw_item)
+                                logger.debug(f"    Created {item_type} '{item.name}'")
                             
-                            # Apply additional filters
-                            if not self.config.should_process_item(item):
-                                logger.debug(f"    Skipping '{item.name}' (filtered by config)")
-                                result.items_skipped += 1
-                                skipped_count += 1
-                                continue
+                                # Apply additional filters
+                                if not self.config.should_process_item(item):
+                                    logger.debug(f"    Skipping '{item.name}' (filtered by config)")
+                                    result.items_skipped += 1
+                                    skipped_count += 1
+                                    continue
                             
-                            items.append(item)
-                            result.items_processed += 1
-                            logger.debug(f"    Added {item_type} '{item.name}' to results")
+                                items.append(item)
+                                result.items_processed += 1
+                                logger.debug(f"    Added {item_type} '{item.name}' to results")
                             
-                        except Exception as e:
-                            handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
+                            except Exception as e:
+                                handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
                     
-                    # Store items for this type
-                    if items:
-                        if item_type not in folder_items[folder]:
-                            folder_items[folder][item_type] = []
-                        folder_items[folder][item_type].extend(items)
+                        # Store items for this type
+                        if items:
+                            if item_type not in folder_items[folder]:
+                                folder_items[folder][item_type] = []
+                            folder_items[folder][item_type].extend(items)
                 
-                except Exception as e:
-                    handle_workflow_error(e, None, f'fetch_{item_type}_from_{folder}', result, self.config)
+                    except Exception as e:
+                        handle_workflow_error(e, None, f'fetch_{item_type}_from_{folder}', result, self.config)
         
         state.complete_operation()
         return folder_items
@@ -1190,68 +1468,70 @@ class PullOrchestrator:
                 )
                 
                 logger.debug(f"  Processing {item_type} for snippet '{snippet}'")
-                try:
-                    # Get model class for this type
-                    model_class = ConfigItemFactory.get_model_class(item_type)
-                    if not model_class or not hasattr(model_class, 'api_endpoint'):
-                        logger.debug(f"  Skipping {item_type} (no model/endpoint)")
-                        continue
+                with log_context(item_type=item_type):
+                    try:
+                        # Get model class for this type
+                        model_class = ConfigItemFactory.get_model_class(item_type)
+                        if not model_class or not hasattr(model_class, 'api_endpoint'):
+                            logger.debug(f"  Skipping {item_type} (no model/endpoint)")
+                            continue
                     
-                    # Fetch items for this type in this snippet
-                    from urllib.parse import quote
-                    encoded_snippet = quote(snippet, safe='')
-                    url = f"{model_class.api_endpoint}?snippet={encoded_snippet}"
-                    response = self.api_client._make_request("GET", url, item_type=item_type)
+                        # Fetch items for this type in this snippet
+                        from urllib.parse import quote
+                        encoded_snippet = quote(snippet, safe='')
+                        url = f"{model_class.api_endpoint}?snippet={encoded_snippet}"
+                        response = self.api_client._make_request("GET", url, item_type=item_type)
                     
-                    # Extract items
-                    raw_items = []
-                    if isinstance(response, dict) and 'data' in response:
-                        raw_items = response['data']
-                    elif isinstance(response, list):
-                        raw_items = response
+                        # Extract items
+                        raw_items = []
+                        if isinstance(response, dict) and 'data' in response:
+                            raw_items = response['data']
+                        elif isinstance(response, list):
+                            raw_items = response
                     
-                    if raw_items:
-                        logger.info(f"  {item_type}: {len(raw_items)} items")
+                        if raw_items:
+                            logger.info(f"  {item_type}: {len(raw_items)} items")
                     
-                    # Instantiate items
-                    items = []
-                    default_count = 0
-                    for raw_item in raw_items:
-                        item_name = raw_item.get('name', 'unknown')
-                        try:
-                            # Check defaults BEFORE creating ConfigItem (more efficient)
-                            # Use snippet field from raw API response
-                            if not self.config.include_defaults and self._is_default_item(raw_item, item_type):
-                                snippet_val = raw_item.get('snippet', '')
-                                logger.debug(f"    Skipping '{item_name}' (default item, snippet='{snippet_val}')")
-                                result.items_skipped += 1
-                                default_count += 1
-                                continue
+                        # Instantiate items
+                        items = []
+                        default_count = 0
+                        default_flags = self._default_flags(raw_items, item_type)
+                        for raw_item, is_default in zip(raw_items, default_flags):
+                            item_name = raw_item.get('name', 'unknown')
+                            try:
+                                # Check defaults BEFORE creating ConfigItem (more efficient)
+                                # Use snippet field from raw API response
+                                if is_default:
+                                    snippet_val = raw_item.get('snippet', '')
+                                    logger.debug(f"    Skipping '{item_name}' (default item, snippet='{snippet_val}')")
+                                    result.items_skipped += 1
+                                    default_count += 1
+                                    continue
                             
-                            item = ConfigItemFactory.create_from_dict(item_type, raw_item)
+                                item = ConfigItemFactory.create_from_dict(item_type, raw_item)
                             
-                            # Apply additional filters
-                            if not self.config.should_process_item(item):
-                                result.items_skipped += 1
-                                continue
+                                # Apply additional filters
+                                if not self.config.should_process_item(item):
+                                    result.items_skipped += 1
+                                    continue
                             
-                            items.append(item)
-                            result.items_processed += 1
+                                items.append(item)
+                                result.items_processed += 1
                             
-                        except Exception as e:
-                            handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
+                            except Exception as e:
+                                handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
                     
-                    if default_count > 0:
-                        logger.debug(f"  Filtered {default_count} default {item_type} items from snippet '{snippet}'")
+                        if default_count > 0:
+                            logger.debug(f"  Filtered {default_count} default {item_type} items from snippet '{snippet}'")
                     
-                    # Store items for this type
-                    if items:
-                        if item_type not in snippet_items[snippet]:
-                            snippet_items[snippet][item_type] = []
-                        snippet_items[snippet][item_type].extend(items)
+                        # Store items for this type
+                        if items:
+                            if item_type not in snippet_items[snippet]:
+                                snippet_items[snippet][item_type] = []
+                            snippet_items[snippet][item_type].extend(items)
                 
-                except Exception as e:
-                    handle_workflow_error(e, None, f'fetch_{item_type}_from_{snippet}', result, self.config)
+                    except Exception as e:
+                        handle_workflow_error(e, None, f'fetch_{item_type}_from_{snippet}', result, self.config)
         
         state.complete_operation()
         return snippet_items
@@ -1513,58 +1793,60 @@ class PullOrchestrator:
         """
         items = []
         
-        try:
-            # Get model class
-            model_class = ConfigItemFactory.get_model_class(item_type)
-            if not model_class or not hasattr(model_class, 'api_endpoint'):
-                logger.warning(f"No model class or endpoint for {item_type}")
-                return items
-            
-            # Fetch items with folder parameter
-            from urllib.parse import quote
-            encoded_folder = quote(folder, safe='')
-            url = f"{model_class.api_endpoint}?folder={encoded_folder}"
-            
-            response = self.api_client._make_request("GET", url, item_type=item_type)
-            
-            # Extract items
-            raw_items = []
-            if isinstance(response, dict) and 'data' in response:
-                raw_items = response['data']
-            elif isinstance(response, list):
-                raw_items = response
-            
-            # Instantiate items
-            default_count = 0
-            for raw_item in raw_items:
-                item_name = raw_item.get('name', 'unknown')
-                try:
-                    # Add folder if missing
-                    if 'folder' not in raw_item:
-                        raw_item['folder'] = folder
-                        logger.debug(f"  Added folder='{folder}' to {item_type} '{item_name}'")
+        with log_context(item_type=item_type):
+            try:
+                # Get model class
+                model_class = ConfigItemFactory.get_model_class(item_type)
+                if not model_class or not hasattr(model_class, 'api_endpoint'):
+                    logger.warning(f"No model class or endpoint for {item_type}")
+                    return items
+            
+                # Fetch items with folder parameter
+                from urllib.parse import quote
+                encoded_folder = quote(folder, safe='')
+                url = f"{model_class.api_endpoint}?folder={encoded_folder}"
+            
+                response = self.api_client._make_request("GET", url, item_type=item_type)
+            
+                # Extract items
+                raw_items = []
+                if isinstance(response, dict) and 'data' in response:
+                    raw_items = response['data']
+                elif isinstance(response, list):
+                    raw_items = response
+            
+                # Instantiate items
+                default_count = 0
+                default_flags = self._default_flags(raw_items, item_type)
+                for raw_item, is_default in zip(raw_items, default_flags):
+                    item_name = raw_item.get('name', 'unknown')
+                    try:
+                        # Add folder if missing
+                        if 'folder' not in raw_item:
+                            raw_item['folder'] = folder
+                            logger.debug(f"  Added folder='{folder}' to {item_type} '{item_name}'")
                     
-                    # Check defaults BEFORE creating ConfigItem (more efficient)
-                    # Use snippet field from raw API response
-                    if not self.config.include_defaults and self._is_default_item(raw_item, item_type):
-                        snippet_val = raw_item.get('snippet', '')
-                        logger.debug(f"  Skipping '{item_name}' (default item, snippet='{snippet_val}')")
-                        result.items_skipped += 1
-                        default_count += 1
-                        continue
+                        # Check defaults BEFORE creating ConfigItem (more efficient)
+                        # Use snippet field from raw API response
+                        if is_default:
+                            snippet_val = raw_item.get('snippet', '')
+                            logger.debug(f"  Skipping '{item_name}' (default item, snippet='{snippet_val}')")
+                            result.items_skipped += 1
+                            default_count += 1
+                            continue
                     
-                    item = ConfigItemFactory.create_from_dict(item_type, raw_item)
-                    items.append(item)
-                    result.items_processed += 1
-                except Exception as e:
-                    handle_workflow_error(e, None, f'parse_{item_type}_from_{folder}', result, self.config)
+                        item = ConfigItemFactory.create_from_dict(item_type, raw_item)
+                        items.append(item)
+                        result.items_processed += 1
+                    except Exception as e:
+                        handle_workflow_error(e, None, f'parse_{item_type}_from_{folder}', result, self.config)
             
-            if default_count > 0:
-                logger.info(f"  Filtered {default_count} default {item_type} items from '{folder}'")
+                if default_count > 0:
+                    logger.info(f"  Filtered {default_count} default {item_type} items from '{folder}'")
         
-        except Exception as e:
-            logger.error(f"Error fetching {item_type} from '{folder}': {e}")
-            handle_workflow_error(e, None, f'fetch_{item_type}_from_{folder}', result, self.config)
+            except Exception as e:
+                logger.error(f"Error fetching {item_type} from '{folder}': {e}")
+                handle_workflow_error(e, None, f'fetch_{item_type}_from_{folder}', result, self.config)
         
         return items
     
@@ -1585,62 +1867,64 @@ class PullOrchestrator:
         """
         items = []
         
-        try:
-            # Get model class
-            model_class = ConfigItemFactory.get_model_class(item_type)
-            if not model_class or not hasattr(model_class, 'api_endpoint'):
-                logger.warning(f"No model class or endpoint for {item_type}")
-                return items
-            
-            # Fetch all items (no folder parameter)
-            url = model_class.api_endpoint
-            response = self.api_client._make_request("GET", url, item_type=item_type)
-            
-            # Extract items
-            raw_items = []
-            if isinstance(response, dict) and 'data' in response:
-                raw_items = response['data']
-            elif isinstance(response, list):
-                raw_items = response
-            
-            # Instantiate items
-            default_count = 0
-            for raw_item in raw_items:
-                item_name = raw_item.get('name', 'unknown')
-                try:
-                    # Infrastructure items need a folder but API doesn't provide one
-                    # Set the correct folder based on infrastructure type
-                    if 'folder' not in raw_item and 'snippet' not in raw_item:
-                        # Get the correct folder for this infrastructure type
-                        folder = self.INFRASTRUCTURE_FOLDER_MAP.get(item_type)
-                        if folder:
-                            raw_item['folder'] = folder
-                            logger.debug(f"  Added folder='{folder}' to {item_type} '{item_name}'")
-                        else:
-                            logger.warning(f"  No folder mapping for {item_type}, skipping")
-                            continue
+        with log_context(item_type=item_type):
+            try:
+                # Get model class
+                model_class = ConfigItemFactory.get_model_class(item_type)
+                if not model_class or not hasattr(model_class, 'api_endpoint'):
+                    logger.warning(f"No model class or endpoint for {item_type}")
+                    return items
+            
+                # Fetch all items (no folder parameter)
+                url = model_class.api_endpoint
+                response = self.api_client._make_request("GET", url, item_type=item_type)
+            
+                # Extract items
+                raw_items = []
+                if isinstance(response, dict) and 'data' in response:
+                    raw_items = response['data']
+                elif isinstance(response, list):
+                    raw_items = response
+            
+                # Instantiate items
+                default_count = 0
+                default_flags = self._default_flags(raw_items, item_type)
+                for raw_item, is_default in zip(raw_items, default_flags):
+                    item_name = raw_item.get('name', 'unknown')
+                    try:
+                        # Infrastructure items need a folder but API doesn't provide one
+                        # Set the correct folder based on infrastructure type
+                        if 'folder' not in raw_item and 'snippet' not in raw_item:
+                            # Get the correct folder for this infrastructure type
+                            folder = self.INFRASTRUCTURE_FOLDER_MAP.get(item_type)
+                            if folder:
+                                raw_item['folder'] = folder
+                                logger.debug(f"  Added folder='{folder}' to {item_type} '{item_name}'")
+                            else:
+                                logger.warning(f"  No folder mapping for {item_type}, skipping")
+                                continue
                     
-                    # Check defaults BEFORE creating ConfigItem (more efficient)
-                    # Use snippet field from raw API response
-                    if not self.config.include_defaults and self._is_default_item(raw_item, item_type):
-                        snippet_val = raw_item.get('snippet', '')
-                        logger.debug(f"  Skipping '{item_name}' (default item, snippet='{snippet_val}')")
-                        result.items_skipped += 1
-                        default_count += 1
-                        continue
+                        # Check defaults BEFORE creating ConfigItem (more efficient)
+                        # Use snippet field from raw API response
+                        if is_default:
+                            snippet_val = raw_item.get('snippet', '')
+                            logger.debug(f"  Skipping '{item_name}' (default item, snippet='{snippet_val}')")
+                            result.items_skipped += 1
+                            default_count += 1
+                            continue
                     
-                    item = ConfigItemFactory.create_from_dict(item_type, raw_item)
-                    items.append(item)
-                    result.items_processed += 1
-                except Exception as e:
-                    handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
+                        item = ConfigItemFactory.create_from_dict(item_type, raw_item)
+                        items.append(item)
+                        result.items_processed += 1
+                    except Exception as e:
+                        handle_workflow_error(e, None, f'parse_{item_type}', result, self.config)
             
-            if default_count > 0:
-                logger.info(f"  Filtered {default_count} default {item_type} items")
+                if default_count > 0:
+                    logger.info(f"  Filtered {default_count} default {item_type} items")
         
-        except Exception as e:
-            logger.error(f"Error fetching {item_type}: {e}")
-            handle_workflow_error(e, None, f'fetch_{item_type}', result, self.config)
+            except Exception as e:
+                logger.error(f"Error fetching {item_type}: {e}")
+                handle_workflow_error(e, None, f'fetch_{item_type}', result, self.config)
         
         return items
     
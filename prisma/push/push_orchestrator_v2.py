@@ -18,6 +18,8 @@ from datetime import datetime
 import time
 import logging
 
+from config.logging_config import log_context
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,7 +72,7 @@ class PushDestination:
     def from_dict(cls, data: Dict[str, Any]) -> 'PushDestination':
         """Create PushDestination from _destination dict.
         
-        Expected keys from selection_row.get_destination_settings():
+        Expected keys from SelectionNode.get_destination_settings():
             - folder: effective folder name (or snippet name)
             - name: destination name (may be same as original)
             - strategy: conflict strategy ('skip', 'overwrite', 'rename')
@@ -204,6 +206,7 @@ class PushSummary:
                 'total': self.total,
                 'created': self.created,
                 'updated': self.updated,
+                'deleted': self.deleted,
                 'skipped': self.skipped,
                 'failed': self.failed,
                 'renamed': self.renamed,
@@ -272,6 +275,17 @@ class PushOrchestratorV2:
         'decryption_rule': 'decryption_rule',
     }
     
+    # Push item types that differ from the ConfigItemFactory type names
+    MODEL_TYPE_ALIASES = {
+        'address': 'address_object',
+        'service': 'service_object',
+        'application': 'application_object',
+        'security_profile_group': 'profile_group',
+        'vulnerability_protection_profile': 'vulnerability_profile',
+        'wildfire_antivirus_profile': 'wildfire_profile',
+        'rule': 'security_rule',
+    }
+    
     def __init__(self, api_client):
         """
         Initialize the push orchestrator.
@@ -334,7 +348,9 @@ class PushOrchestratorV2:
     def push_selected_items(
         self,
         selected_items: Dict[str, Any],
-        destination_config: Optional[Dict[str, Any]] = None
+        destination_config: Optional[Dict[str, Any]] = None,
+        incremental: bool = False,
+        delete_missing: bool = False
     ) -> Dict[str, Any]:
         """
         Push selected configuration items to destination tenant.
@@ -343,9 +359,17 @@ class PushOrchestratorV2:
         1. PHASE 1 (DELETE): Delete existing items in reverse dependency order (parents first)
         2. PHASE 2 (CREATE): Create items in dependency order (children first)
         
+        In incremental mode, items are first compared against destination_config
+        by content hash (see push_planner). Identical items are skipped without
+        any API call, and changed items with OVERWRITE strategy are updated in
+        place with a single PUT instead of delete + create.
+        
         Args:
             selected_items: Dictionary from selection list with folders, snippets, infrastructure
             destination_config: Optional destination config for conflict detection
+            incremental: Only push items whose content differs from the destination
+            delete_missing: In incremental mode, also delete destination items of the
+                pushed types/locations that are not in the selection
             
         Returns:
             Push results dictionary
@@ -355,6 +379,7 @@ class PushOrchestratorV2:
         self._name_mappings = {}
         self._failed_deletes: Set[str] = set()  # Track failed delete item keys
         self._skipped_due_to_dependency: Set[str] = set()  # Track items skipped due to dep failure
+        self._plan = None
         
         logger.info("=" * 80)
         logger.info("PUSH ORCHESTRATOR V2 - STARTING PUSH OPERATION")
@@ -390,6 +415,20 @@ class PushOrchestratorV2:
                     if items_to_skip > 0:
                         logger.warning(f"[Push] {items_to_skip} item(s) will be skipped due to failed snippet creation")
             
+            # Step 2b: Plan incremental push (unchanged / update / create / delete)
+            if incremental and destination_config:
+                from .push_planner import PushPlanner
+                plannable = [item for item in items if not self._is_default_profile(item)]
+                self._plan = PushPlanner(destination_config, include_deletes=delete_missing).plan(plannable)
+                counts = self._plan.counts()
+                self._report_progress(
+                    f"Push plan: {counts['unchanged']} unchanged, {counts['update']} to update, "
+                    f"{counts['create']} to create, {counts['delete']} to delete",
+                    0, total_items
+                )
+            elif incremental:
+                logger.warning("[Push] Incremental push requested without destination_config - pushing everything")
+            
             # Step 3: Identify items that need OVERWRITE (delete + create)
             logger.info(f"[Push] Checking {len(items)} items for OVERWRITE strategy...")
             logger.debug(f"[Push] destination_config keys: {list(destination_config.keys()) if destination_config else 'None'}")
@@ -406,6 +445,10 @@ class PushOrchestratorV2:
                     logger.info(f"[Push] Skipping default profile: {item.item_type}/{item.name}")
                     continue
                 
+                # Unchanged items and in-place updates never need a delete
+                if self._planned_action(item) in ('unchanged', 'update'):
+                    continue
+                
                 is_overwrite = item.destination.strategy == PushStrategy.OVERWRITE
                 exists = self._item_exists_in_dest(item, destination_config) if is_overwrite else False
                 logger.info(f"[Push] Item {item.item_type}/{item.name}: strategy={item.destination.strategy}, "
@@ -454,7 +497,8 @@ class PushOrchestratorV2:
                         len(delete_order)
                     )
                     
-                    success = self._delete_item_for_overwrite(item, destination_config)
+                    with log_context(item_type=item.item_type):
+                        success = self._delete_item_for_overwrite(item, destination_config)
                     
                     if success:
                         self._report_progress(
@@ -568,7 +612,21 @@ class PushOrchestratorV2:
                 
                 # Track results before push to detect new result
                 results_before = len(self.summary.results)
-                self._push_single_item(item, destination_config)
+                planned_action = self._planned_action(item)
+                with log_context(item_type=item.item_type):
+                    if planned_action == 'unchanged':
+                        self._add_result(PushResult(
+                            item_name=item.name,
+                            item_type=item.item_type,
+                            destination=self._get_item_destination(item),
+                            action='skipped',
+                            success=True,
+                            message='Unchanged in destination'
+                        ))
+                    elif planned_action == 'update':
+                        self._update_single_item(item)
+                    else:
+                        self._push_single_item(item, destination_config)
                 
                 # Report outcome for this item
                 if len(self.summary.results) > results_before:
@@ -601,11 +659,16 @@ class PushOrchestratorV2:
                             total_items
                         )
             
+            # Step 7: Delete destination items missing from the source (incremental only)
+            if self._plan and delete_missing:
+                self._delete_missing_items()
+            
             self.summary.end_time = datetime.now()
             
             logger.info("=" * 80)
             logger.info("PUSH OPERATION COMPLETED")
             logger.info(f"Total: {self.summary.total}, Created: {self.summary.created}, "
+                       f"Updated: {self.summary.updated}, Deleted: {self.summary.deleted}, "
                        f"Skipped: {self.summary.skipped}, Failed: {self.summary.failed}")
             logger.info(f"Elapsed: {self.summary.elapsed_seconds:.2f}s")
             logger.info("=" * 80)
@@ -642,6 +705,8 @@ class PushOrchestratorV2:
             f"Skipped: {s.skipped}",
             f"Failed: {s.failed}",
         ]
+        if s.deleted > 0:
+            lines.append(f"Deleted: {s.deleted}")
         if s.renamed > 0:
             lines.append(f"Renamed: {s.renamed}")
         if s.snippets_created > 0:
@@ -1101,6 +1166,108 @@ class PushOrchestratorV2:
                     error=error_msg[:500]  # Allow longer errors for better diagnostics
                 ))
     
+    # =========================================================================
+    # INCREMENTAL PUSH
+    # =========================================================================
+    
+    def _planned_action(self, item: PushItem) -> Optional[str]:
+        """
+        Get the incremental plan action for an item.
+        
+        Returns 'unchanged' or 'update' only when the plan allows skipping the
+        normal create path; None means the item goes through the regular
+        conflict-resolution flow.
+        """
+        if not self._plan:
+            return None
+        
+        entry = self._plan.get(item)
+        if not entry:
+            return None
+        
+        if entry.action.value == 'unchanged':
+            return 'unchanged'
+        
+        # In-place updates honor the user's conflict strategy: SKIP stays skip,
+        # RENAME still creates a copy. Only OVERWRITE turns into a PUT.
+        if (entry.action.value == 'update'
+                and item.destination.strategy == PushStrategy.OVERWRITE
+                and entry.dest_id
+                and self._get_model_class(item.item_type)):
+            return 'update'
+        
+        return None
+    
+    def _get_model_class(self, item_type: str):
+        """Get the ConfigItem class for a push item type (None if not modelled)."""
+        from config.models.factory import ConfigItemFactory
+        model_type = self.MODEL_TYPE_ALIASES.get(item_type, item_type)
+        model_class = ConfigItemFactory.get_model_class(model_type)
+        if model_class and model_class.api_endpoint:
+            return model_class
+        return None
+    
+    def _update_single_item(self, item: PushItem):
+        """Update an existing destination item in place (single PUT via update_item)."""
+        entry = self._plan.get(item)
+        model_class = self._get_model_class(item.item_type)
+        
+        data = dict(item.data)
+        data['id'] = entry.dest_id
+        data['snippet' if entry.is_snippet else 'folder'] = entry.location
+        
+        try:
+            config_item = model_class(data)
+            if not self.api_client.update_item(config_item):
+                raise RuntimeError("update_item returned failure (see log for API error)")
+            
+            self._add_result(PushResult(
+                item_name=item.name,
+                item_type=item.item_type,
+                destination=entry.location,
+                action='updated',
+                success=True,
+                message='Updated in place (content changed)'
+            ))
+        except Exception as e:
+            logger.error(f"Failed to update {item.item_type}/{item.name}: {e}")
+            self._add_result(PushResult(
+                item_name=item.name,
+                item_type=item.item_type,
+                destination=entry.location,
+                action='failed',
+                success=False,
+                message='Update failed',
+                error=str(e)[:500]
+            ))
+    
+    def _delete_missing_items(self):
+        """Delete destination items that the plan marked as missing from the source."""
+        from .push_planner import PlanAction
+        
+        deletes = self._plan.by_action(PlanAction.DELETE)
+        if not deletes:
+            return
+        
+        logger.info(f"[Push] Deleting {len(deletes)} destination items not present in source")
+        delete_order = self._sort_for_delete([entry.item for entry in deletes])
+        
+        for idx, item in enumerate(delete_order):
+            entry = self._plan.get(item)
+            self._report_progress(f"  Deleting {item.item_type}: {item.name}...", idx + 1, len(delete_order))
+            
+            with log_context(item_type=item.item_type):
+                success = self._delete_by_id(item.item_type, item.name, entry.dest_id)
+            self._add_result(PushResult(
+                item_name=item.name,
+                item_type=item.item_type,
+                destination=entry.location,
+                action='deleted' if success else 'failed',
+                success=success,
+                message='Deleted (not in source)' if success else 'Delete failed',
+                error=None if success else 'Delete failed'
+            ))
+    
     def _item_exists(
         self,
         item: PushItem,
@@ -1331,6 +1498,14 @@ class PushOrchestratorV2:
             logger.warning(f"Cannot delete {item_type}/{item_name}: ID not found in destination config")
             return False
         
+        return self._delete_by_id(item_type, item_name, item_id)
+    
+    def _delete_by_id(self, item_type: str, item_name: str, item_id: str) -> bool:
+        """
+        Delete a destination item by ID using the matching API method.
+        
+        Returns True if delete succeeded, False otherwise.
+        """
         try:
             logger.info(f"Deleting {item_type}/{item_name} (ID: {item_id})")
             
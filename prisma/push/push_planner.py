@@ -0,0 +1,263 @@
+"""
+Push Planner - Diff-based incremental push planning.
+
+Compares the items selected for push against a snapshot of the destination
+tenant and classifies each one so that only real changes cost API calls:
+
+- UNCHANGED: Destination already holds an identical copy (no API call)
+- UPDATE: Destination copy differs (single PUT instead of delete + create)
+- CREATE: Item does not exist in the destination
+- DELETE: Item exists in the destination but not in the source (opt-in)
+
+Items are compared by their normalized content fingerprint (see
+config.models.fingerprint), the same one ConfigItem.fingerprint uses.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
+from enum import Enum
+import logging
+
+from config.models.fingerprint import content_fingerprint
+from .push_orchestrator_v2 import PushItem, PushDestination, LocationType
+
+logger = logging.getLogger(__name__)
+
+
+class PlanAction(Enum):
+    """What the push needs to do for an item."""
+    UNCHANGED = "unchanged"
+    UPDATE = "update"
+    CREATE = "create"
+    DELETE = "delete"
+
+
+@dataclass
+class PlannedItem:
+    """A single entry in a push plan."""
+    item: PushItem
+    action: PlanAction
+    location: str
+    is_snippet: bool
+    dest_id: Optional[str] = None
+    source_hash: Optional[str] = None
+    dest_hash: Optional[str] = None
+
+
+@dataclass
+class PushPlan:
+    """Result of planning a push against a destination snapshot."""
+    entries: List[PlannedItem] = field(default_factory=list)
+    _index: Dict[int, PlannedItem] = field(default_factory=dict, repr=False)
+
+    def add(self, entry: PlannedItem):
+        """Add an entry to the plan."""
+        self.entries.append(entry)
+        self._index[id(entry.item)] = entry
+
+    def get(self, item: PushItem) -> Optional[PlannedItem]:
+        """Get the plan entry for a push item (by identity)."""
+        return self._index.get(id(item))
+
+    def by_action(self, action: PlanAction) -> List[PlannedItem]:
+        """Get all entries with the given action."""
+        return [e for e in self.entries if e.action == action]
+
+    def counts(self) -> Dict[str, int]:
+        """Get number of entries per action."""
+        counts = {action.value: 0 for action in PlanAction}
+        for entry in self.entries:
+            counts[entry.action.value] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for display/serialization."""
+        return {
+            'counts': self.counts(),
+            'items': [
+                {
+                    'name': e.item.name,
+                    'type': e.item.item_type,
+                    'location': e.location,
+                    'is_snippet': e.is_snippet,
+                    'action': e.action.value,
+                    'dest_id': e.dest_id,
+                }
+                for e in self.entries
+            ],
+        }
+
+
+class PushPlanner:
+    """
+    Classify push items as unchanged/update/create/delete.
+
+    Works on the destination_config snapshot built by the push preview
+    (``objects``, ``snippet_objects``, ``all_rule_names``, ``all_dest_rules``).
+    """
+
+    RULE_TYPES = {'security_rule', 'rule'}
+
+    def __init__(self, destination_config: Optional[Dict[str, Any]], include_deletes: bool = False):
+        """
+        Initialize the planner.
+
+        Args:
+            destination_config: Destination snapshot from the push preview
+            include_deletes: Also plan deletes for destination items that are
+                not in the source (only for locations/types being pushed)
+        """
+        self.destination_config = destination_config or {}
+        self.include_deletes = include_deletes
+
+    def plan(self, items: List[PushItem]) -> PushPlan:
+        """
+        Build a push plan for the given items.
+
+        Args:
+            items: Items extracted from the selection
+
+        Returns:
+            PushPlan with one entry per item (plus deletes if enabled)
+        """
+        plan = PushPlan()
+        touched: Dict[Tuple[str, bool, str], set] = {}
+
+        for item in items:
+            location, is_snippet = self._resolve_location(item)
+            touched.setdefault((location, is_snippet, item.item_type), set()).add(item.name)
+
+            # New snippets cannot contain anything yet
+            if item.destination.location_type == LocationType.NEW_SNIPPET:
+                plan.add(PlannedItem(item, PlanAction.CREATE, location, is_snippet))
+                continue
+
+            dest_obj = self._find_dest_object(item.item_type, item.name, location, is_snippet)
+            if dest_obj is None:
+                plan.add(PlannedItem(item, PlanAction.CREATE, location, is_snippet))
+                continue
+
+            source_hash = content_fingerprint(item.data)
+            dest_hash = content_fingerprint(dest_obj)
+            action = PlanAction.UNCHANGED if source_hash == dest_hash else PlanAction.UPDATE
+            plan.add(PlannedItem(
+                item, action, location, is_snippet,
+                dest_id=dest_obj.get('id'),
+                source_hash=source_hash,
+                dest_hash=dest_hash,
+            ))
+
+        if self.include_deletes:
+            for entry in self._plan_deletes(touched):
+                plan.add(entry)
+
+        counts = plan.counts()
+        logger.info(f"[Plan] {len(items)} items: {counts['unchanged']} unchanged, "
+                    f"{counts['update']} update, {counts['create']} create, {counts['delete']} delete")
+        return plan
+
+    def _resolve_location(self, item: PushItem) -> Tuple[str, bool]:
+        """Resolve (location, is_snippet) for an item's destination."""
+        dest = item.destination
+        if dest.location_type == LocationType.NEW_SNIPPET:
+            return dest.new_snippet_name or dest.location_name, True
+        if dest.location_type == LocationType.SNIPPET:
+            return dest.location_name, True
+        return dest.location_name, False
+
+    def _type_keys(self, item_type: str) -> List[str]:
+        """Keys an item type may be stored under in the snapshot."""
+        plural = f"{item_type}s" if not item_type.endswith('s') else item_type
+        return [item_type, plural]
+
+    def _find_dest_object(
+        self,
+        item_type: str,
+        name: str,
+        location: str,
+        is_snippet: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the destination copy of an item in the snapshot.
+
+        Returns None if the item does not exist or only its existence (not
+        its content) is known.
+        """
+        if item_type in self.RULE_TYPES:
+            return self._find_dest_rule(name, location, is_snippet)
+
+        if is_snippet:
+            snippet_objects = self.destination_config.get('snippet_objects', {}).get(location, {})
+            for key in self._type_keys(item_type):
+                obj = snippet_objects.get(key, {}).get(name)
+                if isinstance(obj, dict):
+                    return obj
+            return None
+
+        objects = self.destination_config.get('objects', {})
+        for key in self._type_keys(item_type):
+            obj = objects.get(key, {}).get(name)
+            if isinstance(obj, dict) and obj.get('folder') in (None, location):
+                return obj
+        return None
+
+    def _find_dest_rule(self, name: str, location: str, is_snippet: bool) -> Optional[Dict[str, Any]]:
+        """
+        Find the destination copy of a rule in the target folder/snippet.
+
+        all_dest_rules entries are the preview's wrappers
+        ({'data', 'location', 'location_type'}); a same-named rule in another
+        location is not a match.
+        """
+        location_type = 'snippet' if is_snippet else 'folder'
+        entry = self.destination_config.get('all_dest_rules', {}).get(name)
+        if (isinstance(entry, dict) and isinstance(entry.get('data'), dict)
+                and entry.get('location') == location
+                and entry.get('location_type') == location_type):
+            return entry['data']
+
+        if not is_snippet:
+            folder_rules = self.destination_config.get('security_rules', {}).get(location)
+            if isinstance(folder_rules, dict) and isinstance(folder_rules.get(name), dict):
+                return folder_rules[name]
+        return None
+
+    def _plan_deletes(self, touched: Dict[Tuple[str, bool, str], set]) -> List[PlannedItem]:
+        """Plan deletes for destination items missing from the source."""
+        deletes = []
+
+        for (location, is_snippet, item_type), source_names in touched.items():
+            if item_type in self.RULE_TYPES:
+                # Rule ordering makes deletes too risky to infer automatically
+                continue
+
+            if is_snippet:
+                container = self.destination_config.get('snippet_objects', {}).get(location, {})
+            else:
+                container = self.destination_config.get('objects', {})
+            type_objects = container.get(item_type, {})
+
+            for name, obj in type_objects.items():
+                if name in source_names or not isinstance(obj, dict):
+                    continue
+                if not is_snippet and obj.get('folder') != location:
+                    continue
+                if not obj.get('id'):
+                    continue
+
+                push_item = PushItem(
+                    name=name,
+                    item_type=item_type,
+                    data=obj,
+                    destination=PushDestination(
+                        location_type=LocationType.SNIPPET if is_snippet else LocationType.FOLDER,
+                        location_name=location,
+                    ),
+                    original_folder='' if is_snippet else location,
+                    original_snippet=location if is_snippet else '',
+                )
+                deletes.append(PlannedItem(
+                    push_item, PlanAction.DELETE, location, is_snippet, dest_id=obj.get('id')
+                ))
+
+        return deletes
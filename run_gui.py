@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """
 Launch script for Prisma Access Configuration Manager GUI.
+
+Options:
+    --profile-startup   Report per-module import cost and time to first
+                        paint (stderr and logs/startup_profile.txt)
 """
 
+import time
+
+_START = time.perf_counter()
+
 import sys
 import os
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+profiler = None
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    from gui.startup_profiler import start_profiler
+    profiler = start_profiler(_START)
+
 from gui.main_window import main
 
+if profiler:
+    profiler.mark("gui.main_window imported")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark default-item detection.
+
+Builds a synthetic fixture of raw API items (50,000 by default, spread over
+the common item types, ~15% of them defaults by snippet or name) and times,
+for each layer that decides "is this a system default":
+
+    pull       pull filtering / config tree (snippet and per-type names)
+    detector   DefaultDetector object, profile and rule patterns
+    manager    DefaultManager folder and name-prefix rules
+
+each against the per-item loops it replaced (reproduced below as the
+baseline). Every result is checked against the baseline before timing.
+
+Usage:
+    python scripts/benchmark_default_detection.py
+    python scripts/benchmark_default_detection.py --items 200000 --runs 5
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.defaults.default_classifier import DEFAULT_ITEM_NAMES, DEFAULT_SNIPPETS, get_default_classifier
+from config.defaults.default_configs import DefaultConfigs
+from config.workflows.default_manager import DefaultManager
+
+ITEM_TYPES = [
+    'address_object', 'address_group', 'service_object', 'tag', 'application_filter',
+    'external_dynamic_list', 'anti_spyware_profile', 'url_access_profile', 'decryption_profile',
+    'security_rule',
+]
+FOLDERS = ['Mobile Users', 'Remote Networks', 'Shared', 'Service Connections', 'Predefined']
+
+
+def build_fixture(count: int, seed: int = 7) -> Dict[str, List[Dict[str, Any]]]:
+    """Synthetic raw API items grouped by item type."""
+    rnd = random.Random(seed)
+    default_snippets = sorted(DEFAULT_SNIPPETS) + ['web-security-default']
+    custom_snippets = ['corp-baseline', 'branch-offices', 'lab']
+
+    fixture: Dict[str, List[Dict[str, Any]]] = {item_type: [] for item_type in ITEM_TYPES}
+    for i in range(count):
+        item_type = ITEM_TYPES[i % len(ITEM_TYPES)]
+        item = {'id': f"{i:08d}-0000-0000-0000", 'name': f"{item_type.split('_')[0]}-{i}"}
+        roll = rnd.random()
+        if roll < 0.10:
+            item['snippet'] = rnd.choice(default_snippets)
+        elif roll < 0.13 and DEFAULT_ITEM_NAMES.get(item_type):
+            item['name'] = rnd.choice(sorted(DEFAULT_ITEM_NAMES[item_type]))
+            item['folder'] = rnd.choice(FOLDERS)
+        elif roll < 0.15:
+            item['name'] = rnd.choice(['default-deny', 'any-tcp', 'best-practice', 'panw-decrypt', 'strict'])
+            item['folder'] = rnd.choice(FOLDERS)
+        elif roll < 0.40:
+            item['snippet'] = rnd.choice(custom_snippets)
+        else:
+            item['folder'] = rnd.choice(FOLDERS)
+        if item_type == 'security_rule':
+            item.update(action=rnd.choice(['allow', 'deny', 'drop']), source=['any'],
+                        destination=[rnd.choice(['any', 'dmz'])], application=['any'], service=['any'])
+        fixture[item_type].append(item)
+    return fixture
+
+
+# ========== Baseline (previous per-item implementations) ==========
+
+def baseline_pull(item: Dict[str, Any], item_type: str) -> bool:
+    snippet = item.get('snippet', '')
+    if item_type in DEFAULT_ITEM_NAMES and item.get('name', '') in DEFAULT_ITEM_NAMES[item_type]:
+        return True
+    if snippet and snippet in DEFAULT_SNIPPETS:
+        return True
+    return bool(snippet) and snippet.endswith('-default')
+
+
+def _any_match(patterns: List[str], value: str) -> bool:
+    value = value.lower()
+    return any(re.match(pattern, value, re.IGNORECASE) for pattern in patterns)
+
+
+def baseline_object(obj: Dict[str, Any], object_type: str) -> bool:
+    name = obj.get('name', '')
+    if not name:
+        return False
+    snippet = obj.get('snippet', '')
+    if snippet and _any_match(DefaultConfigs.DEFAULT_SNIPPET_PATTERNS, snippet):
+        return True
+    if object_type == 'address' and name in DefaultConfigs.DEFAULT_ADDRESS_OBJECTS:
+        return True
+    if object_type == 'service' and name in DefaultConfigs.DEFAULT_SERVICE_OBJECTS:
+        return True
+    return _any_match(DefaultConfigs.DEFAULT_OBJECT_NAME_PATTERNS, name)
+
+
+def baseline_profile(profile: Dict[str, Any], profile_type: str) -> bool:
+    name = profile.get('name', '')
+    if not name:
+        return False
+    for default_name in DefaultConfigs.DEFAULT_SECURITY_PROFILE_NAMES.get(profile_type, []):
+        if name.lower() == default_name.lower():
+            return True
+    return _any_match(DefaultConfigs.DEFAULT_PROFILE_NAME_PATTERNS, name)
+
+
+def baseline_rule(rule: Dict[str, Any]) -> bool:
+    name = rule.get('name', '')
+    if name and _any_match(DefaultConfigs.DEFAULT_RULE_PATTERNS['name_patterns'], name):
+        return True
+    fields = [rule.get(field, []) for field in ('source', 'destination', 'application', 'service')]
+    if all(not values or 'any' in [v.lower() for v in values] for values in fields):
+        return rule.get('action', '').lower() in ['deny', 'allow']
+    return False
+
+
+def baseline_manager(item, manager: DefaultManager) -> bool:
+    if item.default:
+        return True
+    if item.folder:
+        folder_lower = item.folder.lower()
+        if any(folder_lower == default.lower() for default in manager.default_folders):
+            return True
+        if any(keyword in folder_lower for keyword in ['predefined', 'default', 'system']):
+            return True
+    if item.name:
+        name_lower = item.name.lower()
+        return any(name_lower.startswith(prefix.lower()) for prefix in manager.default_prefixes)
+    return False
+
+
+# ========== Benchmark ==========
+
+def best_time(func, runs: int):
+    best, result = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def compare(label: str, baseline, batch, runs: int, total: int):
+    expected, baseline_time = best_time(baseline, runs)
+    result, batch_time = best_time(batch, runs)
+    if result != expected:
+        mismatches = sum(1 for a, b in zip(result, expected) if a != b)
+        raise SystemExit(f"{label}: {mismatches} results differ from the baseline")
+    defaults = sum(1 for is_default in result if is_default)
+    print(f"{label:<10}{baseline_time * 1000:>14.1f}{batch_time * 1000:>13.1f}"
+          f"{baseline_time / batch_time:>9.1f}x{total / batch_time / 1e6:>11.2f}{defaults:>11,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=50_000, help="Fixture size (default 50000)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement, best time is reported")
+    args = parser.parse_args()
+
+    fixture = build_fixture(args.items)
+    items = [item for type_items in fixture.values() for item in type_items]
+    print(f"Fixture: {len(items):,} items, {len(fixture)} item types\n")
+
+    classifier = get_default_classifier()
+    profile_types = {'anti_spyware_profile': 'anti_spyware', 'url_access_profile': 'url_access',
+                     'decryption_profile': None}
+    object_types = {'address_object': 'address', 'address_group': 'address', 'service_object': 'service',
+                    'tag': None, 'application_filter': None, 'external_dynamic_list': None}
+
+    manager = DefaultManager()
+    config_items = [
+        SimpleNamespace(item_type=item_type, name=item['name'], folder=item.get('folder'), default=False)
+        for item_type, type_items in fixture.items() for item in type_items
+    ]
+
+    print(f"{'Layer':<10}{'Baseline (ms)':>14}{'Batch (ms)':>13}{'Speedup':>10}{'M items/s':>11}{'Defaults':>11}")
+    compare(
+        "pull",
+        lambda: [baseline_pull(item, t) for t, type_items in fixture.items() for item in type_items],
+        lambda: [flag for t, type_items in fixture.items() for flag in classifier.classify(type_items, t)],
+        args.runs, len(items),
+    )
+    compare(
+        "detector",
+        lambda: (
+            [baseline_object(o, object_types[t]) for t in object_types for o in fixture[t]]
+            + [baseline_profile(p, profile_types[t]) for t in profile_types for p in fixture[t]]
+            + [baseline_rule(r) for r in fixture['security_rule']]
+        ),
+        lambda: (
+            [f for t in object_types for f in classifier.classify_objects(fixture[t], object_types[t])]
+            + [f for t in profile_types for f in classifier.classify_profiles(fixture[t], profile_types[t])]
+            + classifier.classify_rules(fixture['security_rule'])
+        ),
+        args.runs, len(items),
+    )
+    compare(
+        "manager",
+        lambda: [baseline_manager(item, manager) for item in config_items],
+        lambda: manager.classify(config_items),
+        args.runs, len(items),
+    )
+
+
+if __name__ == "__main__":
+    main()
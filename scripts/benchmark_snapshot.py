@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark the snapshot format against Configuration.save_to_file() JSON.
+
+Builds a synthetic configuration (or loads an existing saved configuration),
+then saves and loads it as indented JSON, gzip JSON and snapshot, reporting
+file size and save/load times, and verifies that each format round-trips.
+
+Usage:
+    python scripts/benchmark_snapshot.py
+    python scripts/benchmark_snapshot.py --folders 20 --items 2000
+    python scripts/benchmark_snapshot.py --input saved/my-tenant.json
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.logging_config import setup_logging
+from config.models.containers import Configuration, FolderConfig, SnippetConfig
+from config.models.objects import AddressObject, AddressGroup
+from config.models.policies import SecurityRule
+from config.storage.snapshot import SnapshotReader, default_codec
+
+
+def build_configuration(folders: int, items: int) -> Configuration:
+    """Synthetic configuration with `items` addresses/groups/rules per folder."""
+    cfg = Configuration(source_tsg="1234567890", load_type="benchmark")
+    tags = [f"tag-{i}" for i in range(20)]
+
+    def fill(container, location_key, location):
+        for i in range(items):
+            kind = i % 4
+            base = {location_key: location, 'id': f"{location}-{i:08d}-0000-0000-0000"}
+            if kind < 2:
+                item = AddressObject(dict(
+                    base, name=f"host-{i}", ip_netmask=f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}/32",
+                    tag=[tags[i % 20], tags[(i * 7) % 20]], description=f"Server {i}",
+                ))
+            elif kind == 2:
+                item = AddressGroup(dict(base, name=f"group-{i}", static=[f"host-{i - 1}", f"host-{i - 2}"], tag=[tags[i % 20]]))
+            else:
+                item = SecurityRule(dict(
+                    base, name=f"rule-{i}", action="allow", source=["any"], destination=[f"group-{i - 1}"],
+                    application=["web-browsing", "ssl"], service=["application-default"], **{
+                        'from': ["trust"], 'to': ["untrust"],
+                    }
+                ))
+            container.add_item(item)
+
+    for f in range(folders):
+        folder = FolderConfig(f"Folder {f}")
+        fill(folder, 'folder', folder.name)
+        cfg.add_folder(folder)
+    snippet = SnippetConfig("shared-snippet")
+    fill(snippet, 'snippet', snippet.name)
+    cfg.add_snippet(snippet)
+    return cfg
+
+
+def item_dicts(cfg: Configuration) -> dict:
+    """Serialized items keyed by (item_type, location, name)."""
+    return {(item.item_type, item.get_location(), item.name): item.to_dict() for item in cfg.get_all_items()}
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="Existing saved configuration to benchmark")
+    parser.add_argument("--folders", type=int, default=10, help="Synthetic folders (default 10)")
+    parser.add_argument("--items", type=int, default=1000, help="Synthetic items per folder (default 1000)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per measurement, best time is reported")
+    args = parser.parse_args()
+
+    # Keep per-item load/save logging out of the timings and the report
+    setup_logging(level=logging.WARNING, rotate=False)
+
+    if args.input:
+        cfg = Configuration.load_from_file(args.input, strict=False, on_error="skip")
+    else:
+        cfg = build_configuration(args.folders, args.items)
+    total = len(cfg.get_all_items())
+    expected = item_dicts(cfg)
+    print(f"Configuration: {total} items, {len(cfg.folders)} folders, {len(cfg.snippets)} snippets")
+    print(f"Snapshot codec: {default_codec()}\n")
+
+    formats = [("JSON (indented)", "config.json"), ("JSON (gzip)", "config.json.gz"), ("Snapshot", "config.pacsnap")]
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, name in formats:
+            path = str(Path(tmpdir) / name)
+            save_time = min(timed(lambda: cfg.save_to_file(path))[1] for _ in range(args.runs))
+            loaded, load_time = None, None
+            for _ in range(args.runs):
+                loaded, elapsed = timed(lambda: Configuration.load_from_file(path))
+                load_time = elapsed if load_time is None else min(load_time, elapsed)
+            actual = item_dicts(loaded)
+            if actual != expected:
+                differing = sum(1 for key in expected.keys() | actual.keys() if expected.get(key) != actual.get(key))
+                raise SystemExit(f"{label}: {differing} items differ after the round trip")
+            results.append((label, Path(path).stat().st_size, save_time, load_time))
+
+            if name.endswith(".pacsnap"):
+                with SnapshotReader(path) as snapshot:
+                    batch = snapshot.index[0]
+                    _, read_time = timed(lambda: snapshot.read_items(batch["location"], batch["container"], batch["item_type"]))
+                random_access = (batch, read_time)
+
+    baseline = results[0][1]
+    print(f"{'Format':<18}{'Size':>14}{'Ratio':>9}{'Save (s)':>11}{'Load (s)':>11}")
+    for label, size, save_time, load_time in results:
+        print(f"{label:<18}{size:>14,}{size / baseline:>8.1%}{save_time:>11.3f}{load_time:>11.3f}")
+
+    batch, read_time = random_access
+    print(
+        f"\nRandom access: {batch['count']} {batch['item_type']} items of "
+        f"{batch['location']} '{batch['container']}' read in {read_time * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Check the request count of batched firewall/Panorama configuration.
+
+Runs deployment.config_batch.send_config_batch against a fake xapi that
+records every API request (the same ``ad_hoc``/``edit`` surface as
+pan.xapi.PanXapi) and fails unless:
+
+    one-request   N objects are sent as a single multi-config request
+    bisect        a rejected object is pinpointed by splitting the batch,
+                  the other objects are still applied, and the request
+                  count stays well below one per object
+    order         the multi-config sub-requests keep the given order
+
+No device or pan-os-python installation is needed.
+
+Usage:
+    python scripts/check_config_batch.py
+    python scripts/check_config_batch.py --objects 500
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from deployment.config_batch import send_config_batch
+
+
+class FakeObject:
+    """Stand-in for a pan-os-python object (uid, xpath, element_str)."""
+
+    def __init__(self, name: str):
+        self.uid = name
+
+    def xpath(self) -> str:
+        return f"/config/devices/entry/vsys/entry/address/entry[@name='{self.uid}']"
+
+    def element_str(self) -> bytes:
+        return f"<entry name=\"{self.uid}\"><ip-netmask>10.0.0.1/32</ip-netmask></entry>".encode()
+
+
+class FakeXapi:
+    """Records requests; rejects any request that contains a rejected object."""
+
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+        self.requests: List[dict] = []
+
+    def _check(self, text: str):
+        for name in self.rejected:
+            if f'name="{name}"' in text:
+                raise RuntimeError(f"{name} is invalid")
+
+    def ad_hoc(self, qs=None, xpath=None, modify_qs=False):
+        self.requests.append(dict(qs))
+        self._check(qs.get('element', ''))
+
+    def edit(self, xpath=None, element=None, extra_qs=None):
+        self.requests.append({'type': 'config', 'action': 'edit', 'xpath': xpath, 'element': element})
+        self._check(element)
+
+
+def check_one_request(count: int) -> List[str]:
+    objects = [FakeObject(f"host-{i}") for i in range(count)]
+    xapi = FakeXapi()
+    outcome = send_config_batch(xapi, objects)
+    errors = []
+    if len(xapi.requests) != 1 or outcome.round_trips != 1:
+        errors.append(f"{count} objects took {len(xapi.requests)} requests, expected 1")
+    elif xapi.requests[0].get('action') != 'multi-config':
+        errors.append(f"request action is {xapi.requests[0].get('action')!r}, expected 'multi-config'")
+    if len(outcome.applied) != count or outcome.failed:
+        errors.append(f"{len(outcome.applied)}/{count} applied, {len(outcome.failed)} failed")
+    return errors
+
+
+def check_bisect(count: int) -> List[str]:
+    objects = [FakeObject(f"host-{i}") for i in range(count)]
+    bad = objects[count // 3].uid
+    xapi = FakeXapi(rejected={bad})
+    outcome = send_config_batch(xapi, objects)
+    errors = []
+    if [obj.uid for obj, _ in outcome.failed] != [bad]:
+        errors.append(f"failed {[obj.uid for obj, _ in outcome.failed]}, expected [{bad!r}]")
+    if len(outcome.applied) != count - 1:
+        errors.append(f"{len(outcome.applied)}/{count - 1} other objects applied")
+    limit = 2 * max(count - 1, 1).bit_length() + 1
+    if len(xapi.requests) > limit:
+        errors.append(f"{len(xapi.requests)} requests to isolate one failure, expected at most {limit}")
+    return errors
+
+
+def check_order(count: int) -> List[str]:
+    objects = [FakeObject(f"host-{i}") for i in range(count)]
+    xapi = FakeXapi()
+    send_config_batch(xapi, objects)
+    names = re.findall(r'<entry name="([^"]+)"', xapi.requests[0].get('element', ''))
+    if names != [obj.uid for obj in objects]:
+        return ["multi-config sub-requests are not in the given order"]
+    return []
+
+
+CHECKS = {
+    "one-request": check_one_request,
+    "bisect": check_bisect,
+    "order": check_order,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=200, help="Objects per batch (default 200)")
+    args = parser.parse_args()
+
+    failed = False
+    for name, check in CHECKS.items():
+        errors = check(max(args.objects, 2))
+        print(f"{name:<12} {'FAIL' if errors else 'ok'}")
+        for error in errors:
+            print(f"    {error}")
+        failed = failed or bool(errors)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Check that CLI and GUI startup stay within an import-time budget.
+
+Runs each entry point in a fresh interpreter with ``python -X importtime``
+and fails when the total import time exceeds its budget, or when one of the
+heavy optional dependencies (pan-os-python, jinja2, jsonschema,
+cryptography) is imported at startup instead of on first use (see
+config.lazy_import).
+
+Checks:
+    pull-cli   python -m cli.pull_cli --help
+    gui        import gui.main_window, then build and show the main window
+               (offscreen Qt platform, no display needed)
+
+Each check runs in a temporary working directory and HOME so files the
+application writes at startup (activity.log, settings) stay out of the
+repository.
+
+Usage:
+    python scripts/check_import_budget.py
+    python scripts/check_import_budget.py --check pull-cli --budget-ms 300
+    python scripts/check_import_budget.py --runs 5 --top 15
+
+Exit status is non-zero if any check fails.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Packages that must only be imported when actually used
+DEFERRED_PACKAGES = ("panos", "jinja2", "jsonschema", "cryptography")
+
+_GUI_LAUNCH = (
+    "import sys\n"
+    "from PyQt6.QtWidgets import QApplication\n"
+    "app = QApplication(sys.argv)\n"
+    "from gui.main_window import PrismaConfigMainWindow\n"
+    "window = PrismaConfigMainWindow()\n"
+    "window.show()\n"
+    "app.processEvents()\n"
+)
+
+# name -> (command arguments after the interpreter, default budget in ms)
+CHECKS: Dict[str, Tuple[List[str], int]] = {
+    "pull-cli": (["-m", "cli.pull_cli", "--help"], 500),
+    "gui": (["-c", _GUI_LAUNCH], 1500),
+}
+
+
+def run_importtime(args: List[str]) -> Tuple[int, str, List[Tuple[str, int, int]]]:
+    """
+    Run the interpreter with -X importtime.
+
+    Returns:
+        Tuple of (exit code, stderr without importtime lines,
+        [(module, self_us, cumulative_us)]) where nested imports keep
+        their indentation
+    """
+    # Run from a scratch directory/HOME so startup files (activity.log,
+    # settings) are not created in the repository or the user's home
+    with tempfile.TemporaryDirectory(prefix="import-budget-") as scratch:
+        python_path = os.pathsep.join(filter(None, [str(REPO_ROOT.resolve()), os.environ.get("PYTHONPATH")]))
+        env = dict(
+            os.environ,
+            QT_QPA_PLATFORM="offscreen",
+            PYTHONDONTWRITEBYTECODE="1",
+            PYTHONPATH=python_path,
+            HOME=scratch,
+        )
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=scratch,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    imports = []
+    other = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            imports.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue  # header line
+    return proc.returncode, "\n".join(other), imports
+
+
+def check(name: str, args: List[str], budget_ms: int, runs: int, top: int) -> bool:
+    """Run one check (best of `runs`) and print its report."""
+    best = None
+    for _ in range(runs):
+        code, stderr, imports = run_importtime(args)
+        if code != 0:
+            print(f"[FAIL] {name}: exited with status {code}")
+            print("\n".join(stderr.strip().splitlines()[-10:]))
+            return False
+        total_us = sum(cumulative for module, _, cumulative in imports if not module.startswith(" "))
+        if best is None or total_us < best[0]:
+            best = (total_us, imports)
+
+    total_us, imports = best
+    modules = {module.strip() for module, _, _ in imports}
+    eager = sorted(
+        package for package in DEFERRED_PACKAGES
+        if any(module == package or module.startswith(package + ".") for module in modules)
+    )
+
+    total_ms = total_us / 1000
+    ok = total_ms <= budget_ms and not eager
+    print(f"[{'OK' if ok else 'FAIL'}] {name}: {total_ms:.0f} ms of imports "
+          f"(budget {budget_ms} ms), {len(modules)} modules")
+    if eager:
+        print(f"       imported at startup, should be deferred: {', '.join(eager)}")
+
+    ranked = sorted(
+        ((module, cumulative) for module, _, cumulative in imports if not module.startswith(" ")),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    for module, cumulative in ranked[:top]:
+        print(f"       {cumulative / 1000:8.1f} ms  {module}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", choices=sorted(CHECKS), action="append",
+                        help="Check to run (repeatable, default all)")
+    parser.add_argument("--budget-ms", type=int, help="Override the budget of every selected check")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per check, best is reported (default 3)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level imports to list (default 10)")
+    args = parser.parse_args()
+
+    results = []
+    for name in args.check or list(CHECKS):
+        command, budget_ms = CHECKS[name]
+        results.append(check(name, command, args.budget_ms or budget_ms, max(1, args.runs), args.top))
+
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,7 @@ from config.logging_config import (
     set_log_level,
     rotate_logs,
     prune_logs,
+    flush_logging,
     NORMAL
 )
 
@@ -61,6 +62,7 @@ def test_1_normal_level():
         logger.debug("This is DEBUG")  # Should NOT appear
         
         # Check log file
+        flush_logging()
         content = log_file.read_text()
         
         assert "This is ERROR" in content
@@ -159,6 +161,7 @@ def test_4_all_five_levels():
         logger.debug("Level 10: DEBUG")
         
         # Check all present
+        flush_logging()
         content = log_file.read_text()
         
         assert "Level 40: ERROR" in content
@@ -204,6 +207,7 @@ def test_5_level_filtering():
             logger.info("INFO message")
             logger.debug("DEBUG message")
             
+            flush_logging()
             content = log_file.read_text()
             
             for level_name in should_see:
@@ -240,6 +244,7 @@ def test_6_enhanced_logging_volume():
             logger.debug(f"Debug detail for item {i}")  # Should NOT appear
         logger.info("Operation complete")
         
+        flush_logging()
         info_content = log_file.read_text()
         info_lines = [line for line in info_content.strip().split('\n') if line.strip()]
         
@@ -257,6 +262,7 @@ def test_6_enhanced_logging_volume():
             logger.debug(f"Debug detail for item {i}")  # Should appear
         logger.info("Operation complete")
         
+        flush_logging()
         debug_content = log_file.read_text()
         debug_lines = [line for line in debug_content.strip().split('\n') if line.strip()]
         
@@ -351,6 +357,7 @@ def test_8_rotation_on_startup():
         rotated_content = (log_file.parent / "activity-1.log").read_text()
         assert "First run" in rotated_content, f"Rotated log should contain first run, got: {rotated_content}"
         
+        flush_logging()
         current_content = log_file.read_text()
         assert "Second run" in current_content, "Current log should contain second run"
         assert "First run" not in current_content, "Current log should not contain first run"
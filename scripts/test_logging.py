@@ -24,6 +24,7 @@ from config.logging_config import (
     disable_debug_mode,
     is_debug_mode,
     set_log_level,
+    flush_logging,
     ActivityLogger
 )
 from config.models.objects import AddressObject, AddressGroup
@@ -49,6 +50,7 @@ def test_basic_logging():
     logger.error("This is ERROR (should appear)")
     
     # Check log file
+    flush_logging()
     if log_file.exists():
         with open(log_file, 'r') as f:
             lines = f.readlines()
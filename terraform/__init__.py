@@ -4,6 +4,8 @@ Terraform integration for POV cloud deployments.
 Provides:
 - TerraformGenerator: Generates Terraform files from CloudConfig
 - TerraformExecutor: Executes Terraform commands (init, plan, apply, destroy)
+- WorkspaceCache: Init/plan fingerprints so unchanged workspaces skip work
+- configure_provider_cache: Shared per-user provider plugin cache and mirror
 - BootstrapConfig: Configuration for firewall bootstrap packages
 - BootstrapGenerator: Generates init-cfg.txt and bootstrap.xml
 - Jinja2 templates for Azure resources
@@ -15,6 +17,8 @@ from pathlib import Path
 
 from .generator import TerraformGenerator
 from .executor import TerraformExecutor, TerraformResult
+from .cache import WorkspaceCache, write_if_changed
+from .provider_cache import ProviderCacheConfig, configure_provider_cache, get_provider_cache_config
 from .bootstrap import BootstrapConfig, BootstrapGenerator, generate_firewall_bootstrap
 from .azure_cli_auth import (
     check_azure_cli_installed,
@@ -104,6 +108,11 @@ __all__ = [
     'TerraformGenerator',
     'TerraformExecutor',
     'TerraformResult',
+    'WorkspaceCache',
+    'write_if_changed',
+    'ProviderCacheConfig',
+    'configure_provider_cache',
+    'get_provider_cache_config',
     'BootstrapConfig',
     'BootstrapGenerator',
     'generate_firewall_bootstrap',
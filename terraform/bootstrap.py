@@ -15,6 +15,8 @@ from datetime import datetime
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
+from .cache import write_if_changed
+
 logger = logging.getLogger(__name__)
 
 
@@ -213,6 +215,7 @@ class BootstrapGenerator:
             config: BootstrapConfig with all settings
         """
         self.config = config
+        self.files_changed: List[str] = []
 
     def generate_init_cfg(self) -> str:
         """
@@ -493,6 +496,9 @@ class BootstrapGenerator:
         Args:
             output_dir: Directory to write bootstrap files
 
+        Files whose content is unchanged are not rewritten; paths that were
+        written are collected in ``files_changed``.
+
         Returns:
             Dict mapping filename to file path
         """
@@ -500,6 +506,7 @@ class BootstrapGenerator:
         output_path.mkdir(parents=True, exist_ok=True)
 
         files_created = {}
+        self.files_changed = []
 
         # Create bootstrap directory structure
         config_dir = output_path / "config"
@@ -517,29 +524,31 @@ class BootstrapGenerator:
         # Generate init-cfg.txt
         init_cfg_path = config_dir / "init-cfg.txt"
         init_cfg_content = self.generate_init_cfg()
-        with open(init_cfg_path, 'w') as f:
-            f.write(init_cfg_content)
+        self._write(init_cfg_path, init_cfg_content)
         files_created['init-cfg.txt'] = str(init_cfg_path)
-        logger.info(f"Generated {init_cfg_path}")
 
         # Generate bootstrap.xml
         bootstrap_xml_path = config_dir / "bootstrap.xml"
         bootstrap_xml_content = self.generate_bootstrap_xml()
-        with open(bootstrap_xml_path, 'w') as f:
-            f.write(bootstrap_xml_content)
+        self._write(bootstrap_xml_path, bootstrap_xml_content)
         files_created['bootstrap.xml'] = str(bootstrap_xml_path)
-        logger.info(f"Generated {bootstrap_xml_path}")
 
         # Generate authcodes file if provided
         if self.config.auth_code:
             authcodes_path = license_dir / "authcodes"
-            with open(authcodes_path, 'w') as f:
-                f.write(self.config.auth_code + "\n")
+            self._write(authcodes_path, self.config.auth_code + "\n")
             files_created['authcodes'] = str(authcodes_path)
-            logger.info(f"Generated {authcodes_path}")
 
         return files_created
 
+    def _write(self, path: Path, content: str):
+        """Write a bootstrap file if its content changed."""
+        if write_if_changed(path, content):
+            self.files_changed.append(str(path))
+            logger.info(f"Generated {path}")
+        else:
+            logger.debug(f"Unchanged {path}")
+
 
 def generate_firewall_bootstrap(
     firewall,
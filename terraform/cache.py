@@ -0,0 +1,237 @@
+"""
+Change tracking for generated Terraform workspaces.
+
+Iterative POV builds regenerate and re-run Terraform after small CloudConfig
+edits. This module keeps that cheap:
+
+- write_if_changed(): the generator only rewrites files whose content hash
+  changed, so file timestamps and Terraform inputs stay stable.
+- WorkspaceCache: fingerprints of the inputs of ``terraform init`` (terraform
+  and module blocks, providers referenced by resources, lock file) and of
+  ``terraform plan`` (all .tf/.tfvars inputs, state, var file). Init is
+  skipped and a saved plan is reused while their fingerprint is unchanged.
+
+The cache lives in ``.terraform/`` so deleting that directory (or running
+init with force=True) resets it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = "pa_config_lab_cache.json"
+PLAN_FILE = "pa_config_lab.tfplan"
+
+# Saved plans older than this are re-planned to pick up out-of-band drift
+PLAN_MAX_AGE = 3600
+
+_PROVIDER_REF = re.compile(r'^\s*(?:resource|data)\s+"([A-Za-z0-9-]+?)_', re.MULTILINE)
+_INIT_BLOCK_START = re.compile(r'^(terraform|module\s+"[^"]*")\s*\{', re.MULTILINE)
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """SHA-256 hex digest of text or bytes."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_hash(path: Union[str, Path]) -> Optional[str]:
+    """SHA-256 hex digest of a file, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def write_if_changed(path: Union[str, Path], content: str) -> bool:
+    """
+    Write a text file only if its content differs from what is on disk.
+
+    Args:
+        path: File to write
+        content: New file content
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    if file_hash(path) == content_hash(content):
+        logger.debug(f"Unchanged: {path}")
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    logger.debug(f"Wrote {path}")
+    return True
+
+
+def _init_blocks(text: str) -> Iterable[str]:
+    """Yield top-level terraform {} and module {} blocks of an HCL file."""
+    for match in _INIT_BLOCK_START.finditer(text):
+        depth = 0
+        for end in range(match.end() - 1, len(text)):
+            if text[end] == '{':
+                depth += 1
+            elif text[end] == '}':
+                depth -= 1
+                if depth == 0:
+                    yield text[match.start():end + 1]
+                    break
+
+
+class WorkspaceCache:
+    """
+    Fingerprints of the last successful init and plan in a working directory.
+    """
+
+    def __init__(self, working_dir: Union[str, Path]):
+        """
+        Initialize the cache.
+
+        Args:
+            working_dir: Terraform working directory
+        """
+        self.working_dir = Path(working_dir)
+        self.terraform_dir = self.working_dir / ".terraform"
+        self.cache_path = self.terraform_dir / CACHE_FILE
+        self.plan_path = self.terraform_dir / PLAN_FILE
+
+    # ========== Fingerprints ==========
+
+    def _tf_files(self):
+        return sorted(self.working_dir.glob("*.tf"))
+
+    def init_fingerprint(self, options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Fingerprint everything ``terraform init`` depends on.
+
+        Args:
+            options: Init arguments that change its result (upgrade, backend config)
+        """
+        blocks = []
+        providers = set()
+        for path in self._tf_files():
+            text = path.read_text()
+            blocks.extend(_init_blocks(text))
+            providers.update(_PROVIDER_REF.findall(text))
+
+        payload = {
+            'blocks': blocks,
+            'providers': sorted(providers),
+            'lock': file_hash(self.working_dir / ".terraform.lock.hcl"),
+            'options': options or {},
+        }
+        return content_hash(json.dumps(payload, sort_keys=True))
+
+    def plan_fingerprint(self, var_file: Optional[str] = None, destroy: bool = False) -> str:
+        """
+        Fingerprint everything a saved plan depends on.
+
+        Covers all configuration and auto-loaded variable files, the var file,
+        the state (a plan is only valid against the state it was made from) and
+        the installed providers.
+        """
+        inputs = {}
+        for pattern in ("*.tf", "*.tfvars", "*.tfvars.json"):
+            for path in sorted(self.working_dir.glob(pattern)):
+                inputs[path.name] = file_hash(path)
+        if var_file:
+            var_path = self.working_dir / var_file
+            inputs[f"var_file:{var_path}"] = file_hash(var_path)
+
+        payload = {
+            'inputs': inputs,
+            'state': file_hash(self.working_dir / "terraform.tfstate"),
+            'lock': file_hash(self.working_dir / ".terraform.lock.hcl"),
+            'destroy': destroy,
+        }
+        return content_hash(json.dumps(payload, sort_keys=True))
+
+    # ========== Init ==========
+
+    def init_current(self, fingerprint: str) -> bool:
+        """True if init already ran successfully with these inputs."""
+        if not (self.terraform_dir / "providers").is_dir():
+            return False
+        return self._load().get('init') == fingerprint
+
+    def record_init(self, fingerprint: str):
+        """Remember a successful init."""
+        self._update(init=fingerprint)
+
+    # ========== Plan ==========
+
+    def saved_plan(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the saved plan entry if it matches the current inputs.
+
+        Returns:
+            Dict with 'path', 'changes', 'has_changes' and 'created', or None
+        """
+        entry = self._load().get('plan')
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return None
+        if not self.plan_path.is_file():
+            return None
+        if time.time() - entry.get('created', 0) > PLAN_MAX_AGE:
+            logger.debug("Saved plan expired")
+            return None
+        return dict(entry, path=str(self.plan_path))
+
+    def record_plan(self, fingerprint: str, changes: Dict[str, int], has_changes: bool):
+        """Remember a saved plan written to plan_path."""
+        self._update(plan={
+            'fingerprint': fingerprint,
+            'changes': changes,
+            'has_changes': has_changes,
+            'created': time.time(),
+        })
+
+    def invalidate_plan(self):
+        """Forget the saved plan (after apply or when it went stale)."""
+        self._update(plan=None)
+        try:
+            self.plan_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Forget all cached fingerprints."""
+        self.invalidate_plan()
+        try:
+            self.cache_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ========== Storage ==========
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+
+    def _update(self, **values):
+        if not self.terraform_dir.is_dir():
+            return
+        data = self._load()
+        for key, value in values.items():
+            if value is None:
+                data.pop(key, None)
+            else:
+                data[key] = value
+        write_if_changed(self.cache_path, json.dumps(data, indent=2, sort_keys=True))
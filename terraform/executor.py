@@ -7,6 +7,12 @@ Provides a Python interface for executing Terraform operations:
 - apply: Apply changes to infrastructure
 - destroy: Destroy managed infrastructure
 - output: Get output values
+
+init() is skipped while its inputs are unchanged, and plan(reuse=True)
+saves the plan and reuses it until the configuration, variables or state
+change (see terraform.cache). Providers are installed from a per-user
+plugin cache / filesystem mirror shared by all deployments (see
+terraform.provider_cache).
 """
 
 import json
@@ -14,11 +20,15 @@ import subprocess
 import os
 import logging
 import shutil
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .cache import WorkspaceCache
+from .provider_cache import ProviderCacheConfig, get_provider_cache_config
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +51,10 @@ class TerraformResult:
     outputs: Dict[str, Any] = field(default_factory=dict)
     changes: Dict[str, int] = field(default_factory=dict)  # add, change, destroy counts
     error_message: Optional[str] = None
+    cached: bool = False  # Result reused from a previous run, command not executed
+    plan_file: Optional[str] = None  # Saved plan written by plan(reuse=True)
+    has_changes: bool = True  # False if plan reported "No changes."
+    duration_s: Optional[float] = None
 
     @property
     def success(self) -> bool:
@@ -58,6 +72,10 @@ class TerraformResult:
             'outputs': self.outputs,
             'changes': self.changes,
             'error_message': self.error_message,
+            'cached': self.cached,
+            'plan_file': self.plan_file,
+            'has_changes': self.has_changes,
+            'duration_s': self.duration_s,
         }
 
 
@@ -74,6 +92,7 @@ class TerraformExecutor:
         working_dir: str,
         terraform_path: Optional[str] = None,
         auto_approve: bool = False,
+        provider_cache: Optional[ProviderCacheConfig] = None,
     ):
         """
         Initialize Terraform executor.
@@ -82,14 +101,19 @@ class TerraformExecutor:
             working_dir: Directory containing Terraform files
             terraform_path: Path to terraform binary (default: auto-detect)
             auto_approve: If True, skip interactive approval for apply/destroy
+            provider_cache: Provider cache/mirror settings (default: process-wide
+                settings from configure_provider_cache())
         """
         self.working_dir = Path(working_dir)
         self.terraform_path = terraform_path or self._find_terraform()
         self.auto_approve = auto_approve
+        self.provider_cache = provider_cache or get_provider_cache_config()
 
         if not self.working_dir.exists():
             raise ValueError(f"Working directory does not exist: {working_dir}")
 
+        self.cache = WorkspaceCache(self.working_dir)
+
     def _find_terraform(self) -> str:
         """Find terraform binary in PATH."""
         terraform = shutil.which("terraform")
@@ -117,6 +141,7 @@ class TerraformExecutor:
         capture_output: bool = True,
         progress_callback: Optional[Callable[[str], None]] = None,
         timeout: Optional[int] = None,
+        provider_cache: Optional[ProviderCacheConfig] = None,
     ) -> TerraformResult:
         """
         Run a terraform command.
@@ -126,6 +151,7 @@ class TerraformExecutor:
             capture_output: Whether to capture stdout/stderr
             progress_callback: Optional callback for progress updates
             timeout: Optional timeout in seconds
+            provider_cache: Override the executor's provider installation settings
 
         Returns:
             TerraformResult with command output
@@ -137,12 +163,15 @@ class TerraformExecutor:
         logger.info(f"Working directory: {self.working_dir}")
         logger.debug(f"Terraform binary: {self.terraform_path}")
 
+        start = time.monotonic()
         try:
+            env = (provider_cache or self.provider_cache).environment()
             if progress_callback and not capture_output:
                 # Stream output for progress
                 process = subprocess.Popen(
                     cmd,
                     cwd=str(self.working_dir),
+                    env=env,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     text=True,
@@ -164,6 +193,7 @@ class TerraformExecutor:
                 result = subprocess.run(
                     cmd,
                     cwd=str(self.working_dir),
+                    env=env,
                     capture_output=True,
                     text=True,
                     timeout=timeout,
@@ -202,6 +232,7 @@ class TerraformExecutor:
                 stdout=stdout,
                 stderr=stderr,
                 error_message=error_message,
+                duration_s=round(time.monotonic() - start, 1),
             )
 
         except subprocess.TimeoutExpired:
@@ -281,18 +312,41 @@ class TerraformExecutor:
         upgrade: bool = False,
         backend_config: Optional[Dict[str, str]] = None,
         progress_callback: Optional[Callable[[str], None]] = None,
+        force: bool = False,
     ) -> TerraformResult:
         """
         Initialize Terraform working directory.
 
+        Skipped (result.cached=True) when the working directory was already
+        initialized with the same terraform/module blocks, providers and lock
+        file.
+
         Args:
             upgrade: Upgrade modules and plugins
             backend_config: Backend configuration values
             progress_callback: Optional callback for progress updates
+            force: Run init even if nothing changed
 
         Returns:
             TerraformResult
         """
+        # -upgrade only changes which provider versions get locked, and the
+        # lock file is part of the fingerprint
+        options = {'backend_config': backend_config or {}}
+        if not force and not upgrade:
+            fingerprint = self.cache.init_fingerprint(options)
+            if self.cache.init_current(fingerprint):
+                logger.info(f"Terraform init skipped: providers and lock file unchanged in {self.working_dir}")
+                if progress_callback:
+                    progress_callback("Terraform already initialized (providers and lock file unchanged)")
+                return TerraformResult(
+                    status=TerraformStatus.SUCCESS,
+                    command="terraform init",
+                    return_code=0,
+                    cached=True,
+                    duration_s=0.0,
+                )
+
         args = ["init"]
 
         if upgrade:
@@ -311,7 +365,65 @@ class TerraformExecutor:
             logger.error(f"Terraform init failed - stderr: {result.stderr}")
             logger.error(f"Terraform init failed - stdout: {result.stdout}")
         else:
-            logger.info(f"Terraform init succeeded in {self.working_dir}")
+            logger.info(
+                f"Terraform init succeeded in {self.working_dir} after {result.duration_s}s "
+                f"({self._provider_install_summary(result.stdout)})"
+            )
+            # Fingerprint after init: it may have created/updated the lock file
+            self.cache.record_init(self.cache.init_fingerprint(options))
+        return result
+
+    @staticmethod
+    def _provider_install_summary(output: str) -> str:
+        """Summarize where init got its providers from."""
+        cached = downloaded = reused = 0
+        for line in output.splitlines():
+            if "from the shared cache directory" in line:
+                cached += 1
+            elif "Reusing previous version" in line or "Using previously-installed" in line:
+                reused += 1
+            elif line.lstrip().startswith("- Installing "):
+                downloaded += 1
+        return f"providers: {cached} from shared cache, {downloaded} installed, {reused} reused"
+
+    def mirror_providers(
+        self,
+        target_dir: Optional[str] = None,
+        platforms: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> TerraformResult:
+        """
+        Copy the providers this configuration needs into a filesystem mirror.
+
+        The mirror can then be used with configure_provider_cache(
+        provider_mirror=..., mirror_only=True) for offline deployments.
+
+        Args:
+            target_dir: Mirror directory (default: the configured provider mirror)
+            platforms: Target platforms, e.g. ['linux_amd64', 'darwin_arm64']
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            TerraformResult
+        """
+        target_dir = target_dir or self.provider_cache.provider_mirror
+        if not target_dir:
+            raise ValueError("No provider mirror directory configured")
+
+        args = ["providers", "mirror"]
+        for platform in platforms or []:
+            args.append(f"-platform={platform}")
+        args.append(str(target_dir))
+
+        # Seeding needs the registry, so never restrict installation to the mirror itself
+        seed_config = ProviderCacheConfig(plugin_cache_dir=self.provider_cache.plugin_cache_dir)
+        result = self._run_command(
+            args,
+            capture_output=not progress_callback,
+            progress_callback=progress_callback,
+            provider_cache=seed_config,
+        )
+        logger.info(f"Terraform providers mirror to {target_dir}: {result.status.value}")
         return result
 
     def validate(self) -> TerraformResult:
@@ -344,19 +456,46 @@ class TerraformExecutor:
         out: Optional[str] = None,
         destroy: bool = False,
         progress_callback: Optional[Callable[[str], None]] = None,
+        reuse: bool = False,
     ) -> TerraformResult:
         """
         Create Terraform execution plan.
 
+        With reuse=True the plan is saved in the working directory and
+        returned from cache (result.cached=True) while the configuration,
+        variables, state and providers are unchanged. Pass result.plan_file
+        to apply() to apply exactly that plan.
+
         Args:
             var_file: Path to variables file (e.g., terraform.tfvars.json)
             out: Path to save plan file
             destroy: Plan for destruction
             progress_callback: Optional callback for progress updates
+            reuse: Save the plan and reuse it while inputs are identical
 
         Returns:
             TerraformResult with plan details
         """
+        fingerprint = None
+        if reuse and not out:
+            fingerprint = self.cache.plan_fingerprint(var_file, destroy)
+            saved = self.cache.saved_plan(fingerprint)
+            if saved:
+                logger.info(f"Terraform plan reused (inputs unchanged): {saved['changes']}")
+                if progress_callback:
+                    progress_callback("Reusing saved plan (configuration, variables and state unchanged)")
+                return TerraformResult(
+                    status=TerraformStatus.SUCCESS,
+                    command="terraform plan",
+                    return_code=0,
+                    changes=saved['changes'],
+                    cached=True,
+                    plan_file=saved['path'],
+                    has_changes=saved['has_changes'],
+                )
+            self.cache.invalidate_plan()
+            out = str(self.cache.plan_path)
+
         args = ["plan", "-input=false"]
 
         if var_file:
@@ -376,6 +515,10 @@ class TerraformExecutor:
         # Parse plan output for change counts
         if result.success:
             result.changes = self._parse_plan_changes(result.stdout)
+            result.has_changes = "No changes." not in result.stdout
+            result.plan_file = out
+            if fingerprint:
+                self.cache.record_plan(fingerprint, result.changes, result.has_changes)
 
         logger.info(f"Terraform plan: {result.status.value}, changes: {result.changes}")
         if not result.success:
@@ -394,6 +537,9 @@ class TerraformExecutor:
         """
         Apply Terraform changes.
 
+        A saved plan can only be applied once. If Terraform rejects it as
+        stale, apply falls back to planning inline with var_file.
+
         Args:
             plan_file: Path to saved plan file
             var_file: Path to variables file
@@ -422,6 +568,18 @@ class TerraformExecutor:
             timeout=timeout,
         )
 
+        if plan_file:
+            # Consumed on success, stale on failure
+            self.cache.invalidate_plan()
+            if not result.success and "stale" in (result.stdout + result.stderr).lower():
+                logger.warning("Saved plan is stale, applying with a fresh plan")
+                return self.apply(
+                    var_file=var_file,
+                    auto_approve=auto_approve,
+                    progress_callback=progress_callback,
+                    timeout=timeout,
+                )
+
         # Get outputs after successful apply
         if result.success:
             outputs_result = self.output()
@@ -576,6 +734,15 @@ class TerraformExecutor:
 
         return changes
 
+    def saved_plan(self, var_file: Optional[str] = None, destroy: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the plan saved by plan(reuse=True) if it still matches the inputs.
+
+        Returns:
+            Dict with 'path', 'changes' and 'has_changes', or None
+        """
+        return self.cache.saved_plan(self.cache.plan_fingerprint(var_file, destroy))
+
     def is_initialized(self) -> bool:
         """Check if working directory is initialized."""
         terraform_dir = self.working_dir / ".terraform"
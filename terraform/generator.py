@@ -13,16 +13,16 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
-    JINJA2_AVAILABLE = True
-except ImportError:
-    JINJA2_AVAILABLE = False
-
+from config.lazy_import import lazy_import, module_available
 from config.models.cloud import CloudConfig
+from .cache import write_if_changed
 
 logger = logging.getLogger(__name__)
 
+# Jinja2 is imported when the first generator is created
+JINJA2_AVAILABLE = module_available("jinja2")
+jinja2 = lazy_import("jinja2")
+
 
 class TerraformGenerator:
     """
@@ -32,6 +32,10 @@ class TerraformGenerator:
     - terraform.tfvars.json with all variable values
     - Rendered .tf files from Jinja2 templates
     - provider.tf with Azure provider configuration
+
+    Files are only rewritten when their content changes, so regenerating
+    after a small config edit leaves the rest of the workspace untouched
+    (see terraform.cache).
     """
 
     # Default template directory (relative to this file)
@@ -65,11 +69,15 @@ class TerraformGenerator:
         # Set up Jinja2 environment
         self._setup_jinja_env()
 
+        # Files written / left untouched by the current generate() run
+        self._files_changed: List[str] = []
+        self._files_unchanged: List[str] = []
+
     def _setup_jinja_env(self):
         """Configure Jinja2 environment with custom filters."""
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(['html', 'xml']),
+        self.jinja_env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(str(self.template_dir)),
+            autoescape=jinja2.select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
         )
@@ -126,13 +134,17 @@ class TerraformGenerator:
         Returns:
             Dict with generation results:
             - output_dir: Path to generated files
-            - files_created: List of created files
+            - files_created: List of all generated files
+            - files_changed: Files whose content changed (or are new)
+            - files_unchanged: Files that already had the generated content
             - tfvars_path: Path to terraform.tfvars.json
         """
         logger.info(f"Generating Terraform files in {self.output_dir}")
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._files_changed = []
+        self._files_unchanged = []
 
         files_created = []
 
@@ -185,11 +197,16 @@ class TerraformGenerator:
         vars_path = self._generate_variables()
         files_created.append(str(vars_path))
 
-        logger.info(f"Generated {len(files_created)} Terraform files")
+        logger.info(
+            f"Generated {len(files_created)} Terraform files "
+            f"({len(self._files_changed)} changed, {len(self._files_unchanged)} unchanged)"
+        )
 
         return {
             'output_dir': str(self.output_dir),
             'files_created': files_created,
+            'files_changed': list(self._files_changed),
+            'files_unchanged': list(self._files_unchanged),
             'tfvars_path': str(tfvars_path),
             'resource_group': self.cloud_config.deployment.resource_group,
         }
@@ -209,12 +226,30 @@ class TerraformGenerator:
         }
 
         tfvars_path = self.output_dir / "terraform.tfvars.json"
-        with open(tfvars_path, 'w') as f:
-            json.dump(tfvars, f, indent=2)
 
-        logger.debug(f"Generated {tfvars_path}")
+        # Keep the previous timestamp if nothing else changed, otherwise the
+        # file (and every saved plan) would be invalidated on each run
+        try:
+            with open(tfvars_path, 'r') as f:
+                previous = json.load(f)
+            if isinstance(previous, dict) and '_metadata' in previous:
+                candidate = dict(tfvars, _metadata=previous['_metadata'])
+                if candidate == previous:
+                    tfvars = candidate
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            pass
+
+        self._write(tfvars_path, json.dumps(tfvars, indent=2))
         return tfvars_path
 
+    def _write(self, path: Path, content: str):
+        """Write a generated file if its content changed and record the outcome."""
+        if write_if_changed(path, content):
+            self._files_changed.append(str(path))
+            logger.debug(f"Generated {path}")
+        else:
+            self._files_unchanged.append(str(path))
+
     def _generate_provider(self) -> Path:
         """Generate provider.tf with Azure provider configuration."""
         template = self._get_template('provider.tf.j2')
@@ -226,10 +261,7 @@ class TerraformGenerator:
         )
 
         provider_path = self.output_dir / "provider.tf"
-        with open(provider_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {provider_path}")
+        self._write(provider_path, content)
         return provider_path
 
     def _generate_main(self) -> Path:
@@ -248,10 +280,7 @@ class TerraformGenerator:
         )
 
         main_path = self.output_dir / "main.tf"
-        with open(main_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {main_path}")
+        self._write(main_path, content)
         return main_path
 
     def _generate_firewalls(self) -> Path:
@@ -265,10 +294,7 @@ class TerraformGenerator:
         )
 
         fw_path = self.output_dir / "firewall.tf"
-        with open(fw_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {fw_path}")
+        self._write(fw_path, content)
         return fw_path
 
     def _generate_ion_devices(self) -> Path:
@@ -282,10 +308,7 @@ class TerraformGenerator:
         )
 
         ion_path = self.output_dir / "ion.tf"
-        with open(ion_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {ion_path}")
+        self._write(ion_path, content)
         return ion_path
 
     def _generate_panorama(self) -> Path:
@@ -299,10 +322,7 @@ class TerraformGenerator:
         )
 
         pan_path = self.output_dir / "panorama.tf"
-        with open(pan_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {pan_path}")
+        self._write(pan_path, content)
         return pan_path
 
     def _generate_supporting_vms(self) -> Path:
@@ -318,10 +338,7 @@ class TerraformGenerator:
         )
 
         support_path = self.output_dir / "supporting_vms.tf"
-        with open(support_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {support_path}")
+        self._write(support_path, content)
         return support_path
 
     def _generate_bootstrap(self, credentials: Optional[Dict[str, Any]] = None) -> List[str]:
@@ -362,6 +379,10 @@ class TerraformGenerator:
             generator = BootstrapGenerator(config)
             created = generator.generate(str(fw_bootstrap_dir))
             files_created.extend(created.values())
+            self._files_changed.extend(generator.files_changed)
+            self._files_unchanged.extend(
+                path for path in created.values() if path not in generator.files_changed
+            )
 
             logger.info(f"Generated bootstrap package for {fw.name}")
 
@@ -388,8 +409,7 @@ class TerraformGenerator:
             pan_config_dir.mkdir(parents=True, exist_ok=True)
 
             init_cfg_path = pan_config_dir / "init-cfg.txt"
-            with open(init_cfg_path, 'w') as f:
-                f.write(init_cfg_content)
+            self._write(init_cfg_path, init_cfg_content)
             files_created.append(str(init_cfg_path))
 
             logger.info(f"Generated bootstrap package for {self.cloud_config.panorama.name}")
@@ -407,10 +427,7 @@ class TerraformGenerator:
         )
 
         storage_path = self.output_dir / "bootstrap_storage.tf"
-        with open(storage_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {storage_path}")
+        self._write(storage_path, content)
         return storage_path
 
     def _generate_outputs(self) -> Path:
@@ -427,10 +444,7 @@ class TerraformGenerator:
         )
 
         outputs_path = self.output_dir / "outputs.tf"
-        with open(outputs_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {outputs_path}")
+        self._write(outputs_path, content)
         return outputs_path
 
     def _generate_variables(self) -> Path:
@@ -446,10 +460,7 @@ class TerraformGenerator:
         )
 
         vars_path = self.output_dir / "variables.tf"
-        with open(vars_path, 'w') as f:
-            f.write(content)
-
-        logger.debug(f"Generated {vars_path}")
+        self._write(vars_path, content)
         return vars_path
 
     def _get_template(self, template_name: str):
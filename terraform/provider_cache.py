@@ -0,0 +1,136 @@
+"""
+Shared Terraform provider installation.
+
+Every POV deployment has its own working directory, so without help each
+``terraform init`` downloads and unpacks the azurerm provider again. This
+module points all executors at one per-user plugin cache (and optionally a
+filesystem mirror) through a generated Terraform CLI configuration file:
+
+    plugin_cache_dir = "~/.pa_config_lab/terraform/plugin-cache"
+    provider_installation {
+      filesystem_mirror { path = "<mirror>" }
+      direct {}                      # omitted when mirror_only=True
+    }
+
+With a mirror seeded by ``TerraformExecutor.mirror_providers()`` and
+mirror_only=True, init works without network access.
+
+If the user already sets TF_CLI_CONFIG_FILE, their configuration wins and
+nothing is changed.
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .cache import content_hash, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+TERRAFORM_HOME = Path.home() / ".pa_config_lab" / "terraform"
+DEFAULT_PLUGIN_CACHE_DIR = TERRAFORM_HOME / "plugin-cache"
+
+
+@dataclass
+class ProviderCacheConfig:
+    """Provider installation settings shared by all Terraform executors."""
+    plugin_cache_dir: Optional[str] = str(DEFAULT_PLUGIN_CACHE_DIR)
+    provider_mirror: Optional[str] = None
+    mirror_only: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.plugin_cache_dir or self.provider_mirror)
+
+    def cli_config(self) -> str:
+        """Render the Terraform CLI configuration (HCL)."""
+        lines = ["# Generated by pa_config_lab - shared provider installation", ""]
+        if self.plugin_cache_dir:
+            lines.append(f"plugin_cache_dir = {json.dumps(self.plugin_cache_dir)}")
+            # Fresh POV directories have no lock file yet; without this
+            # Terraform >= 1.4 ignores the cache and downloads again
+            lines.append("plugin_cache_may_break_dependency_lock_file = true")
+            lines.append("")
+        if self.provider_mirror:
+            lines.append("provider_installation {")
+            lines.append("  filesystem_mirror {")
+            lines.append(f"    path = {json.dumps(self.provider_mirror)}")
+            lines.append("  }")
+            if not self.mirror_only:
+                lines.append("  direct {}")
+            lines.append("}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def environment(self, base: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """
+        Build the environment for a terraform subprocess.
+
+        Returns:
+            Environment dict, or None to inherit the current environment
+        """
+        env = dict(os.environ if base is None else base)
+        if not self.enabled or env.get("TF_CLI_CONFIG_FILE"):
+            return None
+
+        if self.plugin_cache_dir:
+            Path(self.plugin_cache_dir).mkdir(parents=True, exist_ok=True)
+
+        content = self.cli_config()
+        config_path = TERRAFORM_HOME / f"cli-{content_hash(content)[:12]}.tfrc"
+        write_if_changed(config_path, content)
+        env["TF_CLI_CONFIG_FILE"] = str(config_path)
+        # Also covers Terraform versions that read the cache dir from the environment
+        if self.plugin_cache_dir:
+            env.setdefault("TF_PLUGIN_CACHE_DIR", self.plugin_cache_dir)
+        return env
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'plugin_cache_dir': self.plugin_cache_dir,
+            'provider_mirror': self.provider_mirror,
+            'mirror_only': self.mirror_only,
+        }
+
+
+_config = ProviderCacheConfig()
+_config_lock = threading.Lock()
+
+
+def configure_provider_cache(
+    shared_cache: bool = True,
+    provider_mirror: Optional[str] = None,
+    mirror_only: bool = False,
+    plugin_cache_dir: Optional[str] = None,
+) -> ProviderCacheConfig:
+    """
+    Set the provider installation used by new TerraformExecutors.
+
+    Args:
+        shared_cache: Use a per-user plugin cache shared by all deployments
+        provider_mirror: Filesystem mirror directory (None = registry only)
+        mirror_only: Install providers only from the mirror (offline)
+        plugin_cache_dir: Cache directory (default ~/.pa_config_lab/terraform/plugin-cache)
+
+    Returns:
+        The active ProviderCacheConfig
+    """
+    global _config
+    with _config_lock:
+        _config = ProviderCacheConfig(
+            plugin_cache_dir=(plugin_cache_dir or str(DEFAULT_PLUGIN_CACHE_DIR)) if shared_cache else None,
+            provider_mirror=provider_mirror or None,
+            mirror_only=bool(provider_mirror) and mirror_only,
+        )
+        logger.debug(f"Terraform provider installation: {_config.to_dict()}")
+        return _config
+
+
+def get_provider_cache_config() -> ProviderCacheConfig:
+    """Get the process-wide provider installation settings."""
+    with _config_lock:
+        return _config